@@ -12,6 +12,7 @@ from automated_security_helper.base.plugin_config import PluginConfigBase
 from automated_security_helper.base.plugin_context import PluginContext
 from automated_security_helper.base.uv_tool_mixin import UVToolMixin
 from automated_security_helper.core.enums import PackageManager
+from automated_security_helper.core.perf_profile import perf_span
 from automated_security_helper.core.exceptions import ScannerError
 from automated_security_helper.utils.log import ASH_LOGGER
 
@@ -243,57 +244,63 @@ class PluginBase(UVToolMixin, BaseModel):
             run_command_with_output_handling,
         )
 
-        try:
-            # Use provided cwd or fall back to context.source_dir
-            working_dir = cwd if cwd is not None else Path(self.context.source_dir)
-
-            # Attempt UV tool execution if enabled
-            if self.use_uv_tool and self.command and len(command) > 0:
-                # Check if the first element of the command is our tool command
-                if command[0] == self.command:
-                    uv_result = self._try_uv_tool_execution(
-                        command,
-                        working_dir,
-                        results_dir=Path(results_dir) if results_dir else None,
-                        stdout_preference=stdout_preference,
-                        stderr_preference=stderr_preference,
-                        env=env,
-                    )
-                    if uv_result is not None:
-                        return uv_result
-                    # If UV execution failed, continue with direct execution fallback
-
-            # Run the command using the centralized utility (direct execution or fallback)
-            response = run_command_with_output_handling(
-                command=command,
-                results_dir=results_dir,
-                stdout_preference=stdout_preference,
-                stderr_preference=stderr_preference,
-                cwd=working_dir,
-                env=env,
-                shell=False,
-                class_name=self.__class__.__name__,
-                encoding="utf-8",
-                errors="replace",
-            )
-
-            self._process_command_response(response)
-
-            return response
-
-        except Exception as e:
-            error_msg = f"Error running command {command}: {e}"
-            self.errors.append(error_msg)
-            self._plugin_log(
-                error_msg,
-                level=logging.ERROR,
-            )
-            # show full stack trace in debug
-            ASH_LOGGER.debug(
-                f"({self.config.name}) Full error details: {e}", exc_info=True
-            )
-            self.exit_code = 1
-            return {"error": str(e)}
+        with perf_span(
+            "subprocess",
+            "plugin",
+            plugin=getattr(self.config, "name", None),
+            command=command[0] if command else None,
+        ):
+            try:
+                # Use provided cwd or fall back to context.source_dir
+                working_dir = cwd if cwd is not None else Path(self.context.source_dir)
+
+                # Attempt UV tool execution if enabled
+                if self.use_uv_tool and self.command and len(command) > 0:
+                    # Check if the first element of the command is our tool command
+                    if command[0] == self.command:
+                        uv_result = self._try_uv_tool_execution(
+                            command,
+                            working_dir,
+                            results_dir=Path(results_dir) if results_dir else None,
+                            stdout_preference=stdout_preference,
+                            stderr_preference=stderr_preference,
+                            env=env,
+                        )
+                        if uv_result is not None:
+                            return uv_result
+                        # If UV execution failed, continue with direct execution fallback
+
+                # Run the command using the centralized utility (direct execution or fallback)
+                response = run_command_with_output_handling(
+                    command=command,
+                    results_dir=results_dir,
+                    stdout_preference=stdout_preference,
+                    stderr_preference=stderr_preference,
+                    cwd=working_dir,
+                    env=env,
+                    shell=False,
+                    class_name=self.__class__.__name__,
+                    encoding="utf-8",
+                    errors="replace",
+                )
+
+                self._process_command_response(response)
+
+                return response
+
+            except Exception as e:
+                error_msg = f"Error running command {command}: {e}"
+                self.errors.append(error_msg)
+                self._plugin_log(
+                    error_msg,
+                    level=logging.ERROR,
+                )
+                # show full stack trace in debug
+                ASH_LOGGER.debug(
+                    f"({self.config.name}) Full error details: {e}", exc_info=True
+                )
+                self.exit_code = 1
+                return {"error": str(e)}
 
     def get_installation_commands(self, platform: str, arch: str) -> List[List[str]]:
         """Generate installation commands for the specified platform/architecture as arrays of arguments"""
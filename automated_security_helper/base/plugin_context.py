@@ -1,15 +1,36 @@
 """Module containing the PluginContext class for sharing context between plugins."""
 
 from pathlib import Path
-from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
-from typing import Annotated, TYPE_CHECKING
+from pydantic_core import core_schema
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    PrivateAttr,
+    field_validator,
+    model_validator,
+)
+from typing import Annotated, Any
 
 from automated_security_helper.core.constants import ASH_WORK_DIR_NAME
 from automated_security_helper.plugins.plugin_manager import AshPluginManager
 
-# Import AshConfig only for type checking to avoid circular imports
-if TYPE_CHECKING:
-    from automated_security_helper.config.ash_config import AshConfig
+
+class _AshConfigJsonSchema:
+    """Documents PluginContext.config as AshConfig in JSON schemas.
+
+    The field is typed Any so that plugin schemas leave AshConfig out; building
+    the AshConfig schema imports the config classes of every built-in plugin.
+    validate_config still turns the value into an AshConfig.
+    """
+
+    def __get_pydantic_json_schema__(self, _core_schema, handler):
+        from automated_security_helper.config.ash_config import AshConfig
+
+        # A reference only: PluginContext sits inside AshConfig (through
+        # BuildConfig), so generating AshConfig here would recurse.
+        ash_config_ref = AshConfig.__pydantic_core_schema__["schema"]["ref"]
+        return handler(core_schema.definition_reference_schema(ash_config_ref))
 
 
 class PluginContext(BaseModel):
@@ -24,11 +45,20 @@ class PluginContext(BaseModel):
     work_dir: Annotated[
         Path, Field(description="Working directory for temporary files")
     ] = None
-    config: Annotated["AshConfig", Field(description="ASH configuration")] = None
+    config: Annotated[
+        Any, _AshConfigJsonSchema(), Field(description="ASH configuration")
+    ] = None
     ignore_suppressions: Annotated[
         bool, Field(description="Ignore all suppression rules")
     ] = False
 
+    # Built on first use by utils.inline_suppression_index.
+    _inline_suppression_index: Any = PrivateAttr(default=None)
+    # Union *grep runs keyed by rule digest and target; see utils.stargrep_rules.
+    _shared_rule_runs: Any = PrivateAttr(default=None)
+    # Run-scoped URI memo; see utils.uri_normalizer.
+    _uri_normalizer: Any = PrivateAttr(default=None)
+
     @field_validator("config")
     def validate_config(cls, value):
         from automated_security_helper.config.ash_config import AshConfig
@@ -2,7 +2,8 @@
 
 from abc import abstractmethod
 from datetime import datetime, timezone
-from typing import Annotated, Generic, TypeVar
+from io import StringIO
+from typing import Annotated, ClassVar, Generic, TextIO, TypeVar
 from typing_extensions import Self
 
 from pydantic import Field, model_validator
@@ -33,6 +34,17 @@ class ReporterPluginBase(PluginBase, Generic[T]):
     config: T | ReporterPluginConfigBase | None = None
     dependencies_satisfied: bool = True
 
+    # Reporters that implement report_stream() natively set this so the
+    # report phase writes their output incrementally instead of calling
+    # report() and holding the whole document in memory.
+    supports_streaming: ClassVar[bool] = False
+
+    # Reporters that only read the aggregated results, and keep no state
+    # outside their own instance, set this so the report phase may run them
+    # in parallel with other reporters. Reporters that do not set it always
+    # run on the report phase's own thread.
+    thread_safe: ClassVar[bool] = False
+
     @model_validator(mode="after")
     def setup_paths(self) -> Self:
         """Set up default paths and initialize plugin configuration."""
@@ -77,6 +89,36 @@ class ReporterPluginBase(PluginBase, Generic[T]):
         Defaults to returning True as most reporter plugins are entirely Python based."""
         return self.dependencies_satisfied
 
+    def report_stream(self, model: AshAggregatedResults, fh: TextIO) -> bool:
+        """Write the report for the aggregated results to an open text file.
+
+        Streaming reporters override this to write their output in chunks and
+        set ``supports_streaming``. The default implementation writes the
+        string returned by ``report()``.
+
+        Args:
+            model: The aggregated results to report on
+            fh: Text file handle to write the report to
+
+        Returns:
+            True if a report was written, False if the reporter produced none
+        """
+        content = self.report(model)
+        if not content:
+            return False
+        fh.write(content)
+        return True
+
+    def _report_from_stream(self, model: AshAggregatedResults) -> str:
+        """Render a streaming reporter's output to a string.
+
+        Streaming reporters use this to implement ``report()`` so both entry
+        points produce identical output.
+        """
+        buffer = StringIO()
+        self.report_stream(model, buffer)
+        return buffer.getvalue()
+
     ### Methods that require implementation by plugins.
     @abstractmethod
     def report(self, model: AshAggregatedResults) -> str | None:
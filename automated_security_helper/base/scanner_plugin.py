@@ -6,6 +6,7 @@ from automated_security_helper.base.plugin_base import PluginBase
 from automated_security_helper.base.plugin_config import PluginConfigBase
 from automated_security_helper.core.enums import OfflineStrategy, ScannerToolType
 from automated_security_helper.core.exceptions import ScannerError
+from automated_security_helper.core.perf_profile import perf_span
 from automated_security_helper.models.core import IgnorePathWithReason, ToolArgs
 from automated_security_helper.schemas.cyclonedx_bom_1_6_schema import CycloneDXReport
 from automated_security_helper.schemas.sarif_schema_model import SarifReport
@@ -196,7 +197,12 @@ class ScannerPluginBase(PluginBase, Generic[T]):
         self.start_time = datetime.now(timezone.utc)
         self.results_dir.mkdir(parents=True, exist_ok=True)
 
-        self.dependencies_satisfied = self.validate_plugin_dependencies()
+        with perf_span(
+            "validate_dependencies",
+            "scanner",
+            plugin=getattr(self.config, "name", None),
+        ):
+            self.dependencies_satisfied = self.validate_plugin_dependencies()
 
         if not self.dependencies_satisfied:
             self._plugin_log(
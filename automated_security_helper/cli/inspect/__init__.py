@@ -6,10 +6,16 @@ CLI subcommand for inspecting and analyzing ASH outputs and reports.
 """
 
 import os
+from pathlib import Path
+
 import typer
 
-from automated_security_helper.cli.inspect.inspect_findings_app import findings_command
-from automated_security_helper.utils.sarif_field_analysis import analyze_sarif_fields
+from automated_security_helper.cli.inspect.findings_history import history_command
+from automated_security_helper.utils.results_diff import diff_results
+from automated_security_helper.utils.sarif_field_analysis import (
+    analyze_sarif_fields,
+    validate_aggregation,
+)
 
 inspect_app = typer.Typer(
     name="inspect",
@@ -34,13 +40,59 @@ This command:
 5. Outputs field data in both JSON and CSV formats for further analysis
 """,
 )(analyze_sarif_fields)
+
 inspect_app.command(
+    name="aggregation",
+    help="""
+The `inspect aggregation` command checks that the aggregated SARIF report preserves
+every scanner finding and its critical fields. It exits with code 1 on any loss,
+so it can run as a CI gate after each scan.
+""",
+)(validate_aggregation)
+
+inspect_app.command(
+    name="diff",
+    help="""
+The `inspect diff` command compares an ash_aggregated_results.json file against a
+baseline and lists new, resolved and re-rated findings. It exits with code 2 when
+there are new findings, so it can gate CI on findings introduced by a change.
+""",
+)(diff_results)
+
+inspect_app.command(
+    name="history",
+    help="""
+The `inspect history` command queries the findings history that scans record in the
+output directory. It lists recent scans with new and resolved finding counts, the
+findings that are new or resolved between two scans, or the findings of a scan
+filtered by scanner, rule, file or severity.
+""",
+)(history_command)
+
+
+@inspect_app.command(
     name="findings",
     help="""
 The `inspect findings` command provides an interactive TUI to explore the findings
 and identify actions to quickly take.
 """,
-)(findings_command)
+)
+def _findings_wrapper(
+    output_dir: Path = typer.Option(
+        None,
+        help="Path to the output directory containing an ASH Aggregated Results JSON report file to analyze.",
+    ),
+    report_file: str = typer.Option(
+        "ash_aggregated_results.json",
+        help="Name of the report file to analyze. Defaults to 'ash_aggregated_results.json'.",
+    ),
+):
+    """Lazy wrapper that imports the Textual findings app only when it is used."""
+    from automated_security_helper.cli.inspect.inspect_findings_app import (
+        findings_command,
+    )
+
+    findings_command(output_dir=output_dir, report_file=report_file)
 
 
 if __name__ == "__main__":
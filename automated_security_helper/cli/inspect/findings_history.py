@@ -0,0 +1,176 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""`ash inspect history`: query the findings history recorded by scans."""
+
+import json
+from pathlib import Path
+from typing import Annotated, Any, Dict, List
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+from automated_security_helper.core.findings_history import (
+    FindingsHistory,
+    history_path,
+)
+
+
+def _scan_ref(value: str | None) -> int | str | None:
+    if value is None:
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        return value
+
+
+def _findings_table(title: str, findings: List[Dict[str, Any]]) -> Table:
+    table = Table(title=title)
+    table.add_column("Severity", style="bold")
+    table.add_column("Scanner", style="cyan")
+    table.add_column("Rule")
+    table.add_column("Location")
+    table.add_column("First Seen")
+    for finding in findings:
+        location = finding["file_path"] or ""
+        if location and finding["line_start"] is not None:
+            location = f"{location}:{finding['line_start']}"
+        table.add_row(
+            finding["severity"] + (" (suppressed)" if finding["is_suppressed"] else ""),
+            finding["scanner"] or "",
+            finding["rule_id"] or "",
+            location,
+            finding["first_seen_at"] or "",
+        )
+    return table
+
+
+def history_command(
+    output_dir: Annotated[
+        str,
+        typer.Option(
+            help="ASH output directory the history was recorded in",
+            envvar="ASH_OUTPUT_DIR",
+        ),
+    ] = None,
+    scan: Annotated[
+        str,
+        typer.Option(
+            help="Scan to query: sequence number, report id or generation time. Negative numbers count back from the latest scan. Defaults to the latest scan",
+        ),
+    ] = None,
+    baseline: Annotated[
+        str,
+        typer.Option(
+            help="Scan to compare against for --new and --resolved. Defaults to the scan before --scan",
+        ),
+    ] = None,
+    new: Annotated[
+        bool,
+        typer.Option("--new", help="List findings that are new since the baseline"),
+    ] = False,
+    resolved: Annotated[
+        bool,
+        typer.Option(
+            "--resolved",
+            help="List findings of the baseline that are no longer reported",
+        ),
+    ] = False,
+    scanner: Annotated[
+        str, typer.Option(help="Only list findings of this scanner")
+    ] = None,
+    rule: Annotated[str, typer.Option(help="Only list findings of this rule")] = None,
+    file: Annotated[str, typer.Option(help="Only list findings in this file")] = None,
+    severity: Annotated[
+        str, typer.Option(help="Only list findings with this severity")
+    ] = None,
+    limit: Annotated[
+        int, typer.Option(help="Maximum number of scans or findings to list", min=1)
+    ] = 20,
+    output_json: Annotated[
+        bool,
+        typer.Option("--json", help="Print the results as JSON"),
+    ] = False,
+):
+    """
+    Query the findings history recorded across scans.
+
+    Without options, lists recent scans with their finding counts and the
+    number of new and resolved findings. --new and --resolved compare two
+    scans; --scanner, --rule, --file and --severity list the findings of a
+    scan.
+    """
+    console = Console()
+    if output_dir is None:
+        output_dir = Path.cwd().joinpath(".ash", "ash_output")
+
+    history = FindingsHistory.open_existing(output_dir)
+    if history is None:
+        console.print(
+            f"[bold red]No findings history found at {history_path(output_dir)}[/bold red]"
+        )
+        raise typer.Exit(code=1)
+
+    with history:
+        scan_ref = _scan_ref(scan)
+        baseline_ref = _scan_ref(baseline)
+        if new or resolved:
+            query = history.new_findings if new else history.resolved_findings
+            title = "New Findings" if new else "Resolved Findings"
+            findings = [
+                f
+                for f in query(scan=scan_ref, baseline=baseline_ref)
+                if (scanner is None or f["scanner"] == scanner)
+                and (rule is None or f["rule_id"] == rule)
+                and (file is None or f["file_path"] == file)
+                and (severity is None or f["severity"] == severity.upper())
+            ][:limit]
+            payload: Any = findings
+        elif any(value is not None for value in (scanner, rule, file, severity)):
+            title = "Findings"
+            findings = history.findings(
+                scan=scan_ref,
+                scanner=scanner,
+                rule_id=rule,
+                file_path=file,
+                severity=severity,
+                limit=limit,
+            )
+            payload = findings
+        else:
+            scans = history.trend(limit)
+            for entry in scans:
+                entry["new"] = len(history.new_findings(scan=entry["seq"]))
+                entry["resolved"] = len(history.resolved_findings(scan=entry["seq"]))
+            if output_json:
+                typer.echo(json.dumps(scans, indent=2))
+                return scans
+            table = Table(title="Findings History")
+            table.add_column("Scan", justify="right")
+            table.add_column("Generated At")
+            table.add_column("Findings", justify="right")
+            table.add_column("New", justify="right")
+            table.add_column("Resolved", justify="right")
+            table.add_column("Unsuppressed by Severity")
+            for entry in scans:
+                table.add_row(
+                    str(entry["seq"]),
+                    entry["generated_at"],
+                    str(entry["finding_count"]),
+                    str(entry["new"]),
+                    str(entry["resolved"]),
+                    ", ".join(
+                        f"{name}: {count}"
+                        for name, count in sorted(entry["severity_counts"].items())
+                    ),
+                )
+            console.print(table)
+            return scans
+
+    if output_json:
+        typer.echo(json.dumps(payload, indent=2))
+    else:
+        console.print(_findings_table(title, findings))
+    return payload
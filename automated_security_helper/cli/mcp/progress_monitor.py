@@ -6,7 +6,6 @@ Background scan-progress monitor for the ASH MCP server.
 """
 
 import asyncio
-import json
 from pathlib import Path
 
 from mcp.server.mcpserver import Context
@@ -15,6 +14,10 @@ from automated_security_helper.cli.mcp_tools import (
     mcp_get_scan_progress,
     mcp_get_scan_results,
 )
+from automated_security_helper.core.resource_management.scan_events import (
+    ScanEventProgress,
+    ScanEventTailer,
+)
 from automated_security_helper.utils.log import ASH_LOGGER
 
 logger = ASH_LOGGER
@@ -50,8 +53,12 @@ async def monitor_scan_progress(ctx: Context, scan_id: str) -> None:
         output_dir = directory_path_obj / ".ash" / "ash_output"
         ash_aggregated_results = output_dir / "ash_aggregated_results.json"
 
-        completed_scanners: set = set()
-        total_scanners_estimate = 5
+        # Progress comes from the structured event stream the scan writes to
+        # its output directory; each tick only reads events appended since
+        # the previous one, so polling stays cheap and can run frequently.
+        tailer = ScanEventTailer(output_dir)
+        event_progress = ScanEventProgress()
+        poll_interval = 1
         last_progress_time = asyncio.get_event_loop().time()
         heartbeat_interval = 15
         max_wait_time = 1800
@@ -77,7 +84,7 @@ async def monitor_scan_progress(ctx: Context, scan_id: str) -> None:
                 )
                 return
 
-            if ash_aggregated_results.exists():
+            if event_progress.finished or ash_aggregated_results.exists():
                 completed = True
 
                 try:
@@ -145,104 +152,65 @@ async def monitor_scan_progress(ctx: Context, scan_id: str) -> None:
 
                 return
 
-            scanner_results = list(output_dir.glob("scanners/**/ASH.ScanResults.json"))
-
-            if len(scanner_results) > 0:
-                scanner_dirs = set(path.parent.parent.name for path in scanner_results)
-                total_scanners_estimate = max(
-                    total_scanners_estimate, len(scanner_dirs) * 2
-                )
-
             progress_updated = False
-            for result_path in scanner_results:
-                scanner_name = result_path.parent.parent.name
-                target_type = result_path.parent.name
-                scanner_key = f"{scanner_name}/{target_type}"
-
-                if scanner_key not in completed_scanners:
-                    completed_scanners.add(scanner_key)
-                    progress_updated = True
-
-                    try:
-                        with open(result_path, "r") as f:
-                            scanner_data = json.load(f)
+            for event in tailer.read_new_events():
+                event_progress.apply(event)
+                if event.get("event") != "SCAN_COMPLETE" or not event.get("scanner"):
+                    continue
+
+                progress_updated = True
+                scanner_name = event["scanner"]
+                severity_counts = event.get("severity_counts") or {}
+                findings_summary = ", ".join(
+                    f"{count} {severity.lower()}"
+                    for severity, count in severity_counts.items()
+                    if count and severity.lower() != "suppressed"
+                )
+                if findings_summary:
+                    message = f"{scanner_name} completed: {findings_summary}"
+                else:
+                    message = f"{scanner_name} completed: No issues found"
 
-                        severity_counts = scanner_data.get("severity_counts", {})
-                        finding_count = sum(severity_counts.values())
+                try:
+                    if connection_alive:
+                        await ctx.report_progress(
+                            progress=event_progress.progress,
+                            total=1.0,
+                            message=message,
+                        )
+                        last_progress_time = current_time
+                except Exception as e:
+                    logger.debug(f"Failed to send progress update: {str(e)}")
+                    connection_alive = False
 
-                        if finding_count > 0:
-                            findings_summary = ", ".join(
-                                f"{count} {severity.lower()}"
-                                for severity, count in severity_counts.items()
-                                if count > 0
-                            )
-                            message = f"{scanner_name} completed {target_type} scan: {findings_summary}"
-                        else:
-                            message = f"{scanner_name} completed {target_type} scan: No issues found"
-
-                        progress = len(completed_scanners) / total_scanners_estimate
-                        progress = min(progress, 0.95)
-
-                        try:
-                            if connection_alive:
-                                await ctx.report_progress(
-                                    progress=progress,
-                                    total=1.0,
-                                    message=message,
-                                )
-                                last_progress_time = current_time
-                        except Exception as e:
-                            logger.debug(f"Failed to send progress update: {str(e)}")
-                            connection_alive = False
-
-                        try:
-                            if connection_alive:
-                                await ctx.debug(
-                                    f"Scanner progress: {scanner_name}/{target_type} - {int(progress * 100)}%"
-                                )
-                        except Exception as e:
-                            logger.debug(f"Failed to send debug message: {str(e)}")
-                            connection_alive = False
-                    except asyncio.CancelledError:
-                        raise
-                    except Exception as e:
-                        logger.warning(
-                            f"Error processing scanner results for {scanner_name}/{target_type}: {str(e)}"
+                try:
+                    if connection_alive:
+                        await ctx.debug(
+                            f"Scanner progress: {scanner_name} - {int(event_progress.progress * 100)}%"
                         )
-                        try:
-                            if connection_alive:
-                                await ctx.warning(
-                                    f"Error processing scanner results for {scanner_name}/{target_type}: {str(e)}"
-                                )
-                        except Exception as e:
-                            logger.debug(f"Failed to send warning message: {str(e)}")
-                            connection_alive = False
+                except Exception as e:
+                    logger.debug(f"Failed to send debug message: {str(e)}")
+                    connection_alive = False
 
             if (
                 not progress_updated
                 and connection_alive
                 and (current_time - last_progress_time) >= heartbeat_interval
             ):
-                progress = len(completed_scanners) / max(total_scanners_estimate, 1)
-                progress = min(progress, 0.95)
-
+                completed_count = len(event_progress.completed_scanners)
+                total_count = event_progress.total_scanners or "?"
                 try:
                     await ctx.report_progress(
-                        progress=progress,
+                        progress=event_progress.progress,
                         total=1.0,
-                        message=f"Scan in progress ({len(completed_scanners)}/{total_scanners_estimate} scanners completed)",
+                        message=f"Scan in progress ({completed_count}/{total_count} scanners completed)",
                     )
                     last_progress_time = current_time
                 except Exception as e:
                     logger.debug(f"Failed to send heartbeat: {str(e)}")
                     connection_alive = False
 
-            if len(completed_scanners) == 0:
-                await asyncio.sleep(5)
-            elif len(completed_scanners) < 2:
-                await asyncio.sleep(8)
-            else:
-                await asyncio.sleep(10)
+            await asyncio.sleep(poll_interval)
 
     except asyncio.CancelledError:
         logger.info(f"Scan monitoring cancelled for scan_id: {scan_id}")
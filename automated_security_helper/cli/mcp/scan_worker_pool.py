@@ -0,0 +1,453 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Warm scan worker pool for the ASH MCP server.
+
+Each worker is a long-lived child process that has already imported ASH,
+loaded the built-in plugins, built a default ``AshConfig`` and probed the
+scanner executables before it is handed a scan. Dispatching a scan to a warm
+worker skips that start-up work, so repeated agent-driven scans begin almost
+immediately. The scan itself still builds its own orchestrator and loads any
+scanner rule packs, so only process-level start-up is amortized.
+
+Every worker runs one scan at a time in its own process, so a scanner that
+leaks state or crashes cannot affect the MCP server or other scans. Workers
+are retired and replaced after ``max_scans_per_worker`` scans so long-running
+servers do not accumulate state across many scans. A scan that does not finish
+within ``scan_timeout`` seconds has its worker terminated and replaced, and
+so does a worker that has not finished warming up within ``warm_up_timeout``
+seconds when a scan is dispatched to it.
+
+The pool is opt-in: set ``ASH_MCP_WARM_WORKERS`` to the number of workers to
+keep running, and optionally ``ASH_MCP_WORKER_MAX_SCANS`` to change how many
+scans a worker runs before it is recycled. ``ASH_MCP_WORKER_SCAN_TIMEOUT`` and
+``ASH_MCP_WORKER_WARM_UP_TIMEOUT`` change how many seconds a scan may run, and
+how long a scan waits for its worker to warm up, before the worker is
+terminated.
+"""
+
+import asyncio
+import importlib
+import multiprocessing
+import os
+import threading
+import traceback
+from typing import Any, Callable, Dict, List, Optional
+
+from automated_security_helper.utils.log import ASH_LOGGER
+
+logger = ASH_LOGGER
+
+DEFAULT_SCAN_TARGET = "automated_security_helper.interactions.run_ash_scan:run_ash_scan"
+DEFAULT_MAX_SCANS_PER_WORKER = 10
+DEFAULT_SCAN_TIMEOUT = 3600.0
+DEFAULT_WARM_UP_TIMEOUT = 300.0
+
+
+def _resolve_target(target: str) -> Callable[..., Any]:
+    """Resolve a ``module:function`` reference to a callable."""
+    module_name, _, func_name = target.partition(":")
+    # nosemgrep: python.lang.security.audit.non-literal-import.non-literal-import
+    module = importlib.import_module(module_name)
+    return getattr(module, func_name)
+
+
+def _warm_up() -> None:
+    """Do the per-process start-up work a scan would otherwise pay for."""
+    from automated_security_helper.config.ash_config import AshConfig
+    from automated_security_helper.plugins import ash_plugin_manager
+    from automated_security_helper.plugins.loader import load_internal_plugins
+    from automated_security_helper.utils.subprocess_utils import find_executable
+
+    load_internal_plugins()
+    AshConfig(project_name="ASH Warm Worker")
+
+    # find_executable caches per process, so probing here means scans in this
+    # worker resolve their tool paths from memory.
+    for scanner_class in ash_plugin_manager.plugin_modules("scanner"):
+        command_field = getattr(scanner_class, "model_fields", {}).get("command")
+        command = getattr(command_field, "default", None)
+        if isinstance(command, str) and command:
+            find_executable(command)
+
+
+def _scan_worker_main(conn, scan_target: str, warm_up: bool) -> None:
+    """Entry point of a worker process.
+
+    Receives scan keyword arguments over ``conn`` and replies with a result
+    dictionary for each. A ``None`` message tells the worker to exit.
+    """
+    try:
+        if warm_up:
+            _warm_up()
+        scan_fn = _resolve_target(scan_target)
+    except Exception as e:
+        conn.send({"ready": False, "error": f"Worker warm-up failed: {str(e)}"})
+        conn.close()
+        return
+
+    conn.send({"ready": True, "pid": os.getpid()})
+
+    while True:
+        try:
+            request = conn.recv()
+        except EOFError:
+            break
+        if request is None:
+            break
+
+        try:
+            result = scan_fn(**request)
+            conn.send({"success": True, "result": _to_picklable(result)})
+        except BaseException as e:
+            conn.send(
+                {
+                    "success": False,
+                    "error": str(e),
+                    "error_type": type(e).__name__,
+                    "stack_trace": traceback.format_exc(),
+                }
+            )
+    conn.close()
+
+
+def _to_picklable(result: Any) -> Any:
+    """Return a lightweight, picklable summary of a scan result.
+
+    The full ``AshAggregatedResults`` is already written to the output
+    directory, so there is no reason to ship it back over the pipe.
+    """
+    if result is None or isinstance(result, (str, int, float, bool, dict, list)):
+        return result
+    return type(result).__name__
+
+
+class ScanWorker:
+    """A single warm worker process and its end of the request pipe."""
+
+    def __init__(self, mp_context, scan_target: str, warm_up: bool = True):
+        """
+        Start a worker process.
+
+        Args:
+            mp_context: Multiprocessing context used to start the process
+            scan_target: ``module:function`` the worker calls for each scan
+            warm_up: Whether to pre-load plugins and tool probes on start
+        """
+        self.conn, child_conn = mp_context.Pipe()
+        self.process = mp_context.Process(
+            target=_scan_worker_main,
+            args=(child_conn, scan_target, warm_up),
+            daemon=True,
+        )
+        self.process.start()
+        child_conn.close()
+        self.scans_completed = 0
+        self._ready: Optional[bool] = None
+
+    @property
+    def pid(self) -> Optional[int]:
+        """Process ID of the worker."""
+        return self.process.pid
+
+    def wait_ready(self, timeout: Optional[float] = None) -> bool:
+        """Block until the worker has finished warming up.
+
+        Returns:
+            True if the worker is ready to accept scans
+        """
+        if self._ready is None:
+            if not self.conn.poll(timeout):
+                return False
+            try:
+                message = self.conn.recv()
+            except EOFError:
+                message = {"ready": False, "error": "Worker exited during warm-up"}
+            self._ready = bool(message.get("ready"))
+            if not self._ready:
+                logger.warning(message.get("error", "Scan worker failed to start"))
+        return self._ready
+
+    def run(
+        self,
+        scan_kwargs: Dict[str, Any],
+        timeout: Optional[float] = None,
+        ready_timeout: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """Run one scan in the worker and wait for its result.
+
+        Args:
+            scan_kwargs: Keyword arguments for the scan target
+            timeout: Seconds to wait for the scan, or None to wait indefinitely.
+                On timeout the worker process is terminated.
+            ready_timeout: Seconds to wait for the worker to finish warming
+                up, or None to wait indefinitely. If the worker is not ready
+                in time, or failed to warm up, it is terminated.
+
+        Returns:
+            Dictionary with success flag and either result or error details
+        """
+        if not self.wait_ready(ready_timeout):
+            timed_out = self._ready is None
+            self.terminate()
+            if timed_out:
+                return {
+                    "success": False,
+                    "error": f"Scan worker did not warm up within {ready_timeout} seconds",
+                    "error_type": "TimeoutError",
+                }
+            return {"success": False, "error": "Scan worker is not available"}
+        try:
+            self.conn.send(scan_kwargs)
+            if not self.conn.poll(timeout):
+                self.terminate()
+                return {
+                    "success": False,
+                    "error": f"Scan did not finish within {timeout} seconds",
+                    "error_type": "TimeoutError",
+                }
+            result = self.conn.recv()
+        except (EOFError, OSError, BrokenPipeError) as e:
+            return {
+                "success": False,
+                "error": f"Scan worker exited unexpectedly: {str(e)}",
+                "error_type": type(e).__name__,
+            }
+        self.scans_completed += 1
+        return result
+
+    def is_alive(self) -> bool:
+        """Check whether the worker process is still running."""
+        return self.process.is_alive()
+
+    def terminate(self, timeout: float = 5.0) -> None:
+        """Kill the worker process without waiting for its current scan."""
+        self.process.terminate()
+        self.process.join(timeout)
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join(timeout)
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Ask the worker to exit, terminating it if it does not."""
+        try:
+            self.conn.send(None)
+        except (OSError, BrokenPipeError):
+            pass
+        self.process.join(timeout)
+        if self.process.is_alive():
+            self.process.terminate()
+            self.process.join(timeout)
+        self.conn.close()
+
+
+class ScanWorkerPool:
+    """
+    Pool of warm scan workers.
+
+    Workers are started eagerly and kept idle until a scan is dispatched with
+    ``run_scan``. A worker that has run ``max_scans_per_worker`` scans, or
+    whose process has died, is stopped and replaced by a freshly started one.
+    A worker whose scan exceeds ``scan_timeout`` is terminated and replaced
+    the same way.
+    """
+
+    def __init__(
+        self,
+        size: int = 1,
+        max_scans_per_worker: int = DEFAULT_MAX_SCANS_PER_WORKER,
+        scan_target: str = DEFAULT_SCAN_TARGET,
+        warm_up: bool = True,
+        start_method: str = "spawn",
+        scan_timeout: Optional[float] = DEFAULT_SCAN_TIMEOUT,
+        warm_up_timeout: Optional[float] = DEFAULT_WARM_UP_TIMEOUT,
+    ):
+        """
+        Initialize the pool and start its workers.
+
+        Args:
+            size: Number of workers to keep running
+            max_scans_per_worker: Scans a worker runs before it is recycled
+            scan_target: ``module:function`` workers call for each scan
+            warm_up: Whether workers pre-load plugins and tool probes
+            start_method: Multiprocessing start method for worker processes
+            scan_timeout: Seconds a scan may run before its worker is
+                terminated, or None to wait indefinitely
+            warm_up_timeout: Seconds a scan waits for its worker to finish
+                warming up before the worker is terminated, or None to wait
+                indefinitely
+        """
+        if size < 1:
+            raise ValueError("Scan worker pool size must be at least 1")
+        if max_scans_per_worker < 1:
+            raise ValueError("max_scans_per_worker must be at least 1")
+        if scan_timeout is not None and scan_timeout <= 0:
+            raise ValueError("scan_timeout must be greater than 0")
+        if warm_up_timeout is not None and warm_up_timeout <= 0:
+            raise ValueError("warm_up_timeout must be greater than 0")
+
+        self.size = size
+        self.max_scans_per_worker = max_scans_per_worker
+        self.scan_target = scan_target
+        self.warm_up = warm_up
+        self.scan_timeout = scan_timeout
+        self.warm_up_timeout = warm_up_timeout
+        self._mp_context = multiprocessing.get_context(start_method)
+        self._lock = threading.Lock()
+        self._idle: List[ScanWorker] = [self._start_worker() for _ in range(size)]
+        self._busy: List[ScanWorker] = []
+        self._available = threading.Semaphore(size)
+        self._closed = False
+
+    def _start_worker(self) -> ScanWorker:
+        return ScanWorker(self._mp_context, self.scan_target, warm_up=self.warm_up)
+
+    def _acquire(self) -> ScanWorker:
+        self._available.acquire()
+        with self._lock:
+            worker = self._idle.pop(0)
+            if not worker.is_alive():
+                worker.stop()
+                worker = self._start_worker()
+            self._busy.append(worker)
+            return worker
+
+    def _release(self, worker: ScanWorker) -> None:
+        with self._lock:
+            self._busy.remove(worker)
+            if self._closed:
+                worker.stop()
+            elif (
+                worker.scans_completed >= self.max_scans_per_worker
+                or not worker.is_alive()
+            ):
+                logger.debug(
+                    f"Recycling scan worker {worker.pid} after {worker.scans_completed} scans"
+                )
+                worker.stop()
+                self._idle.append(self._start_worker())
+            else:
+                self._idle.append(worker)
+        self._available.release()
+
+    def run_scan_sync(self, **scan_kwargs: Any) -> Dict[str, Any]:
+        """
+        Run a scan on a warm worker, blocking until it finishes.
+
+        Args:
+            **scan_kwargs: Keyword arguments for the scan target
+
+        Returns:
+            Dictionary with success flag and either result or error details
+        """
+        if self._closed:
+            raise RuntimeError("Scan worker pool has been shut down")
+        worker = self._acquire()
+        try:
+            result = worker.run(
+                scan_kwargs,
+                timeout=self.scan_timeout,
+                ready_timeout=self.warm_up_timeout,
+            )
+            result["worker_pid"] = worker.pid
+            return result
+        finally:
+            self._release(worker)
+
+    async def run_scan(self, **scan_kwargs: Any) -> Dict[str, Any]:
+        """
+        Run a scan on a warm worker without blocking the event loop.
+
+        Args:
+            **scan_kwargs: Keyword arguments for the scan target
+
+        Returns:
+            Dictionary with success flag and either result or error details
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, lambda: self.run_scan_sync(**scan_kwargs)
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        """Get a snapshot of the pool state."""
+        with self._lock:
+            return {
+                "size": self.size,
+                "idle_workers": len(self._idle),
+                "busy_workers": len(self._busy),
+                "max_scans_per_worker": self.max_scans_per_worker,
+                "scan_timeout": self.scan_timeout,
+                "warm_up_timeout": self.warm_up_timeout,
+                "worker_pids": [w.pid for w in self._idle + self._busy],
+            }
+
+    def shutdown(self) -> None:
+        """Stop all idle workers; busy workers stop when their scan finishes."""
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, []
+        for worker in idle:
+            worker.stop()
+
+
+_scan_worker_pool: Optional[ScanWorkerPool] = None
+_scan_worker_pool_lock = threading.Lock()
+
+
+def get_scan_worker_pool() -> Optional[ScanWorkerPool]:
+    """
+    Get the process-wide warm worker pool, creating it on first use.
+
+    Returns:
+        The pool, or None if ``ASH_MCP_WARM_WORKERS`` is unset or zero
+    """
+    global _scan_worker_pool
+
+    try:
+        size = int(os.environ.get("ASH_MCP_WARM_WORKERS", "0") or 0)
+        max_scans = int(
+            os.environ.get(
+                "ASH_MCP_WORKER_MAX_SCANS", str(DEFAULT_MAX_SCANS_PER_WORKER)
+            )
+        )
+        scan_timeout = float(
+            os.environ.get("ASH_MCP_WORKER_SCAN_TIMEOUT", str(DEFAULT_SCAN_TIMEOUT))
+        )
+        warm_up_timeout = float(
+            os.environ.get(
+                "ASH_MCP_WORKER_WARM_UP_TIMEOUT", str(DEFAULT_WARM_UP_TIMEOUT)
+            )
+        )
+    except ValueError:
+        logger.warning(
+            "Ignoring invalid ASH_MCP_WARM_WORKERS/ASH_MCP_WORKER_MAX_SCANS/"
+            "ASH_MCP_WORKER_SCAN_TIMEOUT/ASH_MCP_WORKER_WARM_UP_TIMEOUT value"
+        )
+        return None
+    if size <= 0:
+        return None
+
+    with _scan_worker_pool_lock:
+        if _scan_worker_pool is None:
+            logger.info(
+                f"Starting {size} warm scan worker(s), recycled every {max_scans} scans"
+            )
+            _scan_worker_pool = ScanWorkerPool(
+                size=size,
+                max_scans_per_worker=max(max_scans, 1),
+                scan_timeout=scan_timeout if scan_timeout > 0 else None,
+                warm_up_timeout=warm_up_timeout if warm_up_timeout > 0 else None,
+            )
+        return _scan_worker_pool
+
+
+def shutdown_scan_worker_pool() -> None:
+    """Shut down the process-wide warm worker pool if it was started."""
+    global _scan_worker_pool
+
+    with _scan_worker_pool_lock:
+        if _scan_worker_pool is not None:
+            _scan_worker_pool.shutdown()
+            _scan_worker_pool = None
@@ -27,6 +27,7 @@ from automated_security_helper.cli.mcp_tools import (
     mcp_get_config,
     mcp_list_scanners,
     mcp_diff_scan_results,
+    mcp_get_findings_history,
     mcp_validate_config,
     mcp_explain_finding,
     mcp_suggest_suppression,
@@ -44,6 +45,10 @@ from automated_security_helper.core.resource_management.result_filters import (
     add_findings_list,
 )
 from automated_security_helper.cli.mcp.progress_monitor import monitor_scan_progress
+from automated_security_helper.cli.mcp.scan_worker_pool import (
+    get_scan_worker_pool,
+    shutdown_scan_worker_pool,
+)
 from automated_security_helper.utils.log import ASH_LOGGER
 
 logger = ASH_LOGGER
@@ -695,6 +700,54 @@ async def diff_scan_results(
         }
 
 
+@mcp.tool()
+async def get_findings_history(
+    output_dir: Optional[str] = None,
+    view: str = "scans",
+    scan: Optional[str] = None,
+    baseline: Optional[str] = None,
+    scanner: Optional[str] = None,
+    rule_id: Optional[str] = None,
+    file_path: Optional[str] = None,
+    severity: Optional[str] = None,
+    limit: int = 50,
+) -> Dict[str, Any]:
+    """Query the findings history recorded across scans.
+
+    Args:
+        output_dir: ASH output directory. Defaults to .ash/ash_output.
+        view: "scans" (recent scans with severity counts), "new" or "resolved"
+            (findings that changed between baseline and scan), or "findings"
+            (findings of a scan, filtered by scanner, rule_id, file_path, severity).
+        scan: Scan sequence number, report id or generation time. Negative numbers
+            count back from the latest scan. Defaults to the latest scan.
+        baseline: Scan to compare against. Defaults to the scan before scan.
+        limit: Maximum number of items to return.
+
+    Returns:
+        Dict with keys view and items.
+    """
+    try:
+        return mcp_get_findings_history(
+            output_dir=output_dir,
+            view=view,
+            scan=scan,
+            baseline=baseline,
+            scanner=scanner,
+            rule_id=rule_id,
+            file_path=file_path,
+            severity=severity,
+            limit=limit,
+        )
+    except Exception as e:
+        logger.exception(f"Error in get_findings_history: {str(e)}")
+        return {
+            "success": False,
+            "error": f"Error querying findings history: {str(e)}",
+            "error_type": type(e).__name__,
+        }
+
+
 @mcp.tool()
 def validate_config(
     config_content: Optional[str] = None,
@@ -906,6 +959,8 @@ Focus on actionable insights and practical remediation steps."""
 def run_mcp_server():
     """Run the MCP server with improved error handling."""
     try:
+        # Start warm scan workers (if enabled) before the first request arrives.
+        get_scan_worker_pool()
         mcp.run()
     except KeyboardInterrupt:
         logger.info("MCP server stopped by user")
@@ -918,6 +973,8 @@ def run_mcp_server():
             )
         else:
             logger.exception(f"Error running MCP server: {error_str}")
+    finally:
+        shutdown_scan_worker_pool()
 
 
 if __name__ == "__main__":
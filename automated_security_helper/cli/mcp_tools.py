@@ -16,6 +16,7 @@ from datetime import datetime
 from pathlib import Path
 from typing import Dict, Optional, Any
 
+from automated_security_helper.cli.mcp.scan_worker_pool import get_scan_worker_pool
 from automated_security_helper.core.resource_management.scan_registry import (
     get_scan_registry,
     MCScanStatus,
@@ -219,21 +220,31 @@ async def _run_scan_async(
         f"Starting scan process for scan {scan_id} in directory {directory_path}"
     )
 
+    scan_kwargs = dict(
+        source_dir=directory_path,
+        output_dir=output_dir,
+        config=config_path,
+        mode=RunMode.local,
+        log_level=AshLogLevel.INFO,
+        fail_on_findings=False,  # Don't exit on findings
+        show_summary=False,  # Don't show summary
+    )
+
     try:
-        # Create a task to run the scan in a separate thread to avoid blocking
-        loop = asyncio.get_event_loop()
-        await loop.run_in_executor(
-            None,
-            lambda: run_ash_scan(
-                source_dir=directory_path,
-                output_dir=output_dir,
-                config=config_path,
-                mode=RunMode.local,
-                log_level=AshLogLevel.INFO,
-                fail_on_findings=False,  # Don't exit on findings
-                show_summary=False,  # Don't show summary
-            ),
-        )
+        worker_pool = get_scan_worker_pool()
+        if worker_pool is not None:
+            # Dispatch to a pre-initialized worker process so the scan skips
+            # plugin loading and tool probing.
+            worker_result = await worker_pool.run_scan(**scan_kwargs)
+            if not worker_result.get("success", False):
+                raise RuntimeError(worker_result.get("error", "Unknown worker error"))
+        else:
+            # Create a task to run the scan in a separate thread to avoid blocking
+            loop = asyncio.get_event_loop()
+            await loop.run_in_executor(
+                None,
+                lambda: run_ash_scan(**scan_kwargs),
+            )
 
         # Update scan status based on result
         registry.update_scan_status(scan_id, MCScanStatus.COMPLETED)
@@ -680,7 +691,7 @@ def mcp_diff_scan_results(before_path: str, after_path: str) -> Dict[str, Any]:
             each entry has {id, before_severity, after_severity}.
         On error, returns {"success": False, "error": <message>}.
     """
-    from automated_security_helper.models.asharp_model import AshAggregatedResults
+    from automated_security_helper.utils.results_diff import diff_results_files
 
     before_file = Path(before_path)
     after_file = Path(after_path)
@@ -697,36 +708,92 @@ def mcp_diff_scan_results(before_path: str, after_path: str) -> Dict[str, Any]:
         }
 
     try:
-        before_results = AshAggregatedResults.from_json(before_file.read_text())
-        after_results = AshAggregatedResults.from_json(after_file.read_text())
+        diff = diff_results_files(before_file, after_file)
     except Exception as e:
         return {
             "success": False,
             "error": f"Failed to parse result file: {e}",
         }
 
-    before_vulns = before_results.to_flat_vulnerabilities()
-    after_vulns = after_results.to_flat_vulnerabilities()
+    # Only the changed findings are built in full.
+    return {
+        "new": [v.model_dump() for v in diff.new_findings()],
+        "resolved": [v.model_dump() for v in diff.resolved_findings()],
+        "severity_changed": diff.severity_changed,
+    }
 
-    before_by_id: Dict[str, Any] = {v.id: v for v in before_vulns}
-    after_by_id: Dict[str, Any] = {v.id: v for v in after_vulns}
 
-    before_ids = set(before_by_id)
-    after_ids = set(after_by_id)
+def mcp_get_findings_history(
+    output_dir: Optional[str] = None,
+    view: str = "scans",
+    scan: Optional[str] = None,
+    baseline: Optional[str] = None,
+    scanner: Optional[str] = None,
+    rule_id: Optional[str] = None,
+    file_path: Optional[str] = None,
+    severity: Optional[str] = None,
+    limit: int = 50,
+) -> Dict[str, Any]:
+    """Query the findings history recorded by scans in an output directory.
 
-    new = [after_by_id[i].model_dump() for i in sorted(after_ids - before_ids)]
-    resolved = [before_by_id[i].model_dump() for i in sorted(before_ids - after_ids)]
+    Args:
+        output_dir: ASH output directory. Defaults to <cwd>/.ash/ash_output.
+        view: "scans" for recent scans with severity counts, "new" or
+            "resolved" for findings that changed between ``baseline`` and
+            ``scan``, or "findings" for the findings of ``scan``.
+        scan: Sequence number, report id or generation time of a scan.
+            Negative numbers count back from the latest scan. Defaults to
+            the latest scan.
+        baseline: Scan to compare against. Defaults to the scan before ``scan``.
+        scanner, rule_id, file_path, severity: Filters for the "findings" view.
+        limit: Maximum number of scans or findings to return.
 
-    severity_changed = []
-    for vid in sorted(before_ids & after_ids):
-        b_sev = (before_by_id[vid].severity or "").upper()
-        a_sev = (after_by_id[vid].severity or "").upper()
-        if b_sev != a_sev:
-            severity_changed.append(
-                {"id": vid, "before_severity": b_sev or None, "after_severity": a_sev or None}
-            )
+    Returns:
+        Dict with the ``view`` and its ``items``.
+        On error, returns {"success": False, "error": <message>}.
+    """
+    from automated_security_helper.core.findings_history import (
+        FindingsHistory,
+        history_path,
+    )
+
+    if output_dir is None:
+        output_dir = str(Path.cwd() / ".ash" / "ash_output")
+    if view not in ("scans", "new", "resolved", "findings"):
+        return {"success": False, "error": f"Unknown view: {view}"}
 
-    return {"new": new, "resolved": resolved, "severity_changed": severity_changed}
+    history = FindingsHistory.open_existing(output_dir)
+    if history is None:
+        return {
+            "success": False,
+            "error": f"No findings history found at {history_path(output_dir)}",
+        }
+
+    scan_ref = int(scan) if scan is not None and scan.lstrip("-").isdigit() else scan
+    baseline_ref = (
+        int(baseline)
+        if baseline is not None and baseline.lstrip("-").isdigit()
+        else baseline
+    )
+    with history:
+        if view == "scans":
+            items = history.trend(limit)
+        elif view == "new":
+            items = history.new_findings(scan=scan_ref, baseline=baseline_ref)[:limit]
+        elif view == "resolved":
+            items = history.resolved_findings(scan=scan_ref, baseline=baseline_ref)[
+                :limit
+            ]
+        else:
+            items = history.findings(
+                scan=scan_ref,
+                scanner=scanner,
+                rule_id=rule_id,
+                file_path=file_path,
+                severity=severity,
+                limit=limit,
+            )
+    return {"view": view, "items": items}
 
 
 def mcp_list_scanners() -> list:
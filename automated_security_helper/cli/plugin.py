@@ -17,6 +17,7 @@ from rich.table import Table
 from automated_security_helper.base.plugin_context import PluginContext
 from automated_security_helper.config.resolve_config import find_config_file, resolve_config
 from automated_security_helper.core.constants import ASH_CONFIG_FILE_NAMES
+from automated_security_helper.plugins import ash_plugin_manager
 from automated_security_helper.plugins.loader import load_plugins
 from automated_security_helper.utils.log import get_logger
 
@@ -105,14 +106,14 @@ def list_plugins(
             config=ash_config,
         )
 
-        # Load all plugins
-        loaded_plugins = load_plugins(plugin_context=plugin_context)
+        # Register all plugins, then import them to build the tables
+        load_plugins(plugin_context=plugin_context)
 
         # Create tables for each plugin type
         plugin_types = {
-            "scanners": loaded_plugins.get("scanners", []),
-            "converters": loaded_plugins.get("converters", []),
-            "reporters": loaded_plugins.get("reporters", []),
+            "scanners": ash_plugin_manager.plugin_modules("scanner"),
+            "converters": ash_plugin_manager.plugin_modules("converter"),
+            "reporters": ash_plugin_manager.plugin_modules("reporter"),
         }
 
         for plugin_type, plugin_list in plugin_types.items():
@@ -12,6 +12,10 @@ from automated_security_helper.base.plugin_context import PluginContext
 from automated_security_helper.config.resolve_config import resolve_config
 from automated_security_helper.core.constants import ASH_CONFIG_FILE_NAMES
 from automated_security_helper.core.enums import AshLogLevel, ExportFormat
+from automated_security_helper.core.findings_history import (
+    FindingsHistory,
+    keep_new_findings,
+)
 from automated_security_helper.models.asharp_model import AshAggregatedResults
 from automated_security_helper.plugins import ash_plugin_manager
 from automated_security_helper.plugins.loader import load_plugins
@@ -74,6 +78,13 @@ def report_command(
         bool, typer.Option("--debug", "-d", help="Enable debug logging")
     ] = False,
     color: Annotated[bool, typer.Option(help="Enable/disable colorized output")] = True,
+    new_only: Annotated[
+        bool,
+        typer.Option(
+            "--new-only",
+            help="Only report findings that are new since the previous scan in the findings history",
+        ),
+    ] = False,
 ):
     """Generate a report from ASH scan results using the specified reporter plugin."""
     if config_overrides is None:
@@ -146,6 +157,20 @@ def report_command(
         print(f"[red]Error loading results file: {e}[/red]")
         raise typer.Exit(1)
 
+    if new_only:
+        history = FindingsHistory.open_existing(
+            results_file.parent, ash_config.findings_history
+        )
+        recorded = False
+        if history is not None:
+            with history:
+                recorded = keep_new_findings(model, history)
+        if not recorded:
+            print(
+                "[red]Error: these results are not in the findings history, so new findings cannot be determined.[/red]"
+            )
+            raise typer.Exit(1)
+
     # Find the reporter plugin
     reporter_plugins = ash_plugin_manager.plugin_modules(
         plugin_type="reporter",
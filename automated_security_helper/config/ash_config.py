@@ -1,25 +1,23 @@
+import importlib
 import json
 import os
 from pathlib import Path
 import re
+import sys
+import threading
 from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, ValidationError
+from pydantic.errors import PydanticUndefinedAnnotation
+from pydantic.fields import FieldInfo
 from typing import Annotated, Any, List, Dict, Literal
 
 import yaml
 from automated_security_helper.base.converter_plugin import ConverterPluginConfigBase
-from automated_security_helper.base.plugin_context import PluginContext
 from automated_security_helper.base.reporter_plugin import ReporterPluginConfigBase
 from automated_security_helper.base.scanner_plugin import (
     ScannerPluginBase,
     ScannerPluginConfigBase,
 )
 from automated_security_helper.config.default_config import get_default_config
-from automated_security_helper.plugin_modules.ash_builtin.converters.archive_converter import (
-    ArchiveConverterConfig,
-)
-from automated_security_helper.plugin_modules.ash_builtin.converters.jupyter_converter import (
-    JupyterConverterConfig,
-)
 from automated_security_helper.core.constants import (
     ASH_CONFIG_FILE_NAMES,
     ASH_DEFAULT_SEVERITY_LEVEL,
@@ -27,81 +25,79 @@ from automated_security_helper.core.constants import (
 from automated_security_helper.core.exceptions import ASHConfigValidationError
 from automated_security_helper.models.asharp_model import AshAggregatedResults
 from automated_security_helper.models.core import IgnorePathWithReason, AshSuppression
-from automated_security_helper.plugin_modules.ash_builtin.reporters.csv_reporter import (
-    CSVReporterConfig,
-)
-from automated_security_helper.plugin_modules.ash_builtin.reporters.cyclonedx_reporter import (
-    CycloneDXReporterConfig,
-)
-from automated_security_helper.plugin_modules.ash_builtin.reporters.gitlab_cyclonedx_reporter import (
-    GitLabCycloneDXReporterConfig,
-)
-from automated_security_helper.plugin_modules.ash_builtin.reporters.gitlab_sast_reporter import (
-    GitLabSASTReporterConfig,
-)
-from automated_security_helper.plugin_modules.ash_builtin.reporters.html_reporter import (
-    HTMLReporterConfig,
-)
-from automated_security_helper.plugin_modules.ash_builtin.reporters.flatjson_reporter import (
-    FlatJSONReporterConfig,
-)
-from automated_security_helper.plugin_modules.ash_builtin.reporters.junitxml_reporter import (
-    JUnitXMLReporterConfig,
-)
-from automated_security_helper.plugin_modules.ash_builtin.reporters.markdown_reporter import (
-    MarkdownReporterConfig,
-)
-from automated_security_helper.plugin_modules.ash_builtin.reporters.ocsf_reporter import (
-    OCSFReporterConfig,
-)
-from automated_security_helper.plugin_modules.ash_builtin.reporters.spdx_reporter import (
-    SPDXReporterConfig,
-)
-from automated_security_helper.plugin_modules.ash_builtin.reporters.text_reporter import (
-    TextReporterConfig,
-)
-from automated_security_helper.plugin_modules.ash_builtin.reporters.yaml_reporter import (
-    YAMLReporterConfig,
-)
-from automated_security_helper.plugin_modules.ash_builtin.reporters.sarif_reporter import (
-    SARIFReporterConfig,
-)
-from automated_security_helper.plugin_modules.ash_builtin.reporters.github_ghas_reporter import (
-    GHASReporterConfig,
-)
-from automated_security_helper.plugin_modules.ash_builtin.scanners.bandit_scanner import (
-    BanditScannerConfig,
-)
-from automated_security_helper.plugin_modules.ash_builtin.scanners.cdk_nag_scanner import (
-    CdkNagScannerConfig,
-)
-from automated_security_helper.plugin_modules.ash_builtin.scanners.cfn_nag_scanner import (
-    CfnNagScannerConfig,
-)
-from automated_security_helper.plugin_modules.ash_builtin.scanners.checkov_scanner import (
-    CheckovScannerConfig,
-)
-from automated_security_helper.plugin_modules.ash_builtin.scanners.detect_secrets_scanner import (
-    DetectSecretsScannerConfig,
-)
-from automated_security_helper.plugin_modules.ash_builtin.scanners.grype_scanner import (
-    GrypeScannerConfig,
-)
-from automated_security_helper.plugin_modules.ash_builtin.scanners.npm_audit_scanner import (
-    NpmAuditScannerConfig,
-)
-from automated_security_helper.plugin_modules.ash_builtin.scanners.opengrep_scanner import (
-    OpengrepScannerConfig,
-)
-from automated_security_helper.plugin_modules.ash_builtin.scanners.semgrep_scanner import (
-    SemgrepScannerConfig,
-)
-from automated_security_helper.plugin_modules.ash_builtin.scanners.syft_scanner import (
-    SyftScannerConfig,
-)
 from automated_security_helper.utils.log import ASH_LOGGER
 
 
+class _BuiltinPluginConfig:
+    """Config class of a built-in plugin, imported when pydantic first needs it.
+
+    Importing the class imports the plugin module and the tool libraries it
+    uses, so the segments below name their built-in configs through this
+    marker instead. The import happens when a segment is first validated or
+    its JSON schema is generated.
+    """
+
+    # Set while this thread imports a plugin module for a marker.
+    _importing = threading.local()
+
+    def __init__(self, module: str, class_name: str):
+        self.module = f"automated_security_helper.plugin_modules.ash_builtin.{module}"
+        self.class_name = class_name
+
+    def resolve(self) -> type[BaseModel]:
+        if getattr(self._importing, "active", False):
+            # A plugin class defined by the module being imported is building
+            # a schema that reaches AshConfig. Leave that class incomplete;
+            # pydantic builds it on first use.
+            raise PydanticUndefinedAnnotation(
+                self.class_name, f"{self.class_name} is still being imported"
+            )
+        module = sys.modules.get(self.module)
+        if module is None:
+            self._importing.active = True
+            try:
+                module = importlib.import_module(self.module)
+            finally:
+                self._importing.active = False
+        config_class = getattr(module, self.class_name, None)
+        if config_class is None:
+            # The module is part-way through its own import.
+            raise PydanticUndefinedAnnotation(
+                self.class_name, f"{self.class_name} is not defined yet"
+            )
+        return config_class
+
+    def __call__(self) -> BaseModel:
+        return self.resolve()()
+
+    def __get_pydantic_core_schema__(self, source_type, handler):
+        return handler(self.resolve())
+
+    def __get_pydantic_json_schema__(self, core_schema, handler):
+        json_schema = handler(core_schema)
+        # A default_factory does not show up in the JSON schema on its own.
+        json_schema["default"] = self().model_dump(mode="json", by_alias=True)
+        return json_schema
+
+
+def _builtin_config(module: str, class_name: str) -> FieldInfo:
+    """Default of a segment field holding the config of a built-in plugin."""
+    config = _BuiltinPluginConfig(module, class_name)
+    field = Field(default_factory=config)
+    field.metadata.append(config)
+    return field
+
+
+def _segment_default(segment: type[BaseModel]) -> FieldInfo:
+    """Default of an AshConfig field holding a plugin config segment."""
+    return Field(
+        default_factory=segment,
+        json_schema_extra=lambda json_schema: json_schema.setdefault(
+            "default", segment().model_dump(mode="json", by_alias=True)
+        ),
+    )
+
+
 # Define BuildConfig class
 class BuildConfig(BaseModel):
     """Configuration model for build-time settings."""
@@ -130,18 +126,19 @@ class ConverterConfigSegment(BaseModel):
         arbitrary_types_allowed=True,
         use_enum_values=True,
         extra="allow",
+        defer_build=True,
     )
 
     __pydantic_extra__: Dict[str, Any | ConverterPluginConfigBase] = {}
 
     archive: Annotated[
-        ArchiveConverterConfig,
+        Any,
         Field(description="Configure the options for the ArchiveConverter"),
-    ] = ArchiveConverterConfig()
+    ] = _builtin_config("converters.archive_converter", "ArchiveConverterConfig")
     jupyter: Annotated[
-        JupyterConverterConfig,
+        Any,
         Field(description="Configure the options for the JupyterConverter"),
-    ] = JupyterConverterConfig()
+    ] = _builtin_config("converters.jupyter_converter", "JupyterConverterConfig")
 
 
 class ScannerConfigSegment(BaseModel):
@@ -150,47 +147,48 @@ class ScannerConfigSegment(BaseModel):
         arbitrary_types_allowed=True,
         use_enum_values=True,
         extra="allow",
+        defer_build=True,
     )
 
     __pydantic_extra__: Dict[str, Any | ScannerPluginConfigBase] = {}
 
     bandit: Annotated[
-        BanditScannerConfig, Field(description="Configure the options for Bandit")
-    ] = BanditScannerConfig()
+        Any, Field(description="Configure the options for Bandit")
+    ] = _builtin_config("scanners.bandit_scanner", "BanditScannerConfig")
     cdk_nag: Annotated[
-        CdkNagScannerConfig,
+        Any,
         Field(description="Configure the options for CdkNag", alias="cdk-nag"),
-    ] = CdkNagScannerConfig()
+    ] = _builtin_config("scanners.cdk_nag_scanner", "CdkNagScannerConfig")
     cfn_nag: Annotated[
-        CfnNagScannerConfig,
+        Any,
         Field(description="Configure the options for CfnNag", alias="cfn-nag"),
-    ] = CfnNagScannerConfig()
+    ] = _builtin_config("scanners.cfn_nag_scanner", "CfnNagScannerConfig")
     checkov: Annotated[
-        CheckovScannerConfig, Field(description="Configure the options for Checkov")
-    ] = CheckovScannerConfig()
+        Any, Field(description="Configure the options for Checkov")
+    ] = _builtin_config("scanners.checkov_scanner", "CheckovScannerConfig")
     detect_secrets: Annotated[
-        DetectSecretsScannerConfig,
+        Any,
         Field(
             description="Configure the options for DetectSecrets",
             alias="detect-secrets",
         ),
-    ] = DetectSecretsScannerConfig()
+    ] = _builtin_config("scanners.detect_secrets_scanner", "DetectSecretsScannerConfig")
     grype: Annotated[
-        GrypeScannerConfig, Field(description="Configure the options for Grype")
-    ] = GrypeScannerConfig()
+        Any, Field(description="Configure the options for Grype")
+    ] = _builtin_config("scanners.grype_scanner", "GrypeScannerConfig")
     npm_audit: Annotated[
-        NpmAuditScannerConfig,
+        Any,
         Field(description="Configure the options for NpmAudit", alias="npm-audit"),
-    ] = NpmAuditScannerConfig()
+    ] = _builtin_config("scanners.npm_audit_scanner", "NpmAuditScannerConfig")
     opengrep: Annotated[
-        OpengrepScannerConfig, Field(description="Configure the options for Opengrep")
-    ] = OpengrepScannerConfig()
+        Any, Field(description="Configure the options for Opengrep")
+    ] = _builtin_config("scanners.opengrep_scanner", "OpengrepScannerConfig")
     semgrep: Annotated[
-        SemgrepScannerConfig, Field(description="Configure the options for Semgrep")
-    ] = SemgrepScannerConfig()
+        Any, Field(description="Configure the options for Semgrep")
+    ] = _builtin_config("scanners.semgrep_scanner", "SemgrepScannerConfig")
     syft: Annotated[
-        SyftScannerConfig, Field(description="Configure the options for Syft")
-    ] = SyftScannerConfig()
+        Any, Field(description="Configure the options for Syft")
+    ] = _builtin_config("scanners.syft_scanner", "SyftScannerConfig")
 
 
 class ReporterConfigSegment(BaseModel):
@@ -199,79 +197,80 @@ class ReporterConfigSegment(BaseModel):
         arbitrary_types_allowed=True,
         use_enum_values=True,
         extra="allow",
+        defer_build=True,
     )
 
     __pydantic_extra__: Dict[str, Any | ReporterPluginConfigBase] = {}
 
     csv: Annotated[
-        CSVReporterConfig,
+        Any,
         Field(description="Configure the options for the CSV reporter"),
-    ] = CSVReporterConfig()
+    ] = _builtin_config("reporters.csv_reporter", "CSVReporterConfig")
     cyclonedx: Annotated[
-        CycloneDXReporterConfig,
+        Any,
         Field(description="Configure the options for the CycloneDX reporter"),
-    ] = CycloneDXReporterConfig()
+    ] = _builtin_config("reporters.cyclonedx_reporter", "CycloneDXReporterConfig")
     gitlab_cyclonedx: Annotated[
-        GitLabCycloneDXReporterConfig,
+        Any,
         Field(
             description="Configure the options for the GitLab CycloneDX dependency scanning reporter",
             alias="gitlab-cyclonedx",
         ),
-    ] = GitLabCycloneDXReporterConfig()
+    ] = _builtin_config("reporters.gitlab_cyclonedx_reporter", "GitLabCycloneDXReporterConfig")
     # Do the same for html, json, junitxml, ocsf, sarif, spdx, text, and yaml
     html: Annotated[
-        HTMLReporterConfig,
+        Any,
         Field(description="Configure the options for the HTML reporter"),
-    ] = HTMLReporterConfig()
+    ] = _builtin_config("reporters.html_reporter", "HTMLReporterConfig")
     flat_json: Annotated[
-        FlatJSONReporterConfig,
+        Any,
         Field(
             description="Configure the options for the Flat JSON reporter",
             alias="flat-json",
         ),
-    ] = FlatJSONReporterConfig()
+    ] = _builtin_config("reporters.flatjson_reporter", "FlatJSONReporterConfig")
     gitlab_sast: Annotated[
-        GitLabSASTReporterConfig,
+        Any,
         Field(
             description="Configure the options for the GitLab SAST reporter",
             alias="gitlab-sast",
         ),
-    ] = GitLabSASTReporterConfig()
+    ] = _builtin_config("reporters.gitlab_sast_reporter", "GitLabSASTReporterConfig")
     github_ghas: Annotated[
-        GHASReporterConfig,
+        Any,
         Field(
             description="Configure the options for the GitHub Advanced Security (GHAS) SARIF reporter",
             alias="github-ghas",
         ),
-    ] = GHASReporterConfig()
+    ] = _builtin_config("reporters.github_ghas_reporter", "GHASReporterConfig")
     junitxml: Annotated[
-        JUnitXMLReporterConfig,
+        Any,
         Field(description="Configure the options for the JUnit XML reporter"),
-    ] = JUnitXMLReporterConfig()
+    ] = _builtin_config("reporters.junitxml_reporter", "JUnitXMLReporterConfig")
     markdown: Annotated[
-        MarkdownReporterConfig,
+        Any,
         Field(description="Configure the options for the Markdown reporter"),
-    ] = MarkdownReporterConfig()
+    ] = _builtin_config("reporters.markdown_reporter", "MarkdownReporterConfig")
     ocsf: Annotated[
-        OCSFReporterConfig,
+        Any,
         Field(description="Configure the options for the OCSF reporter"),
-    ] = OCSFReporterConfig()
+    ] = _builtin_config("reporters.ocsf_reporter", "OCSFReporterConfig")
     sarif: Annotated[
-        SARIFReporterConfig,
+        Any,
         Field(description="Configure the options for the SARIF reporter"),
-    ] = SARIFReporterConfig()
+    ] = _builtin_config("reporters.sarif_reporter", "SARIFReporterConfig")
     spdx: Annotated[
-        SPDXReporterConfig,
+        Any,
         Field(description="Configure the options for the SPDX reporter"),
-    ] = SPDXReporterConfig()
+    ] = _builtin_config("reporters.spdx_reporter", "SPDXReporterConfig")
     text: Annotated[
-        TextReporterConfig,
+        Any,
         Field(description="Configure the options for the Text reporter"),
-    ] = TextReporterConfig()
+    ] = _builtin_config("reporters.text_reporter", "TextReporterConfig")
     yaml: Annotated[
-        YAMLReporterConfig,
+        Any,
         Field(description="Configure the options for the YAML reporter"),
-    ] = YAMLReporterConfig()
+    ] = _builtin_config("reporters.yaml_reporter", "YAMLReporterConfig")
 
 
 class MCPResourceManagementConfig(BaseModel):
@@ -427,6 +426,70 @@ class MCPResourceManagementConfig(BaseModel):
     ] = False
 
 
+class ScannerResultCacheConfig(BaseModel):
+    """Configuration model for the cross-run scanner result cache."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    enabled: Annotated[
+        bool,
+        Field(
+            description="Reuse a scanner's previous SARIF results when the scan target, scanner configuration and tool version are unchanged. Suppressions are always re-applied to cached results."
+        ),
+    ] = False
+
+    directory: Annotated[
+        str | None,
+        Field(
+            description="Directory to store cached results in. Defaults to cache/scanner_results under the output directory."
+        ),
+    ] = None
+
+    max_size_mb: Annotated[
+        int,
+        Field(
+            description="Maximum size of the cache directory in megabytes. The least recently used entries are evicted first.",
+            ge=1,
+        ),
+    ] = 512
+
+    max_age_hours: Annotated[
+        float | None,
+        Field(
+            description="Discard cached results older than this many hours so that scanners backed by vulnerability databases are re-run periodically. Set to null to keep results until they are evicted.",
+            gt=0,
+        ),
+    ] = 24
+
+
+class FindingsHistoryConfig(BaseModel):
+    """Configuration model for the persistent findings history."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    enabled: Annotated[
+        bool,
+        Field(
+            description="Record the findings of every scan in a local SQLite database so that new, existing and resolved findings can be queried across scans."
+        ),
+    ] = True
+
+    path: Annotated[
+        str | None,
+        Field(
+            description="Path of the history database. Defaults to cache/findings_history.sqlite3 under the output directory."
+        ),
+    ] = None
+
+    max_scans: Annotated[
+        int,
+        Field(
+            description="Number of most recent scans to keep. Findings that were only seen in older scans are dropped.",
+            ge=1,
+        ),
+    ] = 200
+
+
 class AshConfigGlobalSettingsSection(BaseModel):
     model_config = ConfigDict(
         extra="forbid",
@@ -461,6 +524,8 @@ class AshConfig(BaseModel):
         str_strip_whitespace=True,
         arbitrary_types_allowed=True,
         extra="ignore",
+        # Building the schema imports the built-in plugin configs.
+        defer_build=True,
     )
 
     # Internal field to track config resolution warnings (not serialized)
@@ -511,17 +576,27 @@ class AshConfig(BaseModel):
     converters: Annotated[
         ConverterConfigSegment,
         Field(description="Converter configurations by name."),
-    ] = ConverterConfigSegment()
+    ] = _segment_default(ConverterConfigSegment)
 
     scanners: Annotated[
         ScannerConfigSegment,
         Field(description="Scanner configurations by name."),
-    ] = ScannerConfigSegment()
+    ] = _segment_default(ScannerConfigSegment)
 
     reporters: Annotated[
         ReporterConfigSegment,
         Field(description="Reporter configurations by name."),
-    ] = ReporterConfigSegment()
+    ] = _segment_default(ReporterConfigSegment)
+
+    scanner_result_cache: Annotated[
+        ScannerResultCacheConfig,
+        Field(description="Cross-run scanner result cache settings."),
+    ] = ScannerResultCacheConfig()
+
+    findings_history: Annotated[
+        FindingsHistoryConfig,
+        Field(description="Persistent findings history settings."),
+    ] = FindingsHistoryConfig()
 
     # MCP resource management configuration
     mcp_resource_management: Annotated[
@@ -787,8 +862,9 @@ def _find_suppressions_append_point(lines: list) -> tuple:
 
 
 BuildConfig.model_rebuild()
-ConverterConfigSegment.model_rebuild()
-ScannerConfigSegment.model_rebuild()
-ReporterConfigSegment.model_rebuild()
-PluginContext.model_rebuild()
-AshAggregatedResults.model_rebuild()
+
+# AshAggregatedResults imports AshConfig only for type checking. Publish it in
+# that module so pydantic resolves the forward reference when the model is
+# first used. Rebuilding it here would build the AshConfig schema and import
+# every built-in plugin.
+sys.modules[AshAggregatedResults.__module__].AshConfig = AshConfig
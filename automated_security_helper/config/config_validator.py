@@ -59,6 +59,8 @@ class ConfigValidator:
         "reporters",
         "converters",
         "mcp-resource-management",
+        "scanner_result_cache",
+        "findings_history",
     }
 
     @classmethod
@@ -10,6 +10,12 @@ from typing import List, Optional, Literal
 from automated_security_helper.base.plugin_context import PluginContext
 from automated_security_helper.core.enums import ExecutionPhase, ExecutionStrategy
 from automated_security_helper.core.metrics_table import display_metrics_table
+from automated_security_helper.core.perf_profile import (
+    perf_span,
+    start_recording,
+    stop_recording,
+    write_active_profile,
+)
 from automated_security_helper.core.phases.convert_phase import ConvertPhase
 from automated_security_helper.core.phases.report_phase import ReportPhase
 from automated_security_helper.core.phases.scan_phase import ScanPhase
@@ -264,6 +270,11 @@ class ScanExecutionEngine:
 
         self.ensure_initialized(self._context.config)
 
+    @property
+    def context(self) -> PluginContext:
+        """The plugin context shared by all phases of this run."""
+        return self._context
+
     def get_scanner(
         self, scanner_name: str, check_enabled: bool = True
     ) -> ScannerPluginBase:
@@ -381,6 +392,7 @@ class ScanExecutionEngine:
 
         # Record the start time for calculating scan duration
         scan_start_time = datetime.now(timezone.utc)
+        perf_recorder, owns_perf_recorder = start_recording()
         # Initialize duration variables so the finally block can reference
         # them even when the try block raises before computing them.
         hours = minutes = seconds = 0
@@ -428,88 +440,100 @@ class ScanExecutionEngine:
             for phase_name in ordered_phases:
                 ASH_LOGGER.info(f"\n----- Starting phase: {phase_name.upper()} -----")
 
-                match phase_name:
-                    case "convert":
-                        # Create and execute the Convert phase
-                        convert_phase = ConvertPhase(
-                            plugins=self.plugins["converter"],
-                            plugin_context=self._context,
-                            progress_display=self.progress_display,
-                            asharp_model=self._asharp_model,
-                        )
-                        self._results = convert_phase.execute(
-                            aggregated_results=self._results,
-                            python_based_plugins_only=self._python_only,
-                        )
+                with perf_span(phase_name, "phase"):
+                    match phase_name:
+                        case "convert":
+                            # Create and execute the Convert phase
+                            convert_phase = ConvertPhase(
+                                plugins=self.plugins["converter"],
+                                plugin_context=self._context,
+                                progress_display=self.progress_display,
+                                asharp_model=self._asharp_model,
+                            )
+                            self._results = convert_phase.execute(
+                                aggregated_results=self._results,
+                                python_based_plugins_only=self._python_only,
+                            )
 
-                    case "scan":
-                        # Create and execute the Scan phase
-                        scan_phase = ScanPhase(
-                            plugins=self.plugins["scanner"],
-                            plugin_context=self._context,
-                            progress_display=self.progress_display,
-                            asharp_model=self._asharp_model,
-                        )
+                        case "scan":
+                            # Create and execute the Scan phase
+                            scan_phase = ScanPhase(
+                                plugins=self.plugins["scanner"],
+                                plugin_context=self._context,
+                                progress_display=self.progress_display,
+                                asharp_model=self._asharp_model,
+                            )
 
-                        self._results = scan_phase.execute(
-                            aggregated_results=self._results,
-                            enabled_scanners=self._init_enabled_scanners,
-                            excluded_scanners=self._init_excluded_scanners,
-                            parallel=(self._strategy == ExecutionStrategy.PARALLEL),
-                            max_workers=self._max_workers,
-                            global_ignore_paths=self._global_ignore_paths,
-                            python_based_plugins_only=self._python_only,  # Pass the python_based_plugins_only flag to the scan phase
-                        )
-                        # Store the completed scanners for metrics display
-                        self._completed_scanners = scan_phase._completed_scanners
-
-                    case "report":
-                        # Final suppression pass on the merged SARIF before reporters read it.
-                        # Per-scanner suppression passes may miss findings whose paths only
-                        # become matchable after merge/normalization in the aggregated context.
-                        if not self._context.ignore_suppressions and self._results and self._results.sarif:
-                            from automated_security_helper.utils.sarif_utils import apply_suppressions_to_sarif
-                            self._results.sarif = apply_suppressions_to_sarif(
-                                sarif_report=self._results.sarif,
+                            self._results = scan_phase.execute(
+                                aggregated_results=self._results,
+                                enabled_scanners=self._init_enabled_scanners,
+                                excluded_scanners=self._init_excluded_scanners,
+                                parallel=(self._strategy == ExecutionStrategy.PARALLEL),
+                                max_workers=self._max_workers,
+                                global_ignore_paths=self._global_ignore_paths,
+                                python_based_plugins_only=self._python_only,  # Pass the python_based_plugins_only flag to the scan phase
+                            )
+                            # Store the completed scanners for metrics display
+                            self._completed_scanners = scan_phase._completed_scanners
+
+                        case "report":
+                            # Final suppression pass on the merged SARIF before reporters read it.
+                            # Per-scanner suppression passes may miss findings whose paths only
+                            # become matchable after merge/normalization in the aggregated context.
+                            if not self._context.ignore_suppressions and self._results and self._results.sarif:
+                                from automated_security_helper.utils.sarif_utils import apply_suppressions_to_sarif
+                                with perf_span("apply_suppressions", "postprocess"):
+                                    self._results.sarif = apply_suppressions_to_sarif(
+                                        sarif_report=self._results.sarif,
+                                        plugin_context=self._context,
+                                        used_suppressions=getattr(self._results, 'used_suppressions', None),
+                                    )
+
+                            # Refresh metrics after final suppression pass so exit code
+                            # reflects the post-suppression state.
+                            with perf_span("populate_metrics", "metrics"):
+                                self._results = populate_metrics_from_unified_source(
+                                    aggregated_results=self._results
+                                )
+                            self._asharp_model = self._results
+
+                            # Record the history only now, so suppressions added by the
+                            # final pass above are recorded as suppressed.
+                            if self._context.output_dir:
+                                from automated_security_helper.core.findings_history import record_findings_history
+                                with perf_span("findings_history", "postprocess"):
+                                    record_findings_history(self._context, self._results)
+
+                            # Create and execute the Report phase
+                            report_phase = ReportPhase(
+                                plugins=self.plugins["reporter"],
                                 plugin_context=self._context,
-                                used_suppressions=getattr(self._results, 'used_suppressions', None),
+                                progress_display=self.progress_display,
+                                asharp_model=self._results,
+                            )
+                            self._results = report_phase.execute(
+                                report_dir=self._context.output_dir.joinpath("reports"),
+                                cli_output_formats=self._output_formats or None,
+                                aggregated_results=self._results,
+                                python_based_plugins_only=self._python_only,
+                                parallel=(self._strategy == ExecutionStrategy.PARALLEL),
+                                max_workers=self._max_workers,
                             )
+                            self._asharp_model = self._results
 
-                        # Refresh metrics after final suppression pass so exit code
-                        # reflects the post-suppression state.
-                        self._results = populate_metrics_from_unified_source(
-                            aggregated_results=self._results
-                        )
-                        self._asharp_model = self._results
-
-                        # Create and execute the Report phase
-                        report_phase = ReportPhase(
-                            plugins=self.plugins["reporter"],
-                            plugin_context=self._context,
-                            progress_display=self.progress_display,
-                            asharp_model=self._results,
-                        )
-                        self._results = report_phase.execute(
-                            report_dir=self._context.output_dir.joinpath("reports"),
-                            cli_output_formats=self._output_formats or None,
-                            aggregated_results=self._results,
-                            python_based_plugins_only=self._python_only,
-                        )
-                        self._asharp_model = self._results
-
-                    case "inspect":
-                        # Create and execute the Inspect phase
-                        inspect_phase = InspectPhase(
-                            plugins=[],  # No plugin support for the Inspect phase at this time.
-                            plugin_context=self._context,
-                            progress_display=self.progress_display,
-                            asharp_model=self._asharp_model,
-                        )
-                        self._results = inspect_phase.execute(
-                            aggregated_results=self._results,
-                            python_based_plugins_only=self._python_only,
-                        )
-                        self._asharp_model = self._results
+                        case "inspect":
+                            # Create and execute the Inspect phase
+                            inspect_phase = InspectPhase(
+                                plugins=[],  # No plugin support for the Inspect phase at this time.
+                                plugin_context=self._context,
+                                progress_display=self.progress_display,
+                                asharp_model=self._asharp_model,
+                            )
+                            self._results = inspect_phase.execute(
+                                aggregated_results=self._results,
+                                python_based_plugins_only=self._python_only,
+                            )
+                            self._asharp_model = self._results
 
         except Exception as e:
             ASH_LOGGER.error(f"Execution failed: {str(e)}")
@@ -523,6 +547,7 @@ class ScanExecutionEngine:
                 ash_plugin_manager.notify(
                     AshEventType.ERROR,
                     phase="execution",
+                    plugin_context=self._context,
                     error=str(e),
                     exception=e,
                     message=f"ASH execution failed: {str(e)}",
@@ -551,6 +576,8 @@ class ScanExecutionEngine:
                 ash_plugin_manager.notify(
                     AshEventType.EXECUTION_COMPLETE,
                     phases=ordered_phases,
+                    plugin_context=self._context,
+                    output_dir=self._context.output_dir,
                     results=self._results,
                     duration=scan_duration,
                     completed_scanners=getattr(self, "_completed_scanners", []),
@@ -568,6 +595,12 @@ class ScanExecutionEngine:
                 ):
                     self.progress_display.stop()
 
+                # Write the performance profile before anything below can raise
+                # and leave the recorder active for the next run
+                write_active_profile(reports_dir)
+                if owns_perf_recorder:
+                    stop_recording(perf_recorder)
+
                 # Display the final metrics table
                 if not self._simple_mode:
                     if hours > 0:
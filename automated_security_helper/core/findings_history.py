@@ -0,0 +1,491 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Persistent history of findings across scans.
+
+Unless ``findings_history.enabled`` is turned off, the scan phase records every
+finding of a scan in a SQLite database. By default the database is
+``cache/findings_history.sqlite3`` under the output directory, which is
+``.ash/ash_output`` unless configured otherwise.
+
+Each finding is keyed by a fingerprint of its id, file and code location
+(:func:`finding_fingerprint`). The database holds one row per distinct
+fingerprint and one row per fingerprint per scan it was seen in. Questions
+such as "what is new since the previous scan" or "when was this finding first
+seen" are then indexed lookups instead of diffs of whole results files.
+"""
+
+import hashlib
+import json
+import sqlite3
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+from automated_security_helper.config.ash_config import FindingsHistoryConfig
+from automated_security_helper.models.flat_vulnerability import FlatVulnerability
+from automated_security_helper.utils.finding_fingerprint import location_fingerprint
+from automated_security_helper.utils.log import ASH_LOGGER
+
+DEFAULT_HISTORY_FILE_NAME = "findings_history.sqlite3"
+# Bump when the schema changes; older databases are recreated.
+SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS scans (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    report_id TEXT,
+    generated_at TEXT NOT NULL,
+    ingested_at TEXT NOT NULL,
+    finding_count INTEGER NOT NULL,
+    UNIQUE (report_id, generated_at)
+);
+CREATE TABLE IF NOT EXISTS findings (
+    fingerprint TEXT PRIMARY KEY,
+    finding_id TEXT NOT NULL,
+    scanner TEXT,
+    rule_id TEXT,
+    file_path TEXT,
+    line_start INTEGER,
+    title TEXT,
+    first_seen_seq INTEGER NOT NULL,
+    last_seen_seq INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS occurrences (
+    scan_seq INTEGER NOT NULL,
+    fingerprint TEXT NOT NULL,
+    severity TEXT,
+    is_suppressed INTEGER NOT NULL,
+    PRIMARY KEY (scan_seq, fingerprint)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_findings_scanner ON findings (scanner);
+CREATE INDEX IF NOT EXISTS idx_findings_rule ON findings (rule_id);
+CREATE INDEX IF NOT EXISTS idx_findings_file ON findings (file_path);
+CREATE INDEX IF NOT EXISTS idx_occurrences_fingerprint ON occurrences (fingerprint);
+CREATE INDEX IF NOT EXISTS idx_occurrences_severity ON occurrences (scan_seq, severity);
+"""
+
+_FINDING_COLUMNS = (
+    "f.fingerprint, f.finding_id, f.scanner, f.rule_id, f.file_path, f.line_start, "
+    "f.title, o.severity, o.is_suppressed, "
+    "f.first_seen_seq, "
+    "(SELECT generated_at FROM scans WHERE seq = f.first_seen_seq) AS first_seen_at"
+)
+
+ScanRef = Union[int, str, None]
+
+
+def finding_fingerprint(vuln: FlatVulnerability) -> str:
+    """Return a stable, location-aware fingerprint of a finding.
+
+    This is :func:`location_fingerprint` of the finding's id, file, code
+    snippet and first line.
+    """
+    return location_fingerprint(
+        vuln.id, vuln.file_path, vuln.code_snippet, vuln.line_start
+    )
+
+
+def iter_scan_findings(results: Any) -> Iterator[FlatVulnerability]:
+    """Yield the findings of an ``AshAggregatedResults`` without side effects.
+
+    Unlike ``to_flat_vulnerabilities()``, this does not update the summary
+    stats of ``results``.
+    """
+    detected_at = datetime.now(timezone.utc).isoformat()
+    sarif = getattr(results, "sarif", None)
+    for run in sarif.runs if sarif and sarif.runs else []:
+        tool_name = run.tool.driver.name if run.tool and run.tool.driver else "Unknown"
+        for result in run.results or []:
+            yield FlatVulnerability.from_sarif_result(
+                result, tool_name, "UNKNOWN", detected_at=detected_at
+            )
+    for scanner_name, entries in (
+        getattr(results, "additional_reports", None) or {}
+    ).items():
+        if not isinstance(entries, list):
+            continue
+        for entry in entries:
+            if not isinstance(entry, dict):
+                continue
+            vuln = FlatVulnerability.from_additional_report(entry, scanner_name)
+            if "id" not in entry:
+                # from_additional_report falls back to hash(), which is salted
+                # per process, so the id would not match across scans.
+                digest = hashlib.sha256(
+                    json.dumps(entry, sort_keys=True, default=str).encode()
+                ).hexdigest()[:8]
+                vuln.id = f"{scanner_name}-{digest}"
+            yield vuln
+
+
+def history_path(output_dir: Union[str, Path], settings: Any = None) -> Path:
+    """Return the history database path for ``output_dir`` and its settings."""
+    configured = getattr(settings, "path", None)
+    if configured:
+        return Path(configured)
+    return Path(output_dir).joinpath("cache", DEFAULT_HISTORY_FILE_NAME)
+
+
+class FindingsHistory:
+    """SQLite store of findings seen across scans."""
+
+    def __init__(self, path: Union[str, Path], max_scans: Optional[int] = None):
+        self.path = Path(path)
+        self.max_scans = max_scans
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, timeout=30)
+        self._conn.row_factory = sqlite3.Row
+        with self._conn:
+            version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+            if version not in (0, SCHEMA_VERSION):
+                ASH_LOGGER.debug(
+                    f"Recreating findings history {self.path} (schema {version})"
+                )
+                self._conn.executescript(
+                    "DROP TABLE IF EXISTS occurrences; DROP TABLE IF EXISTS findings; "
+                    "DROP TABLE IF EXISTS scans;"
+                )
+            self._conn.executescript(_SCHEMA)
+            self._conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    @classmethod
+    def from_context(cls, plugin_context: Any) -> Optional["FindingsHistory"]:
+        """Open the history configured for ``plugin_context``, or None if disabled."""
+        settings = getattr(
+            getattr(plugin_context, "config", None), "findings_history", None
+        )
+        if not isinstance(settings, FindingsHistoryConfig) or not settings.enabled:
+            return None
+        if not plugin_context.output_dir:
+            return None
+        return cls(
+            history_path(plugin_context.output_dir, settings),
+            max_scans=settings.max_scans,
+        )
+
+    @classmethod
+    def open_existing(
+        cls, output_dir: Union[str, Path], settings: Any = None
+    ) -> Optional["FindingsHistory"]:
+        """Open the history of ``output_dir`` if one has been recorded."""
+        path = history_path(output_dir, settings)
+        return cls(path) if path.exists() else None
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> "FindingsHistory":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def ingest(self, results: Any) -> int:
+        """Record the findings of an ``AshAggregatedResults``.
+
+        Scans are identified by the report id and generation time of
+        ``results``. A scan is recorded once; ingesting it again returns its
+        existing sequence number.
+
+        Returns:
+            The sequence number of the scan
+        """
+        metadata = getattr(results, "metadata", None)
+        report_id = getattr(metadata, "report_id", None)
+        generated_at = (
+            getattr(metadata, "generated_at", None)
+            or datetime.now(timezone.utc).isoformat()
+        )
+        existing = self._conn.execute(
+            "SELECT seq FROM scans WHERE report_id IS ? AND generated_at = ?",
+            (report_id, generated_at),
+        ).fetchone()
+        if existing is not None:
+            return existing["seq"]
+
+        findings: Dict[str, tuple] = {}
+        occurrences: Dict[str, tuple] = {}
+        for vuln in iter_scan_findings(results):
+            fingerprint = finding_fingerprint(vuln)
+            findings[fingerprint] = (
+                fingerprint,
+                vuln.id,
+                vuln.scanner,
+                vuln.rule_id,
+                vuln.file_path,
+                vuln.line_start,
+                vuln.title,
+            )
+            occurrences[fingerprint] = (
+                fingerprint,
+                (vuln.severity or "").upper(),
+                int(vuln.is_suppressed),
+            )
+
+        with self._conn:
+            seq = self._conn.execute(
+                "INSERT INTO scans (report_id, generated_at, ingested_at, finding_count) "
+                "VALUES (?, ?, ?, ?)",
+                (
+                    report_id,
+                    generated_at,
+                    datetime.now(timezone.utc).isoformat(),
+                    len(occurrences),
+                ),
+            ).lastrowid
+            self._conn.executemany(
+                "INSERT INTO findings (fingerprint, finding_id, scanner, rule_id, "
+                "file_path, line_start, title, first_seen_seq, last_seen_seq) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (fingerprint) DO UPDATE SET "
+                "line_start = excluded.line_start, last_seen_seq = excluded.last_seen_seq",
+                [row + (seq, seq) for row in findings.values()],
+            )
+            self._conn.executemany(
+                "INSERT INTO occurrences (scan_seq, fingerprint, severity, is_suppressed) "
+                "VALUES (?, ?, ?, ?)",
+                [(seq,) + row for row in occurrences.values()],
+            )
+            self._prune()
+        return seq
+
+    def _prune(self) -> None:
+        """Drop the oldest scans beyond ``max_scans`` and findings only they saw."""
+        if not self.max_scans:
+            return
+        cutoff = self._conn.execute(
+            "SELECT seq FROM scans ORDER BY seq DESC LIMIT 1 OFFSET ?",
+            (self.max_scans - 1,),
+        ).fetchone()
+        if cutoff is None:
+            return
+        oldest_kept = cutoff["seq"]
+        self._conn.execute("DELETE FROM occurrences WHERE scan_seq < ?", (oldest_kept,))
+        self._conn.execute("DELETE FROM scans WHERE seq < ?", (oldest_kept,))
+        self._conn.execute(
+            "DELETE FROM findings WHERE last_seen_seq < ?", (oldest_kept,)
+        )
+        self._conn.execute(
+            "UPDATE findings SET first_seen_seq = ? WHERE first_seen_seq < ?",
+            (oldest_kept, oldest_kept),
+        )
+
+    def scans(self, limit: Optional[int] = 20) -> List[Dict[str, Any]]:
+        """Return recorded scans, newest first."""
+        rows = self._conn.execute(
+            "SELECT seq, report_id, generated_at, ingested_at, finding_count "
+            "FROM scans ORDER BY seq DESC LIMIT ?",
+            (limit if limit is not None else -1,),
+        )
+        return [dict(row) for row in rows]
+
+    def resolve_scan(self, scan: ScanRef = None) -> Optional[int]:
+        """Return the sequence number of a scan.
+
+        Args:
+            scan: Sequence number, report id or generation time. Defaults to
+                the latest scan. Negative numbers count back from the latest
+                scan, so -1 is the scan before it. A report id names the
+                latest scan with that id.
+        """
+        if scan is None or (isinstance(scan, int) and scan <= 0):
+            offset = -scan if isinstance(scan, int) else 0
+            row = self._conn.execute(
+                "SELECT seq FROM scans ORDER BY seq DESC LIMIT 1 OFFSET ?", (offset,)
+            ).fetchone()
+        elif isinstance(scan, int) or str(scan).isdigit():
+            row = self._conn.execute(
+                "SELECT seq FROM scans WHERE seq = ?", (int(scan),)
+            ).fetchone()
+        else:
+            row = self._conn.execute(
+                "SELECT MAX(seq) AS seq FROM scans WHERE report_id = ? OR generated_at = ?",
+                (scan, scan),
+            ).fetchone()
+            if row["seq"] is None:
+                return None
+        return row["seq"] if row is not None else None
+
+    def scan_of(self, results: Any) -> Optional[int]:
+        """Return the sequence number ``results`` were recorded under, if any."""
+        metadata = getattr(results, "metadata", None)
+        row = self._conn.execute(
+            "SELECT seq FROM scans WHERE report_id IS ? AND generated_at = ?",
+            (
+                getattr(metadata, "report_id", None),
+                getattr(metadata, "generated_at", None),
+            ),
+        ).fetchone()
+        return row["seq"] if row is not None else None
+
+    def _previous_scan(self, seq: int) -> Optional[int]:
+        row = self._conn.execute(
+            "SELECT MAX(seq) AS seq FROM scans WHERE seq < ?", (seq,)
+        ).fetchone()
+        return row["seq"]
+
+    def _compare(
+        self, scan: ScanRef, baseline: ScanRef, reverse: bool
+    ) -> List[Dict[str, Any]]:
+        seq = self.resolve_scan(scan)
+        if seq is None:
+            return []
+        base = (
+            self._previous_scan(seq)
+            if baseline is None
+            else self.resolve_scan(baseline)
+        )
+        if reverse:
+            seq, base = base, seq
+        if seq is None:
+            return []
+        rows = self._conn.execute(
+            f"SELECT {_FINDING_COLUMNS} FROM occurrences o "
+            "JOIN findings f ON f.fingerprint = o.fingerprint "
+            "WHERE o.scan_seq = ? AND NOT EXISTS ("
+            "SELECT 1 FROM occurrences b WHERE b.scan_seq = ? AND b.fingerprint = o.fingerprint"
+            ") ORDER BY f.file_path, f.line_start, f.finding_id",
+            (seq, base if base is not None else -1),
+        )
+        return [_finding_dict(row) for row in rows]
+
+    def new_findings(
+        self, scan: ScanRef = None, baseline: ScanRef = None
+    ) -> List[Dict[str, Any]]:
+        """Return findings of ``scan`` that ``baseline`` did not have.
+
+        ``scan`` defaults to the latest scan and ``baseline`` to the scan
+        recorded before it.
+        """
+        return self._compare(scan, baseline, reverse=False)
+
+    def resolved_findings(
+        self, scan: ScanRef = None, baseline: ScanRef = None
+    ) -> List[Dict[str, Any]]:
+        """Return findings of ``baseline`` that ``scan`` no longer has."""
+        return self._compare(scan, baseline, reverse=True)
+
+    def findings(
+        self,
+        scan: ScanRef = None,
+        scanner: Optional[str] = None,
+        rule_id: Optional[str] = None,
+        file_path: Optional[str] = None,
+        severity: Optional[str] = None,
+        include_suppressed: bool = True,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """Return the findings of a scan, optionally filtered."""
+        seq = self.resolve_scan(scan)
+        if seq is None:
+            return []
+        clauses = ["o.scan_seq = ?"]
+        params: List[Any] = [seq]
+        for column, value in (
+            ("f.scanner", scanner),
+            ("f.rule_id", rule_id),
+            ("f.file_path", file_path),
+            ("o.severity", severity.upper() if severity else None),
+        ):
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        if not include_suppressed:
+            clauses.append("o.is_suppressed = 0")
+        params.append(limit if limit is not None else -1)
+        rows = self._conn.execute(
+            f"SELECT {_FINDING_COLUMNS} FROM occurrences o "
+            "JOIN findings f ON f.fingerprint = o.fingerprint "
+            f"WHERE {' AND '.join(clauses)} "
+            "ORDER BY f.file_path, f.line_start, f.finding_id LIMIT ?",
+            params,
+        )
+        return [_finding_dict(row) for row in rows]
+
+    def trend(self, limit: Optional[int] = 20) -> List[Dict[str, Any]]:
+        """Return unsuppressed finding counts by severity per scan, newest first."""
+        scans = self.scans(limit)
+        if not scans:
+            return []
+        counts: Dict[int, Dict[str, int]] = {scan["seq"]: {} for scan in scans}
+        rows = self._conn.execute(
+            "SELECT scan_seq, severity, COUNT(*) AS count FROM occurrences "
+            "WHERE scan_seq >= ? AND is_suppressed = 0 GROUP BY scan_seq, severity",
+            (scans[-1]["seq"],),
+        )
+        for row in rows:
+            counts[row["scan_seq"]][row["severity"]] = row["count"]
+        return [{**scan, "severity_counts": counts[scan["seq"]]} for scan in scans]
+
+
+def keep_new_findings(
+    results: Any, history: FindingsHistory, baseline: ScanRef = None
+) -> bool:
+    """Drop the findings of ``results`` that are not new since ``baseline``.
+
+    ``results`` must have been recorded in ``history``. ``baseline`` defaults
+    to the scan recorded before it.
+
+    Returns:
+        False if ``results`` are not in the history and were left unchanged
+    """
+    seq = history.scan_of(results)
+    if seq is None:
+        return False
+    new = {f["fingerprint"] for f in history.new_findings(scan=seq, baseline=baseline)}
+    detected_at = datetime.now(timezone.utc).isoformat()
+    sarif = getattr(results, "sarif", None)
+    for run in sarif.runs if sarif and sarif.runs else []:
+        if not run.results:
+            continue
+        tool_name = run.tool.driver.name if run.tool and run.tool.driver else "Unknown"
+        run.results = [
+            result
+            for result in run.results
+            if finding_fingerprint(
+                FlatVulnerability.from_sarif_result(
+                    result, tool_name, "UNKNOWN", detected_at=detected_at
+                )
+            )
+            in new
+        ]
+    additional_reports = getattr(results, "additional_reports", None) or {}
+    for scanner_name, entries in additional_reports.items():
+        if isinstance(entries, list):
+            additional_reports[scanner_name] = [
+                entry
+                for entry in entries
+                if not isinstance(entry, dict)
+                or finding_fingerprint(
+                    FlatVulnerability.from_additional_report(entry, scanner_name)
+                )
+                in new
+            ]
+    return True
+
+
+def _finding_dict(row: sqlite3.Row) -> Dict[str, Any]:
+    finding = dict(row)
+    finding["is_suppressed"] = bool(finding["is_suppressed"])
+    return finding
+
+
+def record_findings_history(plugin_context: Any, results: Any) -> Optional[int]:
+    """Record ``results`` in the findings history configured for the run.
+
+    History is recorded by default, so any failure is logged and never fails
+    the scan.
+
+    Returns:
+        The sequence number of the recorded scan, or None
+    """
+    try:
+        history = FindingsHistory.from_context(plugin_context)
+        if history is None:
+            return None
+        with history:
+            return history.ingest(results)
+    except Exception as e:
+        ASH_LOGGER.warning(f"Could not record findings history: {e}")
+        return None
@@ -20,6 +20,11 @@ from automated_security_helper.core.constants import (
     ASH_CONFIG_FILE_NAMES,
     ASH_WORK_DIR_NAME,
 )
+from automated_security_helper.core.perf_profile import (
+    perf_span,
+    start_recording,
+    stop_recording,
+)
 from automated_security_helper.core.execution_engine import (
     ScanExecutionEngine as ScanExecutionEngine,
 )
@@ -205,6 +210,9 @@ class ASHScanOrchestrator(BaseModel):
                     "ash_aggregated_results.json",
                     "ash-ignore-report.txt",
                     "ash-scan-set-files-list.txt",
+                    # The MCP server tails this file for progress; a stale
+                    # stream would report the previous run as complete.
+                    "ash.events.jsonl",
                     # Don't delete log files here - they're managed by the logger
                     # which truncates them on initialization
                     # "ash.log",
@@ -315,6 +323,16 @@ class ASHScanOrchestrator(BaseModel):
         ASH_LOGGER.verbose(f"Configuration path: {self.config_path}")
         ASH_LOGGER.verbose(f"Executing phases: {phases}")
 
+        # Record scan-set discovery in the same profile as the phases; the
+        # execution engine writes the profile when it finishes.
+        perf_recorder, owns_perf_recorder = start_recording()
+        try:
+            return self._execute_scan(phases)
+        finally:
+            if owns_perf_recorder:
+                stop_recording(perf_recorder)
+
+    def _execute_scan(self, phases: List[ExecutionPhaseType]) -> AshAggregatedResults:
         try:
             # If existing results path is provided, load the model from it
             if self.existing_results_path and self.existing_results_path.exists():
@@ -361,11 +379,12 @@ class ASHScanOrchestrator(BaseModel):
             # Only identify files to scan if we're not using existing results
             elif "convert" in phases or "scan" in phases:
                 ASH_LOGGER.info("Identifying non-ignored files to include in scans")
-                self.source_scan_set = scan_set(
-                    source=str(self.source_dir),
-                    output=str(self.output_dir),
-                    debug=self.debug,
-                )
+                with perf_span("scan_set", "discovery"):
+                    self.source_scan_set = scan_set(
+                        source=str(self.source_dir),
+                        output=str(self.output_dir),
+                        debug=self.debug,
+                    )
                 ASH_LOGGER.info(
                     f"Found {len(self.source_scan_set)} files within the provided source directory to scan. Please see the 'ash-scan-set-files-list.txt' in the output folder for the full list of files identified to scan within the source directory identified."
                 )
@@ -0,0 +1,319 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Performance instrumentation for ASH runs.
+
+Code paths worth profiling wrap their work in :func:`perf_span`. While a
+:class:`PerfRecorder` is active, each span records its wall-clock time, the
+thread it ran on and the process's memory high-water mark when it finished.
+When no recorder is active, spans cost a single context variable lookup.
+
+The active recorder is held in a context variable, so concurrent runs in one
+process (e.g. scans started by the MCP server) each record their own spans.
+Threads do not inherit context variables; work submitted to a thread pool
+must run in a copy of the submitting context, e.g.
+``executor.submit(contextvars.copy_context().run, fn, *args)``, for its spans
+to be recorded.
+
+At the end of a run the execution engine writes the recording to
+``reports/ash.perf.json``. Set ``ASH_PERF_TRACE=1`` to also write
+``reports/ash.perf.trace.json`` in Chrome trace-event format, which can be
+opened in ``chrome://tracing`` or https://ui.perfetto.dev.
+"""
+
+import contextvars
+import json
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, ContextManager, Dict, Iterator, List, Optional, Tuple
+
+from automated_security_helper.utils.log import ASH_LOGGER
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - Windows
+    resource = None
+
+PERF_PROFILE_FILENAME = "ash.perf.json"
+PERF_TRACE_FILENAME = "ash.perf.trace.json"
+PERF_PROFILE_SCHEMA_VERSION = 1
+ENV_PERF_TRACE = "ASH_PERF_TRACE"
+
+
+def _peak_rss_kb() -> Optional[int]:
+    """Return the process's peak resident set size in KiB, if available.
+
+    This is ``ru_maxrss``: the most memory the process has used since it
+    started, not the memory used by the span being recorded.
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS reports bytes, Linux reports KiB.
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+@dataclass
+class PerfSpan:
+    """A single timed region of an ASH run."""
+
+    name: str
+    category: str
+    start_ns: int
+    end_ns: int
+    thread_id: int
+    thread_name: str
+    args: Dict[str, Any] = field(default_factory=dict)
+    # Process-lifetime RSS high-water mark when the span finished
+    peak_rss_kb: Optional[int] = None
+    tracemalloc_peak_kb: Optional[int] = None
+
+    @property
+    def duration_ms(self) -> float:
+        return (self.end_ns - self.start_ns) / 1_000_000
+
+
+class PerfRecorder:
+    """Collects spans from every thread of an ASH run."""
+
+    def __init__(self) -> None:
+        self.started_at = datetime.now(timezone.utc)
+        self._origin_ns = time.perf_counter_ns()
+        self._spans: List[PerfSpan] = []
+        self._lock = threading.Lock()
+
+    @property
+    def spans(self) -> List[PerfSpan]:
+        with self._lock:
+            return list(self._spans)
+
+    @contextmanager
+    def span(self, name: str, category: str = "ash", **args: Any) -> Iterator[None]:
+        """Time the enclosed block as a span named ``name``."""
+        start_ns = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            end_ns = time.perf_counter_ns()
+            thread = threading.current_thread()
+            tracemalloc_peak_kb = None
+            if tracemalloc.is_tracing():
+                tracemalloc_peak_kb = tracemalloc.get_traced_memory()[1] // 1024
+            recorded = PerfSpan(
+                name=name,
+                category=category,
+                start_ns=start_ns - self._origin_ns,
+                end_ns=end_ns - self._origin_ns,
+                thread_id=thread.ident or 0,
+                thread_name=thread.name,
+                args={k: v for k, v in args.items() if v is not None},
+                peak_rss_kb=_peak_rss_kb(),
+                tracemalloc_peak_kb=tracemalloc_peak_kb,
+            )
+            with self._lock:
+                self._spans.append(recorded)
+
+    def to_profile(self) -> Dict[str, Any]:
+        """Summarize the recording as the ``ash.perf.json`` document.
+
+        ``phases`` and ``plugins`` hold total milliseconds per span name;
+        ``spans`` lists every span in start order. ``peak_rss_kb`` values are
+        the process's RSS high-water mark since it started, so they never
+        decrease and include memory used before the run.
+        """
+        from automated_security_helper.utils.get_ash_version import get_ash_version
+
+        spans = sorted(self.spans, key=lambda s: s.start_ns)
+        phases: Dict[str, float] = {}
+        plugins: Dict[str, Dict[str, float]] = {}
+        operations: Dict[str, Dict[str, Any]] = {}
+        for span in spans:
+            key = f"{span.category}.{span.name}"
+            summary = operations.setdefault(
+                key, {"count": 0, "total_ms": 0.0, "max_ms": 0.0}
+            )
+            summary["count"] += 1
+            summary["total_ms"] += span.duration_ms
+            summary["max_ms"] = max(summary["max_ms"], span.duration_ms)
+            if span.category == "phase":
+                phases[span.name] = phases.get(span.name, 0.0) + span.duration_ms
+            plugin = span.args.get("plugin")
+            if plugin:
+                totals = plugins.setdefault(str(plugin), {})
+                totals[span.name] = totals.get(span.name, 0.0) + span.duration_ms
+
+        # Scanner time not spent waiting on subprocesses is in-process work
+        # such as parsing tool output into SARIF.
+        for totals in plugins.values():
+            if "scan" in totals and "subprocess" in totals:
+                totals["in_process"] = max(totals["scan"] - totals["subprocess"], 0.0)
+
+        end_ns = max((s.end_ns for s in spans), default=0)
+        return {
+            "schema_version": PERF_PROFILE_SCHEMA_VERSION,
+            "ash_version": get_ash_version(),
+            "python_version": sys.version.split()[0],
+            "platform": sys.platform,
+            "started_at": self.started_at.isoformat(),
+            "duration_ms": end_ns / 1_000_000,
+            "peak_rss_kb": _peak_rss_kb(),
+            "phases": _round_values(phases),
+            "plugins": {k: _round_values(v) for k, v in sorted(plugins.items())},
+            "operations": {
+                k: {
+                    **v,
+                    "total_ms": round(v["total_ms"], 3),
+                    "max_ms": round(v["max_ms"], 3),
+                }
+                for k, v in sorted(operations.items())
+            },
+            "spans": [
+                {
+                    "name": s.name,
+                    "category": s.category,
+                    "start_ms": round(s.start_ns / 1_000_000, 3),
+                    "duration_ms": round(s.duration_ms, 3),
+                    "thread": s.thread_name,
+                    "peak_rss_kb": s.peak_rss_kb,
+                    "tracemalloc_peak_kb": s.tracemalloc_peak_kb,
+                    "args": s.args,
+                }
+                for s in spans
+            ],
+        }
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        """Return the recording in Chrome trace-event format."""
+        pid = os.getpid()
+        events: List[Dict[str, Any]] = []
+        threads: Dict[int, str] = {}
+        for span in sorted(self.spans, key=lambda s: s.start_ns):
+            threads.setdefault(span.thread_id, span.thread_name)
+            events.append(
+                {
+                    "name": span.name,
+                    "cat": span.category,
+                    "ph": "X",
+                    "ts": span.start_ns / 1000,
+                    "dur": (span.end_ns - span.start_ns) / 1000,
+                    "pid": pid,
+                    "tid": span.thread_id,
+                    "args": {
+                        **{k: str(v) for k, v in span.args.items()},
+                        "peak_rss_kb": span.peak_rss_kb,
+                    },
+                }
+            )
+        for thread_id, thread_name in threads.items():
+            events.append(
+                {
+                    "name": "thread_name",
+                    "ph": "M",
+                    "pid": pid,
+                    "tid": thread_id,
+                    "args": {"name": thread_name},
+                }
+            )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write(
+        self, reports_dir: Path, trace: Optional[bool] = None
+    ) -> Tuple[Path, Optional[Path]]:
+        """Write ``ash.perf.json`` (and optionally the Chrome trace) to ``reports_dir``.
+
+        Args:
+            reports_dir: Directory to write the files to
+            trace: Also write the Chrome trace; defaults to the
+                ``ASH_PERF_TRACE`` environment variable
+
+        Returns:
+            The profile path and the trace path (None if not written)
+        """
+        if trace is None:
+            trace = os.environ.get(ENV_PERF_TRACE, "").lower() in ("1", "true", "yes")
+        reports_dir = Path(reports_dir)
+        reports_dir.mkdir(parents=True, exist_ok=True)
+        profile_path = reports_dir.joinpath(PERF_PROFILE_FILENAME)
+        profile_path.write_text(
+            json.dumps(self.to_profile(), indent=2, default=str), encoding="utf-8"
+        )
+        trace_path = None
+        if trace:
+            trace_path = reports_dir.joinpath(PERF_TRACE_FILENAME)
+            trace_path.write_text(
+                json.dumps(self.to_chrome_trace(), default=str), encoding="utf-8"
+            )
+        return profile_path, trace_path
+
+
+def _round_values(values: Dict[str, float]) -> Dict[str, float]:
+    return {k: round(v, 3) for k, v in values.items()}
+
+
+_active_recorder: contextvars.ContextVar[Optional[PerfRecorder]] = (
+    contextvars.ContextVar("ash_perf_recorder", default=None)
+)
+
+
+def get_active_recorder() -> Optional[PerfRecorder]:
+    """Return the recorder for the current run, if one is active."""
+    return _active_recorder.get()
+
+
+def start_recording() -> Tuple[PerfRecorder, bool]:
+    """Activate a recorder in the current context unless one is already active.
+
+    Returns:
+        The active recorder and whether this call started it; only the caller
+        that started a recorder should stop it
+    """
+    recorder = _active_recorder.get()
+    if recorder is not None:
+        return recorder, False
+    recorder = PerfRecorder()
+    _active_recorder.set(recorder)
+    return recorder, True
+
+
+def stop_recording(recorder: PerfRecorder) -> None:
+    """Deactivate ``recorder`` if it is the active recorder."""
+    if _active_recorder.get() is recorder:
+        _active_recorder.set(None)
+
+
+def perf_span(name: str, category: str = "ash", **args: Any) -> ContextManager:
+    """Time the enclosed block on the active recorder, if any.
+
+    Args:
+        name: Span name, e.g. ``scan`` or ``apply_suppressions``
+        category: Span category, e.g. ``phase``, ``scanner`` or ``reporter``
+        **args: Extra details; pass ``plugin=<name>`` to attribute the span to
+            a plugin in the profile's ``plugins`` summary
+    """
+    recorder = _active_recorder.get()
+    if recorder is None:
+        return nullcontext()
+    return recorder.span(name, category, **args)
+
+
+def write_active_profile(reports_dir: Path) -> Optional[Path]:
+    """Write the active recording to ``reports_dir``, logging instead of raising."""
+    recorder = _active_recorder.get()
+    if recorder is None:
+        return None
+    try:
+        profile_path, trace_path = recorder.write(reports_dir)
+    except Exception as e:
+        ASH_LOGGER.warning(f"Failed to write performance profile: {e}")
+        return None
+    ASH_LOGGER.debug(f"Wrote performance profile to {profile_path.as_posix()}")
+    if trace_path is not None:
+        ASH_LOGGER.info(f"Wrote Chrome trace to {trace_path.as_posix()}")
+    return profile_path
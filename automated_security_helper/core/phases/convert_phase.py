@@ -3,6 +3,7 @@
 from pathlib import Path
 from automated_security_helper.base.engine_phase import EnginePhase
 from automated_security_helper.core.enums import ExecutionPhase
+from automated_security_helper.core.perf_profile import perf_span
 from automated_security_helper.models.asharp_model import (
     AshAggregatedResults,
     ConverterStatusInfo,
@@ -174,7 +175,16 @@ class ConvertPhase(EnginePhase):
                     )
 
                 # Pass the source directory as the target
-                convert_result_initial = plugin_instance.convert()
+                with perf_span(
+                    "convert",
+                    "converter",
+                    plugin=getattr(
+                        plugin_instance.config,
+                        "name",
+                        plugin_instance.__class__.__name__,
+                    ),
+                ):
+                    convert_result_initial = plugin_instance.convert()
                 # Ensure all convert_result are strings in case some are Paths
                 convert_result = []
                 if convert_result_initial is not None:
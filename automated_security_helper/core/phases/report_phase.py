@@ -1,10 +1,17 @@
 """Implementation of the Report phase."""
 
+from concurrent.futures import ThreadPoolExecutor
+import contextvars
+import os
 from pathlib import Path
+import tempfile
 import traceback
+from typing import Any, List, Optional
 from automated_security_helper.base.engine_phase import EnginePhase
 from automated_security_helper.core.enums import ExecutionPhase
+from automated_security_helper.core.perf_profile import perf_span
 from automated_security_helper.models.asharp_model import AshAggregatedResults
+from automated_security_helper.plugins.events import AshEventType
 from automated_security_helper.utils.log import ASH_LOGGER
 
 
@@ -22,6 +29,8 @@ class ReportPhase(EnginePhase):
         aggregated_results: AshAggregatedResults,
         cli_output_formats=None,
         python_based_plugins_only: bool = False,
+        parallel: bool = False,
+        max_workers: int = 4,
         **kwargs,
     ) -> AshAggregatedResults:
         """Execute the Report phase.
@@ -29,6 +38,8 @@ class ReportPhase(EnginePhase):
         Args:
             report_dir(Path): The directory to save reports to.
             cli_output_formats: Output formats specified via CLI, which override config
+            parallel: Whether to run reporters concurrently in a thread pool
+            max_workers: Maximum number of worker threads for parallel execution
             **kwargs: Additional arguments
         """
         ASH_LOGGER.debug("Entering: ReportPhase._execute_phase()")
@@ -90,11 +101,7 @@ class ReportPhase(EnginePhase):
         enabled_reporters = []
         enabled_reporter_names = []
         for plugin_instance in base_filtered:
-            display_name = plugin_instance.__class__.__name__
-            if hasattr(plugin_instance, "config") and hasattr(
-                plugin_instance.config, "name"
-            ):
-                display_name = plugin_instance.config.name
+            display_name = self._get_display_name(plugin_instance)
 
             if (
                 output_formats
@@ -130,188 +137,332 @@ class ReportPhase(EnginePhase):
             description=f"Generating reports with {len(enabled_reporter_names)} reporters...",
         )
 
-        # Track progress for each reporter
-        total_reporters = len(enabled_reporters)
-        completed = 0
-
         # Directly invoke each reporter plugin
         results = []
         if enabled_reporters:
             ASH_LOGGER.debug(
                 f"Processing {len(enabled_reporters)} enabled reporter classes"
             )
-            for plugin_instance in enabled_reporters:
-                try:
-                    plugin_name = plugin_instance.__class__.__name__
-                    ASH_LOGGER.debug(f"Initializing reporter: {plugin_name}")
-
-                    # Create a task for this reporter
-                    reporter_task = self.progress_display.add_task(
-                        phase=ExecutionPhase.REPORT,
-                        description=f"Starting reporter: {plugin_name}",
-                        total=100,
-                    )
+            if parallel and len(enabled_reporters) > 1:
+                results = self._run_reporters_parallel(
+                    enabled_reporters=enabled_reporters,
+                    aggregated_results=aggregated_results,
+                    report_dir=report_dir,
+                    max_workers=max_workers,
+                )
+            else:
+                results = self._run_reporters_sequential(
+                    enabled_reporters=enabled_reporters,
+                    aggregated_results=aggregated_results,
+                    report_dir=report_dir,
+                )
+        else:
+            ASH_LOGGER.warning("No enabled reporters found matching requested formats")
 
-                    # Use the configured name if available
-                    display_name = plugin_name
-                    if hasattr(plugin_instance, "config") and hasattr(
-                        plugin_instance.config, "name"
-                    ):
-                        display_name = plugin_instance.config.name
-
-                    # Update reporter task to 50%
-                    self.progress_display.update_task(
-                        phase=ExecutionPhase.REPORT,
-                        task_id=reporter_task,
-                        completed=50,
-                        description=f"Running reporter: {display_name}",
-                    )
+        # Update main progress
+        self.update_progress(
+            100,
+            f"Reporters complete: {len(results)} reports generated from {len(enabled_reporters)} reporters",
+        )
 
-                    # Update main progress
-                    progress_percent = 20 + (completed / total_reporters * 70)
-                    self.update_progress(
-                        int(progress_percent),
-                        f"Running reporter {completed + 1}/{total_reporters}: {display_name}",
-                    )
+        # Update progress
+        self.progress_display.update_task(
+            phase=ExecutionPhase.REPORT,
+            task_id=report_task,
+            completed=100,
+            description=f"Reporters complete: {len(results)} reports generated from {len(enabled_reporters)} reporters",
+        )
 
-                    # Call report method directly
-                    ASH_LOGGER.debug(f"Calling report() on {display_name}")
+        # Add summary row
+        self.add_summary("Complete", f"Generated {len(results)} reports")
 
-                    # Notify reporter start
-                    try:
-                        from automated_security_helper.plugins.events import (
-                            AshEventType,
-                        )
+        return aggregated_results
 
-                        self.notify_event(
-                            AshEventType.REPORT_START,
-                            reporter=display_name,
-                            reporter_class=plugin_instance.__class__.__name__,
-                            message=f"Starting reporter: {display_name}",
-                        )
-                    except Exception as event_error:
-                        ASH_LOGGER.error(
-                            f"Failed to notify reporter start event: {str(event_error)}"
-                        )
+    @staticmethod
+    def _get_display_name(plugin_instance: Any) -> str:
+        """Return the configured reporter name, falling back to the class name."""
+        if hasattr(plugin_instance, "config") and hasattr(
+            plugin_instance.config, "name"
+        ):
+            return plugin_instance.config.name
+        return plugin_instance.__class__.__name__
+
+    def _add_reporter_task(self, plugin_instance: Any) -> Any:
+        """Create the progress task shown for a single reporter."""
+        return self.progress_display.add_task(
+            phase=ExecutionPhase.REPORT,
+            description=f"Starting reporter: {plugin_instance.__class__.__name__}",
+            total=100,
+        )
 
-                    report_result = plugin_instance.report(aggregated_results)
+    @staticmethod
+    def _get_output_filename(plugin_instance: Any) -> str:
+        """Return the report filename, based on the reporter's extension if set."""
+        if hasattr(plugin_instance, "config") and hasattr(
+            plugin_instance.config, "extension"
+        ):
+            return f"ash.{plugin_instance.config.extension}"
+        return "ash.txt"
 
-                    if report_result:
-                        ASH_LOGGER.debug(f"Reporter {display_name} returned a report")
+    def _generate_report(
+        self,
+        plugin_instance: Any,
+        reporter_task: Any,
+        aggregated_results: AshAggregatedResults,
+        report_dir: Path,
+    ) -> Optional[Path]:
+        """Run a single reporter and write its output to a temporary file.
 
-                        # Determine output filename based on reporter's extension if available
-                        output_filename = "ash.txt"  # Default
-                        if hasattr(plugin_instance, "config") and hasattr(
-                            plugin_instance.config, "extension"
-                        ):
-                            extension = plugin_instance.config.extension
-                            output_filename = f"ash.{extension}"
+        Reporters that support streaming write straight to the file, so the
+        report never has to be held in memory as one string. The temporary
+        file is only moved into place by ``_write_report``, which keeps a
+        reporter that fails part-way from leaving a truncated report behind.
 
-                        # Write the report to a file
-                        output_file = report_dir.joinpath(output_filename)
-                        ASH_LOGGER.info(
-                            f"Writing {display_name} report to {output_file}"
-                        )
-                        with open(output_file, mode="w", encoding="utf-8") as f:
-                            f.write(report_result)
+        Safe to call from worker threads: it only reads ``aggregated_results``
+        and touches the reporter's own progress task and temporary file.
 
-                        results.append(report_result)
+        Returns:
+            Path of the temporary file holding the report, or None if the
+            reporter produced no report
+        """
+        display_name = self._get_display_name(plugin_instance)
+        self.progress_display.update_task(
+            phase=ExecutionPhase.REPORT,
+            task_id=reporter_task,
+            completed=50,
+            description=f"Running reporter: {display_name}",
+        )
 
-                        # Update reporter task to 100%
-                        self.progress_display.update_task(
-                            phase=ExecutionPhase.REPORT,
-                            task_id=reporter_task,
-                            completed=100,
-                            description=f"[green]({display_name}) Generated report: {output_filename}",
-                        )
+        ASH_LOGGER.debug(f"Calling report() on {display_name}")
+        try:
+            self.notify_event(
+                AshEventType.REPORT_START,
+                reporter=display_name,
+                reporter_class=plugin_instance.__class__.__name__,
+                message=f"Starting reporter: {display_name}",
+            )
+        except Exception as event_error:
+            ASH_LOGGER.error(
+                f"Failed to notify reporter start event: {str(event_error)}"
+            )
 
-                        # Notify reporter complete
-                        try:
-                            from automated_security_helper.plugins.events import (
-                                AshEventType,
-                            )
-
-                            self.notify_event(
-                                AshEventType.REPORT_COMPLETE,
-                                reporter=display_name,
-                                reporter_class=plugin_instance.__class__.__name__,
-                                output_file=str(output_file),
-                                output_filename=output_filename,
-                                message=f"Reporter {display_name} completed: {output_filename}",
-                            )
-                        except Exception as event_error:
-                            ASH_LOGGER.error(
-                                f"Failed to notify reporter complete event: {str(event_error)}"
-                            )
-                    else:
-                        ASH_LOGGER.debug(
-                            f"Reporter {display_name} returned None or empty report"
-                        )
+        with perf_span("report", "reporter", plugin=display_name):
+            return self._render_report(plugin_instance, aggregated_results, report_dir)
 
-                        # Update reporter task to 100%
-                        self.progress_display.update_task(
-                            phase=ExecutionPhase.REPORT,
-                            task_id=reporter_task,
-                            completed=100,
-                            description=f"[yellow]({display_name}) No report generated",
-                        )
+    def _render_report(
+        self,
+        plugin_instance: Any,
+        aggregated_results: AshAggregatedResults,
+        report_dir: Path,
+    ) -> Optional[Path]:
+        """Render a reporter's output into a temporary file in ``report_dir``."""
+        streaming = getattr(plugin_instance, "supports_streaming", False) is True
+        if not streaming:
+            report_result = plugin_instance.report(aggregated_results)
+            if not report_result:
+                return None
+
+        fd, temp_name = tempfile.mkstemp(
+            dir=report_dir,
+            prefix=f".{self._get_output_filename(plugin_instance)}.",
+            suffix=".tmp",
+        )
+        temp_path = Path(temp_name)
+        try:
+            with os.fdopen(fd, mode="w", encoding="utf-8") as f:
+                if streaming:
+                    written = plugin_instance.report_stream(aggregated_results, f)
+                else:
+                    f.write(report_result)
+                    written = True
+        except BaseException:
+            temp_path.unlink(missing_ok=True)
+            raise
+
+        if not written:
+            temp_path.unlink(missing_ok=True)
+            return None
+        return temp_path
+
+    def _write_report(
+        self,
+        plugin_instance: Any,
+        reporter_task: Any,
+        report_file: Optional[Path],
+        report_dir: Path,
+    ) -> Optional[str]:
+        """Move a generated report into place in the report directory.
 
-                        # Notify reporter complete (no report)
-                        try:
-                            from automated_security_helper.plugins.events import (
-                                AshEventType,
-                            )
-
-                            self.notify_event(
-                                AshEventType.REPORT_COMPLETE,
-                                reporter=display_name,
-                                reporter_class=plugin_instance.__class__.__name__,
-                                output_file=None,
-                                output_filename=None,
-                                message=f"Reporter {display_name} completed: no report generated",
-                            )
-                        except Exception as event_error:
-                            ASH_LOGGER.error(
-                                f"Failed to notify reporter complete event: {str(event_error)}"
-                            )
-
-                    # Increment completed count
-                    completed += 1
+        Returns:
+            Path of the written report, or None if the reporter produced none
+        """
+        display_name = self._get_display_name(plugin_instance)
+        output_file = None
+        output_filename = None
+
+        if report_file is not None:
+            ASH_LOGGER.debug(f"Reporter {display_name} returned a report")
+            output_filename = self._get_output_filename(plugin_instance)
+            output_file = report_dir.joinpath(output_filename)
+            ASH_LOGGER.info(f"Writing {display_name} report to {output_file}")
+            os.replace(report_file, output_file)
+
+            self.progress_display.update_task(
+                phase=ExecutionPhase.REPORT,
+                task_id=reporter_task,
+                completed=100,
+                description=f"[green]({display_name}) Generated report: {output_filename}",
+            )
+            message = f"Reporter {display_name} completed: {output_filename}"
+        else:
+            ASH_LOGGER.debug(f"Reporter {display_name} returned None or empty report")
+            self.progress_display.update_task(
+                phase=ExecutionPhase.REPORT,
+                task_id=reporter_task,
+                completed=100,
+                description=f"[yellow]({display_name}) No report generated",
+            )
+            message = f"Reporter {display_name} completed: no report generated"
+
+        try:
+            self.notify_event(
+                AshEventType.REPORT_COMPLETE,
+                reporter=display_name,
+                reporter_class=plugin_instance.__class__.__name__,
+                output_file=str(output_file) if output_file else None,
+                output_filename=output_filename,
+                message=message,
+            )
+        except Exception as event_error:
+            ASH_LOGGER.error(
+                f"Failed to notify reporter complete event: {str(event_error)}"
+            )
 
-                except Exception as e:
-                    ASH_LOGGER.error(f"Error in reporter {plugin_name}: {e}")
-                    ASH_LOGGER.debug(
-                        f"Reporter exception traceback: {traceback.format_exc()}"
-                    )
+        return str(output_file) if output_file else None
 
-                    # Update reporter task to show error
-                    self.progress_display.update_task(
-                        phase=ExecutionPhase.REPORT,
-                        task_id=reporter_task,
-                        completed=100,
-                        description=f"[red]({display_name}) Failed: {str(e)}",
-                    )
+    def _handle_reporter_error(
+        self, plugin_instance: Any, reporter_task: Any, error: Exception
+    ) -> None:
+        """Log a reporter failure and mark its progress task as failed."""
+        ASH_LOGGER.error(
+            f"Error in reporter {plugin_instance.__class__.__name__}: {error}"
+        )
+        ASH_LOGGER.debug(f"Reporter exception traceback: {traceback.format_exc()}")
+        if reporter_task is not None:
+            self.progress_display.update_task(
+                phase=ExecutionPhase.REPORT,
+                task_id=reporter_task,
+                completed=100,
+                description=f"[red]({self._get_display_name(plugin_instance)}) Failed: {str(error)}",
+            )
 
-                    # Increment completed count
-                    completed += 1
-        else:
-            ASH_LOGGER.warning("No enabled reporters found matching requested formats")
+    def _run_reporters_sequential(
+        self,
+        enabled_reporters: List[Any],
+        aggregated_results: AshAggregatedResults,
+        report_dir: Path,
+    ) -> List[str]:
+        """Run reporters one after another in the order they were enabled."""
+        results = []
+        total_reporters = len(enabled_reporters)
+        for completed, plugin_instance in enumerate(enabled_reporters):
+            reporter_task = None
+            try:
+                ASH_LOGGER.debug(
+                    f"Initializing reporter: {plugin_instance.__class__.__name__}"
+                )
+                reporter_task = self._add_reporter_task(plugin_instance)
+                progress_percent = 20 + (completed / total_reporters * 70)
+                self.update_progress(
+                    int(progress_percent),
+                    f"Running reporter {completed + 1}/{total_reporters}: {self._get_display_name(plugin_instance)}",
+                )
+                report_file = self._generate_report(
+                    plugin_instance, reporter_task, aggregated_results, report_dir
+                )
+                written = self._write_report(
+                    plugin_instance, reporter_task, report_file, report_dir
+                )
+                if written:
+                    results.append(written)
+            except Exception as e:
+                self._handle_reporter_error(plugin_instance, reporter_task, e)
+        return results
 
-        # Update main progress
+    def _run_reporters_parallel(
+        self,
+        enabled_reporters: List[Any],
+        aggregated_results: AshAggregatedResults,
+        report_dir: Path,
+        max_workers: int = 4,
+    ) -> List[str]:
+        """Run reporters concurrently against one shared, read-only model.
+
+        Reporters that declare ``thread_safe`` generate their reports in a
+        thread pool. Other reporters, including third-party plugins that have
+        not opted in, generate theirs on the calling thread, one at a time,
+        while the pool works. Outputs are then written and REPORT_COMPLETE
+        events emitted in the same order the reporters were enabled, so the
+        report directory and event stream do not depend on which reporter
+        happens to finish first. A failing reporter only marks its own task
+        as failed.
+        """
+        # to_flat_vulnerabilities() updates the model's suppression stats the
+        # first time it runs, and its findings serialize their lazy fields on
+        # first read. Build and fully serialize the findings once up front so
+        # reporters only ever read the model and the shared findings.
+        aggregated_results.to_flat_vulnerabilities(eager=True)
+
+        reporter_tasks = [
+            self._add_reporter_task(plugin_instance)
+            for plugin_instance in enabled_reporters
+        ]
         self.update_progress(
-            100,
-            f"Reporters complete: {len(results)} reports generated from {len(enabled_reporters)} reporters",
-        )
-
-        # Update progress
-        self.progress_display.update_task(
-            phase=ExecutionPhase.REPORT,
-            task_id=report_task,
-            completed=100,
-            description=f"Reporters complete: {len(results)} reports generated from {len(enabled_reporters)} reporters",
+            40, f"Running {len(enabled_reporters)} reporters in parallel..."
         )
 
-        # Add summary row
-        self.add_summary("Complete", f"Generated {len(results)} reports")
+        results = []
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(max_workers, len(enabled_reporters)))
+        ) as executor:
+            futures = [
+                executor.submit(
+                    contextvars.copy_context().run,
+                    self._generate_report,
+                    plugin_instance,
+                    reporter_task,
+                    aggregated_results,
+                    report_dir,
+                )
+                if self._is_thread_safe(plugin_instance)
+                else None
+                for plugin_instance, reporter_task in zip(
+                    enabled_reporters, reporter_tasks
+                )
+            ]
+            for plugin_instance, reporter_task, future in zip(
+                enabled_reporters, reporter_tasks, futures
+            ):
+                try:
+                    if future is None:
+                        report_file = self._generate_report(
+                            plugin_instance,
+                            reporter_task,
+                            aggregated_results,
+                            report_dir,
+                        )
+                    else:
+                        report_file = future.result()
+                    written = self._write_report(
+                        plugin_instance, reporter_task, report_file, report_dir
+                    )
+                    if written:
+                        results.append(written)
+                except Exception as e:
+                    self._handle_reporter_error(plugin_instance, reporter_task, e)
+        return results
 
-        return aggregated_results
+    @staticmethod
+    def _is_thread_safe(plugin_instance: Any) -> bool:
+        """Whether a reporter declared that it can run alongside other reporters."""
+        return getattr(plugin_instance, "thread_safe", False) is True
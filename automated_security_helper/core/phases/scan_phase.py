@@ -1,6 +1,7 @@
 """Implementation of the Scan phase."""
 
 from concurrent.futures import ThreadPoolExecutor, as_completed
+import contextvars
 from datetime import datetime
 import json
 from typing import Dict, List, Any, Tuple
@@ -8,6 +9,7 @@ from pathlib import Path
 
 from automated_security_helper.base.engine_phase import EnginePhase
 from automated_security_helper.core.enums import ExecutionPhase, ScannerStatus
+from automated_security_helper.core.perf_profile import perf_span
 from automated_security_helper.models.asharp_model import (
     AshAggregatedResults,
     ScannerSeverityCount,
@@ -257,9 +259,12 @@ class ScanPhase(EnginePhase):
 
                         # Check dependencies early
                         ASH_LOGGER.debug(f"Validating dependencies for: {display_name}")
-                        plugin_instance.dependencies_satisfied = (
-                            plugin_instance.validate_plugin_dependencies()
-                        )
+                        with perf_span(
+                            "validate_dependencies", "scanner", plugin=display_name
+                        ):
+                            plugin_instance.dependencies_satisfied = (
+                                plugin_instance.validate_plugin_dependencies()
+                            )
                         if not plugin_instance.dependencies_satisfied:
                             ASH_LOGGER.warning(
                                 f"Scanner {display_name} dependencies are not satisfied, marking as MISSING"
@@ -825,7 +830,15 @@ class ScanPhase(EnginePhase):
                     completed=10,
                     description=f"[blue]({scanner_name}) Queued scan...",
                 )
-                future = executor.submit(self._safe_execute_scanner, scanner_name, scanner_plugin, scan_targets)
+                # Run in a copy of this context so the scanner's perf spans
+                # reach this run's recorder.
+                future = executor.submit(
+                    contextvars.copy_context().run,
+                    self._safe_execute_scanner,
+                    scanner_name,
+                    scanner_plugin,
+                    scan_targets,
+                )
                 future.scanner_info = {"name": scanner_name, "task_key": task_key}
                 futures.append(future)
 
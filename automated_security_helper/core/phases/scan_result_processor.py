@@ -4,13 +4,16 @@ import json
 import traceback
 from typing import Any
 
+from automated_security_helper.core.perf_profile import perf_span
 from automated_security_helper.models.asharp_model import AshAggregatedResults
 from automated_security_helper.models.scan_results_container import ScanResultsContainer
 from automated_security_helper.models.scanner_validation import ScannerValidationManager
 from automated_security_helper.utils.get_ash_version import get_ash_version
 from automated_security_helper.utils.log import ASH_LOGGER
+from automated_security_helper.utils.uri_normalizer import get_uri_normalizer
 from automated_security_helper.utils.sarif_utils import (
     apply_suppressions_to_sarif,
+    mask_secrets_in_sarif,
     sanitize_sarif_paths,
 )
 
@@ -70,14 +73,25 @@ class ScanResultProcessor:
                 f"{scanner_name}: Processing as SARIF report with "
                 f"{len(results.raw_results.runs[0].results) if results.raw_results.runs and results.raw_results.runs[0].results else 0} results"
             )
-            sanitized_sarif = sanitize_sarif_paths(results.raw_results, self.plugin_context.source_dir)
+            with perf_span("sanitize_paths", "postprocess", plugin=scanner_name):
+                sanitized_sarif = sanitize_sarif_paths(
+                    results.raw_results,
+                    self.plugin_context.source_dir,
+                    normalizer=get_uri_normalizer(self.plugin_context),
+                )
+            # Results from the scanner executor are masked already and skipped here.
+            with perf_span("mask_secrets", "postprocess", plugin=scanner_name):
+                sanitized_sarif = mask_secrets_in_sarif(
+                    sanitized_sarif, scanner_name=scanner_name
+                )
 
             if not self.plugin_context.ignore_suppressions:
-                sanitized_sarif = apply_suppressions_to_sarif(
-                    sarif_report=sanitized_sarif,
-                    plugin_context=self.plugin_context,
-                    used_suppressions=aggregated_results.used_suppressions,
-                )
+                with perf_span("apply_suppressions", "postprocess", plugin=scanner_name):
+                    sanitized_sarif = apply_suppressions_to_sarif(
+                        sarif_report=sanitized_sarif,
+                        plugin_context=self.plugin_context,
+                        used_suppressions=aggregated_results.used_suppressions,
+                    )
             else:
                 ASH_LOGGER.debug("Skipping suppression application due to --ignore-suppressions flag")
 
@@ -116,7 +130,8 @@ class ScanResultProcessor:
             )
 
             if aggregated_results.sarif is not None:
-                aggregated_results.sarif.merge_sarif_report(sanitized_sarif)
+                with perf_span("merge_sarif", "postprocess", plugin=scanner_name):
+                    aggregated_results.sarif.merge_sarif_report(sanitized_sarif)
             target_report = aggregated_results.additional_reports[scanner_name][results.target_type]
             target_report.pop("raw_results", None)
 
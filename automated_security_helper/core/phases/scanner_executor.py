@@ -1,18 +1,23 @@
 """ScannerExecutor — owns scanner task lifecycle for ScanPhase."""
 
+import contextvars
 import traceback
 from concurrent.futures import Future, ThreadPoolExecutor, as_completed
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from automated_security_helper.base.scanner_plugin import ScannerPluginBase
 from automated_security_helper.core.enums import ExecutionPhase, ScannerStatus
+from automated_security_helper.core.perf_profile import perf_span
+from automated_security_helper.core.scanner_result_cache import ScannerResultCache
 from automated_security_helper.models.asharp_model import AshAggregatedResults, ScannerSeverityCount
 from automated_security_helper.models.scan_results_container import ScanResultsContainer
 from automated_security_helper.utils.log import ASH_LOGGER
+from automated_security_helper.utils.uri_normalizer import get_uri_normalizer
 from automated_security_helper.utils.sarif_utils import (
     apply_suppressions_to_sarif,
+    mask_secrets_in_sarif,
     sanitize_sarif_paths,
 )
 
@@ -58,6 +63,10 @@ class ScannerExecutor:
         self.completed_scanners: List[ScannerPluginBase] = []
         # Populated by caller when scanner must respect ignored paths
         self._global_ignore_paths: List[Any] = []
+        self._result_cache: Optional[ScannerResultCache] = None
+        settings = getattr(getattr(plugin_context, "config", None), "scanner_result_cache", None)
+        if getattr(settings, "enabled", False) is True:
+            self._result_cache = ScannerResultCache.from_context(plugin_context)
 
     # ------------------------------------------------------------------
     # Internal helpers
@@ -70,6 +79,52 @@ class ScannerExecutor:
             except Exception as e:
                 ASH_LOGGER.error(f"Failed to notify event {event_type}: {e}")
 
+    def _cache_key(
+        self,
+        scanner_plugin: ScannerPluginBase,
+        scanner_config: Any,
+        scan_target: Any,
+        target_type: str,
+    ) -> Optional[str]:
+        """Return the result cache key for a scanner run, or None if caching is off."""
+        if self._result_cache is None:
+            return None
+        try:
+            with perf_span("cache_key", "scanner", plugin=str(scanner_config.name)):
+                return self._result_cache.key_for(
+                    scanner_plugin=scanner_plugin,
+                    scanner_config=scanner_config,
+                    target=Path(scan_target),
+                    target_type=target_type,
+                    global_ignore_paths=self._global_ignore_paths,
+                )
+        except Exception as e:
+            ASH_LOGGER.warning(
+                f"Scanner result cache disabled for {scanner_config.name}: {e}"
+            )
+            return None
+
+    def _scanner_outputs_dir(self, scanner_name: str, target_type: str) -> Path:
+        """Directory a scanner writes its raw output files for one target type to."""
+        return self.plugin_context.output_dir.joinpath(
+            "scanners", scanner_name, target_type
+        )
+
+    @staticmethod
+    def _summarize_results(results_list: List[ScanResultsContainer]) -> Dict[str, Any]:
+        """Return the finding totals carried on SCAN_COMPLETE events."""
+        severity_counts = ScannerSeverityCount()
+        for container in results_list:
+            counts = getattr(container, "severity_counts", None)
+            if isinstance(counts, ScannerSeverityCount):
+                for severity, count in counts.model_dump().items():
+                    setattr(severity_counts, severity, getattr(severity_counts, severity, 0) + int(count or 0))
+        return {
+            "finding_count": sum(int(getattr(c, "finding_count", 0) or 0) for c in results_list),
+            "severity_counts": severity_counts.model_dump(),
+            "target_types": [c.target_type for c in results_list if getattr(c, "target_type", None)],
+        }
+
     def _process_results_fn(
         self,
         results: ScanResultsContainer,
@@ -117,20 +172,43 @@ class ScannerExecutor:
 
                 raw_results: Any = None
                 scanner_config_name: str = str(scanner_config.name) if scanner_config else scanner_plugin.__class__.__name__
+                cache_key: Optional[str] = None
+                cached = None
                 try:
                     if scanner_config and scanner_config.enabled:
+                        cache_key = self._cache_key(
+                            scanner_plugin, scanner_config, scan_target, target_type
+                        )
+                        if cache_key is not None:
+                            cached = self._result_cache.load(cache_key)
+                    if cached is not None:
+                        ASH_LOGGER.info(
+                            f"Reusing cached {scanner_config_name} results for {target_type}; "
+                            "the scan target is unchanged since the last run"
+                        )
+                        raw_results = cached.report
+                        cached.restore_outputs(
+                            self._scanner_outputs_dir(scanner_config_name, target_type)
+                        )
+                    elif scanner_config and scanner_config.enabled:
                         ASH_LOGGER.debug(f"Executing {scanner_config_name}.scan() on {target_type}")
                         if not hasattr(scanner_plugin, "context") or scanner_plugin.context is None:
                             scanner_plugin.context = self.plugin_context
                         scanner_plugin.results_dir = (
                             self.plugin_context.output_dir.joinpath("scanners").joinpath(scanner_config_name)
                         )
-                        raw_results = scanner_plugin.scan(
-                            target=scan_target,
-                            config=scanner_config,
+                        with perf_span(
+                            "scan",
+                            "scanner",
+                            plugin=scanner_config_name,
                             target_type=target_type,
-                            global_ignore_paths=self._global_ignore_paths,
-                        )
+                        ):
+                            raw_results = scanner_plugin.scan(
+                                target=scan_target,
+                                config=scanner_config,
+                                target_type=target_type,
+                                global_ignore_paths=self._global_ignore_paths,
+                            )
                     else:
                         ASH_LOGGER.warning(f"{scanner_config_name} is not enabled!")
                 except Exception as e:
@@ -168,15 +246,23 @@ class ScannerExecutor:
                         )
                         container.status = ScannerStatus.MISSING
 
-                    container.start_time = scanner_plugin.start_time
-                    container.end_time = scanner_plugin.end_time
+                    if cached is not None:
+                        container.start_time = container.end_time = datetime.now(timezone.utc)
+                        container.add_metadata("cache_hit", True)
+                        container.add_metadata(
+                            "cached_at",
+                            datetime.fromtimestamp(cached.stored_at, timezone.utc).isoformat(),
+                        )
+                    else:
+                        container.start_time = scanner_plugin.start_time
+                        container.end_time = scanner_plugin.end_time
                     container.duration = None
                     try:
-                        if isinstance(scanner_plugin.end_time, datetime) and isinstance(
-                            scanner_plugin.start_time, datetime
+                        if isinstance(container.end_time, datetime) and isinstance(
+                            container.start_time, datetime
                         ):
                             container.duration = (
-                                scanner_plugin.end_time - scanner_plugin.start_time
+                                container.end_time - container.start_time
                             ).total_seconds()
                     except Exception as dur_e:
                         ASH_LOGGER.debug(
@@ -187,12 +273,33 @@ class ScannerExecutor:
                     from automated_security_helper.schemas.sarif_schema_model import SarifReport
 
                     if isinstance(raw_results, SarifReport):
-                        raw_results = sanitize_sarif_paths(raw_results, self.plugin_context.source_dir)
-                        if not self.plugin_context.ignore_suppressions:
-                            raw_results = apply_suppressions_to_sarif(
-                                sarif_report=raw_results,
-                                plugin_context=self.plugin_context,
+                        with perf_span("sanitize_paths", "postprocess", plugin=scanner_config_name):
+                            raw_results = sanitize_sarif_paths(
+                                raw_results,
+                                self.plugin_context.source_dir,
+                                normalizer=get_uri_normalizer(self.plugin_context),
                             )
+                        with perf_span("mask_secrets", "postprocess", plugin=scanner_config_name):
+                            raw_results = mask_secrets_in_sarif(
+                                raw_results, scanner_name=scanner_config_name
+                            )
+                        if cache_key is not None and cached is None and not scanner_plugin.errors:
+                            # Store before suppressions so later runs re-apply
+                            # whatever suppression rules are current then.
+                            self._result_cache.store(
+                                cache_key,
+                                raw_results,
+                                exit_code=getattr(scanner_plugin, "exit_code", 0) or 0,
+                                outputs_dir=self._scanner_outputs_dir(
+                                    scanner_config_name, target_type
+                                ),
+                            )
+                        if not self.plugin_context.ignore_suppressions:
+                            with perf_span("apply_suppressions", "postprocess", plugin=scanner_config_name):
+                                raw_results = apply_suppressions_to_sarif(
+                                    sarif_report=raw_results,
+                                    plugin_context=self.plugin_context,
+                                )
                         severity_counts, finding_count = self._extract_metrics_from_sarif(raw_results)
                         container.severity_counts = severity_counts
                         container.finding_count = finding_count
@@ -224,7 +331,11 @@ class ScannerExecutor:
                                             container.severity_counts.increment("info")
                                 container.finding_count = len(raw_results["findings"])
 
-                    container.exit_code = getattr(scanner_plugin, "exit_code", 0)
+                    container.exit_code = (
+                        cached.exit_code
+                        if cached is not None
+                        else getattr(scanner_plugin, "exit_code", 0)
+                    )
                     if container.status != ScannerStatus.ERROR:
                         container.status = container.determine_status(
                             scanner_config.options.severity_threshold
@@ -398,6 +509,7 @@ class ScannerExecutor:
                             total_count=total,
                             remaining_count=remaining_count,
                             remaining_scanners=remaining_scanners,
+                            **self._summarize_results(results_list),
                             message=f"Scanner {scanner_name} completed. {remaining_count} remaining: {remaining_list}",
                         )
                     except Exception:
@@ -472,8 +584,14 @@ class ScannerExecutor:
                     description=f"[blue]({scanner_name}) Queued scan...",
                 )
                 ASH_LOGGER.debug(f"Submitting {scanner_name} to thread pool")
+                # Run in a copy of this context so the scanner's perf spans
+                # reach this run's recorder.
                 future = executor.submit(
-                    self._safe_execute_scanner, scanner_name, scanner_plugin, scan_targets
+                    contextvars.copy_context().run,
+                    self._safe_execute_scanner,
+                    scanner_name,
+                    scanner_plugin,
+                    scan_targets,
                 )
                 future.scanner_name = scanner_name  # type: ignore[attr-defined]
                 future.scanner_task_key = task_key  # type: ignore[attr-defined]
@@ -549,6 +667,7 @@ class ScannerExecutor:
                                     total_count=total,
                                     remaining_count=remaining_count,
                                     remaining_scanners=remaining_scanners.copy(),
+                                    **self._summarize_results(results_list),
                                     message=f"Scanner {scanner_name} completed. {remaining_count} remaining: {remaining_list}",
                                 )
                             except Exception:
@@ -6,48 +6,99 @@ Resource management module for ASH MCP server.
 
 This module provides resource management classes to handle scan tracking,
 scan registry, scan management, error handling, and exceptions for the
-MCP server implementation.
+MCP server implementation. Submodules are imported the first time one of
+their names is accessed.
 """
 
-from automated_security_helper.core.resource_management.exceptions import (
-    MCPResourceError,
-    TaskManagementError,
-    StateManagementError,
-    ResourceExhaustionError,
-)
-from automated_security_helper.core.resource_management.event_manager import (
-    EventSubscriptionManager,
-    EventSubscriptionContextManager,
-    EventSubscription,
-)
-from automated_security_helper.core.resource_management.scan_tracking import (
-    check_scan_completion,
-    find_scanner_result_files,
-    get_completed_scanners,
-    get_scanner_progress,
-    parse_scanner_result_file,
-    parse_aggregated_results,
-    get_scan_progress_info,
-    extract_findings_summary,
-    validate_output_directory,
-)
-from automated_security_helper.core.resource_management.scan_registry import (
-    ScanRegistry,
-    ScanRegistryEntry,
-    MCScanStatus,
-    get_scan_registry,
-)
-from automated_security_helper.core.resource_management.scan_management import (
-    list_active_scans,
-    list_all_scans,
-    cancel_scan,
-    cleanup_scan_resources,
-    cleanup_old_scans,
-    get_scan_statistics,
-    check_scan_exists,
-    get_scan_by_directory,
-    check_scan_progress,
-)
+from typing import TYPE_CHECKING
+
+from automated_security_helper.utils.lazy_exports import lazy_exports
+
+if TYPE_CHECKING:
+    from automated_security_helper.core.resource_management.exceptions import (
+        MCPResourceError,
+        TaskManagementError,
+        StateManagementError,
+        ResourceExhaustionError,
+    )
+    from automated_security_helper.core.resource_management.event_manager import (
+        EventSubscriptionManager,
+        EventSubscriptionContextManager,
+        EventSubscription,
+    )
+    from automated_security_helper.core.resource_management.scan_events import (
+        ScanEventProgress,
+        ScanEventTailer,
+        read_scan_event_progress,
+        write_scan_event,
+    )
+    from automated_security_helper.core.resource_management.scan_tracking import (
+        check_scan_completion,
+        find_scanner_result_files,
+        get_completed_scanners,
+        get_scanner_progress,
+        parse_scanner_result_file,
+        parse_aggregated_results,
+        get_scan_progress_info,
+        extract_findings_summary,
+        validate_output_directory,
+    )
+    from automated_security_helper.core.resource_management.scan_registry import (
+        ScanRegistry,
+        ScanRegistryEntry,
+        MCScanStatus,
+        get_scan_registry,
+    )
+    from automated_security_helper.core.resource_management.scan_management import (
+        list_active_scans,
+        list_all_scans,
+        cancel_scan,
+        cleanup_scan_resources,
+        cleanup_old_scans,
+        get_scan_statistics,
+        check_scan_exists,
+        get_scan_by_directory,
+        check_scan_progress,
+    )
+
+_EXPORTS = {
+    "MCPResourceError": ("exceptions", "MCPResourceError"),
+    "TaskManagementError": ("exceptions", "TaskManagementError"),
+    "StateManagementError": ("exceptions", "StateManagementError"),
+    "ResourceExhaustionError": ("exceptions", "ResourceExhaustionError"),
+    "EventSubscriptionManager": ("event_manager", "EventSubscriptionManager"),
+    "EventSubscriptionContextManager": (
+        "event_manager",
+        "EventSubscriptionContextManager",
+    ),
+    "EventSubscription": ("event_manager", "EventSubscription"),
+    "ScanEventProgress": ("scan_events", "ScanEventProgress"),
+    "ScanEventTailer": ("scan_events", "ScanEventTailer"),
+    "read_scan_event_progress": ("scan_events", "read_scan_event_progress"),
+    "write_scan_event": ("scan_events", "write_scan_event"),
+    "check_scan_completion": ("scan_tracking", "check_scan_completion"),
+    "find_scanner_result_files": ("scan_tracking", "find_scanner_result_files"),
+    "get_completed_scanners": ("scan_tracking", "get_completed_scanners"),
+    "get_scanner_progress": ("scan_tracking", "get_scanner_progress"),
+    "parse_scanner_result_file": ("scan_tracking", "parse_scanner_result_file"),
+    "parse_aggregated_results": ("scan_tracking", "parse_aggregated_results"),
+    "get_scan_progress_info": ("scan_tracking", "get_scan_progress_info"),
+    "extract_findings_summary": ("scan_tracking", "extract_findings_summary"),
+    "validate_output_directory": ("scan_tracking", "validate_output_directory"),
+    "ScanRegistry": ("scan_registry", "ScanRegistry"),
+    "ScanRegistryEntry": ("scan_registry", "ScanRegistryEntry"),
+    "MCScanStatus": ("scan_registry", "MCScanStatus"),
+    "get_scan_registry": ("scan_registry", "get_scan_registry"),
+    "list_active_scans": ("scan_management", "list_active_scans"),
+    "list_all_scans": ("scan_management", "list_all_scans"),
+    "cancel_scan": ("scan_management", "cancel_scan"),
+    "cleanup_scan_resources": ("scan_management", "cleanup_scan_resources"),
+    "cleanup_old_scans": ("scan_management", "cleanup_old_scans"),
+    "get_scan_statistics": ("scan_management", "get_scan_statistics"),
+    "check_scan_exists": ("scan_management", "check_scan_exists"),
+    "get_scan_by_directory": ("scan_management", "get_scan_by_directory"),
+    "check_scan_progress": ("scan_management", "check_scan_progress"),
+}
 
 __all__ = [
     "MCPResourceError",
@@ -57,6 +108,11 @@ __all__ = [
     "EventSubscriptionManager",
     "EventSubscriptionContextManager",
     "EventSubscription",
+    # Scan event stream
+    "ScanEventProgress",
+    "ScanEventTailer",
+    "read_scan_event_progress",
+    "write_scan_event",
     # Scan tracking utilities
     "check_scan_completion",
     "find_scanner_result_files",
@@ -83,3 +139,5 @@ __all__ = [
     "get_scan_by_directory",
     "check_scan_progress",
 ]
+
+__getattr__, __dir__ = lazy_exports(__name__, globals(), _EXPORTS)
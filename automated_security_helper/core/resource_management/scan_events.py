@@ -0,0 +1,330 @@
+#!/usr/bin/env python3
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Structured scan progress event stream for ASH MCP server.
+
+A running scan appends one JSON object per line to ``ash.events.jsonl`` in its
+output directory. The events are fed by the ``AshEventType`` notifications the
+execution engine and ``ScannerExecutor`` already emit. Consumers such as the
+MCP progress monitor tail the file with a ``ScanEventTailer``, which remembers
+its byte offset, so each poll only reads events written since the last one
+instead of re-walking the ``scanners/`` directory and re-parsing result files.
+"""
+
+import json
+import threading
+from collections import OrderedDict
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from automated_security_helper.utils.log import ASH_LOGGER
+
+# Configure module logger
+_logger = ASH_LOGGER
+
+SCAN_EVENTS_FILENAME = "ash.events.jsonl"
+
+# Event payload keys that are copied into the stream. Anything else (the
+# plugin context, result models, exception objects) is either not JSON
+# serializable or too large to be worth writing on every event.
+_STREAMED_FIELDS = (
+    "phase",
+    "scanner",
+    "message",
+    "completed_count",
+    "total_count",
+    "remaining_count",
+    "remaining_scanners",
+    "finding_count",
+    "severity_counts",
+    "target_types",
+    "status",
+    "duration",
+    "error",
+    "phases",
+    "enabled_scanners",
+)
+
+_write_locks: Dict[str, threading.Lock] = {}
+_write_locks_guard = threading.Lock()
+
+
+def get_scan_events_path(output_dir: Path | str) -> Path:
+    """
+    Get the path of the event stream file for an output directory.
+
+    Args:
+        output_dir: Path to the scan output directory
+
+    Returns:
+        Path to the event stream file
+    """
+    return Path(output_dir).joinpath(SCAN_EVENTS_FILENAME)
+
+
+def _lock_for(path: Path) -> threading.Lock:
+    key = str(path)
+    with _write_locks_guard:
+        if key not in _write_locks:
+            _write_locks[key] = threading.Lock()
+        return _write_locks[key]
+
+
+def _to_json_safe(value: Any) -> Any:
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    if isinstance(value, dict):
+        return {str(k): _to_json_safe(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple, set)):
+        return [_to_json_safe(v) for v in value]
+    if hasattr(value, "model_dump"):
+        return _to_json_safe(value.model_dump(mode="json"))
+    return str(value)
+
+
+def build_scan_event(event_type: Any, **kwargs: Any) -> Dict[str, Any]:
+    """
+    Build the JSON-serializable record for a single event.
+
+    Args:
+        event_type: AshEventType member or event name
+        **kwargs: Event payload as passed to the event subscribers
+
+    Returns:
+        Dictionary containing the streamed subset of the event
+    """
+    event: Dict[str, Any] = {
+        "event": getattr(event_type, "name", str(event_type)),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+    }
+    for field in _STREAMED_FIELDS:
+        if kwargs.get(field) is not None:
+            event[field] = _to_json_safe(kwargs[field])
+    if "error" not in event and kwargs.get("exception") is not None:
+        event["error"] = str(kwargs["exception"])
+    return event
+
+
+def write_scan_event(
+    output_dir: Path | str,
+    event_type: Any,
+    truncate: bool = False,
+    **kwargs: Any,
+) -> Optional[Dict[str, Any]]:
+    """
+    Append an event to the event stream of an output directory.
+
+    Each event is written as a single line with one ``write`` call under a
+    per-file lock, so concurrent scanner threads never interleave records and
+    readers only ever observe whole lines or a trailing partial line.
+
+    Args:
+        output_dir: Path to the scan output directory
+        event_type: AshEventType member or event name
+        truncate: Start a new stream, discarding events from a previous run
+        **kwargs: Event payload as passed to the event subscribers
+
+    Returns:
+        The event that was written, or None if it could not be written
+    """
+    events_path = get_scan_events_path(output_dir)
+    event = build_scan_event(event_type, **kwargs)
+    try:
+        line = json.dumps(event, default=str) + "\n"
+        with _lock_for(events_path):
+            events_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(events_path, "w" if truncate else "a", encoding="utf-8") as f:
+                f.write(line)
+    except Exception as e:
+        _logger.debug(f"Failed to write scan event {event['event']}: {str(e)}")
+        return None
+    return event
+
+
+class ScanEventTailer:
+    """
+    Incremental reader for a scan event stream.
+
+    The tailer keeps the byte offset of the last complete line it returned,
+    so ``read_new_events`` costs O(new events) no matter how long the scan
+    has been running. A line that is still being written is held back until
+    its newline arrives. If the file shrinks, a new run has started and the
+    tailer rewinds to the beginning.
+    """
+
+    def __init__(self, output_dir: Path | str):
+        """
+        Initialize an event tailer.
+
+        Args:
+            output_dir: Path to the scan output directory
+        """
+        self.events_path = get_scan_events_path(output_dir)
+        self.offset = 0
+
+    def exists(self) -> bool:
+        """Check if the event stream has been created."""
+        return self.events_path.exists()
+
+    def read_new_events(self) -> List[Dict[str, Any]]:
+        """
+        Read events appended since the previous call.
+
+        Returns:
+            List of events in the order they were written
+        """
+        try:
+            size = self.events_path.stat().st_size
+        except OSError:
+            return []
+
+        if size < self.offset:
+            self.offset = 0
+        if size == self.offset:
+            return []
+
+        with open(self.events_path, "rb") as f:
+            f.seek(self.offset)
+            chunk = f.read(size - self.offset)
+
+        last_newline = chunk.rfind(b"\n")
+        if last_newline < 0:
+            return []
+        self.offset += last_newline + 1
+
+        events: List[Dict[str, Any]] = []
+        for raw_line in chunk[: last_newline + 1].splitlines():
+            if not raw_line.strip():
+                continue
+            try:
+                events.append(json.loads(raw_line))
+            except json.JSONDecodeError as e:
+                _logger.debug(f"Skipping malformed scan event: {str(e)}")
+        return events
+
+
+class ScanEventProgress:
+    """
+    Scan progress folded from an event stream.
+
+    Apply events in order with ``apply``; the instance keeps running totals
+    so callers never have to revisit earlier events.
+    """
+
+    def __init__(self):
+        """Initialize an empty progress state."""
+        self.reset()
+
+    def reset(self) -> None:
+        """Discard all progress folded so far."""
+        self.started = False
+        self.finished = False
+        self.failed = False
+        self.current_phase: Optional[str] = None
+        self.total_scanners: int = 0
+        self.running_scanners: Set[str] = set()
+        self.completed_scanners: Dict[str, Dict[str, Any]] = {}
+        self.errors: List[str] = []
+        self.last_event: Optional[Dict[str, Any]] = None
+
+    def apply(self, event: Dict[str, Any]) -> None:
+        """
+        Update the progress state with a single event.
+
+        Args:
+            event: Event as read from the stream
+        """
+        self.last_event = event
+        name = event.get("event")
+
+        if name == "EXECUTION_START":
+            # A new run truncates the stream; drop anything left from the last one.
+            self.reset()
+            self.started = True
+            self.last_event = event
+        elif name and name.endswith("_PHASE_START"):
+            self.current_phase = name[: -len("_PHASE_START")].lower()
+        elif name == "SCAN_START":
+            scanner = event.get("scanner")
+            if scanner:
+                self.running_scanners.add(scanner)
+        elif name == "SCAN_COMPLETE":
+            scanner = event.get("scanner")
+            if scanner:
+                self.running_scanners.discard(scanner)
+                self.completed_scanners[scanner] = {
+                    "target_types": event.get("target_types", []),
+                    "finding_count": event.get("finding_count", 0),
+                    "severity_counts": event.get("severity_counts", {}),
+                }
+            self.total_scanners = max(
+                self.total_scanners, event.get("total_count") or 0
+            )
+        elif name == "ERROR":
+            self.errors.append(event.get("error") or event.get("message", ""))
+            if event.get("phase") == "execution":
+                self.failed = True
+        elif name == "EXECUTION_COMPLETE":
+            self.finished = True
+
+    @property
+    def progress(self) -> float:
+        """Fraction of scanners completed, capped below 1.0 until finished."""
+        if self.finished:
+            return 1.0
+        if not self.total_scanners:
+            return 0.0
+        return min(len(self.completed_scanners) / self.total_scanners, 0.95)
+
+
+# Progress is cached per output directory; the least recently read
+# directories are dropped once the cache holds this many.
+PROGRESS_CACHE_SIZE = 64
+
+_progress_cache: "OrderedDict[str, Tuple[ScanEventTailer, ScanEventProgress]]" = (
+    OrderedDict()
+)
+_progress_cache_lock = threading.Lock()
+
+
+def read_scan_event_progress(
+    output_dir: Path | str,
+) -> Optional[ScanEventProgress]:
+    """
+    Get the progress folded from an output directory's event stream.
+
+    State is cached per output directory and advanced with only the events
+    written since the previous call. The cached state is dropped when the
+    stream file is removed, which the orchestrator does when a new run
+    starts, so a finished run is never reported for the next one.
+
+    Args:
+        output_dir: Path to the scan output directory
+
+    Returns:
+        ScanEventProgress, or None if the scan has not written an event stream
+    """
+    key = str(Path(output_dir))
+    with _progress_cache_lock:
+        cached = _progress_cache.get(key)
+        if cached is not None and not cached[0].exists():
+            del _progress_cache[key]
+            cached = None
+        if cached is None:
+            tailer = ScanEventTailer(output_dir)
+            if not tailer.exists():
+                return None
+            cached = (tailer, ScanEventProgress())
+            _progress_cache[key] = cached
+            while len(_progress_cache) > PROGRESS_CACHE_SIZE:
+                _progress_cache.popitem(last=False)
+        else:
+            _progress_cache.move_to_end(key)
+
+        tailer, progress = cached
+        for event in tailer.read_new_events():
+            progress.apply(event)
+        return progress
@@ -18,6 +18,9 @@ from typing import Dict, List, Optional, Any, Tuple, Set
 from automated_security_helper.core.resource_management.exceptions import (
     MCPResourceError,
 )
+from automated_security_helper.core.resource_management.scan_events import (
+    read_scan_event_progress,
+)
 from automated_security_helper.models.asharp_model import AshAggregatedResults
 from automated_security_helper.utils.log import ASH_LOGGER
 
@@ -395,6 +398,22 @@ def get_scanner_progress(
     if output_dir is None:
         output_dir = Path.cwd().joinpath(".ash", "ash_output")
     scanner_progress: Dict[str, Dict[str, Any]] = {}
+
+    # Prefer the structured event stream: it is read incrementally and
+    # already carries per-scanner finding counts.
+    event_progress = read_scan_event_progress(output_dir)
+    if event_progress is not None:
+        for scanner_name, info in event_progress.completed_scanners.items():
+            targets = info.get("target_types") or []
+            scanner_progress[scanner_name] = {
+                "targets_completed": list(targets),
+                "targets_count": len(targets),
+                "findings": [],
+                "finding_count": info.get("finding_count", 0),
+                "severity_counts": info.get("severity_counts", {}),
+            }
+        return scanner_progress
+
     scanner_results = find_scanner_result_files(output_dir)
 
     for scanner_name, target_results in scanner_results.items():
@@ -646,6 +665,27 @@ def create_scan_progress_from_files(
             scan_progress.mark_failed()
             return scan_progress
     else:
+        event_progress = read_scan_event_progress(output_dir)
+        if event_progress is not None:
+            for scanner_name, info in event_progress.completed_scanners.items():
+                for target_type in info.get("target_types") or ["source"]:
+                    scanner_progress = ScannerProgress(
+                        scanner_name=scanner_name,
+                        target_type=target_type,
+                        status=MCScannerStatus.COMPLETED,
+                        finding_count=info.get("finding_count", 0),
+                        severity_counts=info.get("severity_counts") or None,
+                    )
+                    scanner_progress.mark_completed()
+                    scan_progress.add_scanner_progress(scanner_progress)
+            for scanner_name in event_progress.running_scanners:
+                scanner_progress = ScannerProgress(
+                    scanner_name=scanner_name, target_type="source"
+                )
+                scanner_progress.mark_running()
+                scan_progress.add_scanner_progress(scanner_progress)
+            return scan_progress
+
         # Find individual scanner result files
         scanner_results = find_scanner_result_files(output_dir)
 
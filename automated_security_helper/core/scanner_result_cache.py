@@ -0,0 +1,440 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Cross-run cache of scanner SARIF results.
+
+When ``scanner_result_cache.enabled`` is set, ``ScannerExecutor`` looks up
+each scanner/target pair here before running the scanner. Entries are keyed
+by a fingerprint of the scan target's contents together with everything that
+can change a scanner's raw output: the scanner name and implementation, the
+tool version, the scanner configuration, the target type, the global ignore
+paths and the ASH version.
+
+Suppressions and severity thresholds are deliberately not part of the key.
+Cached reports are stored after path sanitization but before suppressions,
+so a hit re-applies the current suppression rules just like a fresh scan.
+Each entry also carries the files the scanner wrote to its
+``scanners/<name>/<target type>`` output directory, and a hit restores them,
+so the output directory looks the same as after a fresh run.
+
+The target fingerprint uses git when the target is inside a work tree: the
+committed tree hash plus the contents of every modified, untracked or ignored
+file that git reports. Outside git, every file under the target is hashed.
+ASH's own output and work directories are excluded from both.
+"""
+
+import base64
+import gzip
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from automated_security_helper.utils.log import ASH_LOGGER
+from automated_security_helper.utils.subprocess_utils import (
+    find_executable,
+    run_command,
+)
+
+CACHE_SCHEMA_VERSION = 2
+DEFAULT_CACHE_DIR_NAME = "scanner_results"
+_ENTRY_SUFFIX = ".sarif.json.gz"
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+# Scanner options that only affect post-processing of the results.
+_POST_SCAN_OPTIONS = {"severity_threshold"}
+
+
+def _hash_file(path: Path, digest: "hashlib._Hash") -> None:
+    """Feed a file's contents (or a symlink's target) into ``digest``."""
+    if path.is_symlink():
+        digest.update(b"L" + os.readlink(path).encode("utf-8", "surrogateescape"))
+        return
+    digest.update(b"F")
+    with open(path, "rb") as f:
+        while chunk := f.read(_HASH_CHUNK_SIZE):
+            digest.update(chunk)
+
+
+def _is_under(path: Path, parents: Iterable[Path]) -> bool:
+    return any(path == parent or path.is_relative_to(parent) for parent in parents)
+
+
+def _manifest_digest(
+    root: Path, files: Iterable[Path], excluded: List[Path]
+) -> Tuple[str, int]:
+    """Hash the relative path and contents of each file under ``root``."""
+    digest = hashlib.sha256()
+    count = 0
+    for path in sorted(files):
+        if _is_under(path, excluded):
+            continue
+        digest.update(
+            path.relative_to(root).as_posix().encode("utf-8", "surrogateescape")
+        )
+        digest.update(b"\0")
+        try:
+            if path.is_dir() and not path.is_symlink():
+                digest.update(b"D")
+            elif path.exists() or path.is_symlink():
+                _hash_file(path, digest)
+            else:
+                digest.update(b"X")
+        except OSError as e:
+            digest.update(f"E{e.errno}".encode())
+        digest.update(b"\0")
+        count += 1
+    return digest.hexdigest(), count
+
+
+def _walk_files(root: Path, excluded: List[Path]) -> List[Path]:
+    files: List[Path] = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        current = Path(dirpath)
+        dirnames[:] = [
+            d
+            for d in dirnames
+            if d != ".git" and not _is_under(current.joinpath(d), excluded)
+        ]
+        files.extend(current.joinpath(name) for name in filenames)
+        # Symlinked directories are not followed; hash the link itself.
+        files.extend(
+            current.joinpath(d) for d in dirnames if current.joinpath(d).is_symlink()
+        )
+    return files
+
+
+def _find_git_dir(target: Path) -> bool:
+    return any(parent.joinpath(".git").exists() for parent in (target, *target.parents))
+
+
+def _git_fingerprint(target: Path, excluded: List[Path]) -> Optional[str]:
+    """Fingerprint ``target`` from git's view of the work tree, if possible."""
+    if not _find_git_dir(target) or find_executable("git") is None:
+        return None
+
+    def git(*args: str) -> Optional[str]:
+        result = run_command(
+            ["git", "-C", target.as_posix(), *args],
+            log_level=logging.DEBUG,
+            timeout=120,
+            errors="surrogateescape",
+        )
+        return result.stdout if result.returncode == 0 else None
+
+    toplevel = git("rev-parse", "--show-toplevel")
+    tree = git("rev-parse", "HEAD:./")
+    status = git(
+        "status",
+        "--porcelain=v1",
+        "-z",
+        "--ignored=traditional",
+        "--untracked-files=all",
+        "--no-renames",
+        "--",
+        ".",
+    )
+    if toplevel is None or tree is None or status is None:
+        return None
+
+    root = Path(toplevel.strip()).resolve()
+    # Porcelain paths are relative to the top of the work tree.
+    changed: List[Path] = []
+    for entry in status.split("\0"):
+        if not entry:
+            continue
+        path = root.joinpath(entry[3:])
+        # Untracked nested repositories are reported as a single directory.
+        if path.is_dir() and not path.is_symlink():
+            changed.extend(_walk_files(path, excluded))
+        else:
+            changed.append(path)
+    changed_digest, changed_count = _manifest_digest(target, changed, excluded)
+    ASH_LOGGER.debug(
+        f"Fingerprinted {target.as_posix()} from git tree {tree.strip()} "
+        f"and {changed_count} uncommitted path(s)"
+    )
+    return f"git:{tree.strip()}:{changed_digest}"
+
+
+def compute_tree_fingerprint(target: Path, excluded: Iterable[Path] = ()) -> str:
+    """Return a fingerprint that changes whenever anything under ``target`` changes.
+
+    Args:
+        target: Directory (or file) that a scanner will scan
+        excluded: Directories under ``target`` whose contents are ignored
+
+    Returns:
+        A string beginning with ``git:`` or ``manifest:``
+    """
+    target = Path(target).resolve()
+    excluded_paths = [
+        Path(p).resolve()
+        for p in excluded
+        if p is not None and not _is_under(target, [Path(p).resolve()])
+    ]
+    if target.is_dir():
+        fingerprint = _git_fingerprint(target, excluded_paths)
+        if fingerprint is not None:
+            return fingerprint
+        files = _walk_files(target, excluded_paths)
+        root = target
+    else:
+        files = [target]
+        root = target.parent
+    digest, count = _manifest_digest(root, files, excluded_paths)
+    ASH_LOGGER.debug(f"Fingerprinted {count} file(s) under {target.as_posix()}")
+    return f"manifest:{digest}"
+
+
+def _read_outputs(outputs_dir: Optional[Path]) -> Dict[str, str]:
+    """Return the files under ``outputs_dir`` as base64 text keyed by relative path."""
+    if outputs_dir is None or not outputs_dir.is_dir():
+        return {}
+    return {
+        path.relative_to(outputs_dir).as_posix(): base64.b64encode(
+            path.read_bytes()
+        ).decode("ascii")
+        for path in sorted(outputs_dir.rglob("*"))
+        if path.is_file() and not path.is_symlink()
+    }
+
+
+@dataclass
+class CachedScanResult:
+    """A scanner result loaded from the cache."""
+
+    report: Any
+    exit_code: int
+    stored_at: float
+    outputs: Dict[str, str] = field(default_factory=dict)
+
+    def restore_outputs(self, outputs_dir: Path) -> int:
+        """Write the cached scanner output files back under ``outputs_dir``.
+
+        Returns:
+            The number of files restored
+        """
+        root = Path(outputs_dir).resolve()
+        restored = 0
+        for relative, encoded in self.outputs.items():
+            path = root.joinpath(relative).resolve()
+            # Entries come from our own cache directory, but never write
+            # outside the scanner's output directory.
+            if not path.is_relative_to(root):
+                continue
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                path.write_bytes(base64.b64decode(encoded))
+            except (OSError, ValueError) as e:
+                ASH_LOGGER.warning(
+                    f"Failed to restore cached scanner output {path}: {e}"
+                )
+                continue
+            restored += 1
+        return restored
+
+
+class ScannerResultCache:
+    """Size-bounded, on-disk cache of scanner SARIF reports."""
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        max_size_bytes: int,
+        max_age_seconds: Optional[float] = None,
+        excluded_dirs: Iterable[Path] = (),
+    ) -> None:
+        self.cache_dir = Path(cache_dir)
+        self.max_size_bytes = max_size_bytes
+        self.max_age_seconds = max_age_seconds
+        self.excluded_dirs = [Path(p) for p in excluded_dirs if p is not None]
+        self._fingerprints: Dict[Path, str] = {}
+        self._fingerprint_lock = threading.Lock()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_context(cls, plugin_context: Any) -> Optional["ScannerResultCache"]:
+        """Create the cache configured for ``plugin_context``, or None if disabled."""
+        ash_config = getattr(plugin_context, "config", None)
+        settings = getattr(ash_config, "scanner_result_cache", None)
+        if settings is None or not settings.enabled:
+            return None
+        output_dir = Path(plugin_context.output_dir)
+        cache_dir = (
+            Path(settings.directory)
+            if settings.directory
+            else output_dir.joinpath("cache", DEFAULT_CACHE_DIR_NAME)
+        )
+        return cls(
+            cache_dir=cache_dir,
+            max_size_bytes=settings.max_size_mb * 1024 * 1024,
+            max_age_seconds=(
+                settings.max_age_hours * 3600 if settings.max_age_hours else None
+            ),
+            excluded_dirs=[
+                output_dir,
+                getattr(plugin_context, "work_dir", None),
+                cache_dir,
+            ],
+        )
+
+    def tree_fingerprint(self, target: Path) -> str:
+        """Return the fingerprint of ``target``, computing it once per cache instance."""
+        target = Path(target).resolve()
+        # Scanners run in parallel against the same targets; hold the lock while
+        # computing so each target is only walked and hashed once.
+        with self._fingerprint_lock:
+            if target not in self._fingerprints:
+                self._fingerprints[target] = compute_tree_fingerprint(
+                    target, self.excluded_dirs
+                )
+            return self._fingerprints[target]
+
+    def key_for(
+        self,
+        scanner_plugin: Any,
+        scanner_config: Any,
+        target: Path,
+        target_type: str,
+        global_ignore_paths: Optional[List[Any]] = None,
+    ) -> str:
+        """Build the cache key for one scanner run against one target."""
+        from automated_security_helper.utils.get_ash_version import get_ash_version
+
+        config_data = scanner_config.model_dump(
+            mode="json",
+            exclude={"options": _POST_SCAN_OPTIONS},
+        )
+        ignore_paths = [
+            p.model_dump(mode="json") if hasattr(p, "model_dump") else p
+            for p in (global_ignore_paths or [])
+        ]
+        key_data = {
+            "schema_version": CACHE_SCHEMA_VERSION,
+            "ash_version": get_ash_version(),
+            "scanner": str(scanner_config.name),
+            "implementation": f"{type(scanner_plugin).__module__}.{type(scanner_plugin).__qualname__}",
+            "tool_version": getattr(scanner_plugin, "tool_version", None),
+            "config": config_data,
+            "target_type": target_type,
+            "global_ignore_paths": ignore_paths,
+            "tree": self.tree_fingerprint(target),
+        }
+        encoded = json.dumps(key_data, sort_keys=True, default=str)
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir.joinpath(key[:2], f"{key}{_ENTRY_SUFFIX}")
+
+    def load(self, key: str) -> Optional[CachedScanResult]:
+        """Return the cached result for ``key``, or None on a miss."""
+        from automated_security_helper.schemas.sarif_schema_model import SarifReport
+
+        entry = self._entry_path(key)
+        try:
+            stat = entry.stat()
+        except FileNotFoundError:
+            return None
+        if self.max_age_seconds and time.time() - stat.st_mtime > self.max_age_seconds:
+            ASH_LOGGER.debug(f"Scanner result cache entry {key} has expired")
+            entry.unlink(missing_ok=True)
+            return None
+        try:
+            with gzip.open(entry, "rt", encoding="utf-8") as f:
+                payload = json.load(f)
+            result = CachedScanResult(
+                report=SarifReport.model_validate(payload["sarif"]),
+                exit_code=int(payload.get("exit_code") or 0),
+                stored_at=stat.st_mtime,
+                outputs=dict(payload.get("outputs") or {}),
+            )
+        except Exception as e:
+            ASH_LOGGER.warning(
+                f"Discarding unreadable scanner result cache entry {key}: {e}"
+            )
+            entry.unlink(missing_ok=True)
+            return None
+        # Reads count as uses for LRU eviction; keep the stored-at time intact
+        # for the age check by only updating the access time.
+        os.utime(entry, (time.time(), stat.st_mtime))
+        return result
+
+    def store(
+        self,
+        key: str,
+        report: Any,
+        exit_code: int = 0,
+        outputs_dir: Optional[Path] = None,
+    ) -> None:
+        """Store ``report`` under ``key`` and evict old entries past the size cap.
+
+        Args:
+            key: Cache key from :meth:`key_for`
+            report: The scanner's SARIF report
+            exit_code: The scanner's exit code
+            outputs_dir: Directory of raw scanner output files to store with
+                the report and restore on a hit
+        """
+        entry = self._entry_path(key)
+        try:
+            entry.parent.mkdir(parents=True, exist_ok=True)
+            payload = {
+                "schema_version": CACHE_SCHEMA_VERSION,
+                "exit_code": exit_code,
+                "outputs": _read_outputs(outputs_dir),
+                "sarif": json.loads(
+                    report.model_dump_json(
+                        by_alias=True, exclude_none=True, exclude_unset=True
+                    )
+                ),
+            }
+            fd, tmp_name = tempfile.mkstemp(dir=entry.parent, suffix=".tmp")
+            try:
+                with (
+                    os.fdopen(fd, "wb") as raw,
+                    gzip.GzipFile(
+                        fileobj=raw, mode="wb", compresslevel=6, mtime=0
+                    ) as f,
+                ):
+                    f.write(json.dumps(payload).encode("utf-8"))
+                os.replace(tmp_name, entry)
+            except BaseException:
+                Path(tmp_name).unlink(missing_ok=True)
+                raise
+        except Exception as e:
+            ASH_LOGGER.warning(f"Failed to store scanner result cache entry {key}: {e}")
+            return
+        self.evict()
+
+    def evict(self) -> int:
+        """Delete least recently used entries until the cache fits its size cap.
+
+        Returns:
+            The number of entries removed
+        """
+        with self._lock:
+            entries = []
+            for entry in self.cache_dir.glob(f"*/*{_ENTRY_SUFFIX}"):
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((max(stat.st_atime, stat.st_mtime), stat.st_size, entry))
+            total = sum(size for _, size, _ in entries)
+            removed = 0
+            for _, size, entry in sorted(entries, key=lambda e: e[0]):
+                if total <= self.max_size_bytes:
+                    break
+                entry.unlink(missing_ok=True)
+                total -= size
+                removed += 1
+            if removed:
+                ASH_LOGGER.debug(f"Evicted {removed} scanner result cache entries")
+            return removed
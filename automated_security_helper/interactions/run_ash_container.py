@@ -1,6 +1,8 @@
 # Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
 # SPDX-License-Identifier: Apache-2.0
 
+import fnmatch
+import hashlib
 import json
 import os
 import re
@@ -44,6 +46,16 @@ _SAFE_REVISION_PATTERN = re.compile(r"^[A-Za-z0-9._\-/]+$")
 # Discovery order for OCI runners (first found wins)
 _OCI_RUNNER_CANDIDATES = ["finch", "docker", "nerdctl", "podman"]
 
+# Image label holding the fingerprint of the inputs the image was built from
+ASH_BUILD_FINGERPRINT_LABEL = "com.awslabs.ash.build-fingerprint"
+_BUILD_FINGERPRINT_VERSION = "1"
+
+# Revisions that always name the same source: full commit SHAs and version tags.
+# Anything else (e.g. a branch name) can move without the fingerprint changing.
+_PINNED_REVISION_PATTERN = re.compile(
+    r"^(?:[0-9a-f]{40}|v?\d+(?:\.\d+)+(?:[-.+][\w.-]+)?)$"
+)
+
 
 def _validate_ash_revision(revision: str) -> bool:
     """Validate that an ASH revision string is safe for use as a Docker build-arg.
@@ -392,6 +404,135 @@ def _gha_layer_cache_args(
     ]
 
 
+def _read_dockerignore(context_dir: Path) -> List[str]:
+    """Return the exclusion patterns from the build context's .dockerignore."""
+    dockerignore = context_dir.joinpath(".dockerignore")
+    if not dockerignore.is_file():
+        return []
+    patterns = []
+    for line in dockerignore.read_text(encoding="utf-8").splitlines():
+        line = line.strip()
+        if line and not line.startswith("#"):
+            patterns.append(line.strip("/"))
+    return patterns
+
+
+def _is_dockerignored(rel_path: str, patterns: List[str]) -> bool:
+    """Check a context-relative path against .dockerignore patterns.
+
+    A path is excluded when the last pattern matching it is not a ``!``
+    exception, mirroring the OCI build context rules closely enough for
+    fingerprinting.
+    """
+    ignored = False
+    for pattern in patterns:
+        negate = pattern.startswith("!")
+        if fnmatch.fnmatchcase(rel_path, pattern.lstrip("!")):
+            ignored = not negate
+    return ignored
+
+
+def _hash_build_context(context_dir: Path) -> str:
+    """Return a SHA-256 over the paths and contents of the build context.
+
+    Files and directories excluded by the context's .dockerignore are
+    skipped, since they never reach the build.
+    """
+    patterns = _read_dockerignore(context_dir)
+    digest = hashlib.sha256()
+    for root, dirs, files in os.walk(context_dir):
+        rel_root = Path(root).relative_to(context_dir)
+        dirs[:] = sorted(
+            d
+            for d in dirs
+            if not _is_dockerignored((rel_root / d).as_posix(), patterns)
+        )
+        for name in sorted(files):
+            rel_path = (rel_root / name).as_posix()
+            if _is_dockerignored(rel_path, patterns):
+                continue
+            file_path = Path(root, name)
+            if not file_path.is_file():
+                continue
+            digest.update(rel_path.encode("utf-8") + b"\0")
+            with open(file_path, "rb") as f:
+                for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                    digest.update(chunk)
+            digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def _build_fingerprint(
+    dockerfile_path: Path,
+    build_target: str,
+    container_uid: str,
+    container_gid: str,
+    resolved_revision: str | None,
+    offline: bool,
+    offline_semgrep_rulesets: str,
+    custom_build_arg: List[str],
+) -> str:
+    """Return a fingerprint of everything that determines the built image.
+
+    Covers the Dockerfile, the build target, UID/GID, the ASH revision, the
+    offline flags, the custom build args and the contents of the build
+    context (the local source tree for LOCAL builds).
+    """
+    inputs = {
+        "version": _BUILD_FINGERPRINT_VERSION,
+        "dockerfile": hashlib.sha256(dockerfile_path.read_bytes()).hexdigest(),
+        "build_target": build_target,
+        "uid": container_uid,
+        "gid": container_gid,
+        "revision": resolved_revision,
+        "offline": offline,
+        "offline_semgrep_rulesets": offline_semgrep_rulesets,
+        "custom_build_arg": list(custom_build_arg),
+        "context": _hash_build_context(dockerfile_path.parent),
+    }
+    return hashlib.sha256(
+        json.dumps(inputs, sort_keys=True).encode("utf-8")
+    ).hexdigest()
+
+
+def _revision_is_pinned(resolved_revision: str | None) -> bool:
+    """Return True if the revision always resolves to the same ASH source.
+
+    LOCAL builds are covered by the build context hash. Branch names are not
+    pinned: the image is rebuilt so it picks up new commits on the branch.
+    """
+    if resolved_revision in (None, "LOCAL"):
+        return True
+    return _PINNED_REVISION_PATTERN.match(resolved_revision) is not None
+
+
+def _image_fingerprint(
+    oci_command_prefix: List[str],
+    resolved_oci_runner: str,
+    image_name: str,
+) -> str | None:
+    """Return the build fingerprint label of a local image, or None if there is none."""
+    try:
+        returncode, stdout, _ = subprocess_utils.run_command_get_output(
+            [
+                *oci_command_prefix,
+                resolved_oci_runner,
+                "image",
+                "inspect",
+                "--format",
+                f'{{{{ index .Config.Labels "{ASH_BUILD_FINGERPRINT_LABEL}" }}}}',
+                image_name,
+            ]
+        )
+    except Exception as e:
+        ASH_LOGGER.debug(f"Unable to inspect image {image_name}: {e}")
+        return None
+    if returncode != 0:
+        return None
+    label = stdout.strip()
+    return label if label and label != "<no value>" else None
+
+
 def _build_image(
     oci_command_prefix: List[str],
     resolved_oci_runner: str,
@@ -410,10 +551,38 @@ def _build_image(
 ) -> None:
     """Build the base ASH container image.
 
+    The image is labeled with a fingerprint of its build inputs. Unless
+    ``force`` is set, the build is skipped when a local image with the same
+    name and fingerprint already exists and the ASH revision is pinned (LOCAL,
+    a commit SHA or a version tag).
+
     Raises:
         CalledProcessError: On non-zero exit from the build command.
         Exception: On any other build failure.
     """
+    fingerprint = _build_fingerprint(
+        dockerfile_path=dockerfile_path,
+        build_target=build_target,
+        container_uid=container_uid,
+        container_gid=container_gid,
+        resolved_revision=resolved_revision,
+        offline=offline,
+        offline_semgrep_rulesets=offline_semgrep_rulesets,
+        custom_build_arg=custom_build_arg,
+    )
+    if not force and not _revision_is_pinned(resolved_revision):
+        ASH_LOGGER.debug(
+            f"ASH revision {resolved_revision} is not a commit SHA or version tag, rebuilding image"
+        )
+    elif not force and (
+        _image_fingerprint(oci_command_prefix, resolved_oci_runner, image_name)
+        == fingerprint
+    ):
+        typer.echo(
+            f"Image {image_name} is up to date with its build inputs, skipping build"
+        )
+        return
+
     typer.echo(
         f"Building image {image_name} -- this may take a few minutes during the first build..."
     )
@@ -451,8 +620,12 @@ def _build_image(
             f"OFFLINE_SEMGREP_RULESETS={offline_semgrep_rulesets}",
             "--build-arg",
             f"BUILD_DATE_EPOCH={int(datetime.now().timestamp())}",
+            "--label",
+            f"{ASH_BUILD_FINGERPRINT_LABEL}={fingerprint}",
         ]
     )
+    for build_arg in custom_build_arg:
+        build_cmd.extend(["--build-arg", build_arg])
 
     extra_args: List[str] = []
     if force:
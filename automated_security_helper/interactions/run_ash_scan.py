@@ -14,6 +14,7 @@ import typer
 from pydantic import BaseModel, Field, field_validator
 from rich import print
 
+from automated_security_helper.base.plugin_context import PluginContext
 from automated_security_helper.core.constants import (
     ASH_CONFIG_FILE_NAMES,
     ASH_WORK_DIR_NAME,
@@ -35,6 +36,10 @@ from automated_security_helper.core.unified_metrics import (
 )
 from automated_security_helper.interactions.run_ash_container import run_ash_container
 from automated_security_helper.models.asharp_model import AshAggregatedResults
+from automated_security_helper.utils.uri_normalizer import (
+    UriNormalizer,
+    get_uri_normalizer,
+)
 
 
 # ---------------------------------------------------------------------------
@@ -434,7 +439,17 @@ def _run_local_mode(opts: ScanOptions, logger) -> tuple[AshAggregatedResults, Op
             typer.echo("\nASH scan completed.")
 
         if _changed_file_set and results is not None:
-            results = _filter_results_to_changed_files(results, _changed_file_set, opts.source_dir)
+            _context = getattr(getattr(orchestrator, "execution_engine", None), "context", None)
+            results = _filter_results_to_changed_files(
+                results,
+                _changed_file_set,
+                opts.source_dir,
+                normalizer=(
+                    get_uri_normalizer(_context)
+                    if isinstance(_context, PluginContext)
+                    else None
+                ),
+            )
             sarif_path = opts.output_dir / "reports" / "ash.sarif"
             if sarif_path.exists() and results.sarif:
                 sarif_path.write_text(
@@ -652,10 +667,13 @@ def _filter_results_to_changed_files(
     results: "AshAggregatedResults",
     changed_files: set,
     source_dir: Path,
+    normalizer: Optional[UriNormalizer] = None,
 ) -> "AshAggregatedResults":
     """Remove SARIF results whose primary location is not in *changed_files*."""
     if not results or not results.sarif or not results.sarif.runs:
         return results
+    if normalizer is None or not normalizer.matches(source_dir, normalizer.output_dir):
+        normalizer = UriNormalizer(source_dir)
     for run in results.sarif.runs:
         if not run.results:
             continue
@@ -672,12 +690,7 @@ def _filter_results_to_changed_files(
                 filtered.append(result)
                 continue
             uri = loc.physicalLocation.root.artifactLocation.uri or ""
-            if uri.startswith("file://"):
-                uri = uri[7:]
-                if uri.startswith("///"):
-                    uri = uri[2:]
-            resolved = Path(source_dir).joinpath(uri).resolve()
-            if resolved in changed_files:
+            if normalizer.resolve_in_source(uri) in changed_files:
                 filtered.append(result)
         run.results = filtered
     return results
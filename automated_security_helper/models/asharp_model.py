@@ -509,7 +509,7 @@ class AshAggregatedResults(BaseModel):
         }
         return simple_dict
 
-    def to_flat_vulnerabilities(self) -> List[FlatVulnerability]:
+    def to_flat_vulnerabilities(self, eager: bool = False) -> List[FlatVulnerability]:
         """Convert the AshAggregatedResults to a list of flattened vulnerability objects.
 
         The first call materializes the list and applies legacy side effects
@@ -517,13 +517,24 @@ class AshAggregatedResults(BaseModel):
         calls return the memoized list so the method is safe to call from
         reporters multiple times per run.
 
+        Findings built from SARIF results serialize their ``properties``,
+        ``references`` and ``raw_data`` fields only when those are first read.
+
+        Args:
+            eager: Serialize those fields for every finding up front, e.g.
+                before persisting the findings
+
         Returns:
             List[FlatVulnerability]: A list of flattened vulnerability objects
         """
         if self._flat_cache is not None:
+            if eager:
+                for flat_vuln in self._flat_cache:
+                    flat_vuln.materialize()
             return self._flat_cache
 
         flat_vulns: List[FlatVulnerability] = []
+        detected_at = datetime.now(timezone.utc).isoformat()
 
         if self.sarif and self.sarif.runs:
             for run in self.sarif.runs:
@@ -552,7 +563,11 @@ class AshAggregatedResults(BaseModel):
 
                 for result in run.results:
                     flat_vuln = FlatVulnerability.from_sarif_result(
-                        result, tool_name, tool_type
+                        result,
+                        tool_name,
+                        tool_type,
+                        detected_at=detected_at,
+                        eager=eager,
                     )
                     flat_vulns.append(flat_vuln)
 
@@ -703,12 +718,11 @@ class AshAggregatedResults(BaseModel):
 # Resolve the AshConfig forward reference so model_validate_json works
 # regardless of import order (e.g. in isolated uvx environments).
 # Uses a deferred function to avoid circular imports since ash_config.py
-# imports from this module's package.
+# imports from this module's package. Importing ash_config publishes AshConfig
+# in this module; the model is completed on first use.
 def _resolve_forward_refs():
     try:
-        from automated_security_helper.config.ash_config import AshConfig  # noqa: F401
-
-        AshAggregatedResults.model_rebuild()
+        import automated_security_helper.config.ash_config  # noqa: F401
     except ImportError:
         pass  # Will be resolved when AshConfig is eventually imported
 
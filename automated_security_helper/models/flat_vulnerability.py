@@ -7,10 +7,11 @@ from __future__ import annotations
 
 import hashlib
 import json
+import threading
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, model_serializer
 
 from automated_security_helper.utils.log import ASH_LOGGER
 from automated_security_helper.utils.secret_masking import mask_secret_in_text
@@ -19,8 +20,9 @@ if TYPE_CHECKING:
     from automated_security_helper.schemas.sarif_schema_model import Result
 
 
-_SEVERITY_ORDER = ("CRITICAL", "HIGH", "MEDIUM", "LOW", "INFO")
-_VALID_ISSUE_SEVERITIES = set(_SEVERITY_ORDER)
+# Known finding severities, most severe first.
+SEVERITY_ORDER = ("CRITICAL", "HIGH", "MEDIUM", "LOW", "INFO")
+_VALID_ISSUE_SEVERITIES = set(SEVERITY_ORDER)
 _GENERIC_ASH_TOOL_NAME = "AWS Labs - Automated Security Helper"
 _KNOWN_SCANNER_TAGS = frozenset(
     {
@@ -35,6 +37,11 @@ _KNOWN_SCANNER_TAGS = frozenset(
         "npm-audit",
     }
 )
+# JSON fields serialized from the source SARIF Result only when first read.
+_LAZY_FIELDS = ("properties", "references", "raw_data")
+# Serializes materialize() so a finding shared between threads (e.g. by the
+# report phase's reporters) is serialized once and never seen half-filled.
+_MATERIALIZE_LOCK = threading.Lock()
 # Preserves the historical to_flat_vulnerabilities() mapping (error→HIGH)
 # instead of the stricter sarif_utils mapping (error→CRITICAL). Changing this
 # would alter reporter output for every existing scanner.
@@ -46,51 +53,95 @@ _LEVEL_TO_SEVERITY = {
 }
 
 
-def _resolve_severity(result: "Result") -> str:
-    """Resolve severity for a SARIF Result.
+def resolve_severity(issue_severity: Any, level: Any) -> str:
+    """Resolve the severity of a SARIF result from its parts.
 
-    issue_severity in result.properties wins when present; otherwise falls back
-    to the SARIF level mapping used by to_flat_vulnerabilities().
+    A known ``issue_severity`` property wins; otherwise the SARIF ``level`` is
+    mapped as to_flat_vulnerabilities() does. Shared with results_diff, which
+    reads results as plain JSON.
     """
-    props = result.properties
-    if props is not None:
-        issue_sev = getattr(props, "issue_severity", None)
-        if isinstance(issue_sev, str):
-            upper = issue_sev.upper()
-            if upper in _VALID_ISSUE_SEVERITIES:
-                return upper
-
-    if result.level:
-        return _LEVEL_TO_SEVERITY.get(str(result.level).lower(), "MEDIUM")
+    if isinstance(issue_severity, str):
+        upper = issue_severity.upper()
+        if upper in _VALID_ISSUE_SEVERITIES:
+            return upper
+    if level:
+        return _LEVEL_TO_SEVERITY.get(str(level).lower(), "MEDIUM")
     return "UNKNOWN"
 
 
-def _extract_scanner_name_from_result(
-    result: "Result",
+def resolve_scanner_name(
     run_tool_name: str,
-    tags: Optional[List[str]],
+    scanner_name: Optional[str] = None,
+    details_tool_name: Optional[str] = None,
+    tags: Optional[List[str]] = None,
 ) -> str:
-    """Determine the effective scanner name for a SARIF Result.
+    """Determine the effective scanner name of a SARIF result from its parts.
 
     Precedence: properties.scanner_name → properties.scanner_details.tool_name
     → run_tool_name. If the run tool is the generic ASH aggregate name, a
     matching entry in tags wins as a last resort.
     """
-    actual = run_tool_name
-    props = result.properties
-    if props is not None:
-        scanner_name = getattr(props, "scanner_name", None)
-        if scanner_name:
-            return scanner_name
-        details = getattr(props, "scanner_details", None)
-        if details is not None and getattr(details, "tool_name", None):
-            return details.tool_name
-
-    if actual == _GENERIC_ASH_TOOL_NAME and tags:
+    if scanner_name:
+        return scanner_name
+    if details_tool_name:
+        return details_tool_name
+    if run_tool_name == _GENERIC_ASH_TOOL_NAME and tags:
         for tag in tags:
             if isinstance(tag, str) and tag.lower() in _KNOWN_SCANNER_TAGS:
                 return tag
-    return actual
+    return run_tool_name
+
+
+def file_path_from_uri(uri: Optional[str]) -> Optional[str]:
+    """Return the file path of a SARIF artifact URI, without a file:// scheme."""
+    if uri and uri.startswith("file://"):
+        uri = uri[7:]
+        if uri.startswith("///"):
+            uri = uri[2:]
+    return uri
+
+
+def severity_at_or_above(severity: str, threshold: Optional[str]) -> bool:
+    """Return whether ``severity`` is at or above ``threshold``.
+
+    Every severity passes when ``threshold`` is None; unknown severities and
+    thresholds never do.
+    """
+    if threshold is None:
+        return True
+    sev_upper = severity.upper() if isinstance(severity, str) else ""
+    thr_upper = threshold.upper()
+    if thr_upper not in _VALID_ISSUE_SEVERITIES:
+        return False
+    if sev_upper not in _VALID_ISSUE_SEVERITIES:
+        return False
+    return SEVERITY_ORDER.index(sev_upper) <= SEVERITY_ORDER.index(thr_upper)
+
+
+def _resolve_severity(result: "Result") -> str:
+    """Resolve severity for a SARIF Result; see :func:`resolve_severity`."""
+    return resolve_severity(
+        getattr(result.properties, "issue_severity", None), result.level
+    )
+
+
+def _extract_scanner_name_from_result(
+    result: "Result",
+    run_tool_name: str,
+    tags: Optional[List[str]],
+) -> str:
+    """Determine the effective scanner name for a SARIF Result.
+
+    See :func:`resolve_scanner_name` for the precedence.
+    """
+    props = result.properties
+    details = getattr(props, "scanner_details", None)
+    return resolve_scanner_name(
+        run_tool_name,
+        scanner_name=getattr(props, "scanner_name", None),
+        details_tool_name=getattr(details, "tool_name", None),
+        tags=tags,
+    )
 
 
 def _extract_location_info(
@@ -120,11 +171,7 @@ def _extract_location_info(
 
     artifact_location = getattr(pl_root, "artifactLocation", None)
     if artifact_location and getattr(artifact_location, "uri", None):
-        file_path = artifact_location.uri
-        if file_path and file_path.startswith("file://"):
-            file_path = file_path[7:]
-            if file_path.startswith("///"):
-                file_path = file_path[2:]
+        file_path = file_path_from_uri(artifact_location.uri)
 
     context_region = getattr(pl_root, "contextRegion", None)
     region = getattr(pl_root, "region", None)
@@ -186,7 +233,7 @@ def _extract_references(result: "Result") -> List[str]:
     return refs
 
 
-def _extract_snippet_from_message(description: str) -> Optional[str]:
+def extract_snippet_from_message(description: str) -> Optional[str]:
     """Best-effort extraction of a fenced code block out of the message text."""
     if not description or "```" not in description:
         return None
@@ -266,21 +313,130 @@ class FlatVulnerability(BaseModel):
         None, description="JSON string of the raw vulnerability data"
     )
 
+    # SARIF Result the lazy JSON fields are serialized from when first read
+    _source_result: Optional["Result"] = PrivateAttr(default=None)
+
+    def __getattr__(self, name: str) -> Any:
+        # Only reached when the attribute is missing from __dict__, i.e. for
+        # lazy fields that have not been serialized yet. Another thread may
+        # have materialized the finding since the lookup missed, so read the
+        # field back from __dict__ instead of re-checking the source.
+        if name in _LAZY_FIELDS:
+            self.materialize()
+            if name in self.__dict__:
+                return self.__dict__[name]
+        return super().__getattr__(name)
+
+    def _pending_source(self) -> Optional["Result"]:
+        private = self.__pydantic_private__
+        return private.get("_source_result") if private else None
+
+    def materialize(self) -> "FlatVulnerability":
+        """Serialize the lazy ``properties``, ``references`` and ``raw_data`` fields.
+
+        Findings built by :meth:`from_sarif_result` keep a reference to their
+        SARIF Result and only serialize these fields when they are first read
+        or the finding is dumped. Call this before persisting findings or
+        handing them to code that reads ``__dict__`` directly.
+
+        Safe to call from several threads at once.
+
+        Returns:
+            This finding, for chaining
+        """
+        if self._pending_source() is None:
+            return self
+        with _MATERIALIZE_LOCK:
+            result = self._pending_source()
+            if result is not None:
+                self._materialize_from(result)
+        return self
+
+    def _materialize_from(self, result: "Result") -> None:
+        properties_dict: Dict[str, Any] = {}
+        if result.properties is not None:
+            properties_dict = result.properties.model_dump(exclude_none=True)
+        references = _extract_references(result)
+        self.__dict__["properties"] = (
+            json.dumps(properties_dict, default=str) if properties_dict else None
+        )
+        self.__dict__["references"] = (
+            json.dumps(references, default=str) if references else None
+        )
+        self.__dict__["raw_data"] = result.model_dump_json(exclude_none=True)
+        # Cleared last: a finding without a pending source has all its fields.
+        self.__pydantic_private__["_source_result"] = None
+
+    def raw_data_dict(self) -> Optional[Dict[str, Any]]:
+        """Return the raw vulnerability data as a dictionary.
+
+        Avoids serializing ``raw_data`` to JSON and parsing it back when the
+        source SARIF Result is still available.
+        """
+        result = self._pending_source()
+        if result is not None:
+            return result.model_dump(mode="json", exclude_none=True)
+        if not self.raw_data:
+            return None
+        try:
+            raw_data = json.loads(self.raw_data)
+        except (json.JSONDecodeError, TypeError):
+            return None
+        return raw_data if isinstance(raw_data, dict) else None
+
+    @model_serializer(mode="wrap")
+    def _serialize_materialized(self, handler):
+        self.materialize()
+        return handler(self)
+
+    # dict(vuln), iteration and repr read __dict__ directly.
+    def __iter__(self):
+        self.materialize()
+        return super().__iter__()
+
+    def __repr_args__(self):
+        self.materialize()
+        return super().__repr_args__()
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, FlatVulnerability):
+            self.materialize()
+            other.materialize()
+        return super().__eq__(other)
+
     @classmethod
     def from_sarif_result(
         cls,
         result: "Result",
         tool_name: str,
         tool_type: str,
+        detected_at: Optional[str] = None,
+        eager: bool = False,
     ) -> "FlatVulnerability":
         """Construct a FlatVulnerability from a SARIF Result.
 
         This factory is pure — it does not mutate AshAggregatedResults summary
         stats or scanner_results. Callers are responsible for performing those
         side effects based on the returned vuln's is_suppressed flag.
+
+        ``properties``, ``references`` and ``raw_data`` are serialized from
+        ``result`` when first read unless ``eager`` is set; see
+        :meth:`materialize`.
+
+        Args:
+            result: The SARIF Result to flatten
+            tool_name: Name of the SARIF run's tool
+            tool_type: Type of the SARIF run's tool (SAST, SCA, ...)
+            detected_at: Detection timestamp; defaults to the current time
+            eager: Serialize the JSON fields immediately
         """
         description = _extract_message_text(result)
-        if description and result.ruleId:
+        # Results ingested by a scan are masked already; see mask_secrets_in_sarif.
+        if (
+            description
+            and result.ruleId
+            and not getattr(result.properties, "_secrets_masked", False)
+        ):
             description = mask_secret_in_text(description, result.ruleId)
 
         file_path, line_start, line_end, code_snippet = _extract_location_info(result)
@@ -290,7 +446,7 @@ class FlatVulnerability(BaseModel):
             if prop_snippet:
                 code_snippet = prop_snippet
         if code_snippet is None:
-            code_snippet = _extract_snippet_from_message(description)
+            code_snippet = extract_snippet_from_message(description)
 
         tags = _extract_tags(result)
         actual_scanner = _extract_scanner_name_from_result(
@@ -308,13 +464,7 @@ class FlatVulnerability(BaseModel):
             supp_kind = getattr(supp, "kind", None) or None
             supp_reas = getattr(supp, "justification", None) or None
 
-        properties_dict: Dict[str, Any] = {}
-        if result.properties is not None:
-            properties_dict = result.properties.model_dump(exclude_none=True)
-
-        references = _extract_references(result)
-
-        return cls(
+        vuln = cls(
             id=f"{actual_scanner}-{result.ruleId or 'unknown'}-{hashlib.sha256(description.encode()).hexdigest()[:8]}",
             title=result.ruleId or "Unknown Issue",
             description=description,
@@ -330,15 +480,19 @@ class FlatVulnerability(BaseModel):
             line_end=line_end,
             code_snippet=code_snippet,
             tags=json.dumps(tags, default=str) if tags else None,
-            properties=(
-                json.dumps(properties_dict, default=str) if properties_dict else None
-            ),
-            references=(
-                json.dumps(references, default=str) if references else None
-            ),
-            detected_at=datetime.now(timezone.utc).isoformat(),
-            raw_data=result.model_dump_json(exclude_none=True),
+            properties=None,
+            references=None,
+            detected_at=detected_at or datetime.now(timezone.utc).isoformat(),
+            raw_data=None,
         )
+        # Drop the placeholders so reads fall through to __getattr__; the
+        # fields stay in model_fields_set as they were explicitly provided.
+        for name in _LAZY_FIELDS:
+            del vuln.__dict__[name]
+        vuln._source_result = result
+        if eager:
+            vuln.materialize()
+        return vuln
 
     @classmethod
     def from_additional_report(
@@ -388,14 +542,6 @@ class FlatVulnerability(BaseModel):
         ``threshold`` is case-insensitive. Severity ordering is
         CRITICAL > HIGH > MEDIUM > LOW > INFO.
         """
-        if self.is_suppressed:
-            return False
-        if not isinstance(threshold, str):
-            return False
-        thr_upper = threshold.upper()
-        if thr_upper not in _VALID_ISSUE_SEVERITIES:
-            return False
-        sev_upper = self.severity.upper() if isinstance(self.severity, str) else ""
-        if sev_upper not in _VALID_ISSUE_SEVERITIES:
+        if self.is_suppressed or not isinstance(threshold, str):
             return False
-        return _SEVERITY_ORDER.index(sev_upper) <= _SEVERITY_ORDER.index(thr_upper)
+        return severity_at_or_above(self.severity, threshold)
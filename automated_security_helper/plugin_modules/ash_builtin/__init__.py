@@ -1,10 +1,25 @@
 # Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
 # SPDX-License-Identifier: Apache-2.0
 
+"""Built-in ASH plugins.
+
+Importing this package does not import any plugin. The plugin manager
+registers the built-in plugins from ``plugin_manifest.json`` and imports a
+plugin module only when that plugin is used. ``ASH_CONVERTERS``,
+``ASH_SCANNERS``, ``ASH_REPORTERS`` and ``ASH_EVENT_HANDLERS`` are still
+available and are resolved on first access.
+"""
+
 import importlib
 
 from automated_security_helper.plugins.events import AshEventType
 
+_PLUGIN_LISTS = {
+    "ASH_CONVERTERS": "converters",
+    "ASH_SCANNERS": "scanners",
+    "ASH_REPORTERS": "reporters",
+}
+
 
 def _load_module(module_path: str):
     """Import a module by its dotted path and return it."""
@@ -12,104 +27,45 @@ def _load_module(module_path: str):
     return importlib.import_module(module_path)  # nosemgrep: python.lang.security.audit.non-literal-import.non-literal-import
 
 
-def _load_builtin_plugins():
-    """Load all built-in plugin classes lazily via importlib.
+def _load_plugin_classes(subpackage: str) -> list:
+    """Import every plugin class exported by a built-in plugin subpackage.
 
     The @ash_scanner_plugin / @ash_converter_plugin / @ash_reporter_plugin
     decorators fire at import time to register each class with the plugin
     manager, so the import itself is sufficient for registration.
     """
-    _base = "automated_security_helper.plugin_modules.ash_builtin"
-
-    # -- Converters --
-    converters_mod = _load_module(f"{_base}.converters")
-    ArchiveConverter = converters_mod.ArchiveConverter
-    JupyterConverter = converters_mod.JupyterConverter
-
-    # -- Scanners --
-    scanners_mod = _load_module(f"{_base}.scanners")
-    BanditScanner = scanners_mod.BanditScanner
-    CdkNagScanner = scanners_mod.CdkNagScanner
-    CfnNagScanner = scanners_mod.CfnNagScanner
-    CheckovScanner = scanners_mod.CheckovScanner
-    DetectSecretsScanner = scanners_mod.DetectSecretsScanner
-    GrypeScanner = scanners_mod.GrypeScanner
-    SyftScanner = scanners_mod.SyftScanner
-    OpengrepScanner = scanners_mod.OpengrepScanner
-
-    npm_mod = _load_module(
-        f"{_base}.scanners.npm_audit_scanner"
-    )
-    NpmAuditScanner = npm_mod.NpmAuditScanner
-
-    semgrep_mod = _load_module(
-        f"{_base}.scanners.semgrep_scanner"
-    )
-    SemgrepScanner = semgrep_mod.SemgrepScanner
-
-    # -- Reporters --
-    reporters_mod = _load_module(f"{_base}.reporters")
-    CsvReporter = reporters_mod.CsvReporter
-    CycloneDXReporter = reporters_mod.CycloneDXReporter
-    FlatJsonReporter = reporters_mod.FlatJsonReporter
-    GitLabSASTReporter = reporters_mod.GitLabSASTReporter
-    HtmlReporter = reporters_mod.HtmlReporter
-    JunitXmlReporter = reporters_mod.JunitXmlReporter
-    MarkdownReporter = reporters_mod.MarkdownReporter
-    OcsfReporter = reporters_mod.OcsfReporter
-    SarifReporter = reporters_mod.SarifReporter
-    SpdxReporter = reporters_mod.SpdxReporter
-    TextReporter = reporters_mod.TextReporter
-    UnusedSuppressionsReporter = reporters_mod.UnusedSuppressionsReporter
-    YamlReporter = reporters_mod.YamlReporter
-
-    # -- Event Handlers --
-    event_handlers_mod = _load_module(f"{_base}.event_handlers")
-    handle_scan_completion_logging = event_handlers_mod.handle_scan_completion_logging
-    handle_suppression_expiration_check = event_handlers_mod.handle_suppression_expiration_check
-
-    return (
-        [ArchiveConverter, JupyterConverter],
-        [
-            BanditScanner,
-            CdkNagScanner,
-            CfnNagScanner,
-            CheckovScanner,
-            DetectSecretsScanner,
-            GrypeScanner,
-            NpmAuditScanner,
-            OpengrepScanner,
-            SemgrepScanner,
-            SyftScanner,
-        ],
-        [
-            CsvReporter,
-            CycloneDXReporter,
-            FlatJsonReporter,
-            GitLabSASTReporter,
-            HtmlReporter,
-            JunitXmlReporter,
-            MarkdownReporter,
-            OcsfReporter,
-            SarifReporter,
-            SpdxReporter,
-            TextReporter,
-            UnusedSuppressionsReporter,
-            YamlReporter,
+    module = _load_module(f"{__name__}.{subpackage}")
+    return [
+        plugin_class
+        for plugin_class in (getattr(module, name) for name in module.__all__)
+        if hasattr(plugin_class, "ash_plugin_type")
+    ]
+
+
+def _load_event_handlers() -> dict:
+    """Return the built-in event handlers keyed by event type."""
+    event_handlers_mod = _load_module(f"{__name__}.event_handlers")
+
+    event_handlers = {
+        AshEventType.SCAN_COMPLETE: [event_handlers_mod.handle_scan_completion_logging],
+        AshEventType.EXECUTION_START: [
+            event_handlers_mod.handle_suppression_expiration_check
         ],
-        {
-            AshEventType.SCAN_COMPLETE: [handle_scan_completion_logging],
-            AshEventType.EXECUTION_START: [handle_suppression_expiration_check],
-        },
-    )
-
-
-# Lazy-load on first access via load_internal_plugins() in plugins/loader.py.
-# The module-level lists below are populated once _load_builtin_plugins runs
-# (triggered by `importlib.import_module` in the loader).
-_loaded = _load_builtin_plugins()
-
-ASH_CONVERTERS = _loaded[0]
-ASH_SCANNERS = _loaded[1]
-ASH_REPORTERS = _loaded[2]
-ASH_EVENT_HANDLERS = _loaded[3]
+    }
+    for (
+        event_type,
+        stream_handler,
+    ) in event_handlers_mod.SCAN_EVENT_STREAM_HANDLERS.items():
+        event_handlers.setdefault(event_type, []).append(stream_handler)
+    return event_handlers
+
+
+def __getattr__(name: str):
+    if name == "ASH_EVENT_HANDLERS":
+        value = _load_event_handlers()
+    elif name in _PLUGIN_LISTS:
+        value = _load_plugin_classes(_PLUGIN_LISTS[name])
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
@@ -1,11 +1,31 @@
 # Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
 # SPDX-License-Identifier: Apache-2.0
 
-from automated_security_helper.plugin_modules.ash_builtin.converters.archive_converter import (
-    ArchiveConverter,
-)
-from automated_security_helper.plugin_modules.ash_builtin.converters.jupyter_converter import (
-    JupyterConverter,
-)
-
-__all__ = ["ArchiveConverter", "JupyterConverter"]
+"""Built-in converter plugins.
+
+Each plugin module is imported the first time its class is accessed.
+"""
+
+from typing import TYPE_CHECKING
+
+from automated_security_helper.utils.lazy_exports import lazy_exports
+
+if TYPE_CHECKING:
+    from automated_security_helper.plugin_modules.ash_builtin.converters.archive_converter import (
+        ArchiveConverter,
+    )
+    from automated_security_helper.plugin_modules.ash_builtin.converters.jupyter_converter import (
+        JupyterConverter,
+    )
+
+_EXPORTS = {
+    "ArchiveConverter": ("archive_converter", "ArchiveConverter"),
+    "JupyterConverter": ("jupyter_converter", "JupyterConverter"),
+}
+
+__all__ = [
+    "ArchiveConverter",
+    "JupyterConverter",
+]
+
+__getattr__, __dir__ = lazy_exports(__name__, globals(), _EXPORTS)
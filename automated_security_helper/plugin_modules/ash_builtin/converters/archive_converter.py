@@ -3,11 +3,14 @@
 
 """Module containing the ArchiveConverter implementation."""
 
+import hashlib
 import os
-import sys
+import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import tarfile
-from typing import Annotated, List, Literal, Optional
+from typing import IO, Annotated, Dict, List, Literal, Optional, Tuple
 import zipfile
 
 from pydantic import Field
@@ -27,9 +30,56 @@ from automated_security_helper.utils.log import ASH_LOGGER
 from automated_security_helper.utils.normalizers import get_normalized_filename
 from automated_security_helper.utils.suppression_matcher import file_path_matches as path_matches_pattern
 
+ARCHIVE_EXTENSIONS = ("zip", "tar", "gz")
+_SCANNABLE_EXTENSIONS = frozenset(KNOWN_SCANNABLE_EXTENSIONS)
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def _archive_hash(archive_file: str) -> str:
+    """Return the SHA-256 of an archive's content."""
+    digest = hashlib.sha256()
+    with open(archive_file, "rb") as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _link_tree(source: Path, target: Path) -> None:
+    """Recreate ``source`` at ``target`` using hard links, copying where linking fails."""
+    for root, _dirs, files in os.walk(source):
+        dest_root = target / Path(root).relative_to(source)
+        dest_root.mkdir(parents=True, exist_ok=True)
+        for name in files:
+            dest = dest_root / name
+            if dest.exists():
+                continue
+            try:
+                os.link(Path(root) / name, dest)
+            except OSError:
+                shutil.copy2(Path(root) / name, dest)
+
 
 class ArchiveConverterConfigOptions(ConverterOptionsBase):
-    pass
+    max_workers: Annotated[
+        int | None,
+        Field(
+            description="Maximum archives extracted concurrently. Defaults to the number of CPUs.",
+            ge=1,
+        ),
+    ] = None
+    deduplicate_archives: Annotated[
+        bool,
+        Field(
+            description="Extract archives with identical content once and hard-link the extracted files for the other copies."
+        ),
+    ] = True
+    max_extraction_depth: Annotated[
+        int,
+        Field(
+            description="How many levels of archives nested inside archives to extract. 0 extracts only the archives found in the source directory.",
+            ge=0,
+        ),
+    ] = 0
 
 
 class ArchiveConverterConfig(ConverterPluginConfigBase):
@@ -82,49 +132,192 @@ class ArchiveConverter(ConverterPluginBase[ArchiveConverterConfig]):
 
         return False
 
+    def _inspect_member(
+        self,
+        member: str | zipfile.ZipInfo | tarfile.TarInfo,
+        target_path: Optional[Path] = None,
+        nested_archives: bool = False,
+    ) -> Optional[str]:
+        """Return the member's name if it should be extracted, otherwise None.
+
+        Args:
+            member: The archive member
+            target_path: The intended extraction directory, used to reject path traversal
+            nested_archives: Also accept members that are themselves archives
+        """
+        if isinstance(member, tarfile.TarInfo):
+            member_name = member.name
+
+            # Reject symlinks and hard links in tar archives
+            if member.issym() or member.islnk():
+                ASH_LOGGER.warning(
+                    f"Skipping symbolic/hard link in archive: {member_name}"
+                )
+                return None
+            if not member.isfile():
+                return None
+        elif isinstance(member, zipfile.ZipInfo):
+            member_name = member.filename
+            if member.is_dir():
+                return None
+        elif isinstance(member, str):
+            member_name = member
+        else:
+            ASH_LOGGER.debug(f"Skipping uknown extension from archive: {type(member)}")
+            return None
+        member_ext = member_name.split(".")[-1]
+
+        # Validate path safety when target_path is provided
+        if target_path is not None and self._is_path_traversal(
+            member_name, target_path
+        ):
+            ASH_LOGGER.warning(
+                f"Skipping archive member with path traversal: {member_name}"
+            )
+            return None
+
+        if member_ext in _SCANNABLE_EXTENSIONS:
+            ASH_LOGGER.verbose(f"Found .{member_ext} file: {member}")
+            return member_name
+        if nested_archives and member_ext.lower() in ARCHIVE_EXTENSIONS:
+            ASH_LOGGER.verbose(f"Found nested archive: {member}")
+            return member_name
+        return None
+
     def inspect_members(
         self,
         members: List[str | zipfile.ZipInfo | tarfile.TarInfo],
         target_path: Optional[Path] = None,
     ):
         ASH_LOGGER.verbose(f"Inspecting {len(members)} members from archive")
-        filtered_members = []
-        for member in members:
-            if isinstance(member, tarfile.TarInfo):
-                member_name = member.name
-                member_ext = member_name.split(".")[-1]
-
-                # Reject symlinks and hard links in tar archives
-                if member.issym() or member.islnk():
-                    ASH_LOGGER.warning(
-                        f"Skipping symbolic/hard link in archive: {member_name}"
-                    )
-                    continue
-            elif isinstance(member, zipfile.ZipInfo):
-                member_name = member.filename
-                member_ext = member_name.split(".")[-1]
-            elif isinstance(member, str):
-                member_name = member
-                member_ext = member.split(".")[-1]
-            else:
+        return [
+            member
+            for member in members
+            if self._inspect_member(member, target_path=target_path) is not None
+        ]
+
+    def _is_ignored(self, rel_path: str) -> bool:
+        """Check a source-relative path against the global ignore_paths."""
+        for ignore_path in self.context.config.global_settings.ignore_paths:
+            if path_matches_pattern(rel_path, ignore_path.path):
                 ASH_LOGGER.debug(
-                    f"Skipping uknown extension from archive: {type(member)}"
+                    f"Skipping conversion of ignored path: {rel_path} due to global ignore_path '{ignore_path.path}' with reason '{ignore_path.reason}'"
                 )
-                continue
+                return True
+        return False
 
-            # Validate path safety when target_path is provided
-            if target_path is not None and self._is_path_traversal(
-                member_name, target_path
-            ):
-                ASH_LOGGER.warning(
-                    f"Skipping archive member with path traversal: {member_name}"
+    def _write_member(
+        self,
+        stream: IO[bytes],
+        member_name: str,
+        target_path: Path,
+        rel_path: str,
+        depth: int,
+        evaluated: Optional[Dict[str, bool]] = None,
+    ) -> None:
+        """Write one archive member, extracting it instead if it is a nested archive."""
+        if member_name.split(".")[-1].lower() in ARCHIVE_EXTENSIONS:
+            # Nested archives are spooled to a temporary file and extracted
+            # into a directory named after the member.
+            with tempfile.NamedTemporaryFile(
+                dir=target_path, suffix=Path(member_name).name, delete=False
+            ) as spool:
+                shutil.copyfileobj(stream, spool)
+            try:
+                self._extract_archive(
+                    spool.name,
+                    target_path.joinpath(member_name),
+                    rel_path=rel_path,
+                    depth=depth + 1,
+                    evaluated=evaluated,
                 )
-                continue
+            finally:
+                os.unlink(spool.name)
+            return
+        destination = target_path.joinpath(member_name)
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        with open(destination, "wb") as out:
+            shutil.copyfileobj(stream, out)
+
+    def _extract_archive(
+        self,
+        archive_file: str,
+        target_path: Path,
+        rel_path: str,
+        depth: int = 0,
+        evaluated: Optional[Dict[str, bool]] = None,
+    ) -> bool:
+        """Stream the extractable members of an archive into ``target_path``.
+
+        Members are read one at a time; ignored and non-scannable members are
+        never written. Tarballs are read in a single sequential pass, so
+        compressed tarballs are only decompressed once.
 
-            if member_ext in KNOWN_SCANNABLE_EXTENSIONS:
-                ASH_LOGGER.verbose(f"Found .{member_ext} file: {member}")
-                filtered_members.append(member)
-        return filtered_members
+        Args:
+            archive_file: Path of the archive to extract
+            target_path: Directory to extract into
+            rel_path: The archive's path relative to the source directory, used
+                to match members against the global ignore_paths
+            depth: Nesting depth of this archive; 0 for archives in the source
+            evaluated: If given, filled with the source-relative path of every
+                extractable member, mapped to whether ignore_paths excluded it
+
+        Returns:
+            True if the archive format was supported, False otherwise
+        """
+        nested = depth < self.config.options.max_extraction_depth
+
+        def accept(member) -> Optional[str]:
+            member_name = self._inspect_member(
+                member, target_path=target_path, nested_archives=nested
+            )
+            if member_name is None:
+                return None
+            member_path = f"{rel_path}/{member_name}"
+            ignored = self._is_ignored(member_path)
+            if evaluated is not None:
+                evaluated[member_path] = ignored
+            return None if ignored else member_name
+
+        # Extract ZIP to target path after inspecting members
+        if archive_file.lower().endswith(".zip") and zipfile.is_zipfile(archive_file):
+            target_path.mkdir(parents=True, exist_ok=True)
+            with zipfile.ZipFile(archive_file, "r") as zip_ref:
+                for member in zip_ref.infolist():
+                    member_name = accept(member)
+                    if member_name is None:
+                        continue
+                    with zip_ref.open(member) as stream:
+                        self._write_member(
+                            stream,
+                            member_name,
+                            target_path,
+                            f"{rel_path}/{member_name}",
+                            depth,
+                            evaluated,
+                        )
+            return True
+        # Extract Tarball to target path after inspecting members
+        if tarfile.is_tarfile(archive_file):
+            target_path.mkdir(parents=True, exist_ok=True)
+            with tarfile.open(archive_file, mode="r|*", encoding="utf-8") as tar_ref:
+                for member in tar_ref:
+                    member_name = accept(member)
+                    if member_name is None:
+                        continue
+                    stream = tar_ref.extractfile(member)
+                    if stream is None:
+                        continue
+                    self._write_member(
+                        stream,
+                        member_name,
+                        target_path,
+                        f"{rel_path}/{member_name}",
+                        depth,
+                        evaluated,
+                    )
+            return True
+        return False
 
     def convert(self) -> List[Path]:
         """Convert archive files by extracting their contents.
@@ -163,78 +356,105 @@ class ArchiveConverter(ConverterPluginBase[ArchiveConverterConfig]):
 
         self.results_dir.mkdir(parents=True, exist_ok=True)
 
+        # (archive path, source-relative path, target directory, content hash)
+        jobs: List[Tuple[str, str, Path, Optional[str]]] = []
         for archive_file in archive_files:
             try:
-                skip_item = False
                 # Skip directories
                 if Path(archive_file).is_dir():
                     ASH_LOGGER.debug(f"Skipping directory: {archive_file}")
-                    skip_item = True
-                else:
-                    for ignore_path in self.context.config.global_settings.ignore_paths:
-                        rel_path = (
-                            Path(archive_file)
-                            .relative_to(self.context.source_dir)
-                            .as_posix()
-                        )
-                        if path_matches_pattern(rel_path, ignore_path.path):
-                            ASH_LOGGER.debug(
-                                f"Skipping conversion of ignored path: {archive_file} due to global ignore_path '{ignore_path.path}' with reason '{ignore_path.reason}'"
-                            )
-                            skip_item = True
-                            break
-                if skip_item:
+                    continue
+                try:
+                    rel_path = (
+                        Path(archive_file)
+                        .relative_to(self.context.source_dir)
+                        .as_posix()
+                    )
+                except ValueError:
+                    rel_path = Path(archive_file).as_posix()
+                if self._is_ignored(rel_path):
                     continue
 
                 short_archive_file = get_shortest_name(archive_file)
                 normalized_archive_file = get_normalized_filename(short_archive_file)
                 target_path = self.results_dir.joinpath(normalized_archive_file)
-                ASH_LOGGER.verbose(
-                    f"Extracting {archive_file} contents to target_path: {Path(target_path).as_posix()}"
+                content_hash = (
+                    _archive_hash(archive_file)
+                    if self.config.options.deduplicate_archives
+                    else None
                 )
+                jobs.append((archive_file, rel_path, target_path, content_hash))
+            except Exception as e:
+                ASH_LOGGER.error(f"Error processing archive {archive_file}: {e}")
 
-                # Create target directory if it doesn't exist
-                target_path.mkdir(parents=True, exist_ok=True)
-
-                # Extract ZIP to target path after inspecting members
-                if archive_file.lower().endswith(".zip") and zipfile.is_zipfile(archive_file):
-                    with zipfile.ZipFile(archive_file, "r") as zip_ref:
-                        zip_ref.extractall(
-                            path=target_path,
-                            members=self.inspect_members(
-                                zip_ref.filelist, target_path=target_path
-                            ),
-                        )
-                # Extract Tarball to target path after inspecting members
-                elif tarfile.is_tarfile(archive_file):
-                    with tarfile.open(
-                        archive_file, mode="r", encoding="utf-8"
-                    ) as tar_ref:
-                        safe_members = self.inspect_members(
-                            tar_ref.getmembers(), target_path=target_path
-                        )
-                        if sys.version_info >= (3, 12):
-                            tar_ref.extractall(  # nosec B202
-                                path=target_path,
-                                members=safe_members,
-                                filter="data",
-                            )
-                        else:
-                            tar_ref.extractall(  # nosec B202
-                                path=target_path,
-                                members=safe_members,
-                            )
-                else:
-                    ASH_LOGGER.debug(
-                        f"Skipping unsupported archive format: {archive_file}"
-                    )
-                    continue
-
-                # Add the extracted directory to results
-                results.append(target_path)
+        # Extract each distinct archive once; copies are linked afterwards.
+        extract_jobs: Dict[str, Tuple[str, str, Path, Optional[str]]] = {}
+        for job in jobs:
+            extract_jobs.setdefault(job[3] or job[0], job)
+
+        def extract(
+            job: Tuple[str, str, Path, Optional[str]],
+        ) -> Tuple[Optional[Path], Dict[str, bool]]:
+            """Extract one archive.
+
+            Returns:
+                The extraction directory, or None, and whether each member was
+                ignored, keyed by its path inside the archive
+            """
+            archive_file, rel_path, target_path, _ = job
+            ASH_LOGGER.verbose(
+                f"Extracting {archive_file} contents to target_path: {Path(target_path).as_posix()}"
+            )
+            evaluated: Dict[str, bool] = {}
+            try:
+                if self._extract_archive(
+                    archive_file, target_path, rel_path=rel_path, evaluated=evaluated
+                ):
+                    prefix = len(rel_path) + 1
+                    return target_path, {
+                        path[prefix:]: ignored for path, ignored in evaluated.items()
+                    }
+                ASH_LOGGER.debug(f"Skipping unsupported archive format: {archive_file}")
             except IsADirectoryError:
                 ASH_LOGGER.debug(f"Skipping directory: {archive_file}")
             except Exception as e:
                 ASH_LOGGER.error(f"Error processing archive {archive_file}: {e}")
+            return None, evaluated
+
+        workers = min(
+            len(extract_jobs), self.config.options.max_workers or os.cpu_count() or 1
+        )
+        if workers <= 1:
+            extracted = [extract(job) for job in extract_jobs.values()]
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                extracted = list(executor.map(extract, extract_jobs.values()))
+        extracted_by_key = dict(zip(extract_jobs, extracted))
+
+        for job in jobs:
+            archive_file, rel_path, target_path, content_hash = job
+            extracted_path, evaluated = extracted_by_key[content_hash or archive_file]
+            if extracted_path is None:
+                continue
+            if extracted_path != target_path:
+                # ignore_paths are matched against source-relative paths, so a
+                # copy elsewhere in the source may have other members ignored.
+                if any(
+                    self._is_ignored(f"{rel_path}/{member_path}") != ignored
+                    for member_path, ignored in evaluated.items()
+                ):
+                    if extract(job)[0] is not None:
+                        results.append(target_path)
+                    continue
+                ASH_LOGGER.debug(
+                    f"Linking {archive_file} to identical archive extracted at {extracted_path}"
+                )
+                try:
+                    _link_tree(extracted_path, target_path)
+                except OSError as e:
+                    ASH_LOGGER.error(f"Error processing archive {archive_file}: {e}")
+                    continue
+            # Add the extracted directory to results
+            results.append(target_path)
 
         return results
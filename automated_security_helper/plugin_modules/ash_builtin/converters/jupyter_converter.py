@@ -3,9 +3,16 @@
 
 """Module containing the JupyterConverter implementation."""
 
+import hashlib
+import json
+import multiprocessing
+import os
 import subprocess  # nosec B404 — required for fallback when uv tool unavailable
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Annotated, List, Literal, Optional
+from typing import Annotated, Dict, List, Literal, Optional, Tuple
 
 from pydantic import Field
 
@@ -22,7 +29,98 @@ from automated_security_helper.utils.get_scan_set import scan_set
 from automated_security_helper.utils.get_shortest_name import get_shortest_name
 from automated_security_helper.utils.log import ASH_LOGGER
 from automated_security_helper.utils.normalizers import get_normalized_filename
-from automated_security_helper.utils.suppression_matcher import file_path_matches as path_matches_pattern
+from automated_security_helper.utils.suppression_matcher import (
+    file_path_matches as path_matches_pattern,
+)
+
+
+# Bump when the rendered output changes so cached conversions are not reused.
+_CONVERSION_CACHE_VERSION = "3"
+
+_SCRIPT_HEADER = "#!/usr/bin/env python\n# coding: utf-8\n"
+
+
+@lru_cache(maxsize=1)
+def _ipython_transformer():
+    """Return IPython's cell transformer, or None when IPython is not installed."""
+    try:
+        from IPython.core.inputtransformer2 import TransformerManager
+    except ImportError:
+        return None
+    return TransformerManager()
+
+
+def _ipython2python(code: str) -> Optional[str]:
+    """Apply nbconvert's ``ipython2python`` filter to a code cell.
+
+    Returns None when IPython is not installed. What nbconvert does then
+    depends on whether IPython is installed where nbconvert runs, so the
+    notebook is left to nbconvert.
+    """
+    transformer = _ipython_transformer()
+    if transformer is None:
+        return None
+    return transformer.transform_cell(code)
+
+
+def _cell_source(cell: dict) -> str:
+    source = cell.get("source", "")
+    return "".join(source) if isinstance(source, list) else source
+
+
+def notebook_to_script(notebook: dict) -> Optional[str]:
+    """Render a notebook the way ``jupyter nbconvert --to script`` does.
+
+    Args:
+        notebook: Parsed notebook JSON
+
+    Returns:
+        The Python script, or None if the notebook cannot be rendered
+        identically in-process (not an nbformat 4 Python notebook, contains
+        raw cells, or has code cells while IPython is not installed)
+    """
+    if notebook.get("nbformat") != 4:
+        return None
+    language_info = notebook.get("metadata", {}).get("language_info", {})
+    if language_info.get("nbconvert_exporter") != "python":
+        return None
+
+    parts = [_SCRIPT_HEADER]
+    for cell in notebook.get("cells", []):
+        cell_type = cell.get("cell_type")
+        if cell_type == "code":
+            code = _ipython2python(_cell_source(cell))
+            if code is None:
+                return None
+            prompt = cell.get("execution_count") or " "
+            parts.append(f"\n# In[{prompt}]:\n\n\n{code}\n")
+        elif cell_type == "markdown":
+            parts.append("\n# " + _cell_source(cell).replace("\n", "\n# ") + "\n")
+        elif cell_type == "raw":
+            return None
+    return "".join(parts)
+
+
+def _convert_notebook_batch(
+    batch: List[Tuple[str, bytes]],
+) -> List[Tuple[str, Optional[str], Optional[str]]]:
+    """Convert a batch of notebooks; runs in a worker process.
+
+    Args:
+        batch: ``(content_hash, notebook_bytes)`` pairs
+
+    Returns:
+        ``(content_hash, script, error)`` for each notebook; ``script`` is None
+        when the notebook needs nbconvert
+    """
+    converted = []
+    for content_hash, content in batch:
+        try:
+            script = notebook_to_script(json.loads(content))
+            converted.append((content_hash, script, None))
+        except Exception as e:
+            converted.append((content_hash, None, str(e)))
+    return converted
 
 
 class JupyterConverterConfigOptions(ConverterOptionsBase):
@@ -36,6 +134,32 @@ class JupyterConverterConfigOptions(ConverterOptionsBase):
         int,
         Field(description="Timeout in seconds for tool installation (default: 300)"),
     ] = 300
+    conversion_engine: Annotated[
+        Literal["native", "nbconvert"],
+        Field(
+            description="How notebooks are converted. 'native' parses notebooks in-process and produces the same output as `jupyter nbconvert --to script`, falling back to nbconvert for notebooks it cannot render identically and for every notebook when IPython is not installed. 'nbconvert' runs nbconvert for every notebook."
+        ),
+    ] = "native"
+    max_workers: Annotated[
+        int | None,
+        Field(
+            description="Maximum worker processes for native conversion. Defaults to the number of CPUs.",
+            ge=1,
+        ),
+    ] = None
+    batch_size: Annotated[
+        int,
+        Field(
+            description="Notebooks per worker batch for native conversion. Fewer pending notebooks than this are converted in-process.",
+            ge=1,
+        ),
+    ] = 64
+    cache_conversions: Annotated[
+        bool,
+        Field(
+            description="Reuse converted scripts from previous runs for notebooks whose content has not changed."
+        ),
+    ] = True
 
 
 class JupyterConverterConfig(ConverterPluginConfigBase):
@@ -159,6 +283,13 @@ class JupyterConverter(ConverterPluginBase[JupyterConverterConfig]):
         ):
             pass
 
+        if self.config.options.conversion_engine == "native":
+            ASH_LOGGER.info(
+                f"Converter {self.command} is not available. Notebooks that cannot "
+                f"be converted natively will be skipped."
+            )
+            return True
+
         ASH_LOGGER.warning(
             f"Converter {self.command} is not available. "
             f"Jupyter notebook conversion will be skipped."
@@ -232,8 +363,221 @@ class JupyterConverter(ConverterPluginBase[JupyterConverterConfig]):
             ASH_LOGGER.warning(f"Unexpected error during UV jupyter execution: {e}")
             return False
 
+    def _convert_with_nbconvert(self, ipynb_file: str, target_path: Path) -> bool:
+        """Convert one notebook by running ``jupyter nbconvert --to script``.
+
+        Args:
+            ipynb_file: Path of the notebook to convert
+            target_path: Path of the script to write
+
+        Returns:
+            True if the script was written, False otherwise
+        """
+        try:
+            # Use CLI command similar to the original shell script
+            cmd = [
+                "jupyter",
+                "nbconvert",
+                "--log-level",
+                "WARN",
+                "--to",
+                "script",
+                str(ipynb_file),
+                "--output",
+                str(target_path.with_suffix("")),  # nbconvert adds .py automatically
+            ]
+
+            # Execute using UV tool runner if available, otherwise direct execution
+            if self.use_uv_tool:
+                success = self._execute_nbconvert_via_uv(cmd, timeout=60)
+                if not success:
+                    ASH_LOGGER.warning(
+                        f"UV tool execution failed for {ipynb_file}, trying direct execution"
+                    )
+                    result = subprocess.run(  # nosec B603 — list args from validated nbconvert command
+                        cmd, capture_output=True, text=True, timeout=60
+                    )
+                    if result.returncode != 0:
+                        raise subprocess.CalledProcessError(
+                            result.returncode, cmd, result.stdout, result.stderr
+                        )
+            else:
+                result = subprocess.run(  # nosec B603 — list args from validated nbconvert command
+                    cmd, capture_output=True, text=True, timeout=60
+                )
+                if result.returncode != 0:
+                    raise subprocess.CalledProcessError(
+                        result.returncode, cmd, result.stdout, result.stderr
+                    )
+
+            # Check if the converted file was created
+            if target_path.exists():
+                ASH_LOGGER.debug(
+                    f"Successfully converted {ipynb_file} to {target_path}"
+                )
+                return True
+            ASH_LOGGER.warning(
+                f"Conversion completed but output file not found: {target_path}"
+            )
+
+        except subprocess.TimeoutExpired:
+            ASH_LOGGER.error(f"Timeout converting {ipynb_file}")
+        except subprocess.CalledProcessError as e:
+            ASH_LOGGER.error(f"Error converting {ipynb_file}: {e}")
+            if e.stderr:
+                ASH_LOGGER.debug(f"nbconvert stderr: {e.stderr}")
+        except Exception as e:
+            ASH_LOGGER.error(f"Unexpected error converting {ipynb_file}: {e}")
+            import traceback
+
+            ASH_LOGGER.debug(
+                f"Jupyter conversion error traceback: {traceback.format_exc()}"
+            )
+        return False
+
+    @staticmethod
+    def _multiprocessing_context():
+        """Return the multiprocessing context used for conversion workers.
+
+        Linux uses 'fork' so workers start without re-importing ASH. Other
+        platforms use 'spawn'. The global start method is left untouched.
+        """
+        return multiprocessing.get_context(
+            "fork" if sys.platform == "linux" else "spawn"
+        )
+
+    def _run_native_batches(
+        self, pending: List[Tuple[str, bytes]]
+    ) -> List[Tuple[str, Optional[str], Optional[str]]]:
+        """Convert notebooks in batches, on a process pool when there is more than one batch."""
+        if not pending:
+            return []
+        batch_size = self.config.options.batch_size
+        batches = [
+            pending[i : i + batch_size] for i in range(0, len(pending), batch_size)
+        ]
+        workers = min(
+            len(batches), self.config.options.max_workers or os.cpu_count() or 1
+        )
+        if workers <= 1:
+            return _convert_notebook_batch(pending)
+
+        ASH_LOGGER.debug(
+            f"Converting {len(pending)} notebooks in {len(batches)} batches on {workers} workers"
+        )
+        try:
+            with ProcessPoolExecutor(
+                max_workers=workers, mp_context=self._multiprocessing_context()
+            ) as executor:
+                return [
+                    converted
+                    for batch in executor.map(_convert_notebook_batch, batches)
+                    for converted in batch
+                ]
+        except Exception as e:
+            ASH_LOGGER.warning(
+                f"Notebook conversion worker pool failed ({e}), converting in-process"
+            )
+            return _convert_notebook_batch(pending)
+
+    def _convert_natively(self, jobs: List[Tuple[str, Path]]) -> List[Path]:
+        """Convert notebooks in-process, reusing cached and duplicate conversions.
+
+        Notebooks are grouped by content hash so identical notebooks are
+        converted once. Notebooks the native engine cannot render identically
+        are converted with nbconvert.
+
+        Args:
+            jobs: ``(notebook path, target script path)`` pairs
+
+        Returns:
+            The target paths that were written
+        """
+        cache_dir = None
+        if self.config.options.cache_conversions:
+            cache_dir = Path(self.context.output_dir).joinpath("cache", "jupyter")
+
+        targets_by_hash: Dict[str, List[Tuple[str, Path]]] = {}
+        contents: Dict[str, bytes] = {}
+        for ipynb_file, target_path in jobs:
+            try:
+                content = Path(ipynb_file).read_bytes()
+            except OSError as e:
+                ASH_LOGGER.error(f"Error reading {ipynb_file}: {e}")
+                continue
+            content_hash = hashlib.sha256(
+                _CONVERSION_CACHE_VERSION.encode() + content
+            ).hexdigest()
+            targets_by_hash.setdefault(content_hash, []).append(
+                (ipynb_file, target_path)
+            )
+            contents[content_hash] = content
+
+        scripts: Dict[str, str] = {}
+        pending: List[Tuple[str, bytes]] = []
+        for content_hash in targets_by_hash:
+            cached = cache_dir.joinpath(f"{content_hash}.py") if cache_dir else None
+            if cached is not None and cached.is_file():
+                scripts[content_hash] = cached.read_text(encoding="utf-8")
+            else:
+                pending.append((content_hash, contents[content_hash]))
+        ASH_LOGGER.debug(
+            f"{len(jobs)} notebooks, {len(targets_by_hash)} unique, "
+            f"{len(scripts)} reused from previous conversions"
+        )
+
+        needs_nbconvert: List[str] = []
+        if pending and _ipython_transformer() is None:
+            ASH_LOGGER.debug(
+                "IPython is not installed, converting notebooks with nbconvert"
+            )
+            needs_nbconvert = [content_hash for content_hash, _ in pending]
+            pending = []
+        for content_hash, script, error in self._run_native_batches(pending):
+            if script is None:
+                if error:
+                    ASH_LOGGER.debug(f"Native notebook conversion failed: {error}")
+                needs_nbconvert.append(content_hash)
+                continue
+            scripts[content_hash] = script
+            self._cache_script(cache_dir, content_hash, script)
+
+        converted = set()
+        for content_hash, script in scripts.items():
+            for ipynb_file, target_path in targets_by_hash[content_hash]:
+                target_path.write_text(script, encoding="utf-8")
+                ASH_LOGGER.debug(
+                    f"Successfully converted {ipynb_file} to {target_path}"
+                )
+                converted.add(target_path)
+
+        for content_hash in needs_nbconvert:
+            for ipynb_file, target_path in targets_by_hash[content_hash]:
+                if self._convert_with_nbconvert(ipynb_file, target_path):
+                    converted.add(target_path)
+                    self._cache_script(
+                        cache_dir,
+                        content_hash,
+                        target_path.read_text(encoding="utf-8"),
+                    )
+
+        return [target_path for _, target_path in jobs if target_path in converted]
+
+    @staticmethod
+    def _cache_script(cache_dir: Optional[Path], content_hash: str, script: str):
+        """Store a converted script for reuse by later runs."""
+        if cache_dir is None:
+            return
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            cache_dir.joinpath(f"{content_hash}.py").write_text(
+                script, encoding="utf-8"
+            )
+        except OSError as e:
+            ASH_LOGGER.debug(f"Unable to cache converted notebook: {e}")
+
     def convert(self) -> List[Path]:
-        """Converts Jupyter notebooks (.ipynb files) in the source_dir to Python files using CLI.
+        """Converts Jupyter notebooks (.ipynb files) in the source_dir to Python files.
 
         Returns:
             List[Path]: List of converted Python files
@@ -260,6 +604,7 @@ class JupyterConverter(ConverterPluginBase[JupyterConverterConfig]):
 
         self.results_dir.mkdir(parents=True, exist_ok=True)
 
+        jobs: List[Tuple[str, Path]] = []
         for ipynb_file in ipynb_files:
             try:
                 skip_item = False
@@ -283,7 +628,6 @@ class JupyterConverter(ConverterPluginBase[JupyterConverterConfig]):
                 if skip_item:
                     continue
 
-                ASH_LOGGER.debug(f"Converting {ipynb_file} to .py")
                 short_ipynb_file = get_shortest_name(ipynb_file)
                 normalized_ipynb_file = get_normalized_filename(short_ipynb_file)
                 # Ensure the target path has a .py extension (remove .ipynb and add -converted.py)
@@ -294,68 +638,14 @@ class JupyterConverter(ConverterPluginBase[JupyterConverterConfig]):
                 ASH_LOGGER.verbose(
                     f"Converting {ipynb_file} to target_path: {Path(target_path).as_posix()}"
                 )
-
-                # Use CLI command similar to the original shell script
-                cmd = [
-                    "jupyter",
-                    "nbconvert",
-                    "--log-level",
-                    "WARN",
-                    "--to",
-                    "script",
-                    str(ipynb_file),
-                    "--output",
-                    str(
-                        target_path.with_suffix("")
-                    ),  # nbconvert adds .py automatically
-                ]
-
-                # Execute using UV tool runner if available, otherwise direct execution
-                if self.use_uv_tool:
-                    success = self._execute_nbconvert_via_uv(cmd, timeout=60)
-                    if not success:
-                        ASH_LOGGER.warning(
-                            f"UV tool execution failed for {ipynb_file}, trying direct execution"
-                        )
-                        result = subprocess.run(  # nosec B603 — list args from validated nbconvert command
-                            cmd, capture_output=True, text=True, timeout=60
-                        )
-                        if result.returncode != 0:
-                            raise subprocess.CalledProcessError(
-                                result.returncode, cmd, result.stdout, result.stderr
-                            )
-                else:
-                    result = subprocess.run(  # nosec B603 — list args from validated nbconvert command
-                        cmd, capture_output=True, text=True, timeout=60
-                    )
-                    if result.returncode != 0:
-                        raise subprocess.CalledProcessError(
-                            result.returncode, cmd, result.stdout, result.stderr
-                        )
-
-                # Check if the converted file was created
-                if target_path.exists():
-                    results.append(target_path)
-                    ASH_LOGGER.debug(
-                        f"Successfully converted {ipynb_file} to {target_path}"
-                    )
-                else:
-                    ASH_LOGGER.warning(
-                        f"Conversion completed but output file not found: {target_path}"
-                    )
-
-            except subprocess.TimeoutExpired:
-                ASH_LOGGER.error(f"Timeout converting {ipynb_file}")
-            except subprocess.CalledProcessError as e:
-                ASH_LOGGER.error(f"Error converting {ipynb_file}: {e}")
-                if e.stderr:
-                    ASH_LOGGER.debug(f"nbconvert stderr: {e.stderr}")
+                jobs.append((ipynb_file, target_path))
             except Exception as e:
                 ASH_LOGGER.error(f"Unexpected error converting {ipynb_file}: {e}")
-                import traceback
 
-                ASH_LOGGER.debug(
-                    f"Jupyter conversion error traceback: {traceback.format_exc()}"
-                )
+        if self.config.options.conversion_engine == "native":
+            return self._convert_natively(jobs)
 
+        for ipynb_file, target_path in jobs:
+            if self._convert_with_nbconvert(ipynb_file, target_path):
+                results.append(target_path)
         return results
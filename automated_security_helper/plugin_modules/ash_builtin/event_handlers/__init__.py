@@ -4,11 +4,17 @@
 from automated_security_helper.plugin_modules.ash_builtin.event_handlers.scan_completion_logger import (
     handle_scan_completion_logging,
 )
+from automated_security_helper.plugin_modules.ash_builtin.event_handlers.scan_event_stream import (
+    SCAN_EVENT_STREAM_HANDLERS,
+    handle_scan_event_streaming,
+)
 from automated_security_helper.plugin_modules.ash_builtin.event_handlers.suppression_expiration_checker import (
     handle_suppression_expiration_check,
 )
 
 __all__ = [
+    "SCAN_EVENT_STREAM_HANDLERS",
     "handle_scan_completion_logging",
+    "handle_scan_event_streaming",
     "handle_suppression_expiration_check",
 ]
@@ -0,0 +1,73 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Event subscribers that mirror scan events into the output directory event stream."""
+
+from automated_security_helper.core.resource_management.scan_events import (
+    write_scan_event,
+)
+from automated_security_helper.plugins.events import AshEventType
+
+STREAMED_EVENT_TYPES = [
+    AshEventType.EXECUTION_START,
+    AshEventType.CONVERT_PHASE_START,
+    AshEventType.SCAN_PHASE_START,
+    AshEventType.SCAN_START,
+    AshEventType.SCAN_COMPLETE,
+    AshEventType.SCAN_PHASE_COMPLETE,
+    AshEventType.REPORT_PHASE_START,
+    AshEventType.REPORT_PHASE_COMPLETE,
+    AshEventType.EXECUTION_COMPLETE,
+    AshEventType.ERROR,
+]
+
+
+def handle_scan_event_streaming(event_type: AshEventType, **kwargs) -> bool:
+    """
+    Append an event to ``ash.events.jsonl`` in the scan output directory.
+
+    The MCP server tails this file to report progress instead of polling the
+    scanner result directories. EXECUTION_START truncates the file so the
+    stream only ever describes the current run.
+
+    Args:
+        event_type: The event being streamed
+        **kwargs: Event data; must include plugin_context or output_dir
+
+    Returns:
+        bool: True to indicate successful handling of the event
+    """
+    plugin_context = kwargs.get("plugin_context")
+    output_dir = kwargs.pop("output_dir", None) or getattr(
+        plugin_context, "output_dir", None
+    )
+    if not output_dir:
+        return True
+
+    write_scan_event(
+        output_dir,
+        event_type,
+        truncate=event_type == AshEventType.EXECUTION_START,
+        **kwargs,
+    )
+    return True
+
+
+def _make_stream_subscriber(event_type: AshEventType):
+    """Bind handle_scan_event_streaming to one event type.
+
+    Subscribers are called with the event payload only, so each streamed event
+    type gets its own named callback that knows which event it received.
+    """
+
+    def subscriber(*args, **kwargs) -> bool:
+        return handle_scan_event_streaming(event_type, **kwargs)
+
+    subscriber.__name__ = f"stream_{event_type.name.lower()}_event"
+    return subscriber
+
+
+SCAN_EVENT_STREAM_HANDLERS = {
+    event_type: _make_stream_subscriber(event_type)
+    for event_type in STREAMED_EVENT_TYPES
+}
@@ -1,54 +1,86 @@
 # Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
 # SPDX-License-Identifier: Apache-2.0
 
-from automated_security_helper.plugin_modules.ash_builtin.reporters.csv_reporter import (
-    CsvReporter,
-)
-from automated_security_helper.plugin_modules.ash_builtin.reporters.cyclonedx_reporter import (
-    CycloneDXReporter,
-)
-from automated_security_helper.plugin_modules.ash_builtin.reporters.github_ghas_reporter import (
-    GHASReporter,
-)
-from automated_security_helper.plugin_modules.ash_builtin.reporters.gitlab_cyclonedx_reporter import (
-    GitLabCycloneDXReporter,
-)
-from automated_security_helper.plugin_modules.ash_builtin.reporters.gitlab_sast_reporter import (
-    GitLabSASTReporter,
-)
-from automated_security_helper.plugin_modules.ash_builtin.reporters.html_reporter import (
-    HtmlReporter,
-)
-from automated_security_helper.plugin_modules.ash_builtin.reporters.flatjson_reporter import (
-    FlatJSONReporter as FlatJsonReporter,
-)
-from automated_security_helper.plugin_modules.ash_builtin.reporters.junitxml_reporter import (
-    JunitXmlReporter,
-)
-from automated_security_helper.plugin_modules.ash_builtin.reporters.markdown_reporter import (
-    MarkdownReporter,
-)
-from automated_security_helper.plugin_modules.ash_builtin.reporters.ocsf_reporter import (
-    OcsfReporter,
-)
-from automated_security_helper.plugin_modules.ash_builtin.reporters.report_content_emitter import (
-    ReportContentEmitter,
-)
-from automated_security_helper.plugin_modules.ash_builtin.reporters.sarif_reporter import (
-    SarifReporter,
-)
-from automated_security_helper.plugin_modules.ash_builtin.reporters.spdx_reporter import (
-    SpdxReporter,
-)
-from automated_security_helper.plugin_modules.ash_builtin.reporters.text_reporter import (
-    TextReporter,
-)
-from automated_security_helper.plugin_modules.ash_builtin.reporters.unused_suppressions_reporter import (
-    UnusedSuppressionsReporter,
-)
-from automated_security_helper.plugin_modules.ash_builtin.reporters.yaml_reporter import (
-    YamlReporter,
-)
+"""Built-in reporter plugins.
+
+Each plugin module is imported the first time its class is accessed.
+"""
+
+from typing import TYPE_CHECKING
+
+from automated_security_helper.utils.lazy_exports import lazy_exports
+
+if TYPE_CHECKING:
+    from automated_security_helper.plugin_modules.ash_builtin.reporters.csv_reporter import (
+        CsvReporter,
+    )
+    from automated_security_helper.plugin_modules.ash_builtin.reporters.cyclonedx_reporter import (
+        CycloneDXReporter,
+    )
+    from automated_security_helper.plugin_modules.ash_builtin.reporters.github_ghas_reporter import (
+        GHASReporter,
+    )
+    from automated_security_helper.plugin_modules.ash_builtin.reporters.gitlab_cyclonedx_reporter import (
+        GitLabCycloneDXReporter,
+    )
+    from automated_security_helper.plugin_modules.ash_builtin.reporters.gitlab_sast_reporter import (
+        GitLabSASTReporter,
+    )
+    from automated_security_helper.plugin_modules.ash_builtin.reporters.html_reporter import (
+        HtmlReporter,
+    )
+    from automated_security_helper.plugin_modules.ash_builtin.reporters.flatjson_reporter import (
+        FlatJSONReporter as FlatJsonReporter,
+    )
+    from automated_security_helper.plugin_modules.ash_builtin.reporters.junitxml_reporter import (
+        JunitXmlReporter,
+    )
+    from automated_security_helper.plugin_modules.ash_builtin.reporters.markdown_reporter import (
+        MarkdownReporter,
+    )
+    from automated_security_helper.plugin_modules.ash_builtin.reporters.ocsf_reporter import (
+        OcsfReporter,
+    )
+    from automated_security_helper.plugin_modules.ash_builtin.reporters.report_content_emitter import (
+        ReportContentEmitter,
+    )
+    from automated_security_helper.plugin_modules.ash_builtin.reporters.sarif_reporter import (
+        SarifReporter,
+    )
+    from automated_security_helper.plugin_modules.ash_builtin.reporters.spdx_reporter import (
+        SpdxReporter,
+    )
+    from automated_security_helper.plugin_modules.ash_builtin.reporters.text_reporter import (
+        TextReporter,
+    )
+    from automated_security_helper.plugin_modules.ash_builtin.reporters.unused_suppressions_reporter import (
+        UnusedSuppressionsReporter,
+    )
+    from automated_security_helper.plugin_modules.ash_builtin.reporters.yaml_reporter import (
+        YamlReporter,
+    )
+
+_EXPORTS = {
+    "CsvReporter": ("csv_reporter", "CsvReporter"),
+    "CycloneDXReporter": ("cyclonedx_reporter", "CycloneDXReporter"),
+    "GHASReporter": ("github_ghas_reporter", "GHASReporter"),
+    "GitLabCycloneDXReporter": ("gitlab_cyclonedx_reporter", "GitLabCycloneDXReporter"),
+    "GitLabSASTReporter": ("gitlab_sast_reporter", "GitLabSASTReporter"),
+    "HtmlReporter": ("html_reporter", "HtmlReporter"),
+    "FlatJsonReporter": ("flatjson_reporter", "FlatJSONReporter"),
+    "JunitXmlReporter": ("junitxml_reporter", "JunitXmlReporter"),
+    "MarkdownReporter": ("markdown_reporter", "MarkdownReporter"),
+    "OcsfReporter": ("ocsf_reporter", "OcsfReporter"),
+    "ReportContentEmitter": ("report_content_emitter", "ReportContentEmitter"),
+    "SarifReporter": ("sarif_reporter", "SarifReporter"),
+    "SpdxReporter": ("spdx_reporter", "SpdxReporter"),
+    "TextReporter": ("text_reporter", "TextReporter"),
+    "UnusedSuppressionsReporter": (
+        "unused_suppressions_reporter",
+        "UnusedSuppressionsReporter",
+    ),
+    "YamlReporter": ("yaml_reporter", "YamlReporter"),
+}
 
 __all__ = [
     "CsvReporter",
@@ -68,3 +100,5 @@ __all__ = [
     "UnusedSuppressionsReporter",
     "YamlReporter",
 ]
+
+__getattr__, __dir__ = lazy_exports(__name__, globals(), _EXPORTS)
@@ -1,6 +1,5 @@
 import csv
-from io import StringIO
-from typing import Literal, TYPE_CHECKING
+from typing import ClassVar, Literal, TextIO, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from automated_security_helper.models.asharp_model import AshAggregatedResults
@@ -50,24 +49,42 @@ class CsvReporter(ReporterPluginBase[CSVReporterConfig]):
             "runs[].tool.driver.name": "Scanner",
         }
 
+    supports_streaming: ClassVar[bool] = True
+    thread_safe: ClassVar[bool] = True
+
     def report(self, model: "AshAggregatedResults") -> str:
         """Format ASH model as CSV string."""
+        return self._report_from_stream(model)
 
-        output = StringIO()
-        writer = csv.writer(output)
+    def report_stream(self, model: "AshAggregatedResults", fh: TextIO) -> bool:
+        """Write ASH model as CSV, one finding row at a time."""
+        writer = csv.writer(fh)
 
-        # Get flattened vulnerabilities
-        flat_vulns = [
+        # Dump each flattened vulnerability only when its row is written
+        flat_vulns = (
             item.model_dump(
                 exclude_defaults=False,
                 exclude_none=False,
                 exclude_unset=False,
             )
             for item in model.to_flat_vulnerabilities()
-        ]
+        )
+
+        fields = None
+        for vuln in flat_vulns:
+            if fields is None:
+                # Get all field names from the first vulnerability
+                fields = list(vuln.keys())
+                writer.writerow(fields)
+
+            row = []
+            for field in fields:
+                value = vuln[field]
+                row.append(value if value is not None else "")
+            writer.writerow(row)
 
-        if not flat_vulns:
-            # If no vulnerabilities, return a header-only CSV
+        if fields is None:
+            # If no vulnerabilities, write a header-only CSV
             writer.writerow(
                 [
                     "ID",
@@ -92,20 +109,5 @@ class CsvReporter(ReporterPluginBase[CSVReporterConfig]):
                     "References",
                 ]
             )
-            return output.getvalue()
-
-        # Get all field names from the first vulnerability
-        fields = list(flat_vulns[0].keys())
-
-        # Write header row
-        writer.writerow(fields)
-
-        # Write data rows
-        for vuln in flat_vulns:
-            row = []
-            for field in fields:
-                value = vuln[field]
-                row.append(value if value is not None else "")
-            writer.writerow(row)
 
-        return output.getvalue()
+        return True
@@ -2,7 +2,7 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import json
-from typing import Literal, TYPE_CHECKING, Dict, Any
+from typing import ClassVar, Literal, TYPE_CHECKING, Dict, Any
 
 if TYPE_CHECKING:
     from automated_security_helper.models.asharp_model import AshAggregatedResults
@@ -63,6 +63,8 @@ class FlatJSONReporter(ReporterPluginBase[FlatJSONReporterConfig]):
             "runs[].results[].properties.tags": "tags",
         }
 
+    thread_safe: ClassVar[bool] = True
+
     def report(self, model: "AshAggregatedResults") -> str:
         """Format ASH model as JSON string with comprehensive statistics."""
         # Ensure config is properly typed if it was passed as a dictionary
@@ -17,7 +17,7 @@ Key differences from the generic SARIF reporter:
 """
 
 import json
-from typing import Any, Dict, List, Literal, Optional, TYPE_CHECKING
+from typing import Any, ClassVar, Dict, List, Literal, Optional, TYPE_CHECKING
 
 from pydantic import Field
 from typing_extensions import Annotated
@@ -69,6 +69,8 @@ class GHASReporterConfig(ReporterPluginConfigBase):
 class GHASReporter(ReporterPluginBase[GHASReporterConfig]):
     """Produces a SARIF report optimized for GitHub Advanced Security Code Scanning."""
 
+    thread_safe: ClassVar[bool] = True
+
     def model_post_init(self, context):
         if self.config is None:
             self.config = GHASReporterConfig()
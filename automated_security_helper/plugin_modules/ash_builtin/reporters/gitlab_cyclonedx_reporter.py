@@ -16,7 +16,7 @@ Reference:
 """
 
 import json
-from typing import Literal, Optional, TYPE_CHECKING
+from typing import ClassVar, Literal, Optional, TYPE_CHECKING
 
 from pydantic import Field
 from typing import Annotated
@@ -325,6 +325,8 @@ class GitLabCycloneDXReporter(ReporterPluginBase[GitLabCycloneDXReporterConfig])
     ``artifacts:reports:cyclonedx`` in GitLab CI pipelines.
     """
 
+    thread_safe: ClassVar[bool] = True
+
     def model_post_init(self, context):
         if self.config is None:
             self.config = GitLabCycloneDXReporterConfig()
@@ -2,7 +2,7 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import json
-from typing import Literal, TYPE_CHECKING
+from typing import ClassVar, Literal, TYPE_CHECKING
 
 from automated_security_helper.utils.sarif_utils import get_finding_id
 
@@ -46,6 +46,8 @@ class GitLabSASTReporterConfig(ReporterPluginConfigBase):
 class GitLabSASTReporter(ReporterPluginBase[GitLabSASTReporterConfig]):
     """Formats vulnerability findings report as GitLab SAST format."""
 
+    thread_safe: ClassVar[bool] = True
+
     def model_post_init(self, context):
         if self.config is None:
             self.config = GitLabSASTReporterConfig()
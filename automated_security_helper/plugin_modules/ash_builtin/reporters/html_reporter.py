@@ -1,7 +1,7 @@
 # Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
 # SPDX-License-Identifier: Apache-2.0
 import html
-from typing import Dict, List, Literal, Any, TYPE_CHECKING
+from typing import Any, ClassVar, Dict, Iterator, List, Literal, TextIO, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from automated_security_helper.models.asharp_model import AshAggregatedResults
@@ -39,8 +39,15 @@ class HtmlReporter(ReporterPluginBase[HTMLReporterConfig]):
             self.config = HTMLReporterConfig()
         return super().model_post_init(context)
 
+    supports_streaming: ClassVar[bool] = True
+    thread_safe: ClassVar[bool] = True
+
     def report(self, model: "AshAggregatedResults") -> str:
         """Format ASH model as HTML string with comprehensive styling and organization."""
+        return self._report_from_stream(model)
+
+    def report_stream(self, model: "AshAggregatedResults", fh: TextIO) -> bool:
+        """Write ASH model as HTML, streaming the detailed findings tables."""
         # Use the content emitter to get report data
         emitter = ReportContentEmitter(model)
 
@@ -55,8 +62,7 @@ class HtmlReporter(ReporterPluginBase[HTMLReporterConfig]):
         findings_by_severity = self._group_results_by_severity(results)
         findings_by_type = self._group_results_by_rule(results)
 
-        # Generate HTML sections
-        findings_table = self._format_findings_table(results)
+        # Generate HTML sections; the findings table is streamed separately
         severity_summary = self._format_severity_summary(findings_by_severity)
         type_summary = self._format_type_summary(findings_by_type)
         metadata_section = self._format_metadata(model.metadata)
@@ -203,16 +209,19 @@ class HtmlReporter(ReporterPluginBase[HTMLReporterConfig]):
         </div>
 
         <h2>Detailed Findings</h2>
-        {findings_table}
+        """
+        fh.write(template)
+        for chunk in self._iter_findings_table(results):
+            fh.write(chunk)
+        fh.write(f"""
 
         <h2>Scan Metadata</h2>
         {metadata_section}
     </div>
 </body>
 </html>
-"""
-
-        return template
+""")
+        return True
 
     def _format_scanner_results_table(
         self, scanner_results: List[Dict[str, Any]]
@@ -370,7 +379,11 @@ class HtmlReporter(ReporterPluginBase[HTMLReporterConfig]):
         return summary
 
     def _format_findings_table(self, findings: List[Result]) -> str:
-        """Format the findings table.
+        """Format the findings table as a single string."""
+        return "".join(self._iter_findings_table(findings))
+
+    def _iter_findings_table(self, findings: List[Result]) -> Iterator[str]:
+        """Yield the findings table in chunks, one row at a time.
 
         Active findings are shown first.  Suppressed findings are placed in a
         separate section so they don't crowd the actionable list.  Each
@@ -380,7 +393,7 @@ class HtmlReporter(ReporterPluginBase[HTMLReporterConfig]):
         suppressed = [f for f in findings if self._is_suppressed(f)]
 
         # --- active findings table ---
-        table = """
+        yield """
         <table>
             <tr>
                 <th>Severity</th>
@@ -391,7 +404,7 @@ class HtmlReporter(ReporterPluginBase[HTMLReporterConfig]):
         """
 
         if not active:
-            table += """
+            yield """
             <tr>
                 <td colspan="4">No active findings to display</td>
             </tr>
@@ -409,7 +422,7 @@ class HtmlReporter(ReporterPluginBase[HTMLReporterConfig]):
 
             location_str = self._location_str(finding)
 
-            table += f"""
+            yield f"""
             <tr>
                 <td class="{severity_class}">{html.escape(finding_level.upper() if finding.level else "NONE")}</td>
                 <td>{html.escape(finding.ruleId or "N/A")}</td>
@@ -418,11 +431,11 @@ class HtmlReporter(ReporterPluginBase[HTMLReporterConfig]):
             </tr>
             """
 
-        table += "</table>"
+        yield "</table>"
 
         # --- suppressed findings table ---
         if suppressed:
-            table += f"""
+            yield f"""
             <h3>Suppressed Findings ({len(suppressed)})</h3>
             <p>These findings have been explicitly suppressed and do not affect the scanner result.</p>
             <table>
@@ -454,7 +467,7 @@ class HtmlReporter(ReporterPluginBase[HTMLReporterConfig]):
                     ]
                     reason = "; ".join(reasons) if reasons else ""
 
-                table += f"""
+                yield f"""
                 <tr>
                     <td class="{severity_class}">{html.escape(finding_level.upper() if finding.level else "NONE")}</td>
                     <td>{html.escape(finding.ruleId or "N/A")}</td>
@@ -464,9 +477,7 @@ class HtmlReporter(ReporterPluginBase[HTMLReporterConfig]):
                     <td>{html.escape(reason)}</td>
                 </tr>
                 """
-            table += "</table>"
-
-        return table
+            yield "</table>"
 
     @staticmethod
     def _location_str(finding: Result) -> str:
@@ -1,6 +1,6 @@
 # Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
 # SPDX-License-Identifier: Apache-2.0
-from typing import Literal, TYPE_CHECKING
+from typing import ClassVar, Literal, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from automated_security_helper.models.asharp_model import AshAggregatedResults
@@ -32,6 +32,8 @@ class JUnitXMLReporterConfig(ReporterPluginConfigBase):
 class JunitXmlReporter(ReporterPluginBase[JUnitXMLReporterConfig]):
     """Formats results as JUnitXML."""
 
+    thread_safe: ClassVar[bool] = True
+
     def model_post_init(self, context):
         with warnings.catch_warnings():
             defusedxml.defuse_stdlib()
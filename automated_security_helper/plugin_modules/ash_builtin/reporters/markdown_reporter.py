@@ -2,7 +2,7 @@
 # SPDX-License-Identifier: Apache-2.0
 
 from datetime import datetime, timezone
-from typing import Literal, TYPE_CHECKING
+from typing import ClassVar, Literal, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from automated_security_helper.models.asharp_model import AshAggregatedResults
@@ -48,6 +48,8 @@ class MarkdownReporterConfig(ReporterPluginConfigBase):
 class MarkdownReporter(ReporterPluginBase[MarkdownReporterConfig]):
     """Formats results as a human-readable Markdown document."""
 
+    thread_safe: ClassVar[bool] = True
+
     def model_post_init(self, context):
         if self.config is None:
             self.config = MarkdownReporterConfig()
@@ -1,29 +1,29 @@
 # Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
 # SPDX-License-Identifier: Apache-2.0
 
-from typing import Literal, TYPE_CHECKING
+from typing import ClassVar, Dict, Iterator, Literal, TextIO, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from automated_security_helper.models.asharp_model import AshAggregatedResults
+    from automated_security_helper.schemas.ocsf.ocsf_vulnerability_finding import (
+        Metadata,
+        StatusId,
+        Vulnerability,
+        VulnerabilityFinding,
+    )
 from automated_security_helper.base.options import ReporterOptionsBase
 from automated_security_helper.base.reporter_plugin import (
     ReporterPluginBase,
     ReporterPluginConfigBase,
 )
 from automated_security_helper.plugins.decorators import ash_reporter_plugin
-from automated_security_helper.schemas.ocsf.ocsf_vulnerability_finding import (
-    VulnerabilityFinding,
-    Vulnerability,
-    # Cve,
-    Metadata,
-    Product,
-    FindingInfo,
-    ActivityId,
-    SeverityId,
-    StatusId,
-)
 from automated_security_helper.schemas.sarif_schema_model import Result, Suppression
 from automated_security_helper.utils.get_ash_version import get_ash_version
+from automated_security_helper.utils.json_stream import (
+    dumps_nested,
+    iter_encoded_json_array,
+)
+import itertools
 import json
 from datetime import datetime, timezone
 import uuid
@@ -51,7 +51,7 @@ class OcsfReporter(ReporterPluginBase[OCSFReporterConfig]):
             self.config = OCSFReporterConfig()
         return super().model_post_init(context)
 
-    def _create_vulnerability_from_result(self, result: Result) -> Vulnerability:
+    def _create_vulnerability_from_result(self, result: Result) -> "Vulnerability":
         """Extract vulnerability data from SARIF result.
 
         Args:
@@ -60,6 +60,10 @@ class OcsfReporter(ReporterPluginBase[OCSFReporterConfig]):
         Returns:
             Vulnerability object with data extracted from SARIF result
         """
+        from automated_security_helper.schemas.ocsf.ocsf_vulnerability_finding import (
+            Vulnerability,
+        )
+
         rule_id = "Unknown Rule"
         try:
             # Safely extract rule ID first for logging context
@@ -242,7 +246,7 @@ class OcsfReporter(ReporterPluginBase[OCSFReporterConfig]):
 
     def _determine_status_from_suppressions(
         self, suppressions: Optional[List[Suppression]], rule_id: str = "Unknown"
-    ) -> Tuple[Optional[StatusId], Optional[str], Optional[str]]:
+    ) -> Tuple[Optional["StatusId"], Optional[str], Optional[str]]:
         """Analyze suppressions and return appropriate status.
 
         Args:
@@ -255,6 +259,10 @@ class OcsfReporter(ReporterPluginBase[OCSFReporterConfig]):
             - status_detail: String with suppression details or None
             - status: String with suppression status correlating to the returned status_id
         """
+        from automated_security_helper.schemas.ocsf.ocsf_vulnerability_finding import (
+            StatusId,
+        )
+
         if not suppressions or len(suppressions) == 0:
             # No suppressions - finding is active/open
             ASH_LOGGER.debug(f"No suppressions found for {rule_id} - marking as active")
@@ -362,8 +370,8 @@ class OcsfReporter(ReporterPluginBase[OCSFReporterConfig]):
             return StatusId.integer_0, "Unknown suppression status", "Unknown"
 
     def _create_vulnerability_finding(
-        self, result: Result, metadata: Metadata, current_time_ms: int
-    ) -> VulnerabilityFinding:
+        self, result: Result, metadata: "Metadata", current_time_ms: int
+    ) -> "VulnerabilityFinding":
         """Build individual VulnerabilityFinding object.
 
         Args:
@@ -374,6 +382,15 @@ class OcsfReporter(ReporterPluginBase[OCSFReporterConfig]):
         Returns:
             VulnerabilityFinding object for the individual result
         """
+        from automated_security_helper.schemas.ocsf.ocsf_vulnerability_finding import (
+            ActivityId,
+            FindingInfo,
+            SeverityId,
+            StatusId,
+            Vulnerability,
+            VulnerabilityFinding,
+        )
+
         # Extract rule ID early for logging context
         rule_id = "Unknown Rule"
         try:
@@ -595,11 +612,28 @@ class OcsfReporter(ReporterPluginBase[OCSFReporterConfig]):
                     f"Unable to create VulnerabilityFinding for {rule_id}: {str(e)}"
                 )
 
+    supports_streaming: ClassVar[bool] = True
+    thread_safe: ClassVar[bool] = True
+
     def report(self, model: "AshAggregatedResults") -> str:
         """Format ASH model in Open Cybersecurity Schema Framework (OCSF) format.
 
         Returns an array of VulnerabilityFinding objects, one per SARIF result.
         """
+        return self._report_from_stream(model)
+
+    def report_stream(self, model: "AshAggregatedResults", fh: TextIO) -> bool:
+        """Write ASH model in OCSF format, one VulnerabilityFinding at a time.
+
+        Each SARIF result is converted, serialized and written before the next
+        one is processed, so only a single finding is held in memory.
+        """
+        # The OCSF schema is large; import it only when a report is generated.
+        from automated_security_helper.schemas.ocsf.ocsf_vulnerability_finding import (
+            Metadata,
+            Product,
+        )
+
         ASH_LOGGER.info("Starting OCSF report generation")
 
         # Get current timestamp in milliseconds since epoch
@@ -620,21 +654,16 @@ class OcsfReporter(ReporterPluginBase[OCSFReporterConfig]):
         )
         ASH_LOGGER.debug(f"Created OCSF metadata with ASH version: {get_ash_version()}")
 
-        # Create array of individual VulnerabilityFinding objects
-        vulnerability_findings = []
-        total_results_count = 0
-        failed_results_count = 0
-        suppressed_findings_count = 0
-        active_findings_count = 0
-
         # Check if we have SARIF data to process
         if not model.sarif:
             ASH_LOGGER.info("No SARIF data found in model - returning empty array")
-            return json.dumps([], indent=2)
+            fh.write(json.dumps([], indent=2))
+            return True
 
         if not model.sarif.runs:
             ASH_LOGGER.info("No SARIF runs found in model - returning empty array")
-            return json.dumps([], indent=2)
+            fh.write(json.dumps([], indent=2))
+            return True
 
         all_results = model.sarif.get_all_results()
 
@@ -642,13 +671,96 @@ class OcsfReporter(ReporterPluginBase[OCSFReporterConfig]):
             ASH_LOGGER.info(
                 "No SARIF results found in any run - returning empty array"
             )
-            return json.dumps([], indent=2)
+            fh.write(json.dumps([], indent=2))
+            return True
 
         total_results_count = len(all_results)
         ASH_LOGGER.info(
             f"Processing {total_results_count} SARIF results for OCSF report"
         )
 
+        stats = {
+            "processed": 0,
+            "failed": 0,
+            "suppressed": 0,
+            "active": 0,
+            "serialization_failures": 0,
+        }
+        findings_data = self._iter_serialized_findings(
+            all_results, metadata, current_time_ms, stats
+        )
+
+        # Only open the array once a finding has been serialized, so the
+        # error responses below can still replace it when nothing succeeds.
+        first_finding = next(findings_data, None)
+
+        if first_finding is None:
+            # Every result failed to process or serialize
+            processed_results_count = stats["processed"]
+            failed_results_count = stats["failed"]
+            self._log_processing_statistics(total_results_count, stats)
+
+            # Handle case where all findings failed to process
+            if processed_results_count == 0:
+                ASH_LOGGER.error(
+                    "All SARIF results failed to process - returning error response"
+                )
+                fh.write(
+                    self._create_error_response(
+                        "All findings failed to process",
+                        current_time_ms,
+                        total_results_count,
+                        failed_results_count,
+                    )
+                )
+                return True
+
+            # If all findings failed to serialize, return error response
+            ASH_LOGGER.error(
+                "All findings failed to serialize - returning error response"
+            )
+            fh.write(
+                self._create_error_response(
+                    "All findings failed to serialize",
+                    current_time_ms,
+                    processed_results_count,
+                    processed_results_count,  # All processed findings failed to serialize
+                )
+            )
+            return True
+
+        written_chars = 0
+        for chunk in iter_encoded_json_array(
+            itertools.chain([first_finding], findings_data), indent=2
+        ):
+            fh.write(chunk)
+            written_chars += len(chunk)
+
+        self._log_processing_statistics(total_results_count, stats)
+        serialized_count = stats["processed"] - stats["serialization_failures"]
+        ASH_LOGGER.info(
+            f"Successfully generated OCSF report with {serialized_count} findings ({written_chars} characters)"
+        )
+        return True
+
+    def _iter_serialized_findings(
+        self,
+        all_results: List[Result],
+        metadata: "Metadata",
+        current_time_ms: int,
+        stats: Dict[str, int],
+    ) -> Iterator[str]:
+        """Convert and serialize SARIF results into OCSF finding JSON.
+
+        Each finding is yielded already serialized as an element of the
+        top-level array. Results that fail to convert or serialize are
+        logged, counted in ``stats`` and skipped.
+        """
+        from automated_security_helper.schemas.ocsf.ocsf_vulnerability_finding import (
+            StatusId,
+        )
+
+        total_results_count = len(all_results)
         for i, result in enumerate(all_results):
             rule_id = getattr(result, "ruleId", None) or f"result_{i}"
             ASH_LOGGER.debug(
@@ -660,25 +772,25 @@ class OcsfReporter(ReporterPluginBase[OCSFReporterConfig]):
                 finding = self._create_vulnerability_finding(
                     result, metadata, current_time_ms
                 )
-                vulnerability_findings.append(finding)
+                stats["processed"] += 1
 
                 # Track finding status for statistics
                 if (
                     hasattr(finding, "status_id")
                     and finding.status_id == StatusId.integer_3
                 ):
-                    suppressed_findings_count += 1
+                    stats["suppressed"] += 1
                     ASH_LOGGER.debug(
                         f"Created suppressed vulnerability finding for {rule_id}"
                     )
                 else:
-                    active_findings_count += 1
+                    stats["active"] += 1
                     ASH_LOGGER.debug(
                         f"Created active vulnerability finding for {rule_id}"
                     )
 
             except Exception as e:
-                failed_results_count += 1
+                stats["failed"] += 1
                 ASH_LOGGER.error(
                     f"Error creating vulnerability finding for result {rule_id}: {str(e)}"
                 )
@@ -687,111 +799,57 @@ class OcsfReporter(ReporterPluginBase[OCSFReporterConfig]):
                 )
                 continue
 
-        processed_results_count = len(vulnerability_findings)
-
-        # Log comprehensive processing statistics
-        if total_results_count > 0:
-            success_rate = (processed_results_count / total_results_count) * 100
-            ASH_LOGGER.info(
-                f"OCSF report processing complete: {processed_results_count}/{total_results_count} findings created successfully ({success_rate:.1f}% success rate)"
-            )
-            ASH_LOGGER.info(
-                f"Finding status breakdown: {active_findings_count} active, {suppressed_findings_count} suppressed"
-            )
+            finding_id = "Unknown"
+            try:
+                if hasattr(finding, "finding_info") and hasattr(
+                    finding.finding_info, "uid"
+                ):
+                    finding_id = finding.finding_info.uid
 
-            if failed_results_count > 0:
-                failure_rate = (failed_results_count / total_results_count) * 100
-                ASH_LOGGER.warning(
-                    f"{failed_results_count} findings failed to process and were skipped ({failure_rate:.1f}% failure rate)"
+                ASH_LOGGER.debug(f"Serializing finding {i + 1}: {finding_id}")
+                finding_data = finding.model_dump(
+                    by_alias=True,
+                    exclude_none=True,
+                    exclude_unset=True,
                 )
-        else:
-            ASH_LOGGER.debug("No SARIF results to process")
-
-        # Handle case where all findings failed to process
-        if total_results_count > 0 and processed_results_count == 0:
-            ASH_LOGGER.error(
-                "All SARIF results failed to process - returning error response"
-            )
-            return self._create_error_response(
-                "All findings failed to process",
-                current_time_ms,
-                total_results_count,
-                failed_results_count,
-            )
-
-        # If no findings were created from empty input, return empty array
-        if not vulnerability_findings:
-            ASH_LOGGER.info(
-                "No vulnerability findings created from SARIF results - returning empty array"
-            )
-            return json.dumps([], indent=2)
-
-        try:
-            # Convert array of findings to JSON
-            ASH_LOGGER.debug(
-                f"Serializing {len(vulnerability_findings)} findings to JSON"
-            )
-            findings_data = []
-            serialization_failures = 0
-
-            for i, finding in enumerate(vulnerability_findings):
-                finding_id = "Unknown"
-                try:
-                    if hasattr(finding, "finding_info") and hasattr(
-                        finding.finding_info, "uid"
-                    ):
-                        finding_id = finding.finding_info.uid
-
-                    ASH_LOGGER.debug(
-                        f"Serializing finding {i + 1}/{len(vulnerability_findings)}: {finding_id}"
-                    )
-                    finding_data = finding.model_dump(
-                        by_alias=True,
-                        exclude_none=True,
-                        exclude_unset=True,
-                    )
-                    findings_data.append(finding_data)
-                    ASH_LOGGER.debug(f"Successfully serialized finding {finding_id}")
-                except Exception as e:
-                    serialization_failures += 1
-                    ASH_LOGGER.error(
-                        f"Error serializing individual finding {finding_id}: {str(e)}"
-                    )
-                    continue
-
-            if serialization_failures > 0:
-                serialization_failure_rate = (
-                    serialization_failures / len(vulnerability_findings)
-                ) * 100
-                ASH_LOGGER.warning(
-                    f"{serialization_failures} findings failed to serialize and were excluded from output ({serialization_failure_rate:.1f}% serialization failure rate)"
+                encoded_finding = dumps_nested(
+                    finding_data, indent=2, level=1, default=str
                 )
-
-            # If all findings failed to serialize, return error response
-            if len(findings_data) == 0 and len(vulnerability_findings) > 0:
+                ASH_LOGGER.debug(f"Successfully serialized finding {finding_id}")
+            except Exception as e:
+                stats["serialization_failures"] += 1
                 ASH_LOGGER.error(
-                    "All findings failed to serialize - returning error response"
-                )
-                return self._create_error_response(
-                    "All findings failed to serialize",
-                    current_time_ms,
-                    processed_results_count,
-                    processed_results_count,  # All processed findings failed to serialize
+                    f"Error serializing individual finding {finding_id}: {str(e)}"
                 )
+                continue
 
-            final_json = json.dumps(findings_data, indent=2, default=str)
-            ASH_LOGGER.info(
-                f"Successfully generated OCSF report with {len(findings_data)} findings ({len(final_json)} characters)"
+            yield encoded_finding
+
+    def _log_processing_statistics(
+        self, total_results_count: int, stats: Dict[str, int]
+    ) -> None:
+        """Log processing statistics once all results have been handled."""
+        processed_results_count = stats["processed"]
+        success_rate = (processed_results_count / total_results_count) * 100
+        ASH_LOGGER.info(
+            f"OCSF report processing complete: {processed_results_count}/{total_results_count} findings created successfully ({success_rate:.1f}% success rate)"
+        )
+        ASH_LOGGER.info(
+            f"Finding status breakdown: {stats['active']} active, {stats['suppressed']} suppressed"
+        )
+
+        if stats["failed"] > 0:
+            failure_rate = (stats["failed"] / total_results_count) * 100
+            ASH_LOGGER.warning(
+                f"{stats['failed']} findings failed to process and were skipped ({failure_rate:.1f}% failure rate)"
             )
-            return final_json
 
-        except Exception as e:
-            ASH_LOGGER.error(f"Failed to serialize OCSF findings array: {str(e)}")
-            return self._create_error_response(
-                f"Failed to create OCSF report: {str(e)}",
-                current_time_ms,
-                processed_results_count,
-                failed_results_count,
+        if stats["serialization_failures"] > 0 and processed_results_count > 0:
+            serialization_failure_rate = (
+                stats["serialization_failures"] / processed_results_count
+            ) * 100
+            ASH_LOGGER.warning(
+                f"{stats['serialization_failures']} findings failed to serialize and were excluded from output ({serialization_failure_rate:.1f}% serialization failure rate)"
             )
 
     def _create_error_response(
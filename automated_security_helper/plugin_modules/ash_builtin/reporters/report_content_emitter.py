@@ -2,7 +2,6 @@
 # SPDX-License-Identifier: Apache-2.0
 
 from datetime import datetime, timezone
-import json
 from typing import Dict, List, Any, TYPE_CHECKING
 
 from automated_security_helper.models.flat_vulnerability import FlatVulnerability
@@ -243,13 +242,11 @@ class ReportContentEmitter:
             return vuln.code_snippet
 
         # If no snippet is directly available, try to extract from raw data
-        if not vuln.raw_data:
+        raw_data = vuln.raw_data_dict()
+        if not raw_data:
             return None
 
         try:
-            raw_data = json.loads(vuln.raw_data)
-            if not isinstance(raw_data, dict):
-                return None
 
             # Try to find snippet in common locations
             if "snippet" in raw_data:
@@ -273,7 +270,7 @@ class ReportContentEmitter:
                     if len(parts) >= 3:  # Has at least one code block
                         return parts[1]
 
-        except (json.JSONDecodeError, AttributeError, KeyError, TypeError):
+        except (AttributeError, KeyError, TypeError):
             # If we can't parse the raw data or find a snippet, return None
             pass
 
@@ -1,6 +1,6 @@
 # Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
 # SPDX-License-Identifier: Apache-2.0
-from typing import Literal, TYPE_CHECKING
+from typing import ClassVar, Literal, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from automated_security_helper.models.asharp_model import AshAggregatedResults
@@ -27,6 +27,8 @@ class SARIFReporterConfig(ReporterPluginConfigBase):
 class SarifReporter(ReporterPluginBase[SARIFReporterConfig]):
     """Formats results as SARIF."""
 
+    thread_safe: ClassVar[bool] = True
+
     def model_post_init(self, context):
         if self.config is None:
             self.config = SARIFReporterConfig()
@@ -2,7 +2,7 @@
 # SPDX-License-Identifier: Apache-2.0
 
 from datetime import datetime, timezone
-from typing import Literal, TYPE_CHECKING
+from typing import ClassVar, Literal, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from automated_security_helper.models.asharp_model import AshAggregatedResults
@@ -45,6 +45,8 @@ class TextReporterConfig(ReporterPluginConfigBase):
 class TextReporter(ReporterPluginBase[TextReporterConfig]):
     """Formats results as a human-readable plain text document."""
 
+    thread_safe: ClassVar[bool] = True
+
     def model_post_init(self, context):
         if self.config is None:
             self.config = TextReporterConfig()
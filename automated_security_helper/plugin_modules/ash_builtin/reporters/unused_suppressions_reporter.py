@@ -4,7 +4,7 @@
 """Reporter for identifying unused suppressions."""
 
 import json
-from typing import Literal, TYPE_CHECKING, Dict, Any, List
+from typing import ClassVar, Literal, TYPE_CHECKING, Dict, Any, List
 
 if TYPE_CHECKING:
     from automated_security_helper.models.asharp_model import AshAggregatedResults
@@ -38,6 +38,8 @@ class UnusedSuppressionsReporterConfig(ReporterPluginConfigBase):
 class UnusedSuppressionsReporter(ReporterPluginBase[UnusedSuppressionsReporterConfig]):
     """Identifies and reports suppressions that were not applied to any findings."""
 
+    thread_safe: ClassVar[bool] = True
+
     def model_post_init(self, context):
         if self.config is None:
             self.config = UnusedSuppressionsReporterConfig()
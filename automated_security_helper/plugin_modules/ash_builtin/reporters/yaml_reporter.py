@@ -2,7 +2,7 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import yaml
-from typing import Literal, TYPE_CHECKING
+from typing import ClassVar, Literal, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from automated_security_helper.models.asharp_model import AshAggregatedResults
@@ -34,6 +34,8 @@ class YamlReporter(ReporterPluginBase[YAMLReporterConfig]):
             self.config = YAMLReporterConfig()
         return super().model_post_init(context)
 
+    thread_safe: ClassVar[bool] = True
+
     def report(self, model: "AshAggregatedResults") -> str:
         """Format ASH model as YAML string."""
 
@@ -1,37 +1,59 @@
 # Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
 # SPDX-License-Identifier: Apache-2.0
 
-from automated_security_helper.plugin_modules.ash_builtin.scanners.bandit_scanner import (
-    BanditScanner,
-)
-from automated_security_helper.plugin_modules.ash_builtin.scanners.cdk_nag_scanner import (
-    CdkNagScanner,
-)
-from automated_security_helper.plugin_modules.ash_builtin.scanners.cfn_nag_scanner import (
-    CfnNagScanner,
-)
-from automated_security_helper.plugin_modules.ash_builtin.scanners.checkov_scanner import (
-    CheckovScanner,
-)
-from automated_security_helper.plugin_modules.ash_builtin.scanners.detect_secrets_scanner import (
-    DetectSecretsScanner,
-)
-from automated_security_helper.plugin_modules.ash_builtin.scanners.grype_scanner import (
-    GrypeScanner,
-)
-
-from automated_security_helper.plugin_modules.ash_builtin.scanners.npm_audit_scanner import (
-    NpmAuditScanner,
-)
-from automated_security_helper.plugin_modules.ash_builtin.scanners.opengrep_scanner import (
-    OpengrepScanner,
-)
-from automated_security_helper.plugin_modules.ash_builtin.scanners.semgrep_scanner import (
-    SemgrepScanner,
-)
-from automated_security_helper.plugin_modules.ash_builtin.scanners.syft_scanner import (
-    SyftScanner,
-)
+"""Built-in scanner plugins.
+
+Each plugin module is imported the first time its class is accessed.
+"""
+
+from typing import TYPE_CHECKING
+
+from automated_security_helper.utils.lazy_exports import lazy_exports
+
+if TYPE_CHECKING:
+    from automated_security_helper.plugin_modules.ash_builtin.scanners.bandit_scanner import (
+        BanditScanner,
+    )
+    from automated_security_helper.plugin_modules.ash_builtin.scanners.cdk_nag_scanner import (
+        CdkNagScanner,
+    )
+    from automated_security_helper.plugin_modules.ash_builtin.scanners.cfn_nag_scanner import (
+        CfnNagScanner,
+    )
+    from automated_security_helper.plugin_modules.ash_builtin.scanners.checkov_scanner import (
+        CheckovScanner,
+    )
+    from automated_security_helper.plugin_modules.ash_builtin.scanners.detect_secrets_scanner import (
+        DetectSecretsScanner,
+    )
+    from automated_security_helper.plugin_modules.ash_builtin.scanners.grype_scanner import (
+        GrypeScanner,
+    )
+    from automated_security_helper.plugin_modules.ash_builtin.scanners.npm_audit_scanner import (
+        NpmAuditScanner,
+    )
+    from automated_security_helper.plugin_modules.ash_builtin.scanners.opengrep_scanner import (
+        OpengrepScanner,
+    )
+    from automated_security_helper.plugin_modules.ash_builtin.scanners.semgrep_scanner import (
+        SemgrepScanner,
+    )
+    from automated_security_helper.plugin_modules.ash_builtin.scanners.syft_scanner import (
+        SyftScanner,
+    )
+
+_EXPORTS = {
+    "BanditScanner": ("bandit_scanner", "BanditScanner"),
+    "CdkNagScanner": ("cdk_nag_scanner", "CdkNagScanner"),
+    "CfnNagScanner": ("cfn_nag_scanner", "CfnNagScanner"),
+    "CheckovScanner": ("checkov_scanner", "CheckovScanner"),
+    "DetectSecretsScanner": ("detect_secrets_scanner", "DetectSecretsScanner"),
+    "GrypeScanner": ("grype_scanner", "GrypeScanner"),
+    "NpmAuditScanner": ("npm_audit_scanner", "NpmAuditScanner"),
+    "OpengrepScanner": ("opengrep_scanner", "OpengrepScanner"),
+    "SemgrepScanner": ("semgrep_scanner", "SemgrepScanner"),
+    "SyftScanner": ("syft_scanner", "SyftScanner"),
+}
 
 __all__ = [
     "BanditScanner",
@@ -45,3 +67,5 @@ __all__ = [
     "SemgrepScanner",
     "SyftScanner",
 ]
+
+__getattr__, __dir__ = lazy_exports(__name__, globals(), _EXPORTS)
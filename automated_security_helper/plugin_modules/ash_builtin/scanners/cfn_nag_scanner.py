@@ -1,8 +1,13 @@
 """Module containing the Checkov security scanner implementation."""
 
 import logging
+import os
+import re
+import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Annotated, ClassVar, List, Literal
+from typing import Annotated, Any, ClassVar, Dict, List, Literal
 
 from pydantic import Field
 from automated_security_helper.base.options import ScannerOptionsBase
@@ -35,8 +40,25 @@ from automated_security_helper.utils.log import ASH_LOGGER
 from automated_security_helper.utils.normalizers import get_normalized_filename
 
 
+# Templates are staged as <batch dir>/f<index>/<file name>.
+_STAGED_URI_PATTERN = re.compile(r"(?:^|/)f(\d+)/[^/]+$")
+
+
 class CfnNagScannerConfigOptions(ScannerOptionsBase):
-    pass
+    batch_size: Annotated[
+        int,
+        Field(
+            description="Templates scanned per cfn_nag_scan process. Each process pays Ruby and rule-loading start-up costs once per batch.",
+            ge=1,
+        ),
+    ] = 50
+    max_workers: Annotated[
+        int | None,
+        Field(
+            description="Maximum cfn_nag_scan processes run concurrently. Defaults to the number of CPUs.",
+            ge=1,
+        ),
+    ] = None
 
 
 class CfnNagScannerConfig(ScannerPluginConfigBase):
@@ -96,6 +118,222 @@ class CfnNagScanner(ScannerPluginBase[CfnNagScannerConfig]):
         # the configuration directly from the self.config object.
         return super()._process_config_options()
 
+    def _find_templates(
+        self, scannable: List[str], target_type: Literal["source", "converted"]
+    ) -> List[str]:
+        """Return the files in ``scannable`` that are CloudFormation templates."""
+        templates = []
+        for cfn_file in scannable:
+            # Every template has a top-level Resources section, so files that
+            # never mention it can be skipped without a full YAML parse.
+            try:
+                with open(cfn_file, mode="rb") as f:
+                    if b"Resources" not in f.read():
+                        continue
+            except OSError:
+                continue
+            try:
+                cfn_model = get_model_from_template(template_path=Path(cfn_file))
+            except Exception as e:
+                self._plugin_log(
+                    f"Not a CloudFormation file: {cfn_file}. Exception: {e}",
+                    target_type=target_type,
+                    level=logging.TRACE,
+                )
+                continue
+            if cfn_model is None:
+                self._plugin_log(
+                    f"Not a CloudFormation file: {cfn_file}",
+                    target_type=target_type,
+                    level=logging.TRACE,
+                )
+                continue
+            self._plugin_log(
+                f"File *is* CloudFormation: {cfn_file}",
+                target_type=target_type,
+                level=logging.DEBUG,
+            )
+            templates.append(cfn_file)
+        return templates
+
+    def _scan_templates(
+        self,
+        templates: List[str],
+        target_results_dir: Path,
+        target_type: Literal["source", "converted"],
+    ) -> List[SarifReport]:
+        """Scan ``templates`` in batches and return one SARIF report per template.
+
+        Each batch is a staging directory holding a link to every template in
+        the batch, so a single cfn_nag_scan process scans the whole batch via
+        ``--input-path``. Batches run concurrently on a bounded thread pool.
+        """
+        batch_size = self.config.options.batch_size
+        batches = [
+            list(range(i, min(i + batch_size, len(templates))))
+            for i in range(0, len(templates), batch_size)
+        ]
+        workers = min(len(batches), self.config.options.max_workers or os.cpu_count() or 1)
+        staging_root = Path(
+            tempfile.mkdtemp(prefix="cfn-nag-staging-", dir=target_results_dir)
+        )
+        self._plugin_log(
+            f"Scanning {len(templates)} CloudFormation templates in "
+            f"{len(batches)} batch(es) with {workers} worker(s)",
+            target_type=target_type,
+            level=logging.DEBUG,
+        )
+        try:
+
+            def run(batch_index: int) -> Dict[int, SarifReport]:
+                return self._scan_batch(
+                    templates,
+                    batches[batch_index],
+                    staging_dir=staging_root.joinpath(f"batch-{batch_index}"),
+                    target_results_dir=target_results_dir,
+                )
+
+            if workers <= 1:
+                batch_results = [run(i) for i in range(len(batches))]
+            else:
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    batch_results = list(executor.map(run, range(len(batches))))
+        finally:
+            shutil.rmtree(staging_root, ignore_errors=True)
+
+        per_file: Dict[int, SarifReport] = {}
+        for result in batch_results:
+            per_file.update(result)
+        return [per_file[index] for index in sorted(per_file)]
+
+    def _scan_batch(
+        self,
+        templates: List[str],
+        indexes: List[int],
+        staging_dir: Path,
+        target_results_dir: Path,
+    ) -> Dict[int, SarifReport]:
+        """Run cfn_nag_scan once over ``indexes`` and split its SARIF per template."""
+        for index in indexes:
+            template = Path(templates[index])
+            link = staging_dir.joinpath(f"f{index}", template.name)
+            link.parent.mkdir(parents=True, exist_ok=True)
+            try:
+                link.symlink_to(template.resolve())
+            except OSError:
+                # Symlinks need extra privileges on Windows.
+                shutil.copy2(template, link)
+
+        batch_results_dir = target_results_dir.joinpath(staging_dir.name)
+        batch_results_dir.mkdir(exist_ok=True, parents=True)
+        proc_resp = self._run_subprocess(
+            command=self._resolve_arguments(target=staging_dir),
+            results_dir=batch_results_dir,
+            stdout_preference="both",
+            stderr_preference="both",
+            cwd=staging_dir,
+        )
+        try:
+            stdout = proc_resp.get("stdout", "")
+            if not stdout or not stdout.strip():
+                raise ScannerError(
+                    f"empty stdout (exit code {proc_resp.get('returncode', '?')})"
+                )
+            batch_sarif = SarifReport.model_validate_json(json_data=stdout)
+        except Exception as e:
+            if len(indexes) > 1:
+                ASH_LOGGER.warning(
+                    f"CFN Nag batch {staging_dir.name} failed ({e}); "
+                    "rescanning its templates individually"
+                )
+                results: Dict[int, SarifReport] = {}
+                for index in indexes:
+                    results.update(
+                        self._scan_batch(
+                            templates,
+                            [index],
+                            staging_dir=staging_dir.parent.joinpath(
+                                f"{staging_dir.name}-f{index}"
+                            ),
+                            target_results_dir=target_results_dir,
+                        )
+                    )
+                return results
+            ASH_LOGGER.warning(
+                f"Failed to parse CFN Nag results for {templates[indexes[0]]} as SARIF: {e}"
+            )
+            return {}
+
+        return self._split_batch_sarif(batch_sarif, templates, indexes, target_results_dir)
+
+    def _split_batch_sarif(
+        self,
+        batch_sarif: SarifReport,
+        templates: List[str],
+        indexes: List[int],
+        target_results_dir: Path,
+    ) -> Dict[int, SarifReport]:
+        """De-multiplex a batch's SARIF into one report per template.
+
+        Result locations are rewritten from the staged link back to the
+        original template path, relative to the source directory when the
+        template is inside it.
+        """
+        source_dir = Path(self.context.source_dir).resolve()
+        grouped: Dict[int, List[Any]] = {index: [] for index in indexes}
+        for run in batch_sarif.runs or []:
+            for result in run.results or []:
+                index = None
+                for location in result.locations or []:
+                    physical = location.physicalLocation
+                    artifact = physical.root.artifactLocation if physical else None
+                    match = (
+                        _STAGED_URI_PATTERN.search(artifact.uri)
+                        if artifact and artifact.uri
+                        else None
+                    )
+                    if match is None or int(match.group(1)) not in grouped:
+                        continue
+                    index = int(match.group(1))
+                    original = Path(templates[index]).resolve()
+                    artifact.uri = (
+                        original.relative_to(source_dir).as_posix()
+                        if original.is_relative_to(source_dir)
+                        else original.as_posix()
+                    )
+                    artifact.uriBaseId = None
+                if index is None:
+                    ASH_LOGGER.debug(
+                        f"Dropping CFN Nag result {result.ruleId} with no staged location"
+                    )
+                    continue
+                grouped[index].append(result)
+
+        template_run = batch_sarif.runs[0] if batch_sarif.runs else None
+        per_file: Dict[int, SarifReport] = {}
+        for index, results in grouped.items():
+            file_sarif = SarifReport(
+                version="2.1.0",
+                runs=[
+                    Run(
+                        tool=template_run.tool
+                        if template_run
+                        else Tool(driver=ToolComponent(name="cfn_nag")),
+                        results=results,
+                    )
+                ],
+            )
+            results_file_dir = target_results_dir.joinpath(
+                get_normalized_filename(str_to_normalize=templates[index])
+            )
+            results_file_dir.mkdir(exist_ok=True, parents=True)
+            results_file_dir.joinpath("cfn_nag.sarif").write_text(
+                file_sarif.model_dump_json(exclude_none=True, exclude_unset=True),
+                encoding="utf-8",
+            )
+            per_file[index] = file_sarif
+        return per_file
+
     def scan(
         self,
         target: Path,
@@ -220,88 +458,24 @@ class CfnNagScanner(ScannerPluginBase[CfnNagScannerConfig]):
                 )
                 return sarif_report
 
-            # Process each template file
-            failed_files = []
             sarif_tool = Tool(driver=tool_component)
             sarif_output_file = target_results_dir.joinpath("cfn_nag.sarif")
             sarif_output_file.parent.mkdir(exist_ok=True, parents=True)
-            for cfn_file in scannable:
-                try:
-                    self._plugin_log(
-                        f"Checking if file is CloudFormation: {cfn_file}",
-                        target_type=target_type,
-                        level=logging.DEBUG,
-                    )
-                    cfn_model = get_model_from_template(template_path=Path(cfn_file))
-                    if cfn_model:
-                        self._plugin_log(
-                            f"File *is* CloudFormation: {cfn_file}",
-                            target_type=target_type,
-                            level=logging.DEBUG,
-                        )
-                    else:
-                        self._plugin_log(
-                            f"cfn_model is falsey, but no error was thrown: {cfn_file}",
-                            target_type=target_type,
-                            level=logging.DEBUG,
-                        )
-                except Exception as e:
-                    self._plugin_log(
-                        f"Not a CloudFormation file: {cfn_file}. Exception: {e}",
-                        target_type=target_type,
-                        level=logging.TRACE,
-                    )
-                    continue
-                if cfn_model is None:
-                    self._plugin_log(
-                        f"Not a CloudFormation file: {cfn_file}",
-                        target_type=target_type,
-                        level=logging.TRACE,
-                    )
-                    continue
-                normalized_filename = get_normalized_filename(str_to_normalize=cfn_file)
-                results_file_dir = target_results_dir.joinpath(normalized_filename)
-                results_file_dir.mkdir(exist_ok=True, parents=True)
-                final_args = self._resolve_arguments(
-                    target=cfn_file, results_file=results_file_dir
-                )
-                proc_resp = self._run_subprocess(
-                    command=final_args,
-                    results_dir=results_file_dir,
-                    stdout_preference="both",
-                    stderr_preference="both",
-                )
-                try:
-                    stdout = proc_resp.get("stdout", "")
-                    if not stdout or not stdout.strip():
-                        ASH_LOGGER.debug(
-                            f"CFN Nag returned no stdout for {cfn_file} "
-                            f"(exit code {proc_resp.get('returncode', '?')})"
-                        )
-                        failed_files.append((cfn_file, "empty stdout"))
-                        continue
-                    file_sarif = SarifReport.model_validate_json(
-                        json_data=stdout
-                    )
-                    if sarif_report is None and file_sarif is not None:
-                        sarif_report = file_sarif
-                    elif file_sarif is not None:
-                        sarif_report.merge_sarif_report(
-                            sarif_report=file_sarif,
-                            include_invocation=False,
-                            include_driver=False,
-                            # CFN Nag includes the full rule list regardless if there were
-                            # results matching the rule ID.
-                            # Since `include_driver=True`, it will include the rule list
-                            # when it attaches the initial driver.
-                            include_rules=False,
-                        )
-                except Exception as e:
-                    ASH_LOGGER.warning(
-                        f"Failed to parse CFN Nag results as SARIF: {str(e)}"
+            templates = self._find_templates(scannable, target_type=target_type)
+            if templates:
+                for file_sarif in self._scan_templates(
+                    templates,
+                    target_results_dir=target_results_dir,
+                    target_type=target_type,
+                ):
+                    sarif_report.merge_sarif_report(
+                        sarif_report=file_sarif,
+                        include_invocation=False,
+                        include_driver=False,
+                        # CFN Nag includes the full rule list regardless if there were
+                        # results matching the rule ID.
+                        include_rules=False,
                     )
-                    failed_files.append((cfn_file, str(e)))
-                    continue
 
             self._post_scan(
                 target=target,
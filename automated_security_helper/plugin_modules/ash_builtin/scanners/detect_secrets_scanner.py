@@ -1,14 +1,17 @@
-import logging
 """Module containing the detect-secrets security scanner implementation."""
 
-from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
+from collections import deque
 from importlib.metadata import version
 import json
+import logging
 import multiprocessing
+from multiprocessing.connection import Connection, wait
+import os
 from pathlib import Path
 import re
 import sys
-from typing import Annotated, Any, ClassVar, Dict, List, Literal
+import time
+from typing import Annotated, Any, ClassVar, Dict, List, Literal, Tuple
 
 from pydantic import BaseModel, ConfigDict, Field
 from automated_security_helper.base.options import ScannerOptionsBase
@@ -43,10 +46,67 @@ from automated_security_helper.utils.log import ASH_LOGGER
 from automated_security_helper.models.core import IgnorePathWithReason
 
 from detect_secrets import SecretsCollection
-from detect_secrets.settings import transient_settings
+from detect_secrets.core.scan import scan_file
+from detect_secrets.settings import (
+    configure_settings_from_baseline,
+    get_settings,
+    transient_settings,
+)
 from detect_secrets.core.plugins.util import get_mapping_from_secret_type_to_class
 
 
+def _scan_file(filename: str) -> List[Any]:
+    """Scan one file with the active detect-secrets settings."""
+    return list(scan_file(filename))
+
+
+def _scan_shard(
+    conn: Connection, filenames: List[str], settings: Dict[str, Any]
+) -> None:
+    """Scan a shard of files in a worker process.
+
+    Secrets are sent back after every file as ``(filename, secrets)`` so the
+    parent keeps the results of completed files if the shard is terminated.
+    """
+    try:
+        configure_settings_from_baseline(settings)
+        for filename in filenames:
+            try:
+                secrets = _scan_file(filename)
+            except Exception as e:
+                conn.send((filename, None, str(e)))
+                continue
+            conn.send((filename, secrets, None))
+    finally:
+        conn.close()
+
+
+def _build_shards(filenames: List[str], shard_bytes: int) -> List[List[str]]:
+    """Split files into shards of roughly ``shard_bytes`` each.
+
+    Files are taken largest first so that the slowest shards start early. A
+    file larger than ``shard_bytes`` gets a shard of its own.
+    """
+    sizes = {}
+    for filename in filenames:
+        try:
+            sizes[filename] = os.path.getsize(filename)
+        except OSError:
+            sizes[filename] = 0
+    shards: List[List[str]] = []
+    current: List[str] = []
+    current_bytes = 0
+    for filename in sorted(filenames, key=lambda f: sizes[f], reverse=True):
+        if current and current_bytes + sizes[filename] > shard_bytes:
+            shards.append(current)
+            current, current_bytes = [], 0
+        current.append(filename)
+        current_bytes += sizes[filename]
+    if current:
+        shards.append(current)
+    return shards
+
+
 class DetectSecretsScanSettingsPluginsUsed(BaseModel):
     model_config = ConfigDict(extra="allow")
     name: str | None = None
@@ -91,9 +151,30 @@ class DetectSecretsScannerConfigOptions(ScannerOptionsBase):
     scan_timeout: Annotated[
         int,
         Field(
-            description="Maximum time in seconds to allow the detect-secrets scan to run before aborting. Prevents hangs on pathological files.",
+            description="Maximum time in seconds to allow the detect-secrets scan to run before aborting. Results from files scanned before the deadline are kept.",
         ),
     ] = 300
+    shard_timeout: Annotated[
+        int,
+        Field(
+            description="Maximum time in seconds a single shard may run. When a shard times out, the file being scanned is skipped and the rest of the shard is scanned again.",
+            ge=1,
+        ),
+    ] = 120
+    shard_size_mb: Annotated[
+        float,
+        Field(
+            description="Approximate total size of the files scanned together in one shard.",
+            gt=0,
+        ),
+    ] = 2
+    max_workers: Annotated[
+        int | None,
+        Field(
+            description="Maximum shards scanned in parallel. Defaults to the number of CPUs.",
+            ge=1,
+        ),
+    ] = None
 
 
 class DetectSecretsScannerConfig(ScannerPluginConfigBase):
@@ -270,24 +351,130 @@ class DetectSecretsScanner(ScannerPluginBase[DetectSecretsScannerConfig]):
         ]
 
     @staticmethod
-    def _ensure_fork_multiprocessing() -> None:
-        """Ensure multiprocessing uses 'fork' start method on Linux.
+    def _multiprocessing_context():
+        """Return the multiprocessing context used for shard workers.
+
+        Linux uses 'fork' so workers inherit the loaded plugins without
+        re-importing ASH. Other platforms use 'spawn'. The global start method
+        is left untouched.
+        """
+        return multiprocessing.get_context("fork" if sys.platform == "linux" else "spawn")
+
+    def _scan_shards(
+        self,
+        scannable: List[str],
+        target_type: Literal["source", "converted"],
+    ) -> Tuple[int, List[str]]:
+        """Scan ``scannable`` in shards on worker processes.
 
-        detect-secrets' scan_files() uses multiprocessing.Pool internally.
-        On macOS with Python 3.13+, the default start method is 'spawn',
-        which causes recursive process creation (fork bomb) when called
-        outside of 'if __name__ == "__main__"' guard.
+        Each shard has its own timeout. When a shard times out, the file it was
+        scanning is skipped and the files after it are queued as a new shard,
+        so a pathological file costs at most one shard's timeout. Findings are
+        added to ``self._secrets_collection`` as each file completes.
 
-        On Linux containers (CodeBuild, Docker), 'fork' is the default and
-        works correctly, but we set it explicitly to be safe in case the
-        default changes in future Python versions.
+        Returns:
+            The number of files scanned and the files that were skipped.
         """
-        if sys.platform == "linux":
-            try:
-                multiprocessing.set_start_method("fork", force=True)
-            except RuntimeError:
-                # Already set — this is fine
-                pass
+        options = self.config.options
+        shards = deque(
+            _build_shards(scannable, max(1, int(options.shard_size_mb * 1024 * 1024)))
+        )
+        workers = min(len(shards), options.max_workers or os.cpu_count() or 1)
+        self._plugin_log(
+            f"Scanning {len(scannable)} files in {len(shards)} shards "
+            f"using {workers} worker(s)",
+            level=logging.DEBUG,
+            target_type=target_type,
+        )
+        ctx = self._multiprocessing_context()
+        settings = get_settings().json()
+        deadline = time.monotonic() + options.scan_timeout
+        root = self._secrets_collection.root
+        # Worker connection -> (process, remaining files, shard start time)
+        running: Dict[Connection, Tuple[Any, List[str], float]] = {}
+        scanned = 0
+        skipped: List[str] = []
+
+        def stop(conn: Connection) -> Tuple[Any, List[str], float]:
+            process, remaining, started = running.pop(conn)
+            if process.is_alive():
+                process.terminate()
+            process.join()
+            conn.close()
+            return process, remaining, started
+
+        try:
+            while shards or running:
+                while shards and len(running) < workers:
+                    shard = shards.popleft()
+                    reader, writer = ctx.Pipe(duplex=False)
+                    process = ctx.Process(
+                        target=_scan_shard,
+                        args=(writer, shard, settings),
+                        daemon=True,
+                    )
+                    process.start()
+                    writer.close()
+                    running[reader] = (process, list(shard), time.monotonic())
+
+                expiry = min(
+                    min(started + options.shard_timeout for _, _, started in running.values()),
+                    deadline,
+                )
+                for conn in wait(list(running), timeout=max(0, expiry - time.monotonic())):
+                    try:
+                        filename, secrets, error = conn.recv()
+                    except EOFError:
+                        _, remaining, _ = stop(conn)
+                        if remaining:
+                            # The worker exited without finishing its shard.
+                            skipped.append(remaining[0])
+                            if remaining[1:]:
+                                shards.append(remaining[1:])
+                        continue
+                    remaining = running[conn][1]
+                    remaining.remove(filename)
+                    scanned += 1
+                    if error is not None:
+                        ASH_LOGGER.debug(f"detect-secrets failed to scan {filename}: {error}")
+                        continue
+                    for secret in secrets:
+                        self._secrets_collection[
+                            os.path.relpath(secret.filename, root)
+                        ].add(secret)
+
+                now = time.monotonic()
+                if now >= deadline:
+                    break
+                for conn, (_, _, started) in list(running.items()):
+                    if now >= started + options.shard_timeout:
+                        _, remaining, _ = stop(conn)
+                        self._plugin_log(
+                            f"detect-secrets shard timed out after {options.shard_timeout}s "
+                            f"while scanning {remaining[0]}; skipping that file",
+                            level=logging.WARNING,
+                            target_type=target_type,
+                            append_to_stream="stderr",
+                        )
+                        skipped.append(remaining[0])
+                        if remaining[1:]:
+                            shards.append(remaining[1:])
+        finally:
+            unfinished = [f for _, remaining, _ in running.values() for f in remaining]
+            unfinished.extend(f for shard in shards for f in shard)
+            for conn in list(running):
+                stop(conn)
+
+        if unfinished:
+            self._plugin_log(
+                f"detect-secrets scan timed out after {options.scan_timeout}s; "
+                f"{len(unfinished)} file(s) were not scanned",
+                level=logging.WARNING,
+                target_type=target_type,
+                append_to_stream="stderr",
+            )
+            skipped.extend(unfinished)
+        return scanned, skipped
 
     def scan(
         self,
@@ -485,30 +672,11 @@ class DetectSecretsScanner(ScannerPluginBase[DetectSecretsScannerConfig]):
                 target_type=target_type,
             )
 
-            # Ensure multiprocessing uses 'fork' start method to avoid spawn-related
-            # issues in containerized environments (CodeBuild, Docker) where 'spawn'
-            # can cause recursive process creation and significant overhead.
-            self._ensure_fork_multiprocessing()
-
-            scan_timeout = self.config.options.scan_timeout
-
             with transient_settings(scan_settings_dict) as settings:
                 ASH_LOGGER.debug(f"Settings: {settings}")
-                executor = ThreadPoolExecutor(max_workers=1)
-                future = executor.submit(
-                    self._secrets_collection.scan_files, *scannable
+                scanned_count, skipped_files = self._scan_shards(
+                    scannable, target_type=target_type
                 )
-                try:
-                    future.result(timeout=scan_timeout)
-                except FuturesTimeoutError:
-                    future.cancel()
-                    self._plugin_log(
-                        f"detect-secrets scan timed out after {scan_timeout}s",
-                        level=logging.WARNING,
-                        append_to_stream="stderr",
-                    )
-                finally:
-                    executor.shutdown(wait=False, cancel_futures=True)
 
             self._post_scan(
                 target=target,
@@ -589,6 +757,10 @@ class DetectSecretsScanner(ScannerPluginBase[DetectSecretsScannerConfig]):
                 ),
                 properties=PropertyBag(
                     tool=sarif_tool,
+                    scanned_files=scanned_count,
+                    skipped_files=[
+                        get_shortest_name(input=filename) for filename in skipped_files
+                    ],
                 ),
             )
             sarif_report = SarifReport(
@@ -1,11 +1,18 @@
 """Module containing the NPM Audit security scanner implementation."""
 
+import copy
+import hashlib
 import json
 import logging
+import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Annotated, ClassVar, Dict, List, Literal, Any
+from typing import Annotated, ClassVar, Dict, List, Literal, Any, Tuple
 
-from pydantic import Field, model_validator
+from pydantic import Field, PrivateAttr, model_validator
 from automated_security_helper.base.options import ScannerOptionsBase
 from automated_security_helper.base.scanner_plugin import ScannerPluginConfigBase
 from automated_security_helper.core.enums import OfflineStrategy, ScannerToolType
@@ -37,10 +44,33 @@ from automated_security_helper.schemas.sarif_schema_model import (
 )
 from automated_security_helper.utils.get_scan_set import scan_set
 from automated_security_helper.utils.log import ASH_LOGGER
+from automated_security_helper.utils.npm_lockfile_audit import (
+    AdvisoryIndex,
+    audit_lock_file,
+)
 from automated_security_helper.utils.get_shortest_name import get_shortest_name
 from automated_security_helper.utils.subprocess_utils import find_executable
 
 
+# Lock files in the order they are looked for, mapped to the package manager
+# that audits them.
+_LOCK_FILES = {
+    "yarn.lock": "yarn",
+    "pnpm-lock.yaml": "pnpm",
+    "package-lock.json": "npm",
+}
+
+
+@dataclass
+class _AuditJob:
+    """One audit run, shared by every package directory with identical lockfiles."""
+
+    binary: str
+    lock_file: Path
+    content_hash: str
+    package_dirs: List[Path]
+
+
 class NpmAuditScannerConfigOptions(ScannerOptionsBase):
     offline: Annotated[
         bool,
@@ -49,6 +79,31 @@ class NpmAuditScannerConfigOptions(ScannerOptionsBase):
             default_factory=is_offline_mode,
         ),
     ]
+    max_workers: Annotated[
+        int,
+        Field(
+            description="Maximum audits run concurrently. Package directories with identical lock files are audited once.",
+            ge=1,
+        ),
+    ] = 4
+    cache_audit_results: Annotated[
+        bool,
+        Field(
+            description="Reuse audit output from earlier runs on the same day for lock files whose contents have not changed."
+        ),
+    ] = True
+    engine: Annotated[
+        Literal["package-manager", "lockfile"],
+        Field(
+            description="How lock files are audited. 'package-manager' runs npm, yarn or pnpm audit. 'lockfile' parses the lock files directly and matches them against advisory_database without running a package manager or using the network."
+        ),
+    ] = "package-manager"
+    advisory_database: Annotated[
+        str | None,
+        Field(
+            description="Path to the advisory snapshot used by the 'lockfile' engine, in the npm bulk advisory response format. Relative paths are resolved against the source directory."
+        ),
+    ] = None
 
 
 class NpmAuditScannerConfig(ScannerPluginConfigBase):
@@ -65,6 +120,11 @@ class NpmAuditScanner(ScannerPluginBase[NpmAuditScannerConfig]):
 
     offline_strategy: ClassVar[OfflineStrategy] = OfflineStrategy.CACHE_FLAGS
 
+    _advisory_index: AdvisoryIndex | None = PrivateAttr(default=None)
+    _deferred_responses: threading.local = PrivateAttr(
+        default_factory=threading.local
+    )
+
     def model_post_init(self, context):
         if self.config is None:
             self.config = NpmAuditScannerConfig()
@@ -109,6 +169,9 @@ class NpmAuditScanner(ScannerPluginBase[NpmAuditScannerConfig]):
         Raises:
             ScannerError: If validation fails
         """
+        if self.config.options.engine == "lockfile":
+            return self._load_advisory_index()
+
         found = find_executable(self.command)
         if found:
             self.tool_version = self._run_subprocess(
@@ -119,6 +182,31 @@ class NpmAuditScanner(ScannerPluginBase[NpmAuditScannerConfig]):
 
         return found is not None
 
+    def _load_advisory_index(self) -> bool:
+        """Load the advisory snapshot used by the lockfile engine."""
+        database = self.config.options.advisory_database
+        if not database:
+            ASH_LOGGER.warning(
+                "npm-audit engine 'lockfile' requires options.advisory_database"
+            )
+            return False
+        path = Path(database)
+        if not path.is_absolute():
+            path = Path(self.context.source_dir).joinpath(path)
+        try:
+            self._advisory_index = AdvisoryIndex.from_file(path)
+            snapshot_hash = hashlib.sha256(path.read_bytes()).hexdigest()
+        except (OSError, ValueError) as e:
+            ASH_LOGGER.warning(f"Failed to load npm advisory database {path}: {e}")
+            return False
+        # The snapshot digest stands in for a tool version so that cached
+        # results are invalidated when the advisories change.
+        self.tool_version = f"lockfile+{snapshot_hash[:12]}"
+        ASH_LOGGER.debug(
+            f"Loaded {self._advisory_index.advisory_count} advisories from {path}"
+        )
+        return True
+
     def _has_install_commands(self) -> bool:
         """Check if scanner has non-empty custom install commands."""
         import platform
@@ -136,13 +224,18 @@ class NpmAuditScanner(ScannerPluginBase[NpmAuditScannerConfig]):
         return super()._process_config_options()
 
     def _convert_npm_audit_to_sarif(
-        self, npm_audit_results: Dict[str, Any], target_path: Path
+        self,
+        npm_audit_results: Dict[str, Any],
+        target_path: Path,
+        location_prefix: str = "",
     ) -> SarifReport:
         """Convert npm audit results to SARIF format.
 
         Args:
             npm_audit_results: npm audit results in JSON format
             target_path: Path to the scanned directory
+            location_prefix: Directory of the audited package, relative to
+                ``target_path``; prepended to each result location
 
         Returns:
             SarifReport: SARIF report containing the scan findings
@@ -157,6 +250,11 @@ class NpmAuditScanner(ScannerPluginBase[NpmAuditScannerConfig]):
 
         # Create a dictionary to track unique rules
         rules_dict = {}
+        node_modules_dir = (
+            f"{location_prefix}/node_modules"
+            if location_prefix not in ("", ".")
+            else "node_modules"
+        )
 
         # Create results list for SARIF
         results = []
@@ -239,7 +337,7 @@ class NpmAuditScanner(ScannerPluginBase[NpmAuditScannerConfig]):
                                 Location(
                                     physicalLocation=PhysicalLocation(
                                         artifactLocation=ArtifactLocation(
-                                            uri=f"node_modules/{pkg_location}/package.json"
+                                            uri=f"{node_modules_dir}/{pkg_location}/package.json"
                                         ),
                                         region=Region(startLine=1, startColumn=1),
                                     )
@@ -304,7 +402,7 @@ class NpmAuditScanner(ScannerPluginBase[NpmAuditScannerConfig]):
                                 Location(
                                     physicalLocation=PhysicalLocation(
                                         artifactLocation=ArtifactLocation(
-                                            uri=f"node_modules/{pkg_location}/package.json"
+                                            uri=f"{node_modules_dir}/{pkg_location}/package.json"
                                         ),
                                         region=Region(startLine=1, startColumn=1),
                                     )
@@ -352,6 +450,201 @@ class NpmAuditScanner(ScannerPluginBase[NpmAuditScannerConfig]):
 
         return sarif_report
 
+    def _collect_audit_jobs(self, scannable: List[str]) -> List["_AuditJob"]:
+        """Group the package directories in ``scannable`` by lockfile contents."""
+        jobs: Dict[str, _AuditJob] = {}
+        for item in scannable:
+            package_file = Path(item)
+            lock_file = next(
+                (
+                    package_file.parent.joinpath(name)
+                    for name in _LOCK_FILES
+                    if package_file.parent.joinpath(name).exists()
+                ),
+                None,
+            )
+            if lock_file is None:
+                continue
+            binary = _LOCK_FILES[lock_file.name]
+
+            # Check that the binary is installed before attempting to run
+            # it (#180). npm is already validated in
+            # validate_plugin_dependencies, but yarn and pnpm may not be
+            # present.
+            if (
+                self.config.options.engine != "lockfile"
+                and binary != "npm"
+                and find_executable(binary) is None
+            ):
+                ASH_LOGGER.warning(
+                    f"{binary} is not installed -- skipping "
+                    f"audit for {lock_file}. Install {binary} "
+                    "to scan this lock file."
+                )
+                continue
+
+            # package.json is part of the key because audits also read the
+            # declared dependencies, e.g. to tell dev dependencies apart.
+            digest = hashlib.sha256(lock_file.name.encode())
+            for path in (lock_file, package_file):
+                try:
+                    digest.update(b"\0" + path.read_bytes())
+                except OSError as e:
+                    digest.update(f"\0{path}:{e}".encode())
+            content_hash = digest.hexdigest()
+            if content_hash in jobs:
+                jobs[content_hash].package_dirs.append(package_file.parent)
+            else:
+                jobs[content_hash] = _AuditJob(
+                    binary=binary,
+                    lock_file=lock_file,
+                    content_hash=content_hash,
+                    package_dirs=[package_file.parent],
+                )
+        return list(jobs.values())
+
+    def _audit_cache_file(self, job: "_AuditJob", cmd: List[str]) -> Path | None:
+        """Return where the audit output for ``job`` is cached, if caching is on.
+
+        Registry advisories change over time, so entries are grouped by the
+        UTC date they were fetched on and only reused on the same day. The
+        date is when the audit ran, not when the registry advisories were
+        last updated.
+        """
+        if not self.config.options.cache_audit_results:
+            return None
+        key = hashlib.sha256(
+            json.dumps(
+                [job.content_hash, cmd, self.tool_version], default=str
+            ).encode()
+        ).hexdigest()
+        fetched_on = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+        return Path(self.context.output_dir).joinpath(
+            "cache", "npm_audit", fetched_on, f"{key}.json"
+        )
+
+    def _process_command_response(self, response: dict) -> None:
+        responses = getattr(self._deferred_responses, "responses", None)
+        if responses is None:
+            super()._process_command_response(response)
+        else:
+            responses.append(response)
+
+    def _run_audit_job_deferred(
+        self, job: "_AuditJob", target_results_dir: Path
+    ) -> Tuple[Dict[str, Any] | None, List[dict]]:
+        """Run ``job`` on a worker thread without touching the scanner state.
+
+        Returns the audit results and the command responses of the job, which
+        the scanning thread applies once every job has finished.
+        """
+        self._deferred_responses.responses = []
+        try:
+            audit_results = self._run_audit_job(job, target_results_dir)
+            return audit_results, self._deferred_responses.responses
+        finally:
+            self._deferred_responses.responses = None
+
+    def _run_audit_job(
+        self, job: "_AuditJob", target_results_dir: Path
+    ) -> Dict[str, Any] | None:
+        """Audit one unique lockfile, reusing today's cached output if present."""
+        if self.config.options.engine == "lockfile":
+            try:
+                audit_results = audit_lock_file(job.lock_file, self._advisory_index)
+            except Exception as e:
+                ASH_LOGGER.warning(f"Failed to audit {job.lock_file}: {str(e)}")
+                return None
+            self._process_command_response(
+                {"returncode": 1 if audit_results["vulnerabilities"] else 0}
+            )
+            return audit_results
+
+        cmd = [job.binary, "audit", "--json"]
+        if self.config.options.offline:
+            cmd.append("--offline")
+
+        cache_file = self._audit_cache_file(job, cmd)
+        if cache_file is not None and cache_file.exists():
+            try:
+                cached = json.loads(cache_file.read_text(encoding="utf-8"))
+                self._process_command_response({"returncode": cached["returncode"]})
+                ASH_LOGGER.debug(
+                    f"Using cached {job.binary} audit results for {job.lock_file}"
+                )
+                return cached["results"]
+            except Exception as e:
+                ASH_LOGGER.debug(f"Ignoring unreadable audit cache {cache_file}: {e}")
+
+        package_dir = job.package_dirs[0]
+        try:
+            # Run from the lock file's parent directory so that pnpm (and
+            # yarn) can locate their lock files (#99).
+            result = self._run_subprocess(
+                command=cmd,
+                results_dir=target_results_dir.joinpath(job.content_hash[:12]),
+                stdout_preference="both",
+                stderr_preference="both",
+                cwd=package_dir,
+            )
+        except Exception as e:
+            ASH_LOGGER.warning(f"Failed to run npm audit in {package_dir}: {str(e)}")
+            return None
+        ASH_LOGGER.debug(result)
+
+        # npm audit returns non-zero exit code when vulnerabilities are found
+        # but we still want to process the output
+        if not result.get("stdout", None):
+            return None
+        try:
+            audit_results = json.loads(result["stdout"])
+        except json.JSONDecodeError:
+            ASH_LOGGER.warning(f"Failed to parse npm audit output for {package_dir}")
+            return None
+
+        if cache_file is not None and "error" not in audit_results:
+            try:
+                cache_file.parent.mkdir(parents=True, exist_ok=True)
+                for stale in cache_file.parent.parent.iterdir():
+                    if stale != cache_file.parent:
+                        shutil.rmtree(stale, ignore_errors=True)
+                cache_file.write_text(
+                    json.dumps(
+                        {
+                            "returncode": result.get("returncode", 0),
+                            "results": audit_results,
+                        }
+                    ),
+                    encoding="utf-8",
+                )
+            except OSError as e:
+                ASH_LOGGER.debug(f"Failed to cache audit results in {cache_file}: {e}")
+        return audit_results
+
+    def _convert_per_location(
+        self, per_location: List[Tuple[Path, Dict[str, Any]]], target: Path
+    ) -> SarifReport:
+        """Convert each package directory's audit results and combine them."""
+        combined: SarifReport | None = None
+        for package_dir, audit_results in per_location:
+            try:
+                location_prefix = Path(package_dir).relative_to(target).as_posix()
+            except ValueError:
+                location_prefix = Path(package_dir).as_posix()
+            part = self._convert_npm_audit_to_sarif(
+                audit_results, target, location_prefix=location_prefix
+            )
+            if combined is None:
+                combined = part
+                continue
+            run, part_run = combined.runs[0], part.runs[0]
+            known_rules = {rule.id for rule in run.tool.driver.rules}
+            run.tool.driver.rules.extend(
+                rule for rule in part_run.tool.driver.rules if rule.id not in known_rules
+            )
+            run.results.extend(part_run.results)
+        return combined
+
     def scan(
         self,
         target: Path,
@@ -474,119 +767,79 @@ class NpmAuditScanner(ScannerPluginBase[NpmAuditScannerConfig]):
                 )
                 return sarif_report
 
-            # Run npm audit for each package.json file
-            all_results = {}
-            lock_files = [
-                "yarn.lock",
-                "pnpm-lock.yaml",
-                "package-lock.json",
-            ]
-            for item in scannable:
-                package_file = Path(item)
-                lock_file = None
-                for item in lock_files:
-                    lf_path = package_file.parent.joinpath(item)
-                    if lf_path.exists():
-                        lock_file = lf_path
-                        break
-                if lock_file is not None:
-                    package_dir = package_file.parent
-
-                    try:
-                        # Run npm audit
-                        if lock_file.name == "yarn.lock":
-                            binary = "yarn"
-                        elif lock_file.name == "pnpm-lock.yaml":
-                            binary = "pnpm"
-                        else:
-                            binary = "npm"
-
-                        # Check that the binary is installed before
-                        # attempting to run it (#180).  npm is already
-                        # validated in validate_plugin_dependencies, but
-                        # yarn and pnpm may not be present.
-                        if binary != "npm" and find_executable(binary) is None:
-                            ASH_LOGGER.warning(
-                                f"{binary} is not installed -- skipping "
-                                f"audit for {lock_file}. Install {binary} "
-                                "to scan this lock file."
-                            )
-                            continue
-
-                        cmd = [binary, "audit", "--json"]
-
-                        # Add offline mode if enabled
-                        if self.config.options.offline:
-                            cmd.append("--offline")
-                            ASH_LOGGER.info(
-                                f"🔄 Running {binary} audit in offline mode"
-                            )
-
-                            # Validate offline mode requirements
-                            from automated_security_helper.utils.offline_mode_validator import (
-                                validate_npm_audit_offline_mode,
-                            )
-
-                            offline_valid, offline_messages = (
-                                validate_npm_audit_offline_mode()
-                            )
-                            if not offline_valid:
-                                ASH_LOGGER.warning(
-                                    "npm audit offline mode validation failed, but continuing with scan"
-                                )
+            if self.config.options.engine == "lockfile":
+                ASH_LOGGER.debug("Auditing lock files against the advisory database")
+            elif self.config.options.offline:
+                ASH_LOGGER.info("🔄 Running package manager audits in offline mode")
 
-                        # Run from the lock file's parent directory so
-                        # that pnpm (and yarn) can locate their lock
-                        # files (#99).
-                        result = self._run_subprocess(
-                            command=cmd,
-                            results_dir=target_results_dir,
-                            stdout_preference="both",
-                            stderr_preference="both",
-                            cwd=package_dir,
+                # Validate offline mode requirements
+                from automated_security_helper.utils.offline_mode_validator import (
+                    validate_npm_audit_offline_mode,
+                )
+
+                offline_valid, offline_messages = validate_npm_audit_offline_mode()
+                if not offline_valid:
+                    ASH_LOGGER.warning(
+                        "npm audit offline mode validation failed, but continuing with scan"
+                    )
+
+            # Identical lockfiles are audited once; each job lists every
+            # package directory that shares the same lockfile contents.
+            jobs = self._collect_audit_jobs(scannable)
+            package_count = sum(len(job.package_dirs) for job in jobs)
+            workers = min(len(jobs), self.config.options.max_workers) or 1
+            self._plugin_log(
+                f"Auditing {package_count} package(s) with {len(jobs)} unique "
+                f"lockfile(s) using {workers} worker(s)",
+                target_type=target_type,
+                level=logging.DEBUG,
+            )
+            if workers <= 1:
+                job_results = [
+                    self._run_audit_job(job, target_results_dir) for job in jobs
+                ]
+            else:
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    outcomes = list(
+                        executor.map(
+                            lambda job: self._run_audit_job_deferred(
+                                job, target_results_dir
+                            ),
+                            jobs,
                         )
-                        ASH_LOGGER.info(result)
-
-                        # npm audit returns non-zero exit code when vulnerabilities are found
-                        # but we still want to process the output
-                        if result.get("stdout", None):
-                            try:
-                                audit_results = json.loads(result.get("stdout", None))
-                                # Merge results
-                                if not all_results:
-                                    all_results = audit_results
-                                else:
-                                    # Merge vulnerabilities
-                                    if "vulnerabilities" in audit_results:
-                                        all_results.setdefault(
-                                            "vulnerabilities", {}
-                                        ).update(audit_results["vulnerabilities"])
-                                    # Update metadata
-                                    if "metadata" in audit_results:
-                                        for key, value in audit_results[
-                                            "metadata"
-                                        ].items():
-                                            if key in all_results.get("metadata", {}):
-                                                if isinstance(value, dict):
-                                                    all_results["metadata"][key].update(
-                                                        value
-                                                    )
-                                                elif isinstance(value, (int, float)):
-                                                    all_results["metadata"][key] += (
-                                                        value
-                                                    )
-                                            else:
-                                                all_results.setdefault("metadata", {})[
-                                                    key
-                                                ] = value
-                            except json.JSONDecodeError:
-                                ASH_LOGGER.warning(
-                                    f"Failed to parse npm audit output for {package_dir}"
-                                )
-                    except Exception as e:
-                        ASH_LOGGER.warning(
-                            f"Failed to run npm audit in {package_dir}: {str(e)}"
+                    )
+                job_results = []
+                for audit_results, responses in outcomes:
+                    for response in responses:
+                        self._process_command_response(response)
+                    job_results.append(audit_results)
+
+            all_results = {}
+            per_location: List[Tuple[Path, Dict[str, Any]]] = []
+            for job, audit_results in zip(jobs, job_results):
+                if not audit_results:
+                    continue
+                for package_dir in job.package_dirs:
+                    per_location.append((package_dir, audit_results))
+                    # Merge results
+                    if not all_results:
+                        all_results = copy.deepcopy(audit_results)
+                        continue
+                    # Merge vulnerabilities
+                    if "vulnerabilities" in audit_results:
+                        all_results.setdefault("vulnerabilities", {}).update(
+                            audit_results["vulnerabilities"]
                         )
+                    # Update metadata
+                    if "metadata" in audit_results:
+                        for key, value in audit_results["metadata"].items():
+                            if key in all_results.get("metadata", {}):
+                                if isinstance(value, dict):
+                                    all_results["metadata"][key].update(value)
+                                elif isinstance(value, (int, float)):
+                                    all_results["metadata"][key] += value
+                            else:
+                                all_results.setdefault("metadata", {})[key] = value
 
             # Save the combined results
             if all_results:
@@ -600,7 +853,10 @@ class NpmAuditScanner(ScannerPluginBase[NpmAuditScannerConfig]):
 
             # Convert npm audit results to SARIF
             if all_results:
-                sarif_report = self._convert_npm_audit_to_sarif(all_results, target)
+                sarif_report = self._convert_per_location(per_location, target)
+                sarif_report.runs[0].properties = PropertyBag(
+                    metrics=all_results.get("metadata", {}).get("vulnerabilities", {})
+                )
 
                 # Save SARIF report
                 sarif_file = target_results_dir.joinpath("results_sarif.sarif")
@@ -8,10 +8,10 @@ import platform
 import subprocess  # nosec B404 — required for version detection of opengrep binary
 from typing import Annotated, ClassVar, List, Literal
 
-from pydantic import Field, model_validator
+from pydantic import Field, PrivateAttr, model_validator
 from automated_security_helper.base.options import ScannerOptionsBase
 from automated_security_helper.base.scanner_plugin import ScannerPluginConfigBase
-from automated_security_helper.core.constants import ASH_ASSETS_DIR, is_offline_mode
+from automated_security_helper.core.constants import is_offline_mode
 from automated_security_helper.core.enums import OfflineStrategy, ScannerToolType
 from automated_security_helper.models.core import ToolArgs
 from automated_security_helper.models.core import (
@@ -31,6 +31,12 @@ from automated_security_helper.schemas.sarif_schema_model import (
 from automated_security_helper.utils.get_shortest_name import get_shortest_name
 from automated_security_helper.utils.sarif_utils import attach_scanner_details
 from automated_security_helper.utils.log import ASH_LOGGER
+from automated_security_helper.utils.stargrep_rules import (
+    StargrepRuleConfig,
+    resolve_stargrep_rules,
+    run_with_shared_rules,
+    shared_run_key,
+)
 from automated_security_helper.utils.download_utils import (
     create_url_download_command,
     get_opengrep_url,
@@ -82,6 +88,28 @@ class OpengrepScannerConfigOptions(ScannerOptionsBase):
         ),
     ]
 
+    merge_local_rules: Annotated[
+        bool | None,
+        Field(
+            description="Merge local rule sources (the bundled ASH rules, the offline rule cache and local `config` paths) into one cached, de-duplicated rules file. Defaults to merging in offline mode only. Rule IDs are then not prefixed with their file path, which offline mode already does; enabling this online changes the rule IDs of findings, so suppressions and baselines that use the prefixed IDs stop matching. `rule_sharing: union` needs merged rules.",
+        ),
+    ] = None
+
+    rule_sharing: Annotated[
+        Literal["separate", "union"],
+        Field(
+            description="When 'union' is set on both Semgrep and Opengrep and all of their rule sources are local, the first of them to scan a target runs the union of both rule sets and each keeps the results for its own rules.",
+        ),
+    ] = "separate"
+
+    rule_sharing_timeout: Annotated[
+        int,
+        Field(
+            description="Seconds to wait for the other scanner's union run before running the engine separately.",
+            ge=1,
+        ),
+    ] = 1800
+
     patterns: Annotated[
         List[str],
         Field(
@@ -110,6 +138,7 @@ class OpengrepScanner(ScannerPluginBase[OpengrepScannerConfig]):
     """OpengrepScanner implements code scanning using Opengrep."""
 
     offline_strategy: ClassVar[OfflineStrategy] = OfflineStrategy.CACHE_FLAGS
+    _rule_config: StargrepRuleConfig | None = PrivateAttr(default=None)
 
     def model_post_init(self, context):
         if self.config is None:
@@ -271,22 +300,6 @@ class OpengrepScanner(ScannerPluginBase[OpengrepScannerConfig]):
             arg for arg in self.args.extra_args if arg.key != "--metrics"
         ]
 
-        ash_stargrep_rules = [
-            item
-            for item in ASH_ASSETS_DIR.joinpath("ash_stargrep_rules").glob("*")
-            if (item.as_posix().endswith(".yaml") or item.as_posix().endswith(".yml"))
-        ]
-        if ash_stargrep_rules:
-            ASH_LOGGER.verbose(f"Found ASH *grep rulesets: {ash_stargrep_rules}")
-            self.args.extra_args.extend(
-                [
-                    ToolExtraArg(
-                        key="--config",
-                        value=item.as_posix(),
-                    )
-                    for item in ash_stargrep_rules
-                ]
-            )
         if self.config.options.offline:
             # In offline mode, use metrics=off (only if version supports it)
             if self._should_use_metrics_flag():
@@ -315,26 +328,11 @@ class OpengrepScanner(ScannerPluginBase[OpengrepScannerConfig]):
                     "while online and copy to cache."
                 )
 
-            # Use cached rules directory with --no-rewrite-rule-ids to produce
-            # clean rule IDs (the rule's own id field, no path-derived prefix).
-            opengrep_rules_cache_dir = os.environ.get("OPENGREP_RULES_CACHE_DIR")
             ASH_LOGGER.info(
-                f"Opengrep offline mode: using cached rules from {opengrep_rules_cache_dir}"
-            )
-            self.args.extra_args.append(
-                ToolExtraArg(key="--config", value=opengrep_rules_cache_dir)
-            )
-            self.args.extra_args.append(
-                ToolExtraArg(key="--no-rewrite-rule-ids", value="")
+                f"Opengrep offline mode: using cached rules from {os.environ.get('OPENGREP_RULES_CACHE_DIR')}"
             )
         else:
             # In online mode, use config=auto
-            self.args.extra_args.append(
-                ToolExtraArg(
-                    key="--config",
-                    value=self.config.options.config,
-                )
-            )
             # Only add metrics flag if version supports it
             if self._should_use_metrics_flag():
                 self.args.extra_args.append(
@@ -344,6 +342,24 @@ class OpengrepScanner(ScannerPluginBase[OpengrepScannerConfig]):
                     )
                 )
 
+        self._rule_config = resolve_stargrep_rules(
+            self.context, "opengrep", self.config.options
+        )
+        if self._rule_config.merged is not None:
+            ASH_LOGGER.verbose(
+                f"Using merged *grep rules file {self._rule_config.merged.path}"
+            )
+        self.args.extra_args.extend(
+            ToolExtraArg(key="--config", value=value)
+            for value in self._rule_config.config_args
+        )
+        # Cached and merged rules use --no-rewrite-rule-ids to produce clean
+        # rule IDs (the rule's own id field, no path-derived prefix).
+        if self.config.options.offline or self._rule_config.merged is not None:
+            self.args.extra_args.append(
+                ToolExtraArg(key="--no-rewrite-rule-ids", value="")
+            )
+
         # Add exclude patterns
         for exclude_pattern in self.config.options.exclude:
             self.args.extra_args.append(
@@ -477,11 +493,27 @@ class OpengrepScanner(ScannerPluginBase[OpengrepScannerConfig]):
 
             # No extra env vars needed — --config points to the cache directory
             subprocess_env = None
-            self._run_subprocess(
-                command=final_args,
-                results_dir=target_results_dir,
-                env=subprocess_env,
+
+            def run_engine() -> int:
+                self._run_subprocess(
+                    command=final_args,
+                    results_dir=target_results_dir,
+                    env=subprocess_env,
+                )
+                return self.exit_code
+
+            # With rule_sharing 'union', Semgrep and Opengrep share one run
+            # over the union of their rules.
+            shared_exit_code = run_with_shared_rules(
+                self.context,
+                self._rule_config,
+                shared_run_key(target, target_type, self.config.options),
+                results_file,
+                run_engine,
+                timeout=self.config.options.rule_sharing_timeout,
             )
+            if shared_exit_code is not None:
+                self._process_command_response({"returncode": shared_exit_code})
 
             # SARIF mode - parse SARIF results
             if Path(results_file).exists():
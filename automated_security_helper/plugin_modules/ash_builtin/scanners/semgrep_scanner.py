@@ -7,10 +7,10 @@ from pathlib import Path
 import platform
 from typing import Annotated, ClassVar, List, Literal
 
-from pydantic import Field
+from pydantic import Field, PrivateAttr
 from automated_security_helper.base.options import ScannerOptionsBase
 from automated_security_helper.base.scanner_plugin import ScannerPluginConfigBase
-from automated_security_helper.core.constants import ASH_ASSETS_DIR, is_offline_mode
+from automated_security_helper.core.constants import is_offline_mode
 from automated_security_helper.core.enums import OfflineStrategy, ScannerToolType
 from automated_security_helper.models.core import ToolArgs
 from automated_security_helper.models.core import (
@@ -30,6 +30,12 @@ from automated_security_helper.schemas.sarif_schema_model import (
 from automated_security_helper.utils.get_shortest_name import get_shortest_name
 from automated_security_helper.utils.sarif_utils import attach_scanner_details
 from automated_security_helper.utils.log import ASH_LOGGER
+from automated_security_helper.utils.stargrep_rules import (
+    StargrepRuleConfig,
+    resolve_stargrep_rules,
+    run_with_shared_rules,
+    shared_run_key,
+)
 from automated_security_helper.utils.subprocess_utils import find_executable
 
 
@@ -77,6 +83,28 @@ class SemgrepScannerConfigOptions(ScannerOptionsBase):
         ),
     ]
 
+    merge_local_rules: Annotated[
+        bool | None,
+        Field(
+            description="Merge local rule sources (the bundled ASH rules, the offline rule cache and local `config` paths) into one cached, de-duplicated rules file. Defaults to merging in offline mode only. Rule IDs are then not prefixed with their file path, which offline mode already does; enabling this online changes the rule IDs of findings, so suppressions and baselines that use the prefixed IDs stop matching. `rule_sharing: union` needs merged rules.",
+        ),
+    ] = None
+
+    rule_sharing: Annotated[
+        Literal["separate", "union"],
+        Field(
+            description="When 'union' is set on both Semgrep and Opengrep and all of their rule sources are local, the first of them to scan a target runs the union of both rule sets and each keeps the results for its own rules.",
+        ),
+    ] = "separate"
+
+    rule_sharing_timeout: Annotated[
+        int,
+        Field(
+            description="Seconds to wait for the other scanner's union run before running the engine separately.",
+            ge=1,
+        ),
+    ] = 1800
+
     tool_version: Annotated[
         str | None,
         Field(
@@ -104,6 +132,7 @@ class SemgrepScanner(ScannerPluginBase[SemgrepScannerConfig]):
     """SemgrepScanner implements code scanning using Semgrep."""
 
     offline_strategy: ClassVar[OfflineStrategy] = OfflineStrategy.CACHE_FLAGS
+    _rule_config: StargrepRuleConfig | None = PrivateAttr(default=None)
 
     def model_post_init(self, context):
         if self.config is None:
@@ -232,22 +261,6 @@ class SemgrepScanner(ScannerPluginBase[SemgrepScannerConfig]):
         return True
 
     def _process_config_options(self):
-        ash_stargrep_rules = [
-            item
-            for item in ASH_ASSETS_DIR.joinpath("ash_stargrep_rules").glob("*")
-            if (item.as_posix().endswith(".yaml") or item.as_posix().endswith(".yml"))
-        ]
-        if ash_stargrep_rules:
-            ASH_LOGGER.verbose(f"Found ASH *grep rulesets: {ash_stargrep_rules}")
-            self.args.extra_args.extend(
-                [
-                    ToolExtraArg(
-                        key="--config",
-                        value=item.as_posix(),
-                    )
-                    for item in ash_stargrep_rules
-                ]
-            )
         if self.config.options.offline:
             # In offline mode, use metrics=off
             self.args.extra_args.append(
@@ -276,25 +289,10 @@ class SemgrepScanner(ScannerPluginBase[SemgrepScannerConfig]):
                     "while online and copy to cache."
                 )
 
-            # Use cached rules directory with --no-rewrite-rule-ids to produce
-            # clean rule IDs (the rule's own id field, no path-derived prefix).
-            semgrep_rules_cache_dir = os.environ.get("SEMGREP_RULES_CACHE_DIR")
             ASH_LOGGER.info(
-                f"Semgrep offline mode: using cached rules from {semgrep_rules_cache_dir}"
-            )
-            self.args.extra_args.append(
-                ToolExtraArg(key="--config", value=semgrep_rules_cache_dir)
-            )
-            self.args.extra_args.append(
-                ToolExtraArg(key="--no-rewrite-rule-ids", value="")
+                f"Semgrep offline mode: using cached rules from {os.environ.get('SEMGREP_RULES_CACHE_DIR')}"
             )
         else:
-            self.args.extra_args.append(
-                ToolExtraArg(
-                    key="--config",
-                    value=self.config.options.config,
-                )
-            )
             self.args.extra_args.append(
                 ToolExtraArg(
                     key="--metrics",
@@ -302,6 +300,24 @@ class SemgrepScanner(ScannerPluginBase[SemgrepScannerConfig]):
                 )
             )
 
+        self._rule_config = resolve_stargrep_rules(
+            self.context, "semgrep", self.config.options
+        )
+        if self._rule_config.merged is not None:
+            ASH_LOGGER.verbose(
+                f"Using merged *grep rules file {self._rule_config.merged.path}"
+            )
+        self.args.extra_args.extend(
+            ToolExtraArg(key="--config", value=value)
+            for value in self._rule_config.config_args
+        )
+        # Cached and merged rules use --no-rewrite-rule-ids to produce clean
+        # rule IDs (the rule's own id field, no path-derived prefix).
+        if self.config.options.offline or self._rule_config.merged is not None:
+            self.args.extra_args.append(
+                ToolExtraArg(key="--no-rewrite-rule-ids", value="")
+            )
+
         # Add exclude patterns
         for exclude_pattern in self.config.options.exclude:
             self.args.extra_args.append(
@@ -421,15 +437,35 @@ class SemgrepScanner(ScannerPluginBase[SemgrepScannerConfig]):
             # not mutate os.environ: scanners run concurrently in thread
             # pools and share the parent process env.
             env_vars = {}
-            if self.config.options.offline and "SEMGREP_RULES_CACHE_DIR" in os.environ:
+            if (
+                self.config.options.offline
+                and "SEMGREP_RULES_CACHE_DIR" in os.environ
+                and (self._rule_config is None or self._rule_config.merged is None)
+            ):
                 env_vars["SEMGREP_RULES"] = f"{os.environ['SEMGREP_RULES_CACHE_DIR']}/*"
 
             subprocess_env = {**os.environ, **env_vars} if env_vars else None
-            self._run_subprocess(
-                command=final_args,
-                results_dir=target_results_dir,
-                env=subprocess_env,
+
+            def run_engine() -> int:
+                self._run_subprocess(
+                    command=final_args,
+                    results_dir=target_results_dir,
+                    env=subprocess_env,
+                )
+                return self.exit_code
+
+            # With rule_sharing 'union', Semgrep and Opengrep share one run
+            # over the union of their rules.
+            shared_exit_code = run_with_shared_rules(
+                self.context,
+                self._rule_config,
+                shared_run_key(target, target_type, self.config.options),
+                results_file,
+                run_engine,
+                timeout=self.config.options.rule_sharing_timeout,
             )
+            if shared_exit_code is not None:
+                self._process_command_response({"returncode": shared_exit_code})
 
             semgrep_results = {}
             if Path(results_file).exists():
@@ -7,53 +7,82 @@ from automated_security_helper.plugins import ash_plugin_manager
 from automated_security_helper.utils.log import ASH_LOGGER
 
 
+def _builtin_plugin_version() -> str | None:
+    """Return the installed ASH version recorded on built-in plugin registrations."""
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        return version("automated_security_helper")
+    except PackageNotFoundError:
+        return None
+
+
 def load_internal_plugins():
-    """Load all internal ASH plugins."""
-    internal_modules = [
-        "automated_security_helper.plugin_modules.ash_builtin",
-    ]
+    """Load all internal ASH plugins.
 
-    loaded_plugins = {"converters": [], "scanners": [], "reporters": []}
+    Built-in plugins are registered from the generated plugin manifest, so no
+    plugin module is imported here; the plugin manager imports each module when
+    the plugin is first requested. If the manifest is unavailable, every
+    built-in plugin is imported instead.
 
-    for module_name in internal_modules:
-        try:
-            # nosemgrep: python.lang.security.audit.non-literal-import.non-literal-import
-            module = importlib.import_module(module_name)
-            ASH_LOGGER.debug(f"Loaded internal plugin module: {module_name}")
+    Returns:
+        Dict[str, List[str]]: Names of the registered built-in plugins by type
+    """
+    from automated_security_helper.plugins.manifest import (
+        BUILTIN_PLUGIN_PACKAGE,
+        PLUGIN_TYPE_SECTIONS,
+        load_plugin_manifest,
+    )
 
-            # Track loaded plugins - these should already be auto-registered via decorators
-            if hasattr(module, "ASH_CONVERTERS"):
-                ASH_LOGGER.debug(
-                    f"Found {len(module.ASH_CONVERTERS)} converters in {module_name}"
-                )
-                loaded_plugins["converters"].extend(module.ASH_CONVERTERS)
+    loaded_plugins = {"converters": [], "scanners": [], "reporters": []}
 
-            if hasattr(module, "ASH_SCANNERS"):
-                ASH_LOGGER.debug(
-                    f"Found {len(module.ASH_SCANNERS)} scanners in {module_name}"
-                )
-                loaded_plugins["scanners"].extend(module.ASH_SCANNERS)
+    try:
+        # nosemgrep: python.lang.security.audit.non-literal-import.non-literal-import
+        module = importlib.import_module(BUILTIN_PLUGIN_PACKAGE)
+        ASH_LOGGER.debug(f"Loaded internal plugin module: {BUILTIN_PLUGIN_PACKAGE}")
 
-            if hasattr(module, "ASH_REPORTERS"):
-                ASH_LOGGER.debug(
-                    f"Found {len(module.ASH_REPORTERS)} reporters in {module_name}"
+        manifest = load_plugin_manifest()
+        if manifest is not None:
+            ash_plugin_manager.register_plugin_manifest(
+                manifest, plugin_module_version=_builtin_plugin_version()
+            )
+            for section in PLUGIN_TYPE_SECTIONS.values():
+                loaded_plugins[section].extend(
+                    entry["name"] for entry in manifest.get(section, [])
                 )
-                loaded_plugins["reporters"].extend(module.ASH_REPORTERS)
+        else:
+            ASH_LOGGER.debug(
+                "Built-in plugin manifest not found, importing all built-in plugins"
+            )
+            loaded_plugins["converters"].extend(
+                plugin.__name__ for plugin in module.ASH_CONVERTERS
+            )
+            loaded_plugins["scanners"].extend(
+                plugin.__name__ for plugin in module.ASH_SCANNERS
+            )
+            loaded_plugins["reporters"].extend(
+                plugin.__name__ for plugin in module.ASH_REPORTERS
+            )
+        for section, names in loaded_plugins.items():
+            ASH_LOGGER.debug(
+                f"Found {len(names)} {section} in {BUILTIN_PLUGIN_PACKAGE}"
+            )
 
-            # Register event handlers
-            if hasattr(module, "ASH_EVENT_HANDLERS"):
+        # Register event handlers
+        ASH_LOGGER.debug(
+            f"Found event handlers in {BUILTIN_PLUGIN_PACKAGE}: {list(module.ASH_EVENT_HANDLERS.keys())}"
+        )
+        for event_type, handlers in module.ASH_EVENT_HANDLERS.items():
+            for callback in handlers:
                 ASH_LOGGER.debug(
-                    f"Found event handlers in {module_name}: {list(module.ASH_EVENT_HANDLERS.keys())}"
+                    f"Registering event callback {callback.__name__} for {event_type}"
                 )
-                for event_type, handlers in module.ASH_EVENT_HANDLERS.items():
-                    for callback in handlers:
-                        ASH_LOGGER.debug(
-                            f"Registering event callback {callback.__name__} for {event_type}"
-                        )
-                        ash_plugin_manager.subscribe(event_type, callback)
+                ash_plugin_manager.subscribe(event_type, callback)
 
-        except ImportError as e:
-            ASH_LOGGER.warning(f"Failed to import internal module {module_name}: {e}")
+    except ImportError as e:
+        ASH_LOGGER.warning(
+            f"Failed to import internal module {BUILTIN_PLUGIN_PACKAGE}: {e}"
+        )
 
     return loaded_plugins
 
@@ -129,7 +158,9 @@ def load_plugins(plugin_context=None) -> Dict[str, List[Any]]:
         plugin_context: Optional plugin context containing configuration
 
     Returns:
-        Dict[str, List[Any]]: Dictionary containing lists of loaded plugins by type
+        Dict[str, List[Any]]: Dictionary containing lists of loaded plugins by type.
+            Built-in plugins are listed by name; use
+            ``ash_plugin_manager.plugin_modules`` to get plugin classes.
     """
     # Extract additional plugin modules from context if available
     additional_plugin_modules = []
@@ -0,0 +1,132 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Manifest of the built-in ASH plugins.
+
+The manifest records each built-in plugin's name, type, module path and
+config schema so the plugin manager can register the plugins without
+importing them. Regenerate it after adding, removing or renaming a built-in
+plugin or its config class:
+
+    python -m automated_security_helper.plugins.manifest
+"""
+
+import json
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Optional, get_args
+
+from automated_security_helper.utils.log import ASH_LOGGER
+
+BUILTIN_PLUGIN_PACKAGE = "automated_security_helper.plugin_modules.ash_builtin"
+PLUGIN_MANIFEST_PATH = (
+    Path(__file__).parent.parent
+    / "plugin_modules"
+    / "ash_builtin"
+    / "plugin_manifest.json"
+)
+PLUGIN_MANIFEST_VERSION = 1
+
+# Manifest section name for each plugin type, in registration order.
+PLUGIN_TYPE_SECTIONS = {
+    "converter": "converters",
+    "scanner": "scanners",
+    "reporter": "reporters",
+}
+
+
+def _get_config_class(plugin_class: type) -> Optional[type]:
+    """Return the plugin-specific config class declared on a plugin's config field."""
+    config_field = getattr(plugin_class, "model_fields", {}).get("config")
+    if config_field is None:
+        return None
+    for candidate in get_args(config_field.annotation) or (config_field.annotation,):
+        if (
+            isinstance(candidate, type)
+            and "name" in getattr(candidate, "model_fields", {})
+            and not candidate.__name__.endswith("PluginConfigBase")
+        ):
+            return candidate
+    return None
+
+
+def _manifest_entry(plugin_class: type) -> Dict[str, Any]:
+    """Describe a single plugin class for the manifest."""
+    entry = {
+        "name": plugin_class.__name__,
+        "plugin_module_path": plugin_class.__module__,
+        "config_name": None,
+        "config_class": None,
+        "default_enabled": True,
+    }
+    config_class = _get_config_class(plugin_class)
+    if config_class is not None:
+        fields = config_class.model_fields
+        entry["config_name"] = fields["name"].default
+        entry["config_class"] = f"{config_class.__module__}:{config_class.__name__}"
+        if "enabled" in fields:
+            entry["default_enabled"] = bool(fields["enabled"].default)
+        if "extension" in fields:
+            entry["extension"] = fields["extension"].default
+    return entry
+
+
+def generate_plugin_manifest() -> Dict[str, Any]:
+    """Build the manifest by importing every built-in plugin.
+
+    Returns:
+        The manifest as a JSON-serializable dictionary
+    """
+    import importlib
+
+    manifest: Dict[str, Any] = {"manifest_version": PLUGIN_MANIFEST_VERSION}
+    for plugin_type, section in PLUGIN_TYPE_SECTIONS.items():
+        # nosemgrep: python.lang.security.audit.non-literal-import.non-literal-import
+        package = importlib.import_module(f"{BUILTIN_PLUGIN_PACKAGE}.{section}")
+        entries: List[Dict[str, Any]] = []
+        for export_name in package.__all__:
+            plugin_class = getattr(package, export_name)
+            if getattr(plugin_class, "ash_plugin_type", None) != plugin_type:
+                continue
+            entries.append(_manifest_entry(plugin_class))
+        manifest[section] = entries
+    return manifest
+
+
+def write_plugin_manifest(path: Path = PLUGIN_MANIFEST_PATH) -> Path:
+    """Generate the manifest and write it to ``path``.
+
+    Args:
+        path: Destination of the manifest file
+
+    Returns:
+        The path the manifest was written to
+    """
+    manifest = generate_plugin_manifest()
+    path.write_text(json.dumps(manifest, indent=2) + "\n", encoding="utf-8")
+    return path
+
+
+@lru_cache(maxsize=1)
+def load_plugin_manifest() -> Optional[Dict[str, Any]]:
+    """Read the built-in plugin manifest.
+
+    Returns:
+        The manifest, or None if it is missing, unreadable or was written by an
+        incompatible version of ASH
+    """
+    try:
+        manifest = json.loads(PLUGIN_MANIFEST_PATH.read_text(encoding="utf-8"))
+    except (OSError, ValueError) as e:
+        ASH_LOGGER.debug(f"Built-in plugin manifest unavailable: {e}")
+        return None
+    if manifest.get("manifest_version") != PLUGIN_MANIFEST_VERSION:
+        ASH_LOGGER.debug(
+            f"Ignoring built-in plugin manifest with version {manifest.get('manifest_version')}"
+        )
+        return None
+    return manifest
+
+
+if __name__ == "__main__":
+    print(f"Wrote {write_plugin_manifest()}")
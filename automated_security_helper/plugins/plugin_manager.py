@@ -146,23 +146,18 @@ class AshPluginManager(BaseModel):
                 f"ash-default is a protected plugin_module_name. Plugin module at path '{plugin_module_path}' should register with a different name."
             )
             return
-        elif (
-            (
-                plugin_type == "converter"
-                and plugin_module_name in self.plugin_library.converters
-            )
-            or (
-                plugin_type == "scanner"
-                and plugin_module_name in self.plugin_library.scanners
-            )
-            or (
-                plugin_type == "reporter"
-                and plugin_module_name in self.plugin_library.reporters
-            )
-        ):
-            ASH_LOGGER.warning(
-                f"Plugin module '{plugin_module_name}' already registered. Skipping."
-            )
+
+        registrations = self._registrations(plugin_type)
+        existing = (
+            registrations.get(plugin_module_name) if registrations is not None else None
+        )
+        if existing is not None:
+            # Built-in plugins are registered from the manifest before their
+            # module is imported; the decorator firing on import is expected.
+            if existing.plugin_module_path != plugin_module_path:
+                ASH_LOGGER.warning(
+                    f"Plugin module '{plugin_module_name}' already registered. Skipping."
+                )
             return
 
         plug_reg = AshPluginRegistration(
@@ -171,15 +166,37 @@ class AshPluginManager(BaseModel):
             version=plugin_module_version,
             enabled=plugin_module_enabled,
         )
-        if plugin_type == "converter":
-            self.plugin_library.converters[plugin_module_name] = plug_reg
-        elif plugin_type == "scanner":
-            self.plugin_library.scanners[plugin_module_name] = plug_reg
-        elif plugin_type == "reporter":
-            self.plugin_library.reporters[plugin_module_name] = plug_reg
+        if registrations is not None:
+            registrations[plugin_module_name] = plug_reg
+            self._resolved_plugins.pop(plugin_type, None)
 
         ASH_LOGGER.verbose(f"Registered plugin module '{plugin_module_name}'")
 
+    def register_plugin_manifest(
+        self, manifest: Dict[str, Any], plugin_module_version: str | None = None
+    ):
+        """Register every plugin listed in a plugin manifest without importing it.
+
+        Plugin modules are imported when the plugins are first requested via
+        ``plugin_modules`` or ``get_plugin_module``.
+
+        Args:
+            manifest: Manifest as produced by ``plugins.manifest.generate_plugin_manifest``
+            plugin_module_version: Version to record for the registered plugins
+        """
+        from automated_security_helper.plugins.manifest import PLUGIN_TYPE_SECTIONS
+
+        for plugin_type, section in PLUGIN_TYPE_SECTIONS.items():
+            registrations = self._registrations(plugin_type)
+            for entry in manifest.get(section, []):
+                if entry["name"] in registrations:
+                    continue
+                registrations[entry["name"]] = AshPluginRegistration(
+                    version=plugin_module_version,
+                    **entry,
+                )
+            self._resolved_plugins.pop(plugin_type, None)
+
     def filter_plugin_modules(self, items: List, callback: Callable, *args, **kwargs):
         filtered = []
         for item in items:
@@ -187,6 +204,94 @@ class AshPluginManager(BaseModel):
                 filtered.append(item)
         return filtered
 
+    def _registrations(
+        self, plugin_type: str
+    ) -> Dict[str, AshPluginRegistration] | None:
+        """Return the registration dictionary for a plugin type."""
+        if plugin_type == "converter":
+            return self.plugin_library.converters
+        if plugin_type == "scanner":
+            return self.plugin_library.scanners
+        if plugin_type == "reporter":
+            return self.plugin_library.reporters
+        return None
+
+    def _import_plugin_classes(
+        self, plugin_type: str, registration: AshPluginRegistration
+    ) -> List[type]:
+        """Import a registration's module and return its plugin classes.
+
+        Args:
+            plugin_type: The type of plugin the registration was made for
+            registration: The plugin registration to import
+
+        Returns:
+            The registered plugin class if the module defines it, otherwise every
+            plugin class of ``plugin_type`` found in the module
+        """
+        import importlib
+
+        try:
+            # nosemgrep: python.lang.security.audit.non-literal-import.non-literal-import
+            module = importlib.import_module(registration.plugin_module_path)
+        except ImportError as e:
+            ASH_LOGGER.warning(
+                f"Failed to import plugin module {registration.plugin_module_path}: {e}"
+            )
+            return []
+
+        registered_class = getattr(module, registration.name, None)
+        if (
+            isinstance(registered_class, type)
+            and getattr(registered_class, "ash_plugin_type", None) == plugin_type
+        ):
+            return [registered_class]
+
+        # Find the plugin classes in the module
+        found = []
+        for attr_name in dir(module):
+            attr = getattr(module, attr_name)
+            if (
+                isinstance(attr, type)
+                and hasattr(attr, "ash_plugin_type")
+                and attr.ash_plugin_type == plugin_type
+            ):
+                found.append(attr)
+        return found
+
+    def get_plugin_module(
+        self,
+        plugin_type: Literal["converter", "scanner", "reporter"],
+        name: str,
+    ):
+        """Get a single plugin class, importing only the module that defines it.
+
+        Args:
+            plugin_type: The type of plugin to get
+            name: The plugin's class name or config name (e.g. ``SarifReporter`` or ``sarif``)
+
+        Returns:
+            The plugin class, or None if no enabled plugin matches ``name``
+        """
+        registrations = self._registrations(plugin_type)
+        if registrations is None:
+            ASH_LOGGER.warning(f"Unknown plugin type: {plugin_type}")
+            return None
+
+        lookup = name.lower()
+        for registration in registrations.values():
+            if not registration.enabled:
+                continue
+            config_name = getattr(registration, "config_name", None)
+            if registration.name.lower() != lookup and (
+                config_name is None or config_name.lower() != lookup
+            ):
+                continue
+            for plugin_class in self._import_plugin_classes(plugin_type, registration):
+                if plugin_class.__name__ == registration.name:
+                    return plugin_class
+        return None
+
     def plugin_modules(
         self,
         plugin_type: Literal["converter", "scanner", "reporter"],
@@ -203,8 +308,6 @@ class AshPluginManager(BaseModel):
         Returns:
             List of plugin class implementations (not registration objects)
         """
-        import importlib
-
         # Normalize plugin_type to a string key
         cache_key = plugin_type if isinstance(plugin_type, str) else None
         if cache_key is None:
@@ -215,88 +318,23 @@ class AshPluginManager(BaseModel):
             cached = self._resolved_plugins[cache_key]
             return self.filter_plugin_modules(cached, filter_callback, *args, **kwargs)
 
-        plugins = []
-
-        # Get all registered plugins (internal and external)
-        if plugin_type == "converter":
-            # Add registered converters
-            for name, registration in self.plugin_library.converters.items():
-                if registration.enabled:
-                    try:
-                        # nosemgrep: python.lang.security.audit.non-literal-import.non-literal-import
-                        module = importlib.import_module(
-                            registration.plugin_module_path
-                        )
-                        # Find the plugin class in the module
-                        for attr_name in dir(module):
-                            attr = getattr(module, attr_name)
-                            if (
-                                isinstance(attr, type)
-                                and hasattr(attr, "ash_plugin_type")
-                                and attr.ash_plugin_type == "converter"
-                            ):
-                                if attr not in plugins:  # Avoid duplicates
-                                    plugins.append(attr)
-                    except ImportError as e:
-                        ASH_LOGGER.warning(
-                            f"Failed to import plugin module {registration.plugin_module_path}: {e}"
-                        )
-
-        elif plugin_type == "scanner":
-            # Add registered scanners
-            for name, registration in self.plugin_library.scanners.items():
-                if registration.enabled:
-                    try:
-                        # nosemgrep: python.lang.security.audit.non-literal-import.non-literal-import
-                        module = importlib.import_module(
-                            registration.plugin_module_path
-                        )
-                        # Find the plugin class in the module
-                        for attr_name in dir(module):
-                            attr = getattr(module, attr_name)
-                            if (
-                                isinstance(attr, type)
-                                and hasattr(attr, "ash_plugin_type")
-                                and attr.ash_plugin_type == "scanner"
-                            ):
-                                if attr not in plugins:  # Avoid duplicates
-                                    plugins.append(attr)
-                    except ImportError as e:
-                        ASH_LOGGER.warning(
-                            f"Failed to import plugin module {registration.plugin_module_path}: {e}"
-                        )
-
-        elif plugin_type == "reporter":
-            # Add registered reporters
-            for name, registration in self.plugin_library.reporters.items():
-                if registration.enabled:
-                    try:
-                        # nosemgrep: python.lang.security.audit.non-literal-import.non-literal-import
-                        module = importlib.import_module(
-                            registration.plugin_module_path
-                        )
-                        # Find the plugin class in the module
-                        for attr_name in dir(module):
-                            attr = getattr(module, attr_name)
-                            if (
-                                isinstance(attr, type)
-                                and hasattr(attr, "ash_plugin_type")
-                                and attr.ash_plugin_type == "reporter"
-                            ):
-                                if attr not in plugins:  # Avoid duplicates
-                                    plugins.append(attr)
-                    except ImportError as e:
-                        ASH_LOGGER.warning(
-                            f"Failed to import plugin module {registration.plugin_module_path}: {e}"
-                        )
-        else:
+        registrations = self._registrations(plugin_type)
+        if registrations is None:
             # If we get here, we don't know what to do with this plugin type
             ASH_LOGGER.warning(f"Unknown plugin type: {plugin_type}")
             return []
 
+        # Get all registered plugins (internal and external)
+        plugins = []
+        for registration in list(registrations.values()):
+            if not registration.enabled:
+                continue
+            for plugin_class in self._import_plugin_classes(plugin_type, registration):
+                if plugin_class not in plugins:  # Avoid duplicates
+                    plugins.append(plugin_class)
+
         # Cache the unfiltered result so repeat calls skip the import work
-        if cache_key:
-            self._resolved_plugins[cache_key] = plugins
+        self._resolved_plugins[cache_key] = plugins
 
         # Apply filter callback
         return self.filter_plugin_modules(plugins, filter_callback, *args, **kwargs)
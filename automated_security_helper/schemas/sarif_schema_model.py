@@ -15,7 +15,7 @@ import json
 from pathlib import Path, PurePosixPath
 from typing import Dict, List, Literal, Optional, Union
 
-from pydantic import AnyUrl, BaseModel, ConfigDict, Field, RootModel
+from pydantic import AnyUrl, BaseModel, ConfigDict, Field, PrivateAttr, RootModel
 
 
 class Version(str, Enum):
@@ -109,6 +109,9 @@ class PropertyBag(BaseModel):
         min_length=0,
     )
 
+    # Set by mask_secrets_in_sarif. Private, so it is never written to reports.
+    _secrets_masked: bool = PrivateAttr(default=False)
+
 
 class DeprecatedGuid(RootModel):
     root: str = Field(
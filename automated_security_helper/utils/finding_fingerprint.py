@@ -0,0 +1,30 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Location-aware fingerprints of findings.
+
+Shared by the findings history and results diffs, so a finding gets the same
+fingerprint whether it is read from a FlatVulnerability or from plain JSON.
+"""
+
+import hashlib
+from typing import Optional
+
+
+def location_fingerprint(
+    finding_id: str,
+    file_path: Optional[str],
+    code_snippet: Optional[str],
+    line_start: Optional[int],
+) -> str:
+    """Return a stable fingerprint of a finding from its id and location.
+
+    The fingerprint combines the finding id (scanner, rule and message) with
+    the file and the code snippet. Line numbers are only used when there is
+    no snippet, so a finding keeps its fingerprint when code above it moves.
+    """
+    anchor = " ".join(code_snippet.split()) if code_snippet else ""
+    if not anchor and line_start is not None:
+        anchor = str(line_start)
+    key = "\0".join((finding_id, file_path or "", anchor))
+    return hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
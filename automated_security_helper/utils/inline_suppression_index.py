@@ -0,0 +1,212 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Index of inline suppression comments, built once per run.
+
+The index maps each file and line to the rule IDs suppressed there with
+``ash-ignore`` comments, so applying inline suppressions is a dict lookup per
+finding. Files are only parsed when they contain the ``ash-ignore`` marker.
+The parsed directives are cached by content digest under the output
+directory, and a file whose size and modification time have not changed since
+the previous run is not read at all.
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Tuple
+
+from automated_security_helper.utils.log import ASH_LOGGER
+from automated_security_helper.utils.suppression_matcher import (
+    InlineSuppression,
+    parse_inline_suppressions,
+)
+
+CACHE_SCHEMA_VERSION = 1
+
+# Inline directives are matched case-insensitively, so the marker is too.
+_MARKER_PATTERN = re.compile(rb"ash-ignore", re.IGNORECASE)
+
+_build_lock = threading.Lock()
+
+
+def _file_key(file_path: Path | str) -> str:
+    return os.path.normpath(os.path.abspath(file_path))
+
+
+class InlineSuppressionIndex:
+    """Inline suppressions keyed by file, then by ``(line, lower-case rule ID)``.
+
+    Files that were not part of the initial build are indexed on first lookup.
+    """
+
+    def __init__(self, cache_file: Path | None = None) -> None:
+        self.cache_file = cache_file
+        self._lock = threading.Lock()
+        self._files: Dict[str, Dict[Tuple[int, str], InlineSuppression]] = {}
+        # Persisted state: path -> [size, mtime_ns, digest], and
+        # digest -> [[line, rule_id, reason], ...] for files with directives.
+        self._stats: Dict[str, List[Any]] = {}
+        self._directives: Dict[str, List[List[Any]]] = {}
+        self._load_cache()
+
+    def _load_cache(self) -> None:
+        if self.cache_file is None or not self.cache_file.exists():
+            return
+        try:
+            data = json.loads(self.cache_file.read_text(encoding="utf-8"))
+            if data.get("schema_version") == CACHE_SCHEMA_VERSION:
+                self._stats = data["files"]
+                self._directives = data["directives"]
+        except (OSError, ValueError, KeyError) as e:
+            ASH_LOGGER.debug(f"Ignoring unreadable inline suppression cache: {e}")
+
+    def save(self) -> None:
+        """Write the parsed directives for the indexed files to the cache file."""
+        if self.cache_file is None:
+            return
+        with self._lock:
+            stats = {
+                path: self._stats[path] for path in self._files if path in self._stats
+            }
+            digests = {stat[2] for stat in stats.values()}
+            data = {
+                "schema_version": CACHE_SCHEMA_VERSION,
+                "files": stats,
+                "directives": {
+                    digest: directives
+                    for digest, directives in self._directives.items()
+                    if digest in digests
+                },
+            }
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = self.cache_file.with_suffix(f".{os.getpid()}.tmp")
+            tmp_file.write_text(json.dumps(data), encoding="utf-8")
+            os.replace(tmp_file, self.cache_file)
+        except OSError as e:
+            ASH_LOGGER.debug(f"Failed to write inline suppression cache: {e}")
+
+    def _read_directives(self, key: str) -> List[List[Any]]:
+        """Return the ``[line, rule_id, reason]`` directives in a file."""
+        try:
+            stat = os.stat(key)
+        except OSError:
+            return []
+        with self._lock:
+            cached = self._stats.get(key)
+        if cached is not None and cached[:2] == [stat.st_size, stat.st_mtime_ns]:
+            return self._directives.get(cached[2], [])
+
+        if stat.st_size == 0:
+            return []
+        try:
+            with (
+                open(key, "rb") as f,
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped,
+            ):
+                digest = hashlib.blake2b(mapped, digest_size=16).hexdigest()
+                has_marker = (
+                    digest in self._directives
+                    or _MARKER_PATTERN.search(mapped) is not None
+                )
+                content = mapped[:] if has_marker else b""
+        except (OSError, ValueError) as e:
+            ASH_LOGGER.debug(f"Could not read {key} for inline suppressions: {e}")
+            return []
+
+        with self._lock:
+            directives = self._directives.get(digest)
+        if directives is None:
+            directives = []
+            if has_marker:
+                directives = [
+                    [s.line_number, s.rule_id, s.reason]
+                    for s in parse_inline_suppressions(
+                        content.decode("utf-8", errors="replace")
+                    )
+                ]
+        with self._lock:
+            self._stats[key] = [stat.st_size, stat.st_mtime_ns, digest]
+            if directives:
+                self._directives[digest] = directives
+        return directives
+
+    def _index_file(self, key: str) -> Dict[Tuple[int, str], InlineSuppression]:
+        entries: Dict[Tuple[int, str], InlineSuppression] = {}
+        for line, rule_id, reason in self._read_directives(key):
+            # The first directive for a rule on a line wins, as in a file scan.
+            entries.setdefault(
+                (line, rule_id.lower()),
+                InlineSuppression(line_number=line, rule_id=rule_id, reason=reason),
+            )
+        with self._lock:
+            return self._files.setdefault(key, entries)
+
+    def build(
+        self, file_paths: Iterable[Path | str], max_workers: int | None = None
+    ) -> None:
+        """Index ``file_paths`` in parallel."""
+        keys = [
+            key
+            for key in dict.fromkeys(map(_file_key, file_paths))
+            if key not in self._files
+        ]
+        if not keys:
+            return
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for _ in executor.map(self._index_file, keys):
+                pass
+
+    def lookup(
+        self, file_path: Path | str, line: int, rule_id: str
+    ) -> InlineSuppression | None:
+        """Return the inline suppression for ``rule_id`` at ``line``, if any."""
+        key = _file_key(file_path)
+        entries = self._files.get(key)
+        if entries is None:
+            entries = self._index_file(key)
+        return entries.get((line, rule_id.lower()))
+
+
+def get_inline_suppression_index(plugin_context) -> InlineSuppressionIndex:
+    """Return the run's inline suppression index, building it on first use.
+
+    The index is built over the scan set and stored on ``plugin_context``, so
+    every scanner and report phase in a run shares it.
+    """
+    with _build_lock:
+        index = getattr(plugin_context, "_inline_suppression_index", None)
+        if isinstance(index, InlineSuppressionIndex):
+            return index
+        index = InlineSuppressionIndex()
+        source_dir = getattr(plugin_context, "source_dir", None)
+        output_dir = getattr(plugin_context, "output_dir", None)
+        if not (
+            isinstance(source_dir, Path)
+            and isinstance(output_dir, Path)
+            and source_dir.is_dir()
+        ):
+            plugin_context._inline_suppression_index = index
+            return index
+        try:
+            from automated_security_helper.utils.get_scan_set import scan_set
+
+            index = InlineSuppressionIndex(
+                cache_file=output_dir.joinpath(
+                    "cache", "inline_suppressions", "index.json"
+                )
+            )
+            index.build(scan_set(source=source_dir, output=output_dir))
+            index.save()
+        except Exception as e:
+            ASH_LOGGER.debug(
+                f"Failed to pre-build inline suppression index, indexing files on demand: {e}"
+            )
+        plugin_context._inline_suppression_index = index
+        return index
@@ -0,0 +1,95 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Helpers for writing indented JSON documents incrementally.
+
+The output of these helpers is byte-for-byte identical to ``json.dumps`` with
+the same ``indent``, so reporters can stream large arrays of findings to a
+file handle one item at a time without changing the report format.
+"""
+
+import json
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+
+def dumps_nested(
+    value: Any,
+    indent: int = 2,
+    level: int = 0,
+    default: Optional[Callable[[Any], Any]] = None,
+) -> str:
+    """Serialize a value as it would appear nested ``level`` deep in a document.
+
+    Args:
+        value: JSON-serializable value
+        indent: Number of spaces per indentation level
+        level: Nesting depth of the value within the enclosing document
+        default: Fallback serializer passed through to ``json.dumps``
+
+    Returns:
+        The serialized value; every line after the first is indented to ``level``
+    """
+    serialized = json.dumps(value, indent=indent, default=default)
+    if level == 0:
+        return serialized
+    # Strings never contain raw newlines in JSON, so re-indenting whole lines
+    # is equivalent to serializing the value inside its parent.
+    return serialized.replace("\n", "\n" + " " * (indent * level))
+
+
+def iter_json_array(
+    items: Iterable[Any],
+    indent: int = 2,
+    level: int = 0,
+    default: Optional[Callable[[Any], Any]] = None,
+) -> Iterator[str]:
+    """Yield chunks of a JSON array without materializing the list.
+
+    Args:
+        items: Iterable of JSON-serializable values, consumed lazily
+        indent: Number of spaces per indentation level
+        level: Nesting depth of the array within the enclosing document
+        default: Fallback serializer passed through to ``json.dumps``
+
+    Yields:
+        Chunks that concatenate to ``json.dumps(list(items), indent=indent)``
+    """
+    return iter_encoded_json_array(
+        (
+            dumps_nested(item, indent=indent, level=level + 1, default=default)
+            for item in items
+        ),
+        indent=indent,
+        level=level,
+    )
+
+
+def iter_encoded_json_array(
+    encoded_items: Iterable[str],
+    indent: int = 2,
+    level: int = 0,
+) -> Iterator[str]:
+    """Yield chunks of a JSON array from items that are already serialized.
+
+    Use this when each item has to be serialized individually, for example to
+    skip items that fail to serialize. Items must have been serialized with
+    ``dumps_nested`` at ``level + 1``.
+
+    Args:
+        encoded_items: Iterable of serialized items, consumed lazily
+        indent: Number of spaces per indentation level
+        level: Nesting depth of the array within the enclosing document
+
+    Yields:
+        Chunks of the JSON array
+    """
+    item_prefix = "\n" + " " * (indent * (level + 1))
+    first = True
+    for encoded in encoded_items:
+        yield ("[" if first else ",") + item_prefix
+        yield encoded
+        first = False
+    if first:
+        yield "[]"
+    else:
+        yield "\n" + " " * (indent * level) + "]"
@@ -0,0 +1,45 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Module-level lazy exports for packages (PEP 562).
+
+A package ``__init__`` that re-exports classes from its submodules normally
+imports every submodule as soon as any one of them is imported. Packages that
+use ``lazy_exports`` keep the same public names but only import the submodule
+that defines a name when that name is first accessed.
+"""
+
+import importlib
+from typing import Any, Callable, Dict, List, Tuple
+
+
+def lazy_exports(
+    package_name: str,
+    package_globals: Dict[str, Any],
+    exports: Dict[str, Tuple[str, str]],
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """Build ``__getattr__`` and ``__dir__`` functions for a package.
+
+    Args:
+        package_name: The package's ``__name__``
+        package_globals: The package's ``globals()``; resolved names are cached here
+        exports: Mapping of exported name to ``(submodule, attribute)``
+
+    Returns:
+        The ``__getattr__`` and ``__dir__`` functions to assign in the package
+    """
+
+    def __getattr__(name: str) -> Any:
+        if name not in exports:
+            raise AttributeError(f"module {package_name!r} has no attribute {name!r}")
+        submodule, attribute = exports[name]
+        # nosemgrep: python.lang.security.audit.non-literal-import.non-literal-import
+        module = importlib.import_module(f"{package_name}.{submodule}")
+        value = getattr(module, attribute)
+        package_globals[name] = value
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(package_globals) | set(exports))
+
+    return __getattr__, __dir__
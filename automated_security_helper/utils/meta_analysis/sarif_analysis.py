@@ -5,8 +5,10 @@
 
 import json
 import os
-from typing import Dict, List, Set, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
+from automated_security_helper.utils.log import ASH_LOGGER
 from automated_security_helper.utils.meta_analysis import SCANNER_NAME_MAP
 
 
@@ -122,24 +124,64 @@ def extract_result_summary(result: Dict) -> Dict:
 # ---------------------------------------------------------------------------
 
 
+# Below this many matched pairs, starting a process pool costs more than the
+# field comparison it would spread out, so the comparison stays serial.
+PARALLEL_COMPARE_MIN_PAIRS = 500
+
+
+def _compare_result_pair(pair: Tuple[Dict, Dict]) -> List[Dict]:
+    """Compare one (original, aggregated) result pair; a process pool target."""
+    from automated_security_helper.utils.meta_analysis.field_mapping import (
+        compare_result_fields,
+    )
+
+    return compare_result_fields(*pair)
+
+
+def _compare_result_pairs(
+    pairs: List[Tuple[Dict, Dict]], workers: Optional[int]
+) -> Iterable[List[Dict]]:
+    """Compare result pairs in order.
+
+    A process pool is used when workers > 1 and there are at least
+    PARALLEL_COMPARE_MIN_PAIRS pairs.
+    """
+    if not workers or workers <= 1 or len(pairs) < PARALLEL_COMPARE_MIN_PAIRS:
+        return map(_compare_result_pair, pairs)
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            chunksize = max(1, len(pairs) // (workers * 4))
+            return list(executor.map(_compare_result_pair, pairs, chunksize=chunksize))
+    except Exception as e:
+        ASH_LOGGER.warning(
+            f"Parallel field comparison failed ({e}), comparing serially"
+        )
+        return map(_compare_result_pair, pairs)
+
+
 def validate_sarif_aggregation(
-    original_reports: Dict[str, Dict], aggregated_report: Dict
+    original_reports: Dict[str, Dict],
+    aggregated_report: Dict,
+    workers: Optional[int] = None,
 ) -> Dict:
     """
     Validate that all important fields from original scanner reports
     are preserved in the aggregated report.
 
+    Original results are matched against an index of the aggregated results
+    (see AggregatedResultIndex), so matching is roughly linear in the number
+    of results.
+
     Args:
         original_reports: Dict mapping scanner names to their SARIF reports
         aggregated_report: The combined ASH SARIF report
+        workers: Number of processes used to compare the fields of matched
+            results. None or 1 compares them in this process, as do runs
+            with fewer than PARALLEL_COMPARE_MIN_PAIRS matched results.
 
     Returns:
         Dict with validation results and statistics
     """
-    from automated_security_helper.utils.meta_analysis.field_mapping import (
-        compare_result_fields,
-    )
-
     validation_results = {
         "missing_fields": {},
         "match_statistics": {},
@@ -161,6 +203,10 @@ def validate_sarif_aggregation(
         and aggregated_report["runs"][0].get("results")
     ):
         agg_results = aggregated_report["runs"][0]["results"]
+    agg_index = AggregatedResultIndex(agg_results)
+
+    # Matched (scanner name, original result, aggregated result), compared below
+    matched_pairs: List[Tuple[str, Dict, Dict]] = []
 
     # For each scanner's report
     for scanner_name, original_report in original_reports.items():
@@ -198,27 +244,16 @@ def validate_sarif_aggregation(
             validation_results["summary"]["total_findings"] += 1
 
             # Find matching result in aggregated report
-            matched_result = find_matching_result(orig_result, agg_results)
+            matched_result = agg_index.find(orig_result)
 
             if matched_result:
                 validation_results["match_statistics"][normalized_scanner_name][
                     "matched_results"
                 ] += 1
                 validation_results["summary"]["matched_findings"] += 1
-
-                # Compare fields between original and matched result
-                missing_fields = compare_result_fields(orig_result, matched_result)
-
-                # Categorize missing fields by importance
-                for field_info in missing_fields:
-                    importance = field_info["importance"]
-                    validation_results["missing_fields"][normalized_scanner_name][
-                        importance
-                    ].append(field_info)
-                    validation_results["match_statistics"][normalized_scanner_name][
-                        f"{importance}_fields_missing"
-                    ] += 1
-                    validation_results["summary"][f"{importance}_missing_fields"] += 1
+                matched_pairs.append(
+                    (normalized_scanner_name, orig_result, matched_result)
+                )
             else:
                 # Track unmatched results
                 if (
@@ -232,6 +267,24 @@ def validate_sarif_aggregation(
                     extract_result_summary(orig_result)
                 )
 
+    # Compare fields between each original result and its match
+    missing_fields_per_pair = _compare_result_pairs(
+        [(orig, matched) for _, orig, matched in matched_pairs], workers
+    )
+    for (normalized_scanner_name, _, _), missing_fields in zip(
+        matched_pairs, missing_fields_per_pair
+    ):
+        # Categorize missing fields by importance
+        for field_info in missing_fields:
+            importance = field_info["importance"]
+            validation_results["missing_fields"][normalized_scanner_name][
+                importance
+            ].append(field_info)
+            validation_results["match_statistics"][normalized_scanner_name][
+                f"{importance}_fields_missing"
+            ] += 1
+            validation_results["summary"][f"{importance}_missing_fields"] += 1
+
     # Calculate field preservation rates
     for scanner_name in validation_results["match_statistics"]:
         stats = validation_results["match_statistics"][scanner_name]
@@ -243,6 +296,106 @@ def validate_sarif_aggregation(
     return validation_results
 
 
+# ---------------------------------------------------------------------------
+# AggregatedResultIndex
+# ---------------------------------------------------------------------------
+
+# Largest start-line difference _line_ranges_compatible accepts for
+# overlapping ranges.
+_FUZZY_START_LINE_WINDOW = 5
+
+
+class AggregatedResultIndex:
+    """Hash index over aggregated results for find_matching_result lookups.
+
+    Results are bucketed by ``(ruleId, file path)`` and, within a bucket, by
+    start line. Results without a start line go to a fallback bucket that
+    matches any line range. A lookup only checks the exact start line, the
+    fuzzy window around it and the fallback bucket, and returns the same
+    result find_matching_result would: the first matching aggregated result
+    in report order.
+    """
+
+    def __init__(self, aggregated_results: List[Dict]):
+        self._results = aggregated_results
+        # (ruleId, file path) -> positions, start line -> positions, and
+        # positions of results without a start line
+        self._by_file: Dict[Tuple[Any, Any], List[int]] = {}
+        self._by_start: Dict[Tuple[Any, Any], Dict[int, List[int]]] = {}
+        self._no_start: Dict[Tuple[Any, Any], List[int]] = {}
+        self._ranges: List[Tuple[Any, Any]] = []
+        # (ruleId, analysisTarget uri) -> first position
+        self._by_target: Dict[Tuple[Any, Any], int] = {}
+        self._linear = False
+
+        try:
+            for position, agg_result in enumerate(aggregated_results):
+                rule_id = agg_result.get("ruleId")
+                location = extract_location_info(agg_result)
+                # locations_match treats every empty path as "no path"
+                key = (rule_id, location["file_path"] or None)
+                start, end = location["start_line"], location["end_line"]
+                self._ranges.append((start, end))
+                self._by_file.setdefault(key, []).append(position)
+                if start is None:
+                    self._no_start.setdefault(key, []).append(position)
+                else:
+                    self._by_start.setdefault(key, {}).setdefault(start, []).append(
+                        position
+                    )
+                target = agg_result.get("analysisTarget")
+                if target:
+                    self._by_target.setdefault((rule_id, target.get("uri")), position)
+        except TypeError:
+            # Unhashable rule IDs or paths: fall back to linear matching.
+            self._linear = True
+
+    def find(self, original_result: Dict) -> Optional[Dict]:
+        """Return the first aggregated result matching ``original_result``, or None."""
+        if self._linear:
+            return find_matching_result(original_result, self._results)
+
+        from automated_security_helper.utils.meta_analysis.locations_match import (
+            _line_ranges_compatible,
+        )
+
+        rule_id = original_result.get("ruleId")
+        location = extract_location_info(original_result)
+        key = (rule_id, location["file_path"] or None)
+        start, end = location["start_line"], location["end_line"]
+        candidates: List[int] = []
+
+        try:
+            if start is None:
+                # A missing start line is compatible with any line range.
+                if self._by_file.get(key):
+                    candidates.append(self._by_file[key][0])
+            else:
+                if self._no_start.get(key):
+                    candidates.append(self._no_start[key][0])
+                by_start = self._by_start.get(key, {})
+                for candidate_start in range(
+                    start - _FUZZY_START_LINE_WINDOW,
+                    start + _FUZZY_START_LINE_WINDOW + 1,
+                ):
+                    for position in by_start.get(candidate_start, ()):
+                        if _line_ranges_compatible(
+                            start, end, *self._ranges[position]
+                        ):
+                            candidates.append(position)
+                            break
+
+            target = original_result.get("analysisTarget")
+            if target:
+                position = self._by_target.get((rule_id, target.get("uri")))
+                if position is not None:
+                    candidates.append(position)
+        except TypeError:
+            return find_matching_result(original_result, self._results)
+
+        return self._results[min(candidates)] if candidates else None
+
+
 # ---------------------------------------------------------------------------
 # find_matching_result
 # ---------------------------------------------------------------------------
@@ -0,0 +1,474 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Offline npm dependency auditing from lock files.
+
+This module audits ``package-lock.json`` (lockfile versions 1-3), ``yarn.lock``
+(classic and Berry) and ``pnpm-lock.yaml`` without running a package manager.
+Resolved packages are matched against a local advisory snapshot, and the
+output has the same shape as ``npm audit --json``, so it can be converted to
+SARIF the same way.
+
+The advisory snapshot uses the response format of the npm registry's bulk
+advisory endpoint (``/-/npm/v1/security/advisories/bulk``), which is what
+``npm audit`` itself consumes: a mapping of package name to a list of
+advisories, each with ``id``, ``url``, ``title``, ``severity`` and
+``vulnerable_versions``, and optionally ``cwe`` and ``cvss``. The mapping may
+also be wrapped as ``{"advisories": {...}}`` alongside other metadata.
+
+Version ranges follow node-semver, except that pre-release versions are
+matched by their position in the version order. node-semver's rule that
+excludes pre-releases from ranges without a pre-release comparator is not
+applied, so pre-releases are reported conservatively.
+"""
+
+import json
+import math
+import re
+from bisect import bisect_right
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+import yaml
+
+LOCK_FILE_NAMES = ("package-lock.json", "yarn.lock", "pnpm-lock.yaml")
+
+_SEVERITIES = ("info", "low", "moderate", "high", "critical")
+
+_VERSION_PATTERN = re.compile(
+    r"^\s*[v=]*\s*(\d+)(?:\.(\d+)(?:\.(\d+)(?:-([0-9A-Za-z.-]+))?)?)?(?:\+[0-9A-Za-z.-]+)?\s*$"
+)
+_PARTIAL_PATTERN = re.compile(
+    r"^[v=]*(\d+|[xX*])(?:\.(\d+|[xX*]))?(?:\.(\d+|[xX*]))?(?:-([0-9A-Za-z.-]+))?(?:\+[0-9A-Za-z.-]+)?$"
+)
+_COMPARATOR_PATTERN = re.compile(r"^(<=|>=|<|>|=|\^|~>|~)?(.*)$")
+
+# A version key is (major, minor, patch, pre-release key). Releases sort
+# after their pre-releases, so the release key is (1,) and a pre-release
+# key is (0, *identifiers).
+VersionKey = Tuple[Any, ...]
+_RELEASE = (1,)
+MIN_KEY: VersionKey = (-1, 0, 0, (0,))
+MAX_KEY: VersionKey = (math.inf, 0, 0, _RELEASE)
+
+
+def _prerelease_key(prerelease: Optional[str]) -> Tuple[Any, ...]:
+    if not prerelease:
+        return _RELEASE
+    identifiers = []
+    for part in prerelease.split("."):
+        # Numeric identifiers sort before alphanumeric ones.
+        identifiers.append((0, int(part), "") if part.isdigit() else (1, 0, part))
+    return (0, *identifiers)
+
+
+def parse_version(version: str) -> Optional[VersionKey]:
+    """Return the sort key for a full ``major.minor.patch`` version, or None."""
+    match = _VERSION_PATTERN.match(version or "")
+    if match is None or match.group(3) is None:
+        return None
+    major, minor, patch, prerelease = match.groups()
+    return (int(major), int(minor), int(patch), _prerelease_key(prerelease))
+
+
+class Interval(NamedTuple):
+    """A contiguous range of versions."""
+
+    low: VersionKey
+    low_inclusive: bool
+    high: VersionKey
+    high_inclusive: bool
+
+    def contains(self, key: VersionKey) -> bool:
+        above = key > self.low or (self.low_inclusive and key == self.low)
+        below = key < self.high or (self.high_inclusive and key == self.high)
+        return above and below
+
+    def intersect(self, other: "Interval") -> Optional["Interval"]:
+        if (self.low, not self.low_inclusive) >= (other.low, not other.low_inclusive):
+            low, low_inclusive = self.low, self.low_inclusive
+        else:
+            low, low_inclusive = other.low, other.low_inclusive
+        if (self.high, self.high_inclusive) <= (other.high, other.high_inclusive):
+            high, high_inclusive = self.high, self.high_inclusive
+        else:
+            high, high_inclusive = other.high, other.high_inclusive
+        if low > high or (low == high and not (low_inclusive and high_inclusive)):
+            return None
+        return Interval(low, low_inclusive, high, high_inclusive)
+
+
+_ANY = Interval(MIN_KEY, True, MAX_KEY, True)
+
+
+def _partial(text: str) -> Optional[Tuple[List[Optional[int]], Optional[str]]]:
+    """Parse a possibly partial version, e.g. ``1``, ``1.2.x`` or ``1.2.3-rc.1``."""
+    if text in ("", "*", "x", "X"):
+        return [None, None, None], None
+    match = _PARTIAL_PATTERN.match(text)
+    if match is None:
+        return None
+    parts = [
+        None if p is None or p in ("x", "X", "*") else int(p)
+        for p in match.groups()[:3]
+    ]
+    # Anything after a wildcard is a wildcard too.
+    for i in range(1, 3):
+        if parts[i - 1] is None:
+            parts[i] = None
+    return parts, match.group(4)
+
+
+def _key(
+    major: int, minor: int = 0, patch: int = 0, prerelease: Optional[str] = None
+) -> VersionKey:
+    return (major, minor, patch, _prerelease_key(prerelease))
+
+
+def _next_key(parts: List[Optional[int]]) -> VersionKey:
+    """Return the first version above the partial version ``parts``."""
+    major, minor, _ = parts
+    if minor is None:
+        return _key(major + 1, 0, 0, "0")
+    return _key(major, minor + 1, 0, "0")
+
+
+def _comparator_interval(token: str) -> Optional[Interval]:
+    operator, text = _COMPARATOR_PATTERN.match(token).groups()
+    parsed = _partial(text.strip())
+    if parsed is None:
+        return None
+    parts, prerelease = parsed
+    major, minor, patch = parts
+    if major is None:
+        # "*", ">=*" etc. match everything; "<*" and ">*" match nothing.
+        return None if operator in ("<", ">") else _ANY
+    floor = _key(major, minor or 0, patch or 0, prerelease)
+    is_partial = patch is None
+
+    if operator in (None, "", "="):
+        if not is_partial:
+            return Interval(floor, True, floor, True)
+        return Interval(floor, True, _next_key(parts), False)
+    if operator == ">=":
+        return Interval(floor, True, MAX_KEY, True)
+    if operator == ">":
+        if is_partial:
+            return Interval(_next_key(parts), True, MAX_KEY, True)
+        return Interval(floor, False, MAX_KEY, True)
+    if operator == "<":
+        if is_partial:
+            # "<1.2" excludes 1.2.0's pre-releases too.
+            return Interval(MIN_KEY, True, _key(major, minor or 0, 0, "0"), False)
+        return Interval(MIN_KEY, True, floor, False)
+    if operator == "<=":
+        if is_partial:
+            return Interval(MIN_KEY, True, _next_key(parts), False)
+        return Interval(MIN_KEY, True, floor, True)
+    if operator in ("~", "~>"):
+        if minor is None:
+            return Interval(floor, True, _key(major + 1, 0, 0, "0"), False)
+        return Interval(floor, True, _key(major, minor + 1, 0, "0"), False)
+    # Caret: allow changes that do not modify the left-most non-zero part.
+    if major > 0 or minor is None:
+        return Interval(floor, True, _key(major + 1, 0, 0, "0"), False)
+    if minor > 0 or patch is None:
+        return Interval(floor, True, _key(0, minor + 1, 0, "0"), False)
+    return Interval(floor, True, _key(0, 0, patch + 1, "0"), False)
+
+
+def parse_range(range_text: str) -> List[Interval]:
+    """Convert a node-semver range into the intervals it matches.
+
+    Unparsable comparator sets are skipped, so an unparsable range matches
+    nothing rather than everything.
+    """
+    intervals = []
+    for comparator_set in (range_text or "").split("||"):
+        comparator_set = comparator_set.strip()
+        hyphen = re.match(r"^(\S+)\s+-\s+(\S+)$", comparator_set)
+        if hyphen:
+            low, high = hyphen.groups()
+            tokens = [f">={low}", f"<={high}"]
+        else:
+            # Join operators separated from their version, e.g. ">= 1.2.3".
+            comparator_set = re.sub(r"(<=|>=|<|>|=|\^|~>|~)\s+", r"\1", comparator_set)
+            tokens = comparator_set.split() or ["*"]
+        current: Optional[Interval] = _ANY
+        for token in tokens:
+            interval = _comparator_interval(token)
+            current = current.intersect(interval) if interval and current else None
+            if current is None:
+                break
+        if current is not None:
+            intervals.append(current)
+    return intervals
+
+
+@dataclass
+class ResolvedPackage:
+    """A package version installed according to a lock file."""
+
+    name: str
+    version: str
+    path: str
+
+
+class AdvisoryIndex:
+    """Advisories indexed by package name and vulnerable version interval.
+
+    For each package, intervals are sorted by lower bound and paired with a
+    running maximum of upper bounds. A lookup bisects to the last interval
+    starting at or below the version and walks back only while some earlier
+    interval can still reach it.
+    """
+
+    def __init__(self, advisories: Dict[str, List[Dict[str, Any]]]) -> None:
+        self._index: Dict[
+            str,
+            Tuple[
+                List[VersionKey],
+                List[VersionKey],
+                List[Tuple[Interval, Dict[str, Any]]],
+            ],
+        ] = {}
+        self.advisory_count = 0
+        for name, package_advisories in advisories.items():
+            entries = []
+            for advisory in package_advisories or []:
+                self.advisory_count += 1
+                if not advisory.get("vulnerable_versions"):
+                    continue
+                for interval in parse_range(advisory.get("vulnerable_versions", "")):
+                    entries.append((interval, advisory))
+            if not entries:
+                continue
+            entries.sort(key=lambda e: (e[0].low, not e[0].low_inclusive))
+            lows = [interval.low for interval, _ in entries]
+            max_highs: List[VersionKey] = []
+            for interval, _ in entries:
+                high = interval.high
+                max_highs.append(max(high, max_highs[-1]) if max_highs else high)
+            self._index[name] = (lows, max_highs, entries)
+
+    @classmethod
+    def from_file(cls, path: Path) -> "AdvisoryIndex":
+        """Load an advisory snapshot file."""
+        with open(path, mode="r", encoding="utf-8") as f:
+            data = json.load(f)
+        if isinstance(data, dict) and isinstance(data.get("advisories"), dict):
+            data = data["advisories"]
+        if not isinstance(data, dict):
+            raise ValueError(f"{path} is not an advisory snapshot")
+        return cls(data)
+
+    def match(self, name: str, version: str) -> List[Dict[str, Any]]:
+        """Return the advisories affecting ``name`` at ``version``."""
+        indexed = self._index.get(name)
+        key = parse_version(version)
+        if indexed is None or key is None:
+            return []
+        lows, max_highs, entries = indexed
+        matches: Dict[Any, Dict[str, Any]] = {}
+        for i in range(bisect_right(lows, key) - 1, -1, -1):
+            if max_highs[i] < key:
+                break
+            interval, advisory = entries[i]
+            if interval.contains(key):
+                matches.setdefault(advisory.get("id", id(advisory)), advisory)
+        return list(matches.values())
+
+
+def _package_name_from_path(path: str) -> str:
+    return path.rsplit("node_modules/", 1)[-1]
+
+
+def parse_package_lock(text: str) -> List[ResolvedPackage]:
+    """Parse a ``package-lock.json`` (or ``npm-shrinkwrap.json``)."""
+    data = json.loads(text)
+    packages: List[ResolvedPackage] = []
+    if isinstance(data.get("packages"), dict):
+        # Lockfile v2/v3: keys are install paths; "" is the root project and
+        # paths outside node_modules are workspace packages.
+        for path, info in data["packages"].items():
+            if "node_modules/" not in path or not isinstance(info, dict):
+                continue
+            if info.get("link") or not info.get("version"):
+                continue
+            name = info.get("name") or _package_name_from_path(path)
+            packages.append(ResolvedPackage(name, info["version"], path))
+        return packages
+
+    def walk(dependencies: Dict[str, Any], prefix: str) -> None:
+        for name, info in (dependencies or {}).items():
+            if not isinstance(info, dict):
+                continue
+            path = f"{prefix}node_modules/{name}"
+            version = info.get("version", "")
+            # Aliases are recorded as "npm:<real name>@<version>".
+            if version.startswith("npm:"):
+                name, _, version = version[4:].rpartition("@")
+            if version and not version.startswith(("file:", "link:", "git")):
+                packages.append(ResolvedPackage(name, version, path))
+            walk(info.get("dependencies"), f"{path}/")
+
+    # Lockfile v1 nests each package's private dependencies.
+    walk(data.get("dependencies"), "")
+    return packages
+
+
+def _name_from_spec(spec: str) -> str:
+    spec = spec.strip().strip('"')
+    at = spec.find("@", 1)
+    return spec if at == -1 else spec[:at]
+
+
+def parse_yarn_lock(text: str) -> List[ResolvedPackage]:
+    """Parse a classic (v1) or Berry (v2+) ``yarn.lock``."""
+    packages: List[ResolvedPackage] = []
+    if "__metadata:" in text:
+        data = yaml.safe_load(text) or {}
+        for specs, info in data.items():
+            if specs == "__metadata" or not isinstance(info, dict):
+                continue
+            if "@workspace:" in specs or "@link:" in specs or "@portal:" in specs:
+                continue
+            name = _name_from_spec(specs.split(",")[0])
+            version = str(info.get("version", ""))
+            packages.append(ResolvedPackage(name, version, f"node_modules/{name}"))
+        return packages
+
+    name = None
+    for line in text.splitlines():
+        if not line.strip() or line.lstrip().startswith("#"):
+            continue
+        if not line[0].isspace():
+            name = _name_from_spec(line.rstrip(":").split(",")[0])
+            continue
+        # Only the package's own "version" field is indented by two spaces;
+        # dependency lists are nested one level deeper.
+        if name and line.startswith("  version ") and not line.startswith("   "):
+            version = line[len("  version ") :].strip().strip('"')
+            packages.append(ResolvedPackage(name, version, f"node_modules/{name}"))
+            name = None
+    return packages
+
+
+_PNPM_KEY_PATTERN = re.compile(r"^(@[^/@]+/[^/@]+|[^/@]+)[@/](\d[^_(/]*)")
+
+
+def _split_pnpm_key(key: str) -> Optional[Tuple[str, str]]:
+    """Split a pnpm package key into name and version.
+
+    Keys look like ``/name/1.0.0_peer@2.0.0`` (v5), ``/name@1.0.0(peer@2.0.0)``
+    (v6) or ``name@1.0.0`` (v9), with an optional ``@scope/`` prefix.
+    """
+    match = _PNPM_KEY_PATTERN.match(key.lstrip("/"))
+    return match.groups() if match else None
+
+
+def parse_pnpm_lock(text: str) -> List[ResolvedPackage]:
+    """Parse a ``pnpm-lock.yaml`` (lockfile versions 5 through 9)."""
+    data = yaml.safe_load(text) or {}
+    packages: List[ResolvedPackage] = []
+    for key, info in (data.get("packages") or {}).items():
+        info = info if isinstance(info, dict) else {}
+        split = _split_pnpm_key(str(key))
+        if split is None:
+            continue
+        name, version = split
+        name = info.get("name", name)
+        version = str(info.get("version", version))
+        packages.append(ResolvedPackage(name, version, f"node_modules/{name}"))
+    return packages
+
+
+_PARSERS = {
+    "package-lock.json": parse_package_lock,
+    "npm-shrinkwrap.json": parse_package_lock,
+    "yarn.lock": parse_yarn_lock,
+    "pnpm-lock.yaml": parse_pnpm_lock,
+}
+
+
+def parse_lock_file(lock_file: Path) -> List[ResolvedPackage]:
+    """Return the packages a lock file resolves, de-duplicated by install path."""
+    parser = _PARSERS.get(Path(lock_file).name)
+    if parser is None:
+        raise ValueError(f"Unsupported lock file: {lock_file}")
+    text = Path(lock_file).read_text(encoding="utf-8")
+    unique: Dict[Tuple[str, str, str], ResolvedPackage] = {}
+    for package in parser(text):
+        unique.setdefault((package.name, package.version, package.path), package)
+    return list(unique.values())
+
+
+def audit_packages(
+    packages: Iterable[ResolvedPackage], index: AdvisoryIndex
+) -> Dict[str, Any]:
+    """Match ``packages`` against ``index`` and return ``npm audit --json`` output."""
+    vulnerabilities: Dict[str, Dict[str, Any]] = {}
+    total = 0
+    for package in packages:
+        total += 1
+        advisories = index.match(package.name, package.version)
+        if not advisories:
+            continue
+        entry = vulnerabilities.setdefault(
+            package.name,
+            {
+                "name": package.name,
+                "severity": "info",
+                "isDirect": False,
+                "via": [],
+                "effects": [],
+                "range": [],
+                "nodes": [],
+                "fixAvailable": False,
+            },
+        )
+        entry["nodes"].append(package.path)
+        known = {via["source"] for via in entry["via"]}
+        for advisory in advisories:
+            if advisory.get("id") in known:
+                continue
+            severity = advisory.get("severity", "moderate")
+            entry["via"].append(
+                {
+                    "source": advisory.get("id"),
+                    "name": package.name,
+                    "dependency": package.name,
+                    "title": advisory.get("title", ""),
+                    "url": advisory.get("url", ""),
+                    "severity": severity,
+                    "cwe": advisory.get("cwe", []),
+                    "cvss": advisory.get("cvss", {}),
+                    "range": advisory.get("vulnerable_versions", ""),
+                }
+            )
+            entry["range"].append(advisory.get("vulnerable_versions", ""))
+            if severity in _SEVERITIES and _SEVERITIES.index(
+                severity
+            ) > _SEVERITIES.index(entry["severity"]):
+                entry["severity"] = severity
+
+    counts = {severity: 0 for severity in _SEVERITIES}
+    for entry in vulnerabilities.values():
+        entry["range"] = " || ".join(dict.fromkeys(entry["range"]))
+        entry["nodes"] = sorted(set(entry["nodes"]))
+        counts[entry["severity"]] = counts.get(entry["severity"], 0) + 1
+    counts["total"] = len(vulnerabilities)
+    return {
+        "auditReportVersion": 2,
+        "vulnerabilities": vulnerabilities,
+        "metadata": {
+            "vulnerabilities": counts,
+            "dependencies": {"total": total},
+        },
+    }
+
+
+def audit_lock_file(lock_file: Path, index: AdvisoryIndex) -> Dict[str, Any]:
+    """Audit a single lock file against ``index``."""
+    return audit_packages(parse_lock_file(lock_file), index)
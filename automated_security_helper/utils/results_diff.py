@@ -0,0 +1,420 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Diffing of ``ash_aggregated_results.json`` files.
+
+Loading a results file into ``AshAggregatedResults`` validates every SARIF
+result and builds a ``FlatVulnerability`` for each finding, although a diff
+only compares finding ids and severities. This module reads the files as
+plain JSON and keeps a small :class:`FindingSummary` per finding. Its id is
+the same id ``FlatVulnerability`` assigns. Findings are matched by the
+location-aware fingerprint the findings history uses, since the id only
+covers the scanner, rule and message. Full findings are built only for the
+findings that changed.
+"""
+
+import hashlib
+import json
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Annotated, Any, Dict, List, NamedTuple, Optional, Tuple
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+from automated_security_helper.models.flat_vulnerability import (
+    SEVERITY_ORDER,
+    FlatVulnerability,
+    extract_snippet_from_message,
+    file_path_from_uri,
+    resolve_scanner_name,
+    resolve_severity,
+    severity_at_or_above,
+)
+from automated_security_helper.utils.finding_fingerprint import location_fingerprint
+from automated_security_helper.utils.secret_masking import mask_secret_in_text
+
+_TOOL_TYPES = {"SAST", "DAST", "SCA", "IAC", "SECRETS", "CONTAINER", "SBOM"}
+
+
+class FindingSummary(NamedTuple):
+    """The fields of a finding that a diff compares or reports."""
+
+    id: str
+    severity: str
+    rule_id: Optional[str]
+    location: Optional[str]
+    is_suppressed: bool
+    fingerprint: str
+
+    def at_or_above(self, threshold: Optional[str]) -> bool:
+        """Return whether the severity is at or above ``threshold``.
+
+        Every severity passes when ``threshold`` is None.
+        """
+        return severity_at_or_above(self.severity, threshold)
+
+
+def _as_dict(value: Any) -> Dict[str, Any]:
+    return value if isinstance(value, dict) else {}
+
+
+def _tool_info(run: Dict[str, Any]) -> Tuple[str, str]:
+    """Return the ``(tool_name, tool_type)`` of a SARIF run.
+
+    Mirrors ``AshAggregatedResults.to_flat_vulnerabilities``.
+    """
+    driver = _as_dict(_as_dict(run.get("tool")).get("driver"))
+    if not driver:
+        return "Unknown", "UNKNOWN"
+    for tag in _as_dict(driver.get("properties")).get("tags") or []:
+        if isinstance(tag, str) and tag.upper() in _TOOL_TYPES:
+            return driver.get("name"), tag.upper()
+    return driver.get("name"), "UNKNOWN"
+
+
+# The SARIF Result model defaults a missing level to Level.error, whose str()
+# the level mapping does not know, so such results resolve to MEDIUM.
+_DEFAULT_RESULT_LEVEL = "Level.error"
+
+
+def _severity(result: Dict[str, Any], properties: Dict[str, Any]) -> str:
+    return resolve_severity(
+        properties.get("issue_severity"), result.get("level", _DEFAULT_RESULT_LEVEL)
+    )
+
+
+def _scanner_name(properties: Dict[str, Any], tool_name: str) -> str:
+    return resolve_scanner_name(
+        tool_name,
+        scanner_name=properties.get("scanner_name"),
+        details_tool_name=_as_dict(properties.get("scanner_details")).get("tool_name"),
+        tags=properties.get("tags"),
+    )
+
+
+def _location(
+    result: Dict[str, Any],
+) -> Tuple[Optional[str], Optional[int], Optional[str]]:
+    """Return ``(file_path, line_start, code_snippet)`` of a SARIF result dict.
+
+    Mirrors ``flat_vulnerability._extract_location_info``.
+    """
+    locations = result.get("locations") or []
+    if not locations:
+        return None, None, None
+    physical = _as_dict(_as_dict(locations[0]).get("physicalLocation"))
+    uri = file_path_from_uri(
+        _as_dict(physical.get("artifactLocation")).get("uri") or None
+    )
+    region = _as_dict(physical.get("contextRegion") or physical.get("region"))
+    snippet = _as_dict(region.get("snippet")).get("text")
+    return uri, region.get("startLine"), snippet
+
+
+def _format_location(file_path: Optional[str], line: Optional[int]) -> Optional[str]:
+    return f"{file_path}:{line}" if file_path and line is not None else file_path
+
+
+def summarize_sarif_result(result: Dict[str, Any], tool_name: str) -> FindingSummary:
+    """Summarize a SARIF result dict without validating it.
+
+    The id matches ``FlatVulnerability.from_sarif_result`` and the fingerprint
+    matches ``finding_fingerprint`` of that finding.
+    """
+    properties = _as_dict(result.get("properties"))
+    rule_id = result.get("ruleId")
+    description = _as_dict(result.get("message")).get("text") or ""
+    # Masking is idempotent, so results masked at ingestion keep their text.
+    if description and rule_id:
+        description = mask_secret_in_text(description, rule_id)
+    scanner = _scanner_name(properties, tool_name)
+    digest = hashlib.sha256(description.encode()).hexdigest()[:8]
+    finding_id = f"{scanner}-{rule_id or 'unknown'}-{digest}".strip()
+    file_path, line, snippet = _location(result)
+    if snippet is None:
+        snippet = properties.get("snippet") or extract_snippet_from_message(description)
+    return FindingSummary(
+        id=finding_id,
+        severity=_severity(result, properties),
+        rule_id=rule_id,
+        location=_format_location(file_path, line),
+        is_suppressed=bool(result.get("suppressions")),
+        fingerprint=location_fingerprint(finding_id, file_path, snippet, line),
+    )
+
+
+def summarize_additional_finding(
+    entry: Dict[str, Any], scanner_name: str
+) -> FindingSummary:
+    """Summarize an ``additional_reports`` entry.
+
+    The id matches ``FlatVulnerability.from_additional_report``.
+    """
+    severity = entry.get("severity", "MEDIUM") or "MEDIUM"
+    file_path = entry.get("file_path")
+    line = entry.get("line_start")
+    finding_id = f"{scanner_name}-{entry.get('id', hash(str(entry)) % 10000)}"
+    return FindingSummary(
+        id=finding_id.strip(),
+        severity=(severity.upper() if isinstance(severity, str) else "MEDIUM").strip(),
+        rule_id=entry.get("rule_id"),
+        location=_format_location(file_path, line),
+        is_suppressed=False,
+        fingerprint=location_fingerprint(finding_id, file_path, None, line),
+    )
+
+
+class ResultsIndex:
+    """Summaries of the findings in one aggregated results document.
+
+    Findings are keyed by fingerprint, so findings with the same rule and
+    message in different files or places are told apart. A later finding
+    replaces an earlier one with the same fingerprint.
+    """
+
+    def __init__(self, document: Dict[str, Any]):
+        self._document = document
+        self.findings: Dict[str, FindingSummary] = {}
+        # Where each finding came from, for materialize().
+        self._sources: Dict[str, Tuple[Any, ...]] = {}
+
+        runs = _as_dict(document.get("sarif")).get("runs") or []
+        for run_index, run in enumerate(runs):
+            run = _as_dict(run)
+            tool_name, tool_type = _tool_info(run)
+            for result_index, result in enumerate(run.get("results") or []):
+                summary = summarize_sarif_result(result, tool_name)
+                self.findings[summary.fingerprint] = summary
+                self._sources[summary.fingerprint] = (
+                    "sarif",
+                    run_index,
+                    result_index,
+                    tool_name,
+                    tool_type,
+                )
+
+        for scanner_name, entries in _as_dict(
+            document.get("additional_reports")
+        ).items():
+            if not isinstance(entries, list):
+                continue
+            for entry_index, entry in enumerate(entries):
+                if not isinstance(entry, dict):
+                    continue
+                summary = summarize_additional_finding(entry, scanner_name)
+                self.findings[summary.fingerprint] = summary
+                self._sources[summary.fingerprint] = (
+                    "additional",
+                    scanner_name,
+                    entry_index,
+                )
+
+    @classmethod
+    def load(cls, path: str | Path) -> "ResultsIndex":
+        """Read an ``ash_aggregated_results.json`` file.
+
+        Raises:
+            ValueError: If the file is not a JSON object
+        """
+        with open(path, "rb") as f:
+            document = json.load(f)
+        if not isinstance(document, dict):
+            raise ValueError(f"{path} does not contain a JSON object")
+        return cls(document)
+
+    def materialize(self, fingerprint: str) -> FlatVulnerability:
+        """Build the full finding with the given fingerprint."""
+        from automated_security_helper.schemas.sarif_schema_model import Result
+
+        source = self._sources[fingerprint]
+        if source[0] == "additional":
+            _, scanner_name, entry_index = source
+            entry = self._document["additional_reports"][scanner_name][entry_index]
+            return FlatVulnerability.from_additional_report(entry, scanner_name)
+        _, run_index, result_index, tool_name, tool_type = source
+        result = self._document["sarif"]["runs"][run_index]["results"][result_index]
+        return FlatVulnerability.from_sarif_result(
+            Result.model_validate(result), tool_name, tool_type
+        )
+
+
+class ResultsDiff:
+    """Findings added, removed and re-rated between two results documents.
+
+    ``new_ids`` and ``resolved_ids`` hold fingerprints; the summaries and the
+    ``severity_changed`` entries carry the finding ids.
+    """
+
+    def __init__(self, before: ResultsIndex, after: ResultsIndex):
+        self.before = before
+        self.after = after
+        before_keys = before.findings.keys()
+        after_keys = after.findings.keys()
+        self.new_ids: List[str] = sorted(after_keys - before_keys)
+        self.resolved_ids: List[str] = sorted(before_keys - after_keys)
+        self.severity_changed: List[Dict[str, Optional[str]]] = []
+        for fingerprint in sorted(before_keys & after_keys):
+            before_severity = before.findings[fingerprint].severity.upper()
+            after_severity = after.findings[fingerprint].severity.upper()
+            if before_severity != after_severity:
+                self.severity_changed.append(
+                    {
+                        "id": before.findings[fingerprint].id,
+                        "before_severity": before_severity or None,
+                        "after_severity": after_severity or None,
+                    }
+                )
+
+    def new(self) -> List[FindingSummary]:
+        return [self.after.findings[i] for i in self.new_ids]
+
+    def resolved(self) -> List[FindingSummary]:
+        return [self.before.findings[i] for i in self.resolved_ids]
+
+    def new_findings(self) -> List[FlatVulnerability]:
+        """Build the full new findings."""
+        return [self.after.materialize(i) for i in self.new_ids]
+
+    def resolved_findings(self) -> List[FlatVulnerability]:
+        """Build the full resolved findings."""
+        return [self.before.materialize(i) for i in self.resolved_ids]
+
+
+def diff_results_files(before_path: str | Path, after_path: str | Path) -> ResultsDiff:
+    """Diff two ``ash_aggregated_results.json`` files.
+
+    The files are read concurrently.
+
+    Raises:
+        OSError: If a file cannot be read
+        ValueError: If a file is not a JSON object
+    """
+    if Path(before_path) == Path(after_path):
+        index = ResultsIndex.load(before_path)
+        return ResultsDiff(index, index)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        before, after = executor.map(ResultsIndex.load, (before_path, after_path))
+    return ResultsDiff(before, after)
+
+
+def diff_results(
+    baseline: Annotated[
+        str,
+        typer.Option(
+            help="Baseline ash_aggregated_results.json, e.g. from the target branch",
+        ),
+    ],
+    current: Annotated[
+        str,
+        typer.Option(
+            help="ash_aggregated_results.json to check. Defaults to the one in --output-dir",
+        ),
+    ] = None,
+    output_dir: Annotated[
+        str,
+        typer.Option(
+            help="ASH output directory containing the current ash_aggregated_results.json",
+            envvar="ASH_OUTPUT_DIR",
+        ),
+    ] = None,
+    severity_threshold: Annotated[
+        str,
+        typer.Option(
+            help="Only gate on new findings at or above this severity (CRITICAL, HIGH, MEDIUM, LOW, INFO). Defaults to all severities",
+        ),
+    ] = None,
+    include_suppressed: Annotated[
+        bool,
+        typer.Option(help="Gate on new findings that are suppressed"),
+    ] = False,
+    fail_on_new: Annotated[
+        bool,
+        typer.Option(
+            help="Exit with code 2 when there are new findings to gate on",
+        ),
+    ] = True,
+    output_json: Annotated[
+        bool,
+        typer.Option("--json", help="Print the diff as JSON"),
+    ] = False,
+):
+    """
+    Compare scan results against a baseline and gate on new findings.
+
+    Findings are matched by id, file and code location. Only ids, severities,
+    rules and locations are read from the results files, so the check stays fast on large reports.
+    Exits with code 2 when new findings pass the filters, so it can run as a
+    CI gate against a baseline artifact.
+    """
+    console = Console()
+
+    if severity_threshold is not None and (
+        severity_threshold.upper() not in SEVERITY_ORDER
+    ):
+        console.print(
+            f"[bold red]Invalid severity threshold: {severity_threshold}[/bold red]"
+        )
+        raise typer.Exit(code=1)
+    if current is None:
+        if output_dir is None:
+            output_dir = Path.cwd().joinpath(".ash", "ash_output")
+        current = Path(output_dir).joinpath("ash_aggregated_results.json")
+    for label, path in (("Baseline", baseline), ("Current", current)):
+        if not Path(path).exists():
+            console.print(f"[bold red]{label} results not found: {path}[/bold red]")
+            raise typer.Exit(code=1)
+
+    try:
+        diff = diff_results_files(baseline, current)
+    except (OSError, ValueError) as e:
+        console.print(f"[bold red]Failed to read results: {e}[/bold red]")
+        raise typer.Exit(code=1)
+
+    gated = [
+        finding
+        for finding in diff.new()
+        if (include_suppressed or not finding.is_suppressed)
+        and finding.at_or_above(severity_threshold)
+    ]
+
+    if output_json:
+        typer.echo(
+            json.dumps(
+                {
+                    "new": [f._asdict() for f in diff.new()],
+                    "resolved": [f._asdict() for f in diff.resolved()],
+                    "severity_changed": diff.severity_changed,
+                    "gated": [f.id for f in gated],
+                },
+                indent=2,
+            )
+        )
+    else:
+        if gated:
+            table = Table(title="New Findings")
+            table.add_column("Severity", style="bold")
+            table.add_column("Rule", style="cyan")
+            table.add_column("Location")
+            table.add_column("ID")
+            for finding in gated:
+                table.add_row(
+                    finding.severity,
+                    finding.rule_id or "",
+                    finding.location or "",
+                    finding.id,
+                )
+            console.print(table)
+        console.print(
+            f"{len(diff.new_ids)} new, {len(diff.resolved_ids)} resolved, "
+            f"{len(diff.severity_changed)} with changed severity"
+        )
+
+    if fail_on_new and gated:
+        if not output_json:
+            console.print(
+                f"[bold red]FAILED: {len(gated)} new findings since the baseline[/bold red]"
+            )
+        raise typer.Exit(code=2)
+    return diff
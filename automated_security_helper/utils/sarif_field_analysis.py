@@ -446,3 +446,110 @@ def analyze_sarif_fields(
         raise typer.Exit(code=1)
 
     return results_dict
+
+
+def validate_aggregation(
+    output_dir: Annotated[
+        str,
+        typer.Option(
+            help="ASH output directory containing the scanners/ and reports/ directories",
+        ),
+    ] = None,
+    workers: Annotated[
+        int,
+        typer.Option(
+            help="Processes used to compare fields of matched findings",
+            min=1,
+        ),
+    ] = 1,
+    fail_on_unmatched: Annotated[
+        bool,
+        typer.Option(
+            help="Exit with code 1 when a scanner finding is missing from the aggregated report",
+        ),
+    ] = True,
+    fail_on_critical: Annotated[
+        bool,
+        typer.Option(
+            help="Exit with code 1 when a critical field was lost during aggregation",
+        ),
+    ] = True,
+):
+    """
+    Check that the aggregated SARIF report preserves every scanner finding.
+
+    Each finding in the scanner SARIF reports under ``scanners/`` is matched
+    against ``reports/ash.sarif`` and the fields of matched findings are
+    compared. Exits with code 1 when findings or critical fields are missing,
+    so the check can run as a CI gate after every scan.
+    """
+    from automated_security_helper.utils.meta_analysis.sarif_analysis import (
+        validate_sarif_aggregation,
+    )
+
+    console = Console()
+
+    if output_dir is None:
+        output_dir = Path.cwd().joinpath(".ash", "ash_output")
+
+    aggregated_path = Path(output_dir).joinpath("reports", "ash.sarif")
+    if not aggregated_path.exists():
+        console.print(
+            f"[bold red]Aggregated SARIF report not found: {aggregated_path}[/bold red]"
+        )
+        raise typer.Exit(code=1)
+    aggregated_report = json.loads(aggregated_path.read_text(encoding="utf-8"))
+
+    # Merge the results of each scanner's SARIF files (source and converted)
+    original_reports: Dict[str, Dict[str, Any]] = {}
+    scanner_files = glob.glob(
+        os.path.join(output_dir, "scanners", "**", "*.sarif"), recursive=True
+    )
+    for file_path in sorted(scanner_files):
+        scanner_name = get_scanner_name_from_path(file_path)
+        try:
+            sarif_data = json.loads(Path(file_path).read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            console.print(f"[yellow]Skipping unreadable {file_path}: {e}[/yellow]")
+            continue
+        report = original_reports.setdefault(scanner_name, {"runs": [{"results": []}]})
+        for run in sarif_data.get("runs") or []:
+            report["runs"][0]["results"].extend(run.get("results") or [])
+
+    validation = validate_sarif_aggregation(
+        original_reports, aggregated_report, workers=workers
+    )
+
+    table = Table(title="SARIF Aggregation Fidelity")
+    table.add_column("Scanner", style="cyan")
+    table.add_column("Findings", justify="right")
+    table.add_column("Matched", justify="right")
+    table.add_column("Critical Missing", justify="right")
+    table.add_column("Important Missing", justify="right")
+    for scanner_name, stats in sorted(validation["match_statistics"].items()):
+        table.add_row(
+            scanner_name,
+            str(stats["total_results"]),
+            str(stats["matched_results"]),
+            str(stats["critical_fields_missing"]),
+            str(stats["important_fields_missing"]),
+        )
+    console.print(table)
+
+    summary = validation["summary"]
+    unmatched = summary["total_findings"] - summary["matched_findings"]
+    failures = []
+    if fail_on_unmatched and unmatched:
+        failures.append(f"{unmatched} findings missing from the aggregated report")
+    if fail_on_critical and summary["critical_missing_fields"]:
+        failures.append(
+            f"{summary['critical_missing_fields']} critical fields lost during aggregation"
+        )
+    if failures:
+        console.print(f"[bold red]FAILED: {'; '.join(failures)}[/bold red]")
+        raise typer.Exit(code=1)
+
+    console.print(
+        f"[bold green]{summary['matched_findings']} of {summary['total_findings']} findings preserved[/bold green]"
+    )
+    return validation
@@ -1,13 +1,14 @@
 """Utility functions for working with SARIF reports."""
 
+import hashlib
+import os
 import random
-from contextlib import suppress
-from typing import List
+from functools import lru_cache
+from typing import Any, Dict, List
 import uuid
-from pathlib import Path, PurePosixPath
+from pathlib import Path
 from automated_security_helper.base.plugin_context import PluginContext
 from automated_security_helper.core.constants import (
-    ASH_WORK_DIR_NAME,
     KNOWN_IGNORE_PATHS,
 )
 from automated_security_helper.models.core import IgnorePathWithReason
@@ -23,73 +24,95 @@ from automated_security_helper.schemas.sarif_schema_model import (
     Suppression,
     Kind1,
 )
+from automated_security_helper.utils.inline_suppression_index import (
+    InlineSuppressionIndex,
+    get_inline_suppression_index,
+)
 from automated_security_helper.utils.suppression_matcher import (
-    find_inline_suppressions,
     should_suppress_finding,
 )
 from automated_security_helper.models.flat_vulnerability import FlatVulnerability
 from automated_security_helper.models.asharp_model import ScannerSeverityCount
-from automated_security_helper.utils.secret_masking import mask_secret_in_text
+from automated_security_helper.utils.uri_normalizer import (
+    UriNormalizer,
+    _normalize_sarif_uri,  # noqa: F401 - re-exported for existing callers
+    _sanitize_uri,  # noqa: F401 - re-exported for existing callers
+    get_uri_normalizer,
+)
+from automated_security_helper.utils.secret_masking import (
+    mask_texts,
+    secret_family,
+)
 from automated_security_helper.utils.suppression_matcher import file_path_matches
 
 
-def get_finding_id(
+# Finding ID engines. "compat" seeds a Mersenne Twister with the ID seed and
+# produces the same IDs as earlier ASH releases, so existing reports,
+# suppressions and GitLab vulnerability records keep matching; it is the
+# default. "blake2" hashes the ID seed with BLAKE2b and is faster, but every
+# finding gets a new ID. Opt in with ASH_FINDING_ID_ENGINE=blake2.
+FINDING_ID_ENGINES = ("blake2", "compat")
+DEFAULT_FINDING_ID_ENGINE = "compat"
+FINDING_ID_CACHE_SIZE = 65536
+
+
+@lru_cache(maxsize=FINDING_ID_CACHE_SIZE)
+def _cached_finding_id(
+    engine: str,
     rule_id: str,
-    file: str | None = None,
-    start_line: int | None = None,
-    end_line: int | None = None,
+    file: str | None,
+    start_line: int | None,
+    end_line: int | None,
 ) -> str:
     seed = "::".join(
         str(item)
         for item in [rule_id, file, start_line, end_line]
         if item is not None
     )
-    rd = random.Random()  # nosec B311 — seeded PRNG for deterministic finding IDs, not security
-    rd.seed(seed)
-    return str(uuid.UUID(int=rd.getrandbits(128), version=4))
+    if engine == "compat":
+        rd = random.Random()  # nosec B311 — seeded PRNG for deterministic finding IDs, not security
+        rd.seed(seed)
+        return str(uuid.UUID(int=rd.getrandbits(128), version=4))
+    digest = hashlib.blake2b(seed.encode("utf-8"), digest_size=16).digest()
+    return str(uuid.UUID(bytes=digest, version=4))
 
 
-def _sanitize_uri(uri: str, source_dir_path: Path, source_dir_str: str) -> str:
-    """
-    Sanitize a URI in a SARIF report.
+def get_finding_id(
+    rule_id: str,
+    file: str | None = None,
+    start_line: int | None = None,
+    end_line: int | None = None,
+    engine: str | None = None,
+) -> str:
+    """Return a deterministic, UUIDv4-shaped ID for a finding.
+
+    IDs are memoized by ``(rule_id, file, start_line, end_line)``.
 
     Args:
-        uri: The URI to sanitize
-        source_dir_path: The source directory path object
-        source_dir_str: The source directory string with trailing separator
+        rule_id: The finding's rule ID
+        file: Path of the file the finding is in
+        start_line: First line of the finding
+        end_line: Last line of the finding
+        engine: One of ``FINDING_ID_ENGINES``. Defaults to the
+            ``ASH_FINDING_ID_ENGINE`` environment variable, then ``compat``.
 
     Returns:
-        The sanitized URI
+        The finding ID
     """
-    if not uri:
-        return uri
-
-    # Remove file:// prefix if present, using urlparse to handle host segments
-    if uri.startswith("file://"):
-        from urllib.parse import urlparse
-
-        parsed = urlparse(uri)
-        uri = parsed.path
-
-    # Make path relative to source directory
-    try:
-        # Try to resolve the path and make it relative
-        path_obj = Path(uri)
-        if path_obj.is_absolute():
-            with suppress(ValueError):
-                uri = str(path_obj.relative_to(source_dir_path))
-        elif uri.startswith(source_dir_str):
-            uri = uri.removeprefix(source_dir_str)
-    except Exception as e:
-        ASH_LOGGER.debug(f"Error processing path {uri}: {e}")
-
-    # Replace backslashes with forward slashes for consistency
-    uri = str(uri).replace("\\", "/")
-    return uri
+    if engine is None:
+        engine = os.environ.get("ASH_FINDING_ID_ENGINE", DEFAULT_FINDING_ID_ENGINE)
+    engine = engine.lower()
+    if engine not in FINDING_ID_ENGINES:
+        raise ValueError(
+            f"Unknown finding ID engine '{engine}', expected one of {FINDING_ID_ENGINES}"
+        )
+    return _cached_finding_id(engine, rule_id, file, start_line, end_line)
 
 
 def sanitize_sarif_paths(
-    sarif_report: SarifReport, source_dir: str | Path
+    sarif_report: SarifReport,
+    source_dir: str | Path,
+    normalizer: UriNormalizer | None = None,
 ) -> SarifReport:
     """
     Sanitize paths in SARIF report to be relative to the source directory.
@@ -97,6 +120,7 @@ def sanitize_sarif_paths(
     Args:
         sarif_report: The SARIF report to sanitize
         source_dir: The source directory to make paths relative to
+        normalizer: The run's URI normalizer; see get_uri_normalizer
 
     Returns:
         The sanitized SARIF report
@@ -104,10 +128,12 @@ def sanitize_sarif_paths(
     if not sarif_report or not sarif_report.runs:
         return sarif_report
 
-    source_dir_path = Path(source_dir).resolve()
-    source_dir_str = str(source_dir_path) + "/"
+    if normalizer is None:
+        normalizer = UriNormalizer(source_dir)
 
-    ASH_LOGGER.debug(f"Sanitizing SARIF paths relative to: {source_dir_str}")
+    ASH_LOGGER.debug(
+        f"Sanitizing SARIF paths relative to: {normalizer.source_dir_resolved}"
+    )
 
     clean_runs = []
     for run in sarif_report.runs:
@@ -125,7 +151,7 @@ def sanitize_sarif_paths(
                     ):
                         uri = location.physicalLocation.root.artifactLocation.uri
                         if uri:
-                            uri = _sanitize_uri(uri, source_dir_path, source_dir_str)
+                            uri = normalizer.sanitize(uri)
                             location.physicalLocation.root.artifactLocation.uri = uri
 
             # Process related locations if present
@@ -137,13 +163,13 @@ def sanitize_sarif_paths(
                     ):
                         uri = related.physicalLocation.root.artifactLocation.uri
                         if uri:
-                            uri = _sanitize_uri(uri, source_dir_path, source_dir_str)
+                            uri = normalizer.sanitize(uri)
                             related.physicalLocation.root.artifactLocation.uri = uri
 
             # Process analysis target if present
             if result.analysisTarget and result.analysisTarget.uri:
                 uri = result.analysisTarget.uri
-                uri = _sanitize_uri(uri, source_dir_path, source_dir_str)
+                uri = normalizer.sanitize(uri)
                 result.analysisTarget.uri = uri
             clean_results.append(result)
 
@@ -277,12 +303,36 @@ def get_severity_metrics_from_sarif(
     return counts
 
 
-def mask_secrets_in_sarif(sarif_report: SarifReport) -> SarifReport:
+def _maskable_texts(result: Result) -> List[Any]:
+    """Return the objects holding a result's message and snippet text."""
+    holders = []
+    message = getattr(result, "message", None)
+    message = getattr(message, "root", message)
+    if getattr(message, "text", None):
+        holders.append(message)
+    for location in result.locations or []:
+        physical = getattr(location, "physicalLocation", None)
+        physical = getattr(physical, "root", physical)
+        region = getattr(physical, "region", None)
+        snippet = getattr(region, "snippet", None)
+        if getattr(snippet, "text", None):
+            holders.append(snippet)
+    return holders
+
+
+def mask_secrets_in_sarif(
+    sarif_report: SarifReport, scanner_name: str | None = None
+) -> SarifReport:
     """
-    Mask secrets in SARIF report messages based on rule IDs.
+    Mask secrets in SARIF result messages and snippets.
+
+    Results are grouped by masking family and each family's texts are masked
+    as one batch. Masked results are marked with a private flag on their
+    property bag and skipped if the report is masked again.
 
     Args:
         sarif_report: The SARIF report to modify
+        scanner_name: The ASH scanner that produced the report, if known
 
     Returns:
         The modified SARIF report with secrets masked
@@ -290,62 +340,32 @@ def mask_secrets_in_sarif(sarif_report: SarifReport) -> SarifReport:
     if not sarif_report or not sarif_report.runs:
         return sarif_report
 
+    batches: Dict[str, List[Any]] = {}
     for run in sarif_report.runs:
-        if not run.results:
-            continue
+        for result in run.results or []:
+            properties = result.properties
+            if properties is not None and properties._secrets_masked:
+                continue
+            if properties is None:
+                properties = result.properties = PropertyBag()
+            family = secret_family(
+                result.ruleId,
+                scanner_name or getattr(properties, "scanner_name", None),
+                properties.tags,
+            )
+            batches.setdefault(family, []).extend(_maskable_texts(result))
+            properties._secrets_masked = True
 
-        for result in run.results:
-            if result.message and result.ruleId:
-                # Mask secrets in message text
-                if hasattr(result.message, "text") and result.message.text:
-                    result.message.text = mask_secret_in_text(
-                        result.message.text, result.ruleId
-                    )
-                elif (
-                    hasattr(result.message, "root")
-                    and hasattr(result.message.root, "text")
-                    and result.message.root.text
-                ):
-                    result.message.root.text = mask_secret_in_text(
-                        result.message.root.text, result.ruleId
-                    )
+    for family, holders in batches.items():
+        for holder, masked in zip(
+            holders, mask_texts([holder.text for holder in holders], family)
+        ):
+            if masked != holder.text:
+                holder.text = masked
 
     return sarif_report
 
 
-def _normalize_sarif_uri(
-    uri: str,
-    source_dir_prefix: str,
-    source_dir_prefix_with_slash: str,
-    source_dir_prefix_no_drive: str | None,
-    source_dir_basename: PurePosixPath | None,
-) -> str:
-    """Strip source-directory prefix from a SARIF artifact URI.
-
-    Handles five platform variants:
-    1. Standard Unix/Windows absolute: uri starts with source_dir_prefix
-    2. Windows with leading slash before drive: /D:/path/...
-    3. Windows with drive letter stripped by scanner: /a/repo/... vs D:/a/repo/
-    4. Offline opengrep basename-relative: basename/subpath/file.py
-    5. No match: returned unchanged (forward-slash normalised)
-    """
-    uri_normalized = uri.replace("\\", "/")
-    if uri_normalized.startswith(source_dir_prefix):
-        return uri_normalized[len(source_dir_prefix):]
-    if uri_normalized.startswith(source_dir_prefix_with_slash):
-        return uri_normalized[len(source_dir_prefix_with_slash):]
-    if source_dir_prefix_no_drive and uri_normalized.startswith(source_dir_prefix_no_drive):
-        return uri_normalized[len(source_dir_prefix_no_drive):]
-    # source_dir_basename is None when the source dir contains a child of the same
-    # name (see #361): the basename is a real project dir, not a scanner artifact,
-    # so stripping it would corrupt the path. relative_to(None) raises TypeError,
-    # which suppress(ValueError) would not catch, so the None check is load-bearing.
-    if source_dir_basename is not None:
-        with suppress(ValueError):
-            return str(PurePosixPath(uri_normalized).relative_to(source_dir_basename))
-    return uri_normalized
-
-
 def _check_ignore_paths(
     normalized_uri: str,
     ignore_paths: List[IgnorePathWithReason],
@@ -400,31 +420,27 @@ def _apply_inline_suppression(
     normalized_uri: str,
     source_dir: Path,
     result_line: int,
-    inline_cache: dict[str, list],
+    inline_index: InlineSuppressionIndex,
 ) -> bool:
-    """Scan the source file for an inline suppression comment matching *result*.
+    """Look up an inline suppression comment matching *result*.
 
     Mutates result.suppressions on match. Returns True when a suppression was applied.
     """
-    file_path = source_dir / normalized_uri
-    file_key = str(file_path)
-    if file_key not in inline_cache:
-        inline_cache[file_key] = find_inline_suppressions(file_path)
-    for isup in inline_cache[file_key]:
-        if isup.rule_id.lower() == result.ruleId.lower() and isup.line_number == result_line:
-            if not result.suppressions:
-                result.suppressions = []
-            ASH_LOGGER.verbose(
-                f"Suppressing rule '{result.ruleId}' at line {result_line} in '{normalized_uri}' via inline comment: [yellow]{isup.reason}[/yellow]"
-            )
-            result.suppressions.append(
-                Suppression(
-                    kind=Kind1.inSource,
-                    justification=f"(ASH inline) {isup.reason}",
-                )
-            )
-            return True
-    return False
+    isup = inline_index.lookup(source_dir / normalized_uri, result_line, result.ruleId)
+    if isup is None:
+        return False
+    if not result.suppressions:
+        result.suppressions = []
+    ASH_LOGGER.verbose(
+        f"Suppressing rule '{result.ruleId}' at line {result_line} in '{normalized_uri}' via inline comment: [yellow]{isup.reason}[/yellow]"
+    )
+    result.suppressions.append(
+        Suppression(
+            kind=Kind1.inSource,
+            justification=f"(ASH inline) {isup.reason}",
+        )
+    )
+    return True
 
 
 def apply_suppressions_to_sarif(
@@ -461,30 +477,10 @@ def apply_suppressions_to_sarif(
     if not sarif_report or not sarif_report.runs:
         return sarif_report
 
-    # Cache resolved output paths outside the inner loop (bug #46)
-    _output_dir_resolved = plugin_context.output_dir.resolve()
-    _work_dir_resolved = plugin_context.output_dir.joinpath(ASH_WORK_DIR_NAME).resolve()
-    _uri_resolve_cache: dict[str, Path] = {}
-    _source_dir_prefix = str(plugin_context.source_dir.resolve()).replace("\\", "/") + "/"
-    # On Windows, SARIF URIs may have a leading "/" before the drive letter (e.g., /D:/path)
-    _source_dir_prefix_with_slash = "/" + _source_dir_prefix
-    # Some Windows scanners strip the drive letter entirely (e.g., /a/repo/ instead of D:/a/repo/)
-    _source_dir_prefix_no_drive = (
-        _source_dir_prefix[2:] if len(_source_dir_prefix) > 2 and _source_dir_prefix[1] == ":" else None
-    )
-    # Offline opengrep produces relative paths with source_dir basename prefix (e.g., "src/.github/...")
-    # However, skip basename stripping when source_dir contains a subdirectory with the same name
-    # as its own basename (#361) - that means the basename is a real project directory, not a
-    # scanner artifact. Example: source_dir="/src" with /src/src/ existing -> skip.
-    _resolved_source = plugin_context.source_dir.resolve()
-    _source_dir_basename_str = _resolved_source.name
-    _source_dir_basename: PurePosixPath | None = None
-    if _source_dir_basename_str:
-        _child_with_same_name = _resolved_source / _source_dir_basename_str
-        if not _child_with_same_name.exists():
-            _source_dir_basename = PurePosixPath(_source_dir_basename_str)
-
-    _inline_suppression_cache: dict[str, list] = {}
+    # Normalized URIs and output-path checks are memoized for the whole run.
+    normalizer = get_uri_normalizer(plugin_context)
+
+    _inline_index: InlineSuppressionIndex | None = None
 
     for run in sarif_report.runs:
         if not run.results:
@@ -507,19 +503,8 @@ def apply_suppressions_to_sarif(
                     raw_uri = location.physicalLocation.root.artifactLocation.uri
                     if not raw_uri:
                         continue
-                    uri = _normalize_sarif_uri(
-                        raw_uri,
-                        _source_dir_prefix,
-                        _source_dir_prefix_with_slash,
-                        _source_dir_prefix_no_drive,
-                        _source_dir_basename,
-                    )
-                    if uri not in _uri_resolve_cache:
-                        _uri_resolve_cache[uri] = Path(uri).resolve()
-                    resolved_uri = _uri_resolve_cache[uri]
-                    if resolved_uri.is_relative_to(_output_dir_resolved) and not resolved_uri.is_relative_to(
-                        _work_dir_resolved
-                    ):
+                    uri = normalizer.normalize(raw_uri)
+                    if normalizer.in_output_dir(uri):
                         ASH_LOGGER.verbose(
                             f"Excluding result -- location is in output path and NOT in the work directory and should not have been included: '{uri}'"
                         )
@@ -549,13 +534,7 @@ def apply_suppressions_to_sarif(
                         and location.physicalLocation.root.artifactLocation
                     ):
                         raw_uri = location.physicalLocation.root.artifactLocation.uri
-                        uri = _normalize_sarif_uri(
-                            raw_uri or "",
-                            _source_dir_prefix,
-                            _source_dir_prefix_with_slash,
-                            _source_dir_prefix_no_drive,
-                            _source_dir_basename,
-                        ) if raw_uri else (raw_uri or "")
+                        uri = normalizer.normalize(raw_uri) if raw_uri else ""
                         line_start = None
                         line_end = None
                         if (
@@ -618,15 +597,11 @@ def apply_suppressions_to_sarif(
                             result_line = location.physicalLocation.root.region.startLine
                         if result_line is None:
                             continue
-                        uri = _normalize_sarif_uri(
-                            raw_uri,
-                            _source_dir_prefix,
-                            _source_dir_prefix_with_slash,
-                            _source_dir_prefix_no_drive,
-                            _source_dir_basename,
-                        )
+                        uri = normalizer.normalize(raw_uri)
+                        if _inline_index is None:
+                            _inline_index = get_inline_suppression_index(plugin_context)
                         _apply_inline_suppression(
-                            result, uri, plugin_context.source_dir, result_line, _inline_suppression_cache
+                            result, uri, plugin_context.source_dir, result_line, _inline_index
                         )
 
             updated_results.append(result)
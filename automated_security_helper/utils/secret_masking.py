@@ -1,6 +1,166 @@
-"""Utility functions for masking secrets in security findings."""
+"""Utility functions for masking secrets in security findings.
+
+Findings are masked once, when scanner results are ingested, by
+:func:`automated_security_helper.utils.sarif_utils.mask_secrets_in_sarif`.
+Each result is assigned a masking family from its rule ID, scanner and tags.
+The messages of all results in a family are then masked together with that
+family's precompiled patterns. Masked results are marked on their property
+bag, so later stages in the same run skip them. Masking is idempotent, so
+results read back from a report can safely be masked again.
+"""
 
 import re
+from functools import lru_cache
+from typing import Callable, Dict, Iterable, List, Sequence
+
+BANDIT_PASSWORD_RULES = frozenset({"B105", "B106", "B107"})
+
+# Scanners whose findings are all secrets or sensitive data.
+SECRET_SCANNERS = frozenset({"detect-secrets", "ferret-scan"})
+
+# Rule IDs of secret findings from other scanners, such as Semgrep
+# `...hardcoded-password...`, Checkov `CKV_SECRET_*` and Trivy `github-pat`.
+_SECRET_RULE_PATTERN = re.compile(
+    r"secret|passw(?:or)?d|credential|token|api[-_]?key|access[-_]?key|"
+    r"private[-_]?key|-pat$",
+    re.IGNORECASE,
+)
+
+# Bandit B105/B106/B107 messages look like
+# "Possible hardcoded password: 'actual_secret_value'". The non-greedy match
+# handles escaped quotes and stops at the matching closing delimiter.
+_BANDIT_PASSWORD_PATTERN = re.compile(
+    r"""(Possible hardcoded password:\s*)(["'])((?:(?!\2).)*)\2"""
+)
+
+# `name = value` and `name: "value"` assignments of credential-like names.
+_ASSIGNMENT_PATTERN = re.compile(
+    r"""((?:passw(?:or)?d|pwd|secret|token|api[-_]?key|access[-_]?key(?:[-_]?id)?|"""
+    r"""private[-_]?key|auth|credentials?)["']?\s*[:=]\s*)(["']?)([^\s"',;]{4,})\2""",
+    re.IGNORECASE,
+)
+
+# Trivy secret findings print the matched line as "Match: ...".
+_MATCH_LINE_PATTERN = re.compile(r"^(Match:[ \t]*)(\S.*)$", re.MULTILINE)
+
+# Well-known credential formats, masked in every message.
+_TOKEN_PATTERN = re.compile(
+    r"()\b("
+    r"(?:AKIA|ASIA|AGPA|AIDA|AROA|ANPA|ANVA)[0-9A-Z]{16}"
+    r"|gh[pousr]_[A-Za-z0-9]{36,}"
+    r"|github_pat_[A-Za-z0-9_]{22,}"
+    r"|xox[abposr]-[A-Za-z0-9-]{10,}"
+    r"|glpat-[A-Za-z0-9_-]{20,}"
+    r"|sk_live_[A-Za-z0-9]{16,}"
+    r"|AIza[0-9A-Za-z_-]{35}"
+    r")\b"
+    r"|()(-----BEGIN [A-Z ]*PRIVATE KEY-----[^\x00]*?-----END [A-Z ]*PRIVATE KEY-----)"
+)
+
+# Sensitive data reported by ferret-scan with `show_match` enabled.
+_PII_PATTERN = re.compile(r"()\b(\d{3}-\d{2}-\d{4}|\d(?:[ -]?\d){12,18})\b")
+
+# Messages are masked in batches joined by this separator. None of the
+# patterns match across it.
+_BATCH_SEPARATOR = "\n\x00\n"
+
+
+def _mask_match(match: re.Match) -> str:
+    """Mask a match made of ``(prefix, secret)`` group pairs.
+
+    Alternations repeat the pair, so the first pair that matched is used.
+    """
+    groups = match.groups()
+    for index in range(0, len(groups), 2):
+        if groups[index + 1] is not None:
+            return groups[index] + _mask_secret_value(groups[index + 1])
+    return match.group(0)
+
+
+def _mask_quoted_match(match: re.Match) -> str:
+    prefix, quote, secret = match.group(1), match.group(2), match.group(3)
+    return f"{prefix}{quote}{_mask_secret_value(secret)}{quote}"
+
+
+def _sub(pattern: re.Pattern, replacement: Callable[[re.Match], str]):
+    return lambda text: pattern.sub(replacement, text)
+
+
+_mask_tokens = _sub(_TOKEN_PATTERN, _mask_match)
+
+# Masking passes for each family, applied in order.
+_FAMILY_PASSES: Dict[str, List[Callable[[str], str]]] = {
+    "bandit-password": [
+        _sub(_BANDIT_PASSWORD_PATTERN, _mask_quoted_match),
+        _sub(_ASSIGNMENT_PATTERN, _mask_quoted_match),
+        _mask_tokens,
+    ],
+    "secret": [
+        _sub(_ASSIGNMENT_PATTERN, _mask_quoted_match),
+        _sub(_MATCH_LINE_PATTERN, _mask_match),
+        _mask_tokens,
+    ],
+    "sensitive-data": [
+        _sub(_ASSIGNMENT_PATTERN, _mask_quoted_match),
+        _sub(_PII_PATTERN, _mask_match),
+        _mask_tokens,
+    ],
+    "default": [_mask_tokens],
+}
+
+
+@lru_cache(maxsize=4096)
+def _family_for(rule_id: str | None, scanner_name: str | None, tagged_secret: bool) -> str:
+    if rule_id in BANDIT_PASSWORD_RULES:
+        return "bandit-password"
+    if scanner_name == "ferret-scan":
+        return "sensitive-data"
+    if (
+        tagged_secret
+        or scanner_name in SECRET_SCANNERS
+        or (rule_id and _SECRET_RULE_PATTERN.search(rule_id))
+    ):
+        return "secret"
+    return "default"
+
+
+def secret_family(
+    rule_id: str | None,
+    scanner_name: str | None = None,
+    tags: Iterable[str] | None = None,
+) -> str:
+    """Return the masking family of a finding.
+
+    Args:
+        rule_id: The rule ID that triggered the finding (e.g., 'B105')
+        scanner_name: The ASH name of the scanner that reported it
+        tags: The finding's SARIF property tags
+
+    Returns:
+        One of ``bandit-password``, ``secret``, ``sensitive-data`` or ``default``
+    """
+    return _family_for(rule_id, scanner_name, "secret" in (tags or ()))
+
+
+def mask_texts(texts: Sequence[str], family: str) -> List[str]:
+    """Mask secrets in a batch of texts of the same family.
+
+    Each pattern runs once over the whole batch rather than once per text.
+    """
+    if not texts:
+        return []
+    passes = _FAMILY_PASSES[family]
+    if len(texts) == 1 or any("\x00" in text for text in texts):
+        masked = list(texts)
+        for index, text in enumerate(masked):
+            for masking_pass in passes:
+                text = masking_pass(text)
+            masked[index] = text
+        return masked
+    joined = _BATCH_SEPARATOR.join(texts)
+    for masking_pass in passes:
+        joined = masking_pass(joined)
+    return joined.split(_BATCH_SEPARATOR)
 
 
 def mask_secret_in_text(text: str, rule_id: str | None = None) -> str:
@@ -17,11 +177,7 @@ def mask_secret_in_text(text: str, rule_id: str | None = None) -> str:
     if not text or not rule_id:
         return text
 
-    # Handle Bandit B105/B106/B107 (hardcoded password) findings
-    if rule_id in ("B105", "B106", "B107"):
-        return _mask_bandit_password_secret(text)
-
-    return text
+    return mask_texts([text], secret_family(rule_id))[0]
 
 
 def _mask_bandit_password_secret(text: str) -> str:
@@ -37,20 +193,7 @@ def _mask_bandit_password_secret(text: str) -> str:
     Returns:
         The text with the secret value masked
     """
-    # Pattern to match Bandit password messages with quoted secrets.
-    # Uses a non-greedy match that handles escaped quotes and stops at
-    # the matching closing delimiter (single or double quote).
-    pattern = r"""(Possible hardcoded password:\s*)(["'])((?:(?!\2).)*)\2"""
-
-    def mask_replacement(match):
-        prefix = match.group(1)  # "Possible hardcoded password: "
-        quote = match.group(2)   # The quote character (' or ")
-        secret = match.group(3)  # The actual secret
-
-        masked_secret = _mask_secret_value(secret)
-        return f"{prefix}{quote}{masked_secret}{quote}"
-
-    return re.sub(pattern, mask_replacement, text)
+    return _BANDIT_PASSWORD_PATTERN.sub(_mask_quoted_match, text)
 
 
 _mask_bandit_b105_secret = _mask_bandit_password_secret
@@ -0,0 +1,413 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Shared rule cache for the Semgrep and Opengrep scanners.
+
+Local rule sources (the bundled ASH rulesets, the offline rule cache directory
+and any local ``config`` path) are merged into a single rules file, by default
+only in offline mode. Identical
+rules are written once. The merged file is cached under the output directory,
+keyed by a digest of the source files, so unchanged rule packs are only
+parsed once. Registry entries and URLs cannot be resolved locally and are
+passed to the engine as they are.
+
+When both scanners use ``rule_sharing: union`` and all of their rule sources
+are local, one engine runs the union of both rule sets and each scanner keeps
+the results for its own rules.
+"""
+
+import copy
+import hashlib
+import json
+import os
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Tuple
+
+import yaml
+
+from automated_security_helper.core.constants import ASH_ASSETS_DIR
+from automated_security_helper.utils.log import ASH_LOGGER
+
+RULE_FILE_SUFFIXES = (".yaml", ".yml")
+
+# Environment variables naming each scanner's offline rule cache directory.
+RULES_CACHE_ENV_VARS = {
+    "semgrep": "SEMGREP_RULES_CACHE_DIR",
+    "opengrep": "OPENGREP_RULES_CACHE_DIR",
+}
+
+# Number of merged rule files kept in the cache directory.
+MERGED_RULES_TO_KEEP = 8
+
+_shared_runs_lock = threading.Lock()
+
+
+def collect_rule_sources(scanner_name: str, options: Any) -> List[str]:
+    """Return the ``--config`` sources a scanner would pass to its engine."""
+    sources = [
+        item.as_posix()
+        for item in sorted(ASH_ASSETS_DIR.joinpath("ash_stargrep_rules").glob("*"))
+        if item.suffix in RULE_FILE_SUFFIXES
+    ]
+    if options.offline:
+        sources.append(os.environ.get(RULES_CACHE_ENV_VARS[scanner_name], ""))
+    else:
+        sources.append(options.config)
+    return [source for source in dict.fromkeys(sources) if source]
+
+
+def split_rule_sources(sources: Iterable[str]) -> Tuple[List[Path], List[str]]:
+    """Split sources into local rule files and sources the engine resolves.
+
+    Directories are expanded to the rule files they contain.
+    """
+    local: Dict[Path, None] = {}
+    remote: Dict[str, None] = {}
+    for source in sources:
+        path = Path(source)
+        if path.is_file() and path.suffix in RULE_FILE_SUFFIXES:
+            local[path.resolve()] = None
+        elif path.is_dir():
+            for item in sorted(path.rglob("*")):
+                if item.is_file() and item.suffix in RULE_FILE_SUFFIXES:
+                    local[item.resolve()] = None
+        else:
+            remote[source] = None
+    return list(local), list(remote)
+
+
+@dataclass
+class MergedRules:
+    """A merged rules file and the rule IDs contributed by each source file."""
+
+    path: Path
+    digest: str
+    rule_ids_by_source: Dict[str, List[str]] = field(default_factory=dict)
+
+    def rule_ids(self, sources: Iterable[Path] | None = None) -> FrozenSet[str]:
+        """Return the rule IDs from ``sources``, or from every source."""
+        if sources is None:
+            keys = self.rule_ids_by_source.keys()
+        else:
+            keys = [Path(source).as_posix() for source in sources]
+        return frozenset(
+            rule_id for key in keys for rule_id in self.rule_ids_by_source.get(key, [])
+        )
+
+
+def _sources_digest(files: List[Path]) -> str:
+    digest = hashlib.sha256()
+    for path in sorted(files):
+        digest.update(path.as_posix().encode() + b"\0")
+        try:
+            digest.update(hashlib.sha256(path.read_bytes()).digest())
+        except OSError as e:
+            digest.update(str(e).encode())
+    return digest.hexdigest()
+
+
+def build_merged_rules(files: List[Path], cache_dir: Path) -> MergedRules | None:
+    """Merge the rules in ``files`` into one cached rules file.
+
+    Returns None when the files contain no rules.
+    """
+    if not files:
+        return None
+    digest = _sources_digest(files)
+    rules_file = cache_dir.joinpath(f"{digest}.yaml")
+    index_file = cache_dir.joinpath(f"{digest}.json")
+    if rules_file.exists() and index_file.exists():
+        try:
+            rule_ids_by_source = json.loads(index_file.read_text(encoding="utf-8"))
+            os.utime(rules_file)
+            ASH_LOGGER.debug(f"Using cached merged rules {rules_file}")
+            return MergedRules(rules_file, digest, rule_ids_by_source)
+        except (OSError, ValueError) as e:
+            ASH_LOGGER.debug(f"Rebuilding unreadable merged rules index: {e}")
+
+    merged: List[Dict[str, Any]] = []
+    canonical_by_id: Dict[str, str] = {}
+    source_by_id: Dict[str, Path] = {}
+    rule_ids_by_source: Dict[str, List[str]] = {}
+    duplicates = 0
+    for path in sorted(files):
+        try:
+            with open(path, mode="r", encoding="utf-8") as f:
+                data = yaml.safe_load(f) or {}
+        except (OSError, yaml.YAMLError) as e:
+            ASH_LOGGER.warning(f"Skipping unreadable rules file {path}: {e}")
+            continue
+        rules = data.get("rules") if isinstance(data, dict) else None
+        for rule in rules or []:
+            if not isinstance(rule, dict) or "id" not in rule:
+                continue
+            rule_id = str(rule["id"])
+            rule_ids_by_source.setdefault(path.as_posix(), []).append(rule_id)
+            canonical = json.dumps(rule, sort_keys=True, default=str)
+            if rule_id in canonical_by_id:
+                duplicates += 1
+                if canonical_by_id[rule_id] != canonical:
+                    ASH_LOGGER.warning(
+                        f"Rule {rule_id} in {path} differs from the rule with the "
+                        f"same ID in {source_by_id[rule_id]}; keeping the rule from "
+                        f"{source_by_id[rule_id]}"
+                    )
+                continue
+            canonical_by_id[rule_id] = canonical
+            source_by_id[rule_id] = path
+            merged.append(rule)
+    if not merged:
+        return None
+
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    # JSON is valid YAML and much faster to write for large rule packs.
+    tmp_file = rules_file.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp_file.write_text(json.dumps({"rules": merged}, default=str), encoding="utf-8")
+    os.replace(tmp_file, rules_file)
+    index_file.write_text(json.dumps(rule_ids_by_source), encoding="utf-8")
+    ASH_LOGGER.verbose(
+        f"Merged {len(merged)} rules from {len(files)} rule files into {rules_file} "
+        f"({duplicates} duplicates removed)"
+    )
+
+    cached = sorted(
+        cache_dir.glob("*.yaml"), key=lambda p: p.stat().st_mtime, reverse=True
+    )
+    for stale in cached[MERGED_RULES_TO_KEEP:]:
+        stale.unlink(missing_ok=True)
+        stale.with_suffix(".json").unlink(missing_ok=True)
+    return MergedRules(rules_file, digest, rule_ids_by_source)
+
+
+@dataclass
+class StargrepRuleConfig:
+    """How a scanner passes its rules to the engine."""
+
+    config_args: List[str]
+    """Values for the engine's ``--config`` arguments."""
+    merged: MergedRules | None = None
+    own_rule_ids: FrozenSet[str] | None = None
+    """Set when the engine runs a union of rule sets; results are filtered to these."""
+    shared_key: str | None = None
+    """Identifies the union run shared with the other scanner."""
+
+
+def _partner_options(plugin_context: Any, scanner_name: str) -> Tuple[str, Any] | None:
+    """Return the other scanner's name and options if it also runs the union."""
+    partner_name = "opengrep" if scanner_name == "semgrep" else "semgrep"
+    try:
+        partner = plugin_context.config.get_plugin_config("scanner", partner_name)
+    except Exception:
+        return None
+    if not partner or not partner.get("enabled", False):
+        return None
+    options = partner.get("options") or {}
+    if options.get("rule_sharing") != "union" or options.get("patterns"):
+        return None
+
+    class _Options:
+        offline = options.get("offline", False)
+        config = options.get("config", "p/ci")
+
+    return partner_name, _Options
+
+
+def resolve_stargrep_rules(
+    plugin_context: Any, scanner_name: str, options: Any
+) -> StargrepRuleConfig:
+    """Resolve a scanner's rule sources, merging the local ones."""
+    sources = collect_rule_sources(scanner_name, options)
+    merge = options.merge_local_rules
+    if merge is None:
+        # Engines are run with --no-rewrite-rule-ids on merged rules, which
+        # offline runs already use, so only merge by default when offline.
+        merge = options.offline
+    if not merge:
+        return StargrepRuleConfig(config_args=sources)
+
+    own_local, own_remote = split_rule_sources(sources)
+    local = own_local
+    sharing = False
+    if options.rule_sharing == "union" and getattr(options, "patterns", None):
+        ASH_LOGGER.verbose(
+            f"{scanner_name}: rule_sharing 'union' does not apply to pattern search; "
+            "running separately"
+        )
+    elif options.rule_sharing == "union":
+        partner = _partner_options(plugin_context, scanner_name)
+        if partner is None:
+            ASH_LOGGER.verbose(
+                f"{scanner_name}: rule_sharing is 'union' but the other *grep scanner "
+                "is not enabled with rule_sharing 'union'; running separately"
+            )
+        else:
+            partner_local, partner_remote = split_rule_sources(
+                collect_rule_sources(*partner)
+            )
+            if own_remote or partner_remote:
+                ASH_LOGGER.verbose(
+                    f"{scanner_name}: rule_sharing 'union' needs local rule sources, "
+                    f"but {[*own_remote, *partner_remote]} must be fetched by the "
+                    "engine; running separately"
+                )
+            else:
+                local = sorted(set(own_local) | set(partner_local))
+                sharing = True
+
+    merged = build_merged_rules(
+        local, Path(plugin_context.output_dir).joinpath("cache", "stargrep_rules")
+    )
+    if merged is None:
+        return StargrepRuleConfig(config_args=own_remote)
+    return StargrepRuleConfig(
+        config_args=[merged.path.as_posix(), *own_remote],
+        merged=merged,
+        own_rule_ids=merged.rule_ids(own_local) if sharing else None,
+        shared_key=merged.digest if sharing else None,
+    )
+
+
+def filter_sarif_to_rules(
+    sarif: Dict[str, Any], rule_ids: FrozenSet[str]
+) -> Dict[str, Any]:
+    """Return a copy of ``sarif`` with only the results and rules in ``rule_ids``."""
+    filtered = copy.deepcopy(sarif)
+    for run in filtered.get("runs", []) or []:
+        run["results"] = [
+            result
+            for result in run.get("results", []) or []
+            if result.get("ruleId") in rule_ids
+        ]
+        driver = (run.get("tool") or {}).get("driver") or {}
+        if "rules" in driver:
+            driver["rules"] = [
+                rule for rule in driver["rules"] or [] if rule.get("id") in rule_ids
+            ]
+    return filtered
+
+
+class SharedRuleRun:
+    """The engine output of a union run, published by whichever scanner ran it."""
+
+    def __init__(self) -> None:
+        self._done = threading.Event()
+        self.sarif: Dict[str, Any] | None = None
+        self.exit_code = 0
+
+    def publish(self, sarif: Dict[str, Any] | None, exit_code: int) -> None:
+        self.sarif = sarif
+        self.exit_code = exit_code
+        self._done.set()
+
+    def wait(
+        self, timeout: float | None = None
+    ) -> Tuple[Dict[str, Any] | None, int] | None:
+        """Return the published output, or None if it is not published in time."""
+        if not self._done.wait(timeout):
+            return None
+        return self.sarif, self.exit_code
+
+
+def claim_shared_run(
+    plugin_context: Any, key: Tuple[str, ...]
+) -> Tuple[SharedRuleRun, bool]:
+    """Return the shared run for ``key`` and whether the caller must run it."""
+    with _shared_runs_lock:
+        runs = getattr(plugin_context, "_shared_rule_runs", None)
+        if not isinstance(runs, dict):
+            runs = {}
+            plugin_context._shared_rule_runs = runs
+        if key in runs:
+            return runs[key], False
+        runs[key] = SharedRuleRun()
+        return runs[key], True
+
+
+def shared_run_key(target: Path, target_type: str, options: Any) -> Tuple[Any, ...]:
+    """Identify the target and result filters of a union run.
+
+    Scanners that exclude different paths, rules or severities do not share a run.
+    """
+    return (
+        Path(target).as_posix(),
+        target_type,
+        tuple(options.exclude),
+        tuple(options.exclude_rule),
+        tuple(options.severity),
+    )
+
+
+def run_with_shared_rules(
+    plugin_context: Any,
+    rule_config: StargrepRuleConfig | None,
+    run_key: Tuple[Any, ...],
+    results_file: Path,
+    run: Callable[[], int],
+    timeout: float | None = None,
+) -> int | None:
+    """Run the engine with ``run``, sharing union runs between scanners.
+
+    ``run`` writes SARIF results to ``results_file`` and returns the engine's
+    exit code. Without rule sharing this simply calls ``run``. With rule
+    sharing, the first scanner to arrive runs the engine and publishes its
+    output. The other scanner writes that output to its own results file
+    instead, or runs the engine itself if the first run produced no results
+    or did not finish within ``timeout`` seconds. Either way the results file
+    is then filtered to the scanner's own rules.
+
+    Returns:
+        The exit code of the shared run when this scanner reused it, else None.
+    """
+    if (
+        rule_config is None
+        or rule_config.shared_key is None
+        or rule_config.own_rule_ids is None
+    ):
+        run()
+        return None
+
+    shared, owner = claim_shared_run(plugin_context, (rule_config.shared_key, *run_key))
+    reused_exit_code = None
+    sarif = None
+    if owner:
+        exit_code = 1
+        try:
+            exit_code = run()
+            sarif = _read_sarif(results_file)
+        finally:
+            shared.publish(sarif, exit_code)
+    else:
+        outcome = shared.wait(timeout)
+        if outcome is None:
+            ASH_LOGGER.warning(
+                f"Shared *grep run did not finish within {timeout}s; running separately"
+            )
+            sarif, exit_code = None, 0
+        else:
+            sarif, exit_code = outcome
+            if sarif is None:
+                ASH_LOGGER.verbose(
+                    "Shared *grep run produced no results; running separately"
+                )
+        if sarif is None:
+            run()
+            sarif = _read_sarif(results_file)
+        else:
+            ASH_LOGGER.verbose(f"Reusing shared *grep run for {run_key[0]}")
+            reused_exit_code = exit_code
+    if sarif is not None:
+        results_file.parent.mkdir(parents=True, exist_ok=True)
+        results_file.write_text(
+            json.dumps(filter_sarif_to_rules(sarif, rule_config.own_rule_ids)),
+            encoding="utf-8",
+        )
+    return reused_exit_code
+
+
+def _read_sarif(results_file: Path) -> Dict[str, Any] | None:
+    try:
+        return json.loads(results_file.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
@@ -229,13 +229,20 @@ def find_inline_suppressions(file_path: Path) -> List[InlineSuppression]:
     Returns:
         List of ``InlineSuppression`` instances, one per directive found.
     """
-    suppressions: List[InlineSuppression] = []
     try:
         text = file_path.read_text(encoding="utf-8", errors="replace")
     except (OSError, UnicodeDecodeError) as exc:
         ASH_LOGGER.debug(f"Could not read {file_path} for inline suppressions: {exc}")
-        return suppressions
+        return []
+    return parse_inline_suppressions(text)
+
+
+def parse_inline_suppressions(text: str) -> List[InlineSuppression]:
+    """Parse inline suppression comments from source text.
 
+    See ``find_inline_suppressions`` for the recognised directives.
+    """
+    suppressions: List[InlineSuppression] = []
     for line_num_0, line in enumerate(text.splitlines()):
         line_num = line_num_0 + 1  # 1-based
 
@@ -0,0 +1,248 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Run-scoped normalization of SARIF artifact URIs.
+
+Path sanitization, suppressions and changed-file filtering all normalize
+result locations, and the same few thousand URIs would be resolved against
+the filesystem over and over. A :class:`UriNormalizer` memoizes each of those
+steps per URI string and interns the results, so each distinct URI is
+processed once per run and every later lookup is a dict hit.
+
+Later consumers, such as flattened findings, metrics and reporters, read the
+URIs sanitization already wrote back onto the results and do not resolve
+them again.
+"""
+
+import sys
+import threading
+from contextlib import suppress
+from pathlib import Path, PurePosixPath
+from typing import Dict
+
+from automated_security_helper.core.constants import ASH_WORK_DIR_NAME
+from automated_security_helper.utils.log import ASH_LOGGER
+
+_context_lock = threading.Lock()
+
+
+def _sanitize_uri(uri: str, source_dir_path: Path, source_dir_str: str) -> str:
+    """
+    Sanitize a URI in a SARIF report.
+
+    Args:
+        uri: The URI to sanitize
+        source_dir_path: The source directory path object
+        source_dir_str: The source directory string with trailing separator
+
+    Returns:
+        The sanitized URI
+    """
+    if not uri:
+        return uri
+
+    # Remove file:// prefix if present, using urlparse to handle host segments
+    if uri.startswith("file://"):
+        from urllib.parse import urlparse
+
+        parsed = urlparse(uri)
+        uri = parsed.path
+
+    # Make path relative to source directory
+    try:
+        # Try to resolve the path and make it relative
+        path_obj = Path(uri)
+        if path_obj.is_absolute():
+            with suppress(ValueError):
+                uri = str(path_obj.relative_to(source_dir_path))
+        elif uri.startswith(source_dir_str):
+            uri = uri.removeprefix(source_dir_str)
+    except Exception as e:
+        ASH_LOGGER.debug(f"Error processing path {uri}: {e}")
+
+    # Replace backslashes with forward slashes for consistency
+    uri = str(uri).replace("\\", "/")
+    return uri
+
+
+def _normalize_sarif_uri(
+    uri: str,
+    source_dir_prefix: str,
+    source_dir_prefix_with_slash: str,
+    source_dir_prefix_no_drive: str | None,
+    source_dir_basename: PurePosixPath | None,
+) -> str:
+    """Strip source-directory prefix from a SARIF artifact URI.
+
+    Handles five platform variants:
+    1. Standard Unix/Windows absolute: uri starts with source_dir_prefix
+    2. Windows with leading slash before drive: /D:/path/...
+    3. Windows with drive letter stripped by scanner: /a/repo/... vs D:/a/repo/
+    4. Offline opengrep basename-relative: basename/subpath/file.py
+    5. No match: returned unchanged (forward-slash normalised)
+    """
+    uri_normalized = uri.replace("\\", "/")
+    if uri_normalized.startswith(source_dir_prefix):
+        return uri_normalized[len(source_dir_prefix) :]
+    if uri_normalized.startswith(source_dir_prefix_with_slash):
+        return uri_normalized[len(source_dir_prefix_with_slash) :]
+    if source_dir_prefix_no_drive and uri_normalized.startswith(
+        source_dir_prefix_no_drive
+    ):
+        return uri_normalized[len(source_dir_prefix_no_drive) :]
+    # source_dir_basename is None when the source dir contains a child of the same
+    # name (see #361): the basename is a real project dir, not a scanner artifact,
+    # so stripping it would corrupt the path. relative_to(None) raises TypeError,
+    # which suppress(ValueError) would not catch, so the None check is load-bearing.
+    if source_dir_basename is not None:
+        with suppress(ValueError):
+            return str(PurePosixPath(uri_normalized).relative_to(source_dir_basename))
+    return uri_normalized
+
+
+def _as_path(value: str | Path) -> Path:
+    return value if hasattr(value, "resolve") else Path(value)
+
+
+class UriNormalizer:
+    """Memoized URI normalization relative to one source directory.
+
+    Lookups are safe from multiple threads. Two threads may compute the same
+    entry, but both compute the same value.
+    """
+
+    def __init__(self, source_dir: str | Path, output_dir: str | Path | None = None):
+        self.source_dir = _as_path(source_dir)
+        self.output_dir = _as_path(output_dir) if output_dir is not None else None
+        self.source_dir_resolved = self.source_dir.resolve()
+
+        self._source_dir_str = str(self.source_dir_resolved) + "/"
+        self._source_dir_prefix = str(self.source_dir_resolved).replace("\\", "/") + "/"
+        # On Windows, SARIF URIs may have a leading "/" before the drive letter (e.g., /D:/path)
+        self._source_dir_prefix_with_slash = "/" + self._source_dir_prefix
+        # Some Windows scanners strip the drive letter entirely (e.g., /a/repo/ instead of D:/a/repo/)
+        self._source_dir_prefix_no_drive = (
+            self._source_dir_prefix[2:]
+            if len(self._source_dir_prefix) > 2 and self._source_dir_prefix[1] == ":"
+            else None
+        )
+        # Offline opengrep produces relative paths with source_dir basename prefix (e.g., "src/.github/...")
+        # However, skip basename stripping when source_dir contains a subdirectory with the same name
+        # as its own basename (#361) - that means the basename is a real project directory, not a
+        # scanner artifact. Example: source_dir="/src" with /src/src/ existing -> skip.
+        self._source_dir_basename: PurePosixPath | None = None
+        basename = self.source_dir_resolved.name
+        if basename and not (self.source_dir_resolved / basename).exists():
+            self._source_dir_basename = PurePosixPath(basename)
+
+        self._output_dir_resolved = (
+            self.output_dir.resolve() if self.output_dir is not None else None
+        )
+        self._work_dir_resolved = (
+            self.output_dir.joinpath(ASH_WORK_DIR_NAME).resolve()
+            if self.output_dir is not None
+            else None
+        )
+
+        self._sanitized: Dict[str, str] = {}
+        self._normalized: Dict[str, str] = {}
+        self._resolved: Dict[str, Path] = {}
+        self._in_output_dir: Dict[str, bool] = {}
+        self._resolved_in_source: Dict[str, Path] = {}
+
+    def matches(self, source_dir: str | Path, output_dir: str | Path | None) -> bool:
+        """Return whether this normalizer was built for these directories."""
+        return self.source_dir == _as_path(source_dir) and self.output_dir == (
+            _as_path(output_dir) if output_dir is not None else None
+        )
+
+    def sanitize(self, uri: str) -> str:
+        """Return ``uri`` relative to the source directory; see :func:`_sanitize_uri`."""
+        if not uri:
+            return uri
+        cached = self._sanitized.get(uri)
+        if cached is not None:
+            return cached
+        sanitized = sys.intern(
+            _sanitize_uri(uri, self.source_dir_resolved, self._source_dir_str)
+        )
+        self._sanitized[uri] = sanitized
+        return sanitized
+
+    def normalize(self, uri: str) -> str:
+        """Strip the source directory prefix from a SARIF artifact URI.
+
+        See :func:`_normalize_sarif_uri` for the prefix variants handled.
+        """
+        cached = self._normalized.get(uri)
+        if cached is not None:
+            return cached
+        normalized = sys.intern(
+            _normalize_sarif_uri(
+                uri,
+                self._source_dir_prefix,
+                self._source_dir_prefix_with_slash,
+                self._source_dir_prefix_no_drive,
+                self._source_dir_basename,
+            )
+        )
+        self._normalized[uri] = normalized
+        return normalized
+
+    def resolve(self, uri: str) -> Path:
+        """Return ``Path(uri).resolve()``."""
+        resolved = self._resolved.get(uri)
+        if resolved is None:
+            resolved = self._resolved[uri] = Path(uri).resolve()
+        return resolved
+
+    def in_output_dir(self, uri: str) -> bool:
+        """Return whether a normalized URI points into the output directory.
+
+        Files in the work directory, such as converted notebooks, do not count.
+        """
+        cached = self._in_output_dir.get(uri)
+        if cached is not None:
+            return cached
+        result = False
+        if self._output_dir_resolved is not None:
+            resolved = self.resolve(uri)
+            result = resolved.is_relative_to(
+                self._output_dir_resolved
+            ) and not resolved.is_relative_to(self._work_dir_resolved)
+        self._in_output_dir[uri] = result
+        return result
+
+    def resolve_in_source(self, uri: str) -> Path:
+        """Return the absolute, resolved path of a source-relative URI."""
+        resolved = self._resolved_in_source.get(uri)
+        if resolved is None:
+            path = uri
+            if path.startswith("file://"):
+                path = path[7:]
+                if path.startswith("///"):
+                    path = path[2:]
+            resolved = self._resolved_in_source[uri] = self.source_dir.joinpath(
+                path
+            ).resolve()
+        return resolved
+
+
+def get_uri_normalizer(plugin_context) -> UriNormalizer:
+    """Return the run's URI normalizer, creating it on first use.
+
+    The normalizer is stored on ``plugin_context``, so all phases of a run
+    share its memoized lookups.
+    """
+    source_dir = plugin_context.source_dir
+    output_dir = getattr(plugin_context, "output_dir", None)
+    with _context_lock:
+        normalizer = getattr(plugin_context, "_uri_normalizer", None)
+        if isinstance(normalizer, UriNormalizer) and normalizer.matches(
+            source_dir, output_dir
+        ):
+            return normalizer
+        normalizer = UriNormalizer(source_dir, output_dir)
+        with suppress(AttributeError, TypeError, ValueError):
+            plugin_context._uri_normalizer = normalizer
+        return normalizer
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Benchmark `ash` CLI startup: wall time and import time per CLI command.
+
+Run with: uv run python scripts/benchmark_cli_startup.py
+
+Each command is run several times in a fresh interpreter with
+`python -X importtime`; the median wall time and median total import time
+are reported along with the modules that took longest to import. Save the
+results with --output and compare a later run against them with --baseline;
+the script exits 1 if any command got slower than --max-regression allows.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+COMMANDS = {
+    "help": ["--help"],
+    "scan --help": ["scan", "--help"],
+    "config --help": ["config", "--help"],
+    "config validate": ["config", "validate"],
+    "plugin list": ["plugin", "list"],
+    "report --help": ["report", "--help"],
+    "inspect --help": ["inspect", "--help"],
+}
+
+# "import time: <self us> | <cumulative us> | <indent><module>"
+IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+
+def parse_importtime(stderr: str) -> tuple[float, dict[str, float]]:
+    """Return total import seconds and per-module self seconds."""
+    total_us = 0
+    self_times: dict[str, float] = {}
+    for line in stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if not match:
+            continue
+        self_us, cumulative_us, indent, module = match.groups()
+        # Top-level imports have a single space of indentation.
+        if len(indent) == 1:
+            total_us += int(cumulative_us)
+        self_times[module] = self_times.get(module, 0.0) + int(self_us) / 1e6
+    return total_us / 1e6, self_times
+
+
+def run_command(args: list[str], cwd: Path) -> tuple[float, float, dict[str, float]]:
+    """Run one CLI command and return wall seconds, import seconds and module times."""
+    env = dict(os.environ, ASH_NO_COLOR="1", NO_COLOR="1")
+    started = time.perf_counter()
+    completed = subprocess.run(
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-m",
+            "automated_security_helper.cli.main",
+            *args,
+        ],
+        cwd=cwd,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    wall = time.perf_counter() - started
+    import_total, module_times = parse_importtime(completed.stderr)
+    return wall, import_total, module_times
+
+
+def benchmark(commands: dict[str, list[str]], runs: int, top: int) -> dict:
+    """Benchmark each command and return the results keyed by command name."""
+    results = {}
+    with tempfile.TemporaryDirectory() as workdir:
+        for name, args in commands.items():
+            # Warm the filesystem and bytecode caches before timing.
+            run_command(args, Path(workdir))
+            walls, imports, module_totals = [], [], {}
+            for _ in range(runs):
+                wall, import_total, module_times = run_command(args, Path(workdir))
+                walls.append(wall)
+                imports.append(import_total)
+                for module, seconds in module_times.items():
+                    module_totals[module] = module_totals.get(module, 0.0) + seconds
+            slowest = sorted(module_totals.items(), key=lambda kv: kv[1], reverse=True)
+            results[name] = {
+                "args": args,
+                "wall_seconds": round(statistics.median(walls), 4),
+                "import_seconds": round(statistics.median(imports), 4),
+                "slowest_imports": {
+                    module: round(seconds / runs, 4)
+                    for module, seconds in slowest[:top]
+                },
+            }
+    return results
+
+
+def compare(results: dict, baseline: dict, max_regression: float) -> list[str]:
+    """Return a message for each command slower than the baseline allows."""
+    regressions = []
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if previous is None:
+            continue
+        limit = previous["wall_seconds"] * (1 + max_regression / 100)
+        if current["wall_seconds"] > limit:
+            regressions.append(
+                f"{name}: {current['wall_seconds']:.3f}s vs baseline "
+                f"{previous['wall_seconds']:.3f}s (limit {limit:.3f}s)"
+            )
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="Timed runs per command")
+    parser.add_argument(
+        "--top", type=int, default=5, help="Slowest imports to list per command"
+    )
+    parser.add_argument(
+        "--command",
+        action="append",
+        choices=sorted(COMMANDS),
+        help="Only benchmark this command (repeatable)",
+    )
+    parser.add_argument("--output", type=Path, help="Write results to this JSON file")
+    parser.add_argument(
+        "--baseline", type=Path, help="Compare against results from an earlier run"
+    )
+    parser.add_argument(
+        "--max-regression",
+        type=float,
+        default=20.0,
+        help="Allowed wall time increase over the baseline, in percent",
+    )
+    opts = parser.parse_args()
+
+    commands = {name: COMMANDS[name] for name in (opts.command or COMMANDS)}
+    results = benchmark(commands, runs=opts.runs, top=opts.top)
+
+    print(f"{'command':<18} {'wall (s)':>9} {'imports (s)':>12}  slowest import")
+    for name, result in results.items():
+        slowest = next(iter(result["slowest_imports"].items()), ("-", 0.0))
+        print(
+            f"{name:<18} {result['wall_seconds']:>9.3f} "
+            f"{result['import_seconds']:>12.3f}  {slowest[0]} ({slowest[1]:.3f}s)"
+        )
+
+    if opts.output:
+        opts.output.write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+        print(f"\nWrote {opts.output}")
+
+    if opts.baseline:
+        regressions = compare(
+            results,
+            json.loads(opts.baseline.read_text(encoding="utf-8")),
+            opts.max_regression,
+        )
+        if regressions:
+            print("\nStartup regressions:")
+            for message in regressions:
+                print(f"  {message}")
+            return 1
+        print(
+            f"\nNo command is more than {opts.max_regression:.0f}% slower than the baseline."
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
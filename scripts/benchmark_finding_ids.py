@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Benchmark finding ID generation: the blake2 engine against the compat engine.
+
+Run with: uv run python scripts/benchmark_finding_ids.py
+
+Each engine generates IDs for --count synthetic findings, first with an empty
+memo table (every ID is computed) and then again with the memo table warm
+(the repeated suppression passes of a scan). The memo table holds
+FINDING_ID_CACHE_SIZE IDs, so counts above that measure the cold path twice.
+Times are the best of --runs.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+
+from automated_security_helper.utils.sarif_utils import (
+    FINDING_ID_CACHE_SIZE,
+    FINDING_ID_ENGINES,
+    _cached_finding_id,
+    get_finding_id,
+)
+
+
+def make_keys(count: int) -> list[tuple[str, str, int, int]]:
+    """Return (rule, file, start, end) tuples for synthetic findings."""
+    return [
+        (f"RULE{i % 97:03d}", f"src/module_{i % 1013}.py", i % 500 + 1, i % 500 + 3)
+        for i in range(count)
+    ]
+
+
+def time_engine(engine: str, keys: list, runs: int) -> tuple[float, float]:
+    """Return the best cold and warm seconds to generate an ID for every key."""
+    cold, warm = [], []
+    for _ in range(runs):
+        _cached_finding_id.cache_clear()
+        started = time.perf_counter()
+        for key in keys:
+            get_finding_id(*key, engine=engine)
+        cold.append(time.perf_counter() - started)
+
+        started = time.perf_counter()
+        for key in keys:
+            get_finding_id(*key, engine=engine)
+        warm.append(time.perf_counter() - started)
+    return min(cold), min(warm)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--count",
+        type=int,
+        default=FINDING_ID_CACHE_SIZE // 2,
+        help="Findings to generate IDs for",
+    )
+    parser.add_argument("--runs", type=int, default=3, help="Timed runs per engine")
+    opts = parser.parse_args()
+
+    keys = make_keys(opts.count)
+    results = {
+        engine: time_engine(engine, keys, opts.runs) for engine in FINDING_ID_ENGINES
+    }
+
+    print(f"{'engine':<8} {'cold (s)':>9} {'warm (s)':>9} {'us/id cold':>11}")
+    for engine, (cold, warm) in results.items():
+        print(f"{engine:<8} {cold:>9.3f} {warm:>9.3f} {cold / opts.count * 1e6:>11.2f}")
+    speedup = results["compat"][0] / results["blake2"][0]
+    print(f"\nblake2 is {speedup:.1f}x faster than compat without the memo table.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,394 @@
+#!/usr/bin/env python3
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Benchmark the post-scan pipeline against synthetic large-repo and large-SARIF fixtures.
+
+Run with: uv run python scripts/benchmark_post_scan.py
+
+Generates a source tree of --files files with .gitignore files nested
+--depth directories deep, --scanners SARIF reports holding --results results
+between them, and --suppressions suppression rules. Then times scan_set,
+merge_sarif_report, apply_suppressions_to_sarif, to_flat_vulnerabilities,
+get_unified_scanner_metrics and every built-in reporter against them. Setup
+such as copying the input report is not timed. The median of --runs timed
+runs is reported. Save the results with --output and compare a later run
+against them with --baseline; the script exits 1 if any benchmark got slower
+than --max-regression allows.
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import json
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+from automated_security_helper.base.plugin_context import PluginContext
+from automated_security_helper.config.ash_config import AshConfig
+from automated_security_helper.core.unified_metrics import get_unified_scanner_metrics
+from automated_security_helper.models.asharp_model import AshAggregatedResults
+from automated_security_helper.models.core import AshSuppression
+from automated_security_helper.schemas.sarif_schema_model import SarifReport
+from automated_security_helper.utils.get_scan_set import scan_set
+from automated_security_helper.utils.log import get_logger
+from automated_security_helper.utils.sarif_utils import apply_suppressions_to_sarif
+
+SCANNER_NAMES = [
+    "bandit",
+    "semgrep",
+    "checkov",
+    "detect-secrets",
+    "grype",
+    "cfn-nag",
+    "npm-audit",
+    "opengrep",
+]
+LEVELS = ["error", "warning", "note"]
+EXTENSIONS = [".py", ".js", ".ts", ".yaml", ".json", ".tf", ".go", ".java"]
+
+# A benchmark is a setup function returning the zero-argument callable to time.
+Benchmark = Callable[[], Callable[[], object]]
+
+
+def make_source_tree(root: Path, files: int, depth: int) -> List[str]:
+    """Write a source tree of ``files`` files with nested .gitignore files.
+
+    Every directory level holds a .gitignore that ignores build output and
+    logs below it and re-includes one file, so scan_set has to evaluate
+    ignore rules from every level. About one file in eight is ignored.
+
+    Returns:
+        Relative paths of the files that should be scanned
+    """
+    branches = max(1, round(files ** (1 / max(depth, 1)) / 2))
+    directories = [root]
+    for level in range(depth):
+        next_level = []
+        for directory in directories:
+            directory.mkdir(parents=True, exist_ok=True)
+            directory.joinpath(".gitignore").write_text(
+                f"*.log\nbuild_{level}/\n!keep_{level}.log\n", encoding="utf-8"
+            )
+            next_level.extend(directory / f"pkg{level}_{b}" for b in range(branches))
+        directories = next_level
+    for directory in directories:
+        directory.mkdir(parents=True, exist_ok=True)
+
+    scanned = []
+    for i in range(files):
+        directory = directories[i % len(directories)]
+        if i % 8 == 7:
+            path = directory / f"build_{depth - 1}" / f"artifact_{i}.py"
+        elif i % 8 == 6:
+            path = directory / f"debug_{i}.log"
+        else:
+            path = directory / f"module_{i}{EXTENSIONS[i % len(EXTENSIONS)]}"
+            scanned.append(path.relative_to(root).as_posix())
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(f"# synthetic file {i}\nvalue = {i}\n", encoding="utf-8")
+    return scanned
+
+
+def make_sarif_reports(
+    results: int, scanners: int, paths: List[str]
+) -> List[SarifReport]:
+    """Return one SARIF report per scanner, ``results`` results in total."""
+    reports = []
+    names = [
+        SCANNER_NAMES[i % len(SCANNER_NAMES)]
+        + (f"-{i}" if i >= len(SCANNER_NAMES) else "")
+        for i in range(scanners)
+    ]
+    for s, name in enumerate(names):
+        count = results // scanners + (1 if s < results % scanners else 0)
+        rule_ids = [f"{name.upper()}-{r:03d}" for r in range(25)]
+        run_results = []
+        for i in range(count):
+            line = (i * 7) % 400 + 1
+            run_results.append(
+                {
+                    "ruleId": rule_ids[i % len(rule_ids)],
+                    "level": LEVELS[i % len(LEVELS)],
+                    "message": {
+                        "text": f"{name} finding {i}: potential issue in generated code"
+                    },
+                    "locations": [
+                        {
+                            "physicalLocation": {
+                                "artifactLocation": {
+                                    "uri": paths[(s * 31 + i) % len(paths)]
+                                },
+                                "region": {
+                                    "startLine": line,
+                                    "endLine": line + 2,
+                                    "snippet": {"text": f"value = {i}"},
+                                },
+                            }
+                        }
+                    ],
+                    "properties": {"tags": ["security", name]},
+                }
+            )
+        reports.append(
+            SarifReport.model_validate(
+                {
+                    "version": "2.1.0",
+                    "runs": [
+                        {
+                            "tool": {
+                                "driver": {
+                                    "name": name,
+                                    "version": "1.0.0",
+                                    "rules": [
+                                        {
+                                            "id": rule_id,
+                                            "shortDescription": {
+                                                "text": f"Rule {rule_id}"
+                                            },
+                                        }
+                                        for rule_id in rule_ids
+                                    ],
+                                }
+                            },
+                            "results": run_results,
+                        }
+                    ],
+                }
+            )
+        )
+    return reports
+
+
+def make_suppressions(
+    count: int, paths: List[str], scanners: int
+) -> List[AshSuppression]:
+    """Return ``count`` suppression rules mixing exact paths, globs and line ranges."""
+    suppressions = []
+    for i in range(count):
+        name = SCANNER_NAMES[i % min(scanners, len(SCANNER_NAMES))]
+        kind = i % 3
+        if kind == 0:
+            path = paths[(i * 13) % len(paths)]
+        elif kind == 1:
+            path = f"**/pkg0_{i % 4}/**/*{EXTENSIONS[i % len(EXTENSIONS)]}"
+        else:
+            path = f"{Path(paths[(i * 17) % len(paths)]).parent.as_posix()}/*"
+        suppressions.append(
+            AshSuppression(
+                rule_id=f"{name.upper()}-{i % 25:03d}",
+                path=path,
+                line_start=1 if kind == 2 else None,
+                line_end=200 if kind == 2 else None,
+                reason=f"Synthetic suppression {i}",
+            )
+        )
+    return suppressions
+
+
+def merge_reports(reports: List[SarifReport]) -> SarifReport:
+    """Merge per-scanner reports into a fresh aggregated report."""
+    merged = AshAggregatedResults().sarif.model_copy(deep=True)
+    for report in reports:
+        merged.merge_sarif_report(report)
+    return merged
+
+
+def reporter_benchmarks(
+    context: PluginContext, results: AshAggregatedResults
+) -> Dict[str, Benchmark]:
+    """Return a benchmark for every built-in reporter."""
+    from automated_security_helper.plugins import ash_plugin_manager
+    from automated_security_helper.plugins.loader import load_internal_plugins
+
+    load_internal_plugins()
+    benchmarks: Dict[str, Benchmark] = {}
+    for reporter_class in ash_plugin_manager.plugin_modules("reporter"):
+        reporter = reporter_class(context=context)
+        name = getattr(reporter.config, "name", reporter_class.__name__)
+
+        def setup(reporter=reporter) -> Callable[[], object]:
+            if getattr(reporter, "supports_streaming", False) is True:
+                return lambda: reporter.report_stream(results, io.StringIO())
+            return lambda: reporter.report(results)
+
+        benchmarks[f"reporter:{name}"] = setup
+    return benchmarks
+
+
+def build_benchmarks(opts: argparse.Namespace, workdir: Path) -> Dict[str, Benchmark]:
+    """Generate the fixtures and return the benchmarks keyed by name."""
+    source_dir = workdir / "source"
+    output_dir = workdir / "output"
+    output_dir.mkdir(parents=True)
+    paths = make_source_tree(source_dir, opts.files, opts.depth)
+    reports = make_sarif_reports(opts.results, opts.scanners, paths)
+    context = PluginContext(
+        source_dir=source_dir,
+        output_dir=output_dir,
+        config=AshConfig(
+            project_name="benchmark",
+            global_settings={
+                "suppressions": make_suppressions(
+                    opts.suppressions, paths, opts.scanners
+                )
+            },
+        ),
+    )
+    merged = merge_reports(reports)
+    suppressed = apply_suppressions_to_sarif(merged.model_copy(deep=True), context)
+
+    def fresh_results() -> AshAggregatedResults:
+        return AshAggregatedResults(sarif=suppressed.model_copy(deep=True))
+
+    def flattened_results() -> AshAggregatedResults:
+        results = fresh_results()
+        results.to_flat_vulnerabilities()
+        return results
+
+    benchmarks: Dict[str, Benchmark] = {
+        "scan_set": lambda: lambda: scan_set(
+            source=str(source_dir), output=str(output_dir)
+        ),
+        "merge_sarif_report": lambda: lambda: merge_reports(reports),
+        "apply_suppressions_to_sarif": lambda: (
+            lambda report: lambda: apply_suppressions_to_sarif(report, context)
+        )(merged.model_copy(deep=True)),
+        "to_flat_vulnerabilities": lambda: fresh_results().to_flat_vulnerabilities,
+        "get_unified_scanner_metrics": lambda: (
+            lambda results: lambda: get_unified_scanner_metrics(results)
+        )(fresh_results()),
+    }
+    benchmarks.update(reporter_benchmarks(context, flattened_results()))
+    return benchmarks
+
+
+def run_benchmarks(
+    benchmarks: Dict[str, Benchmark], runs: int
+) -> Dict[str, Dict[str, float]]:
+    """Time each benchmark ``runs`` times and return median and min seconds."""
+    results = {}
+    for name, setup in benchmarks.items():
+        timings = []
+        for _ in range(runs):
+            operation = setup()
+            started = time.perf_counter()
+            operation()
+            timings.append(time.perf_counter() - started)
+        results[name] = {
+            "median_seconds": round(statistics.median(timings), 5),
+            "min_seconds": round(min(timings), 5),
+        }
+    return results
+
+
+def compare(results: dict, baseline: dict, max_regression: float) -> List[str]:
+    """Return a message for each benchmark slower than the baseline allows."""
+    regressions = []
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if previous is None:
+            continue
+        limit = previous["median_seconds"] * (1 + max_regression / 100)
+        if current["median_seconds"] > limit:
+            regressions.append(
+                f"{name}: {current['median_seconds']:.4f}s vs baseline "
+                f"{previous['median_seconds']:.4f}s (limit {limit:.4f}s)"
+            )
+    return regressions
+
+
+def parse_args(argv: List[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--files", type=int, default=5000, help="Files in the source tree"
+    )
+    parser.add_argument("--depth", type=int, default=6, help="Directory nesting depth")
+    parser.add_argument(
+        "--results", type=int, default=10000, help="SARIF results in total"
+    )
+    parser.add_argument(
+        "--scanners", type=int, default=8, help="SARIF reports to merge"
+    )
+    parser.add_argument(
+        "--suppressions", type=int, default=200, help="Suppression rules to apply"
+    )
+    parser.add_argument("--runs", type=int, default=3, help="Timed runs per benchmark")
+    parser.add_argument(
+        "--benchmark",
+        action="append",
+        help="Only run benchmarks whose name starts with this prefix (repeatable)",
+    )
+    parser.add_argument("--output", type=Path, help="Write results to this JSON file")
+    parser.add_argument(
+        "--baseline", type=Path, help="Compare against results from an earlier run"
+    )
+    parser.add_argument(
+        "--max-regression",
+        type=float,
+        default=20.0,
+        help="Allowed median time increase over the baseline, in percent",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: List[str] | None = None) -> int:
+    opts = parse_args(argv)
+    # Scanner and reporter code logs per finding; keep the timings about the work.
+    get_logger(level=40)
+
+    with tempfile.TemporaryDirectory() as workdir:
+        benchmarks = build_benchmarks(opts, Path(workdir))
+        if opts.benchmark:
+            benchmarks = {
+                name: setup
+                for name, setup in benchmarks.items()
+                if any(name.startswith(prefix) for prefix in opts.benchmark)
+            }
+        results = run_benchmarks(benchmarks, opts.runs)
+
+    params = {
+        key: getattr(opts, key)
+        for key in ("files", "depth", "results", "scanners", "suppressions", "runs")
+    }
+    print(", ".join(f"{key}={value}" for key, value in params.items()))
+    print(f"{'benchmark':<36} {'median (s)':>11} {'min (s)':>9}")
+    for name, result in results.items():
+        print(
+            f"{name:<36} {result['median_seconds']:>11.4f} {result['min_seconds']:>9.4f}"
+        )
+
+    if opts.output:
+        opts.output.write_text(
+            json.dumps({"params": params, "results": results}, indent=2) + "\n",
+            encoding="utf-8",
+        )
+        print(f"\nWrote {opts.output}")
+
+    if opts.baseline:
+        baseline = json.loads(opts.baseline.read_text(encoding="utf-8"))
+        if baseline.get("params") != params:
+            print(
+                f"\nWarning: baseline was recorded with {baseline.get('params')}; "
+                "timings are not comparable."
+            )
+        regressions = compare(results, baseline.get("results", {}), opts.max_regression)
+        if regressions:
+            print("\nPerformance regressions:")
+            for message in regressions:
+                print(f"  {message}")
+            return 1
+        print(
+            f"\nNo benchmark is more than {opts.max_regression:.0f}% slower than the baseline."
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
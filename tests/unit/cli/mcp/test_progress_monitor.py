@@ -149,14 +149,23 @@ class TestMonitorScanProgress:
             await monitor_scan_progress(mock_ctx, "scan-cancel")
 
     @pytest.mark.asyncio
-    async def test_reports_scanner_progress_from_result_files(self, mock_ctx, tmp_path):
+    async def test_reports_scanner_progress_from_event_stream(self, mock_ctx, tmp_path):
         output_dir = tmp_path / ".ash" / "ash_output"
-        scanners_dir = output_dir / "scanners" / "bandit" / "source"
-        scanners_dir.mkdir(parents=True)
-        result_file = scanners_dir / "ASH.ScanResults.json"
-        result_file.write_text(json.dumps({"severity_counts": {"high": 2, "medium": 1}}))
-
-        aggregated = output_dir / "ash_aggregated_results.json"
+        output_dir.mkdir(parents=True)
+        events_file = output_dir / "ash.events.jsonl"
+        events_file.write_text(
+            json.dumps({"event": "EXECUTION_START"})
+            + "\n"
+            + json.dumps(
+                {
+                    "event": "SCAN_COMPLETE",
+                    "scanner": "bandit",
+                    "total_count": 2,
+                    "severity_counts": {"high": 2, "medium": 1},
+                }
+            )
+            + "\n"
+        )
 
         call_count = 0
 
@@ -166,7 +175,8 @@ class TestMonitorScanProgress:
             if call_count == 1:
                 return {"success": True, "directory_path": str(tmp_path)}
             if call_count >= 3:
-                aggregated.write_text("{}")
+                with open(events_file, "a") as f:
+                    f.write(json.dumps({"event": "EXECUTION_COMPLETE"}) + "\n")
             return {"success": True, "status": "running", "directory_path": str(tmp_path)}
 
         with (
@@ -188,4 +198,12 @@ class TestMonitorScanProgress:
         ):
             await monitor_scan_progress(mock_ctx, "scan-progress")
 
-        assert mock_ctx.report_progress.await_count >= 1
+        messages = [
+            call.kwargs.get("message") for call in mock_ctx.report_progress.await_args_list
+        ]
+        assert "bandit completed: 2 high, 1 medium" in messages
+        progress_values = [
+            call.kwargs.get("progress") for call in mock_ctx.report_progress.await_args_list
+        ]
+        assert 0.5 in progress_values
+        assert progress_values[-1] == 1.0
@@ -0,0 +1,219 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Unit tests for cli/mcp/scan_worker_pool.py.
+
+The workers are real child processes; stdlib functions stand in for
+run_ash_scan so the tests exercise dispatch, isolation and recycling
+without running any scanners.
+"""
+
+import subprocess
+
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from automated_security_helper.cli.mcp import scan_worker_pool
+from automated_security_helper.cli.mcp.scan_worker_pool import (
+    ScanWorker,
+    ScanWorkerPool,
+    get_scan_worker_pool,
+    shutdown_scan_worker_pool,
+)
+
+
+@pytest.fixture
+def pool():
+    worker_pool = ScanWorkerPool(
+        size=1,
+        max_scans_per_worker=2,
+        scan_target="json:dumps",
+        warm_up=False,
+    )
+    yield worker_pool
+    worker_pool.shutdown()
+
+
+class TestScanWorkerPool:
+    def test_runs_scan_in_worker_process(self, pool):
+        result = pool.run_scan_sync(obj={"a": 1}, sort_keys=True)
+        assert result["success"] is True
+        assert result["result"] == '{"a": 1}'
+        assert result["worker_pid"] is not None
+
+    def test_worker_is_reused_until_recycled(self, pool):
+        first = pool.run_scan_sync(obj=1)
+        second = pool.run_scan_sync(obj=2)
+        third = pool.run_scan_sync(obj=3)
+
+        assert first["worker_pid"] == second["worker_pid"]
+        assert third["worker_pid"] != first["worker_pid"]
+        assert pool.stats()["idle_workers"] == 1
+
+    def test_scan_errors_are_isolated_in_worker(self, pool):
+        result = pool.run_scan_sync(unexpected_kwarg=True)
+        assert result["success"] is False
+        assert result["error_type"] == "TypeError"
+
+        # The same worker keeps serving scans after a failed one.
+        assert pool.run_scan_sync(obj=[])["success"] is True
+
+    def test_dead_worker_is_replaced(self, pool):
+        dead_pid = pool.stats()["worker_pids"][0]
+        pool._idle[0].process.kill()
+        pool._idle[0].process.join()
+
+        result = pool.run_scan_sync(obj="x")
+        assert result["success"] is True
+        assert result["worker_pid"] != dead_pid
+
+    @pytest.mark.asyncio
+    async def test_async_run_scan(self, pool):
+        result = await pool.run_scan(obj=[1, 2])
+        assert result["result"] == "[1, 2]"
+
+    def test_scan_timeout_replaces_worker(self):
+        worker_pool = ScanWorkerPool(
+            size=1, scan_target="subprocess:call", warm_up=False, scan_timeout=2
+        )
+        try:
+            hung_pid = worker_pool.stats()["worker_pids"][0]
+            result = worker_pool.run_scan_sync(args=["sleep", "30"])
+
+            assert result["success"] is False
+            assert result["error_type"] == "TimeoutError"
+            assert worker_pool.stats()["worker_pids"] != [hung_pid]
+            assert worker_pool.run_scan_sync(args=["true"])["result"] == 0
+        finally:
+            worker_pool.shutdown()
+
+    def test_warm_up_timeout_replaces_worker(self, pool):
+        pool.warm_up_timeout = 1
+        hung = ScanWorker.__new__(ScanWorker)
+        hung.conn, _child_conn = pool._mp_context.Pipe()
+        hung.process = pool._mp_context.Process(
+            target=subprocess.call, args=(["sleep", "30"],), daemon=True
+        )
+        hung.process.start()
+        hung.scans_completed = 0
+        hung._ready = None
+        pool._idle[0].stop()
+        pool._idle[0] = hung
+
+        result = pool.run_scan_sync(obj=1)
+
+        assert result["success"] is False
+        assert result["error_type"] == "TimeoutError"
+        assert not hung.is_alive()
+        # The replacement worker imports from scratch; don't hold it to 1s.
+        pool.warm_up_timeout = None
+        assert pool.run_scan_sync(obj=2)["success"] is True
+
+    def test_rejects_scans_after_shutdown(self, pool):
+        pool.shutdown()
+        with pytest.raises(RuntimeError):
+            pool.run_scan_sync(obj=1)
+
+    def test_invalid_sizes_rejected(self):
+        with pytest.raises(ValueError):
+            ScanWorkerPool(size=0, warm_up=False)
+        with pytest.raises(ValueError):
+            ScanWorkerPool(size=1, max_scans_per_worker=0, warm_up=False)
+        with pytest.raises(ValueError):
+            ScanWorkerPool(size=1, scan_timeout=0, warm_up=False)
+        with pytest.raises(ValueError):
+            ScanWorkerPool(size=1, warm_up_timeout=0, warm_up=False)
+
+
+class TestGetScanWorkerPool:
+    def test_disabled_by_default(self, monkeypatch):
+        monkeypatch.delenv("ASH_MCP_WARM_WORKERS", raising=False)
+        assert get_scan_worker_pool() is None
+
+    def test_invalid_env_value_disables_pool(self, monkeypatch):
+        monkeypatch.setenv("ASH_MCP_WARM_WORKERS", "many")
+        assert get_scan_worker_pool() is None
+
+    def test_creates_singleton_from_env(self, monkeypatch):
+        monkeypatch.setenv("ASH_MCP_WARM_WORKERS", "2")
+        monkeypatch.setenv("ASH_MCP_WORKER_MAX_SCANS", "5")
+        monkeypatch.setenv("ASH_MCP_WORKER_SCAN_TIMEOUT", "0")
+        monkeypatch.setenv("ASH_MCP_WORKER_WARM_UP_TIMEOUT", "60")
+        with patch.object(scan_worker_pool, "ScanWorkerPool") as mock_pool_cls:
+            try:
+                pool = get_scan_worker_pool()
+                assert get_scan_worker_pool() is pool
+                mock_pool_cls.assert_called_once_with(
+                    size=2,
+                    max_scans_per_worker=5,
+                    scan_timeout=None,
+                    warm_up_timeout=60.0,
+                )
+            finally:
+                shutdown_scan_worker_pool()
+        pool.shutdown.assert_called_once()
+
+
+class TestRunScanAsyncDispatch:
+    @pytest.mark.asyncio
+    async def test_dispatches_to_worker_pool(self, tmp_path):
+        from automated_security_helper.cli import mcp_tools
+        from automated_security_helper.core.resource_management.scan_registry import (
+            MCScanStatus,
+            get_scan_registry,
+        )
+
+        (tmp_path / ".ash" / "ash_output").mkdir(parents=True)
+        registry = get_scan_registry()
+        scan_id = registry.register_scan(
+            directory_path=str(tmp_path),
+            output_directory=str(tmp_path / ".ash" / "ash_output"),
+            severity_threshold="MEDIUM",
+        )
+        fake_pool = AsyncMock()
+        fake_pool.run_scan = AsyncMock(return_value={"success": True})
+
+        with patch.object(mcp_tools, "get_scan_worker_pool", return_value=fake_pool):
+            await mcp_tools._run_scan_async(
+                scan_id=scan_id,
+                directory_path=str(tmp_path),
+                output_dir=str(tmp_path / ".ash" / "ash_output"),
+                severity_threshold="MEDIUM",
+            )
+
+        kwargs = fake_pool.run_scan.await_args.kwargs
+        assert kwargs["source_dir"] == str(tmp_path)
+        assert kwargs["fail_on_findings"] is False
+        assert registry.get_scan(scan_id).status == MCScanStatus.COMPLETED
+
+    @pytest.mark.asyncio
+    async def test_worker_failure_marks_scan_failed(self, tmp_path):
+        from automated_security_helper.cli import mcp_tools
+        from automated_security_helper.core.resource_management.scan_registry import (
+            MCScanStatus,
+            get_scan_registry,
+        )
+
+        (tmp_path / ".ash" / "ash_output").mkdir(parents=True)
+        registry = get_scan_registry()
+        scan_id = registry.register_scan(
+            directory_path=str(tmp_path),
+            output_directory=str(tmp_path / ".ash" / "ash_output"),
+            severity_threshold="MEDIUM",
+        )
+        fake_pool = AsyncMock()
+        fake_pool.run_scan = AsyncMock(
+            return_value={"success": False, "error": "worker crashed"}
+        )
+
+        with patch.object(mcp_tools, "get_scan_worker_pool", return_value=fake_pool):
+            await mcp_tools._run_scan_async(
+                scan_id=scan_id,
+                directory_path=str(tmp_path),
+                output_dir=str(tmp_path / ".ash" / "ash_output"),
+                severity_threshold="MEDIUM",
+            )
+
+        entry = registry.get_scan(scan_id)
+        assert entry.status == MCScanStatus.FAILED
+        assert "worker crashed" in entry.error_message
@@ -0,0 +1,95 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for `ash inspect history` and the get_findings_history MCP tool."""
+
+import json
+
+from typer.testing import CliRunner
+
+from automated_security_helper.cli.inspect import inspect_app
+from automated_security_helper.cli.mcp_tools import mcp_get_findings_history
+from automated_security_helper.core.findings_history import (
+    FindingsHistory,
+    history_path,
+)
+from automated_security_helper.models.asharp_model import AshAggregatedResults
+
+
+def _results(generated_at, *rule_ids):
+    return AshAggregatedResults.from_json(
+        {
+            "metadata": {"report_id": "ASH-20260101", "generated_at": generated_at},
+            "sarif": {
+                "version": "2.1.0",
+                "runs": [
+                    {
+                        "tool": {"driver": {"name": "bandit"}},
+                        "results": [
+                            {
+                                "ruleId": rule_id,
+                                "level": "warning",
+                                "message": {"text": rule_id},
+                                "locations": [
+                                    {
+                                        "physicalLocation": {
+                                            "artifactLocation": {"uri": "app.py"},
+                                            "region": {"startLine": 1},
+                                        }
+                                    }
+                                ],
+                            }
+                            for rule_id in rule_ids
+                        ],
+                    }
+                ],
+            },
+        }
+    )
+
+
+def _record(output_dir):
+    with FindingsHistory(history_path(output_dir)) as history:
+        history.ingest(_results("2026-01-01T00:00:00", "B101", "B102"))
+        history.ingest(_results("2026-01-02T00:00:00", "B101", "B103"))
+
+
+def test_inspect_history(tmp_path):
+    _record(tmp_path)
+    runner = CliRunner()
+
+    scans = runner.invoke(
+        inspect_app, ["history", "--output-dir", str(tmp_path), "--json"]
+    )
+    new = runner.invoke(
+        inspect_app, ["history", "--output-dir", str(tmp_path), "--new", "--json"]
+    )
+    missing = runner.invoke(
+        inspect_app, ["history", "--output-dir", str(tmp_path / "none")]
+    )
+
+    assert scans.exit_code == 0
+    assert [(s["new"], s["resolved"]) for s in json.loads(scans.output)] == [
+        (1, 1),
+        (2, 0),
+    ]
+    assert [f["rule_id"] for f in json.loads(new.output)] == ["B103"]
+    assert missing.exit_code == 1
+
+
+def test_mcp_get_findings_history(tmp_path):
+    _record(tmp_path)
+
+    resolved = mcp_get_findings_history(output_dir=str(tmp_path), view="resolved")
+    findings = mcp_get_findings_history(
+        output_dir=str(tmp_path), view="findings", scan="-1", rule_id="B102"
+    )
+
+    assert [f["rule_id"] for f in resolved["items"]] == ["B102"]
+    assert [f["severity"] for f in findings["items"]] == ["MEDIUM"]
+    assert (
+        mcp_get_findings_history(output_dir=str(tmp_path / "none"))["success"] is False
+    )
+    assert (
+        mcp_get_findings_history(output_dir=str(tmp_path), view="x")["success"] is False
+    )
@@ -1,5 +1,7 @@
 """Tests for converter implementations."""
 
+import io
+import os
 import pytest
 from pathlib import Path
 import tempfile
@@ -7,13 +9,22 @@ import zipfile
 import tarfile
 import json
 
+from automated_security_helper.models.core import IgnorePathWithReason
 from automated_security_helper.plugin_modules.ash_builtin.converters.archive_converter import (
     ArchiveConverter,
     ArchiveConverterConfig,
+    ArchiveConverterConfigOptions,
 )
 from automated_security_helper.plugin_modules.ash_builtin.converters.jupyter_converter import (
     JupyterConverter,
     JupyterConverterConfig,
+    JupyterConverterConfigOptions,
+    _ipython2python,
+    notebook_to_script,
+)
+
+_JUPYTER_MODULE = (
+    "automated_security_helper.plugin_modules.ash_builtin.converters.jupyter_converter"
 )
 
 
@@ -149,6 +160,143 @@ class TestArchiveConverter:
         assert (extracted_dir / "test.py").exists()
         assert not (extracted_dir / "test.txt").exists()
 
+    def _convert(self, test_plugin_context, monkeypatch, archives, **options):
+        monkeypatch.setattr(
+            "automated_security_helper.plugin_modules.ash_builtin.converters.archive_converter.scan_set",
+            lambda *args, **kwargs: [str(a) for a in archives],
+        )
+        converter = ArchiveConverter(
+            context=test_plugin_context,
+            config=ArchiveConverterConfig(
+                options=ArchiveConverterConfigOptions(**options)
+            ),
+        )
+        return converter, converter.convert()
+
+    def test_archive_converter_dedupes_identical_archives(
+        self, temp_dir, sample_zip_file, test_plugin_context, monkeypatch
+    ):
+        """Identical archives are extracted once and the copy is hard-linked."""
+        copy = temp_dir / "copy.zip"
+        copy.write_bytes(sample_zip_file.read_bytes())
+
+        extracted = []
+        original = ArchiveConverter._extract_archive
+
+        def spy(self, archive_file, *args, **kwargs):
+            extracted.append(archive_file)
+            return original(self, archive_file, *args, **kwargs)
+
+        monkeypatch.setattr(ArchiveConverter, "_extract_archive", spy)
+        _, results = self._convert(
+            test_plugin_context, monkeypatch, [sample_zip_file, copy]
+        )
+
+        assert len(extracted) == 1
+        assert len(results) == 2
+        first, second = (d / "subfolder" / "test2.py" for d in results)
+        assert second.read_text() == 'print("World")'
+        assert os.path.samefile(first, second)
+
+    def test_archive_converter_dedupe_respects_ignore_paths_of_each_copy(
+        self, temp_dir, sample_zip_file, test_plugin_context, monkeypatch
+    ):
+        """A copy whose members are ignored differently is extracted on its own."""
+        (temp_dir / "vendor").mkdir()
+        copy = temp_dir / "vendor" / "copy.zip"
+        copy.write_bytes(sample_zip_file.read_bytes())
+        test_plugin_context.config.global_settings.ignore_paths = [
+            IgnorePathWithReason(path="**/vendor/copy.zip/subfolder/**", reason="x")
+        ]
+
+        _, results = self._convert(
+            test_plugin_context, monkeypatch, [sample_zip_file, copy]
+        )
+
+        assert len(results) == 2
+        first, second = results
+        assert (first / "subfolder" / "test2.py").exists()
+        assert (second / "test.py").exists()
+        assert not (second / "subfolder").exists()
+
+    def test_archive_converter_unsupported_archive_creates_no_directory(
+        self, temp_dir, test_plugin_context, monkeypatch
+    ):
+        """Files with an archive extension but no archive content are skipped."""
+        fake = temp_dir / "fake.zip"
+        fake.write_text("not an archive")
+
+        converter, results = self._convert(test_plugin_context, monkeypatch, [fake])
+
+        assert results == []
+        assert list(converter.results_dir.iterdir()) == []
+
+    def test_archive_converter_skips_ignored_members(
+        self, temp_dir, sample_zip_file, test_plugin_context, monkeypatch
+    ):
+        """Members matching global ignore_paths are never written."""
+        test_plugin_context.config.global_settings.ignore_paths = [
+            IgnorePathWithReason(path="**/subfolder/**", reason="vendored")
+        ]
+        _, results = self._convert(test_plugin_context, monkeypatch, [sample_zip_file])
+        assert len(results) == 1
+        assert (results[0] / "test.py").exists()
+        assert not (results[0] / "subfolder").exists()
+
+    def test_archive_converter_nested_archives_are_bounded(
+        self, temp_dir, test_plugin_context, monkeypatch
+    ):
+        """Nested archives are extracted up to max_extraction_depth levels."""
+        inner = io.BytesIO()
+        with zipfile.ZipFile(inner, "w") as zf:
+            zf.writestr("inner.py", 'print("inner")')
+        middle = io.BytesIO()
+        with zipfile.ZipFile(middle, "w") as zf:
+            zf.writestr("middle.py", 'print("middle")')
+            zf.writestr("lib/inner.zip", inner.getvalue())
+        outer = temp_dir / "outer.zip"
+        with zipfile.ZipFile(outer, "w") as zf:
+            zf.writestr("outer.py", 'print("outer")')
+            zf.writestr("middle.zip", middle.getvalue())
+
+        _, results = self._convert(test_plugin_context, monkeypatch, [outer])
+        assert sorted(p.name for p in results[0].iterdir()) == ["outer.py"]
+
+        _, results = self._convert(
+            test_plugin_context, monkeypatch, [outer], max_extraction_depth=1
+        )
+        middle_dir = results[0] / "middle.zip"
+        assert (middle_dir / "middle.py").exists()
+        assert not (middle_dir / "lib").exists()
+
+        _, results = self._convert(
+            test_plugin_context, monkeypatch, [outer], max_extraction_depth=2
+        )
+        assert (results[0] / "middle.zip" / "lib" / "inner.zip" / "inner.py").exists()
+
+    def test_archive_converter_concurrent_extraction(
+        self, temp_dir, test_plugin_context, monkeypatch
+    ):
+        """Distinct archives extracted on a worker pool keep their input order."""
+        archives = []
+        for index in range(4):
+            path = temp_dir / f"archive{index}.tar.gz"
+            with tarfile.open(path, mode="w:gz") as tf:
+                data = f"value = {index}".encode()
+                info = tarfile.TarInfo(name=f"module{index}.py")
+                info.size = len(data)
+                tf.addfile(info, io.BytesIO(data))
+            archives.append(path)
+
+        _, results = self._convert(
+            test_plugin_context, monkeypatch, archives, max_workers=4
+        )
+        assert len(results) == 4
+        for index, extracted_dir in enumerate(results):
+            assert (
+                extracted_dir / f"module{index}.py"
+            ).read_text() == f"value = {index}"
+
 
 class TestArchiveConverterPathTraversal:
     """Security tests for path traversal prevention in ArchiveConverter."""
@@ -489,3 +637,209 @@ class TestJupyterConverter:
         # Check content
         content = converted_file.read_text()
         assert 'print("Hello World")' in content
+
+    @staticmethod
+    def _python_notebook(cells):
+        return {
+            "cells": cells,
+            "metadata": {
+                "language_info": {"name": "python", "nbconvert_exporter": "python"}
+            },
+            "nbformat": 4,
+            "nbformat_minor": 4,
+        }
+
+    def test_notebook_to_script_matches_nbconvert_layout(self):
+        """Native conversion renders cells the way `nbconvert --to script` does."""
+        pytest.importorskip("IPython")
+        notebook = self._python_notebook(
+            [
+                {
+                    "cell_type": "markdown",
+                    "metadata": {},
+                    "source": ["# Title\n", "text"],
+                },
+                {
+                    "cell_type": "code",
+                    "execution_count": 3,
+                    "metadata": {},
+                    "outputs": [],
+                    "source": ["import os\n", "print(os.sep)"],
+                },
+                {
+                    "cell_type": "code",
+                    "execution_count": None,
+                    "metadata": {},
+                    "outputs": [],
+                    "source": "x = 1",
+                },
+            ]
+        )
+        assert notebook_to_script(notebook) == (
+            "#!/usr/bin/env python\n# coding: utf-8\n"
+            "\n# # Title\n# text\n"
+            "\n# In[3]:\n\n\nimport os\nprint(os.sep)\n\n"
+            "\n# In[ ]:\n\n\nx = 1\n\n"
+        )
+
+    def test_notebook_to_script_defers_unsupported_notebooks(self):
+        """Notebooks the native engine cannot render identically return None."""
+        raw_cell = self._python_notebook(
+            [{"cell_type": "raw", "metadata": {}, "source": "raw"}]
+        )
+        assert notebook_to_script(raw_cell) is None
+
+        r_notebook = self._python_notebook([])
+        r_notebook["metadata"]["language_info"] = {"name": "R"}
+        assert notebook_to_script(r_notebook) is None
+
+    def test_code_cells_need_nbconvert_without_ipython(self, monkeypatch):
+        """Without IPython, notebooks with code cells are left to nbconvert."""
+        monkeypatch.setattr(f"{_JUPYTER_MODULE}._ipython_transformer", lambda: None)
+        assert _ipython2python("x = 1") is None
+
+        code_cell = {
+            "cell_type": "code",
+            "execution_count": 1,
+            "metadata": {},
+            "outputs": [],
+            "source": "x = 1",
+        }
+        assert notebook_to_script(self._python_notebook([code_cell])) is None
+
+    def test_jupyter_converter_native_without_ipython_uses_nbconvert(
+        self, test_plugin_context, temp_dir, monkeypatch
+    ):
+        """Without IPython, the native engine hands every notebook to nbconvert."""
+        path = temp_dir / "notebook.ipynb"
+        path.write_text(
+            json.dumps(
+                self._python_notebook(
+                    [
+                        {
+                            "cell_type": "code",
+                            "execution_count": 1,
+                            "metadata": {},
+                            "outputs": [],
+                            "source": "x = 1",
+                        }
+                    ]
+                )
+            ),
+            encoding="utf-8",
+        )
+        monkeypatch.setattr(f"{_JUPYTER_MODULE}.scan_set", lambda *a, **k: [str(path)])
+        monkeypatch.setattr(f"{_JUPYTER_MODULE}._ipython_transformer", lambda: None)
+
+        def fail_batch(batch):
+            raise AssertionError("notebooks should not be converted natively")
+
+        monkeypatch.setattr(f"{_JUPYTER_MODULE}._convert_notebook_batch", fail_batch)
+
+        converted = []
+
+        def fake_nbconvert(self, ipynb_file, target_path):
+            converted.append(ipynb_file)
+            target_path.write_text("x = 1\n", encoding="utf-8")
+            return True
+
+        monkeypatch.setattr(JupyterConverter, "_convert_with_nbconvert", fake_nbconvert)
+
+        converter = JupyterConverter(
+            context=test_plugin_context,
+            config=JupyterConverterConfig(),
+        )
+        assert len(converter.convert()) == 1
+        assert converted == [str(path)]
+
+    def test_jupyter_converter_native_convert_and_cache(
+        self, test_plugin_context, temp_dir, monkeypatch
+    ):
+        """Native conversion writes scripts, dedupes identical notebooks and reuses the cache."""
+        pytest.importorskip("IPython")
+        notebook = self._python_notebook(
+            [
+                {
+                    "cell_type": "code",
+                    "execution_count": 1,
+                    "metadata": {},
+                    "outputs": [],
+                    "source": 'print("Hello World")',
+                }
+            ]
+        )
+        notebooks = []
+        for name in ("first.ipynb", "second.ipynb"):
+            path = temp_dir / name
+            path.write_text(json.dumps(notebook), encoding="utf-8")
+            notebooks.append(str(path))
+
+        monkeypatch.setattr(f"{_JUPYTER_MODULE}.scan_set", lambda *a, **k: notebooks)
+
+        def fail_subprocess(*args, **kwargs):
+            raise AssertionError("nbconvert should not run for native notebooks")
+
+        monkeypatch.setattr(f"{_JUPYTER_MODULE}.subprocess.run", fail_subprocess)
+
+        converter = JupyterConverter(
+            context=test_plugin_context,
+            config=JupyterConverterConfig(),
+        )
+        results = converter.convert()
+        assert len(results) == 2
+        assert results[0].name.endswith("first__ipynb-converted.py")
+        assert results[1].name.endswith("second__ipynb-converted.py")
+        assert all('print("Hello World")' in p.read_text() for p in results)
+
+        cache_dir = Path(test_plugin_context.output_dir) / "cache" / "jupyter"
+        assert len(list(cache_dir.glob("*.py"))) == 1
+
+        def fail_batch(batch):
+            raise AssertionError("cached notebooks should not be converted again")
+
+        monkeypatch.setattr(f"{_JUPYTER_MODULE}._convert_notebook_batch", fail_batch)
+        assert len(converter.convert()) == 2
+
+    def test_jupyter_converter_native_parallel_batches(
+        self, test_plugin_context, temp_dir, monkeypatch
+    ):
+        """Several batches are converted on a worker pool and keep their order."""
+        pytest.importorskip("IPython")
+        notebooks = []
+        for index in range(5):
+            path = temp_dir / f"nb{index}.ipynb"
+            path.write_text(
+                json.dumps(
+                    self._python_notebook(
+                        [
+                            {
+                                "cell_type": "code",
+                                "execution_count": 1,
+                                "metadata": {},
+                                "outputs": [],
+                                "source": f"value = {index}",
+                            }
+                        ]
+                    )
+                ),
+                encoding="utf-8",
+            )
+            notebooks.append(str(path))
+        monkeypatch.setattr(f"{_JUPYTER_MODULE}.scan_set", lambda *a, **k: notebooks)
+
+        converter = JupyterConverter(
+            context=test_plugin_context,
+            config=JupyterConverterConfig(
+                options=JupyterConverterConfigOptions(
+                    batch_size=2, max_workers=2, cache_conversions=False
+                )
+            ),
+        )
+        results = converter.convert()
+        assert len(results) == 5
+        assert all(
+            p.name.endswith(f"nb{index}__ipynb-converted.py")
+            for index, p in enumerate(results)
+        )
+        for index, path in enumerate(results):
+            assert f"value = {index}" in path.read_text()
@@ -0,0 +1,301 @@
+"""Unit tests for ReportPhase sequential and parallel reporter execution."""
+
+from __future__ import annotations
+
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from automated_security_helper.config.ash_config import AshConfig
+from automated_security_helper.core.phases.report_phase import ReportPhase
+from automated_security_helper.models.asharp_model import AshAggregatedResults
+from automated_security_helper.plugins.events import AshEventType
+
+AshConfig.model_rebuild()
+AshAggregatedResults.model_rebuild()
+
+
+@pytest.fixture
+def mock_plugin_context(tmp_path):
+    ctx = MagicMock()
+    ctx.source_dir = tmp_path / "source"
+    ctx.work_dir = tmp_path / "work"
+    ctx.output_dir = tmp_path / "output"
+    ctx.config = MagicMock()
+    ctx.config.output_formats = []
+    return ctx
+
+
+@pytest.fixture
+def mock_progress():
+    display = MagicMock()
+    display.add_task.side_effect = range(1000)
+    return display
+
+
+def _make_reporter_class(name, extension, report=None, delay=0.0, thread_safe=True):
+    """Return a MagicMock that looks like a reporter plugin class."""
+    cls = MagicMock(name=name)
+    cls.__name__ = name
+    instance = MagicMock()
+    instance.__class__ = cls
+    instance.__class__.__name__ = name
+    instance.thread_safe = thread_safe
+    cfg = MagicMock()
+    cfg.enabled = True
+    cfg.name = name.lower()
+    cfg.extension = extension
+    instance.config = cfg
+    instance.is_python_only.return_value = True
+    instance.validate_plugin_dependencies.return_value = True
+    instance.dependencies_satisfied = True
+
+    def _report(model):
+        time.sleep(delay)
+        if isinstance(report, Exception):
+            raise report
+        return report
+
+    instance.report.side_effect = _report
+    cls.return_value = instance
+    return cls
+
+
+def _run(phase, tmp_path, **kwargs):
+    return phase._execute_phase(
+        report_dir=tmp_path / "reports",
+        aggregated_results=AshAggregatedResults(),
+        **kwargs,
+    )
+
+
+class TestReportPhaseParallel:
+    def test_parallel_writes_every_report(
+        self, mock_plugin_context, mock_progress, tmp_path
+    ):
+        phase = ReportPhase(
+            plugin_context=mock_plugin_context,
+            plugins=[
+                _make_reporter_class("SlowReporter", "csv", "a,b", delay=0.2),
+                _make_reporter_class("FastReporter", "md", "# md"),
+                _make_reporter_class("EmptyReporter", "txt", None),
+            ],
+            progress_display=mock_progress,
+        )
+        _run(phase, tmp_path, parallel=True)
+
+        assert (tmp_path / "reports" / "ash.csv").read_text() == "a,b"
+        assert (tmp_path / "reports" / "ash.md").read_text() == "# md"
+        assert not (tmp_path / "reports" / "ash.txt").exists()
+
+    def test_completion_order_matches_enabled_order(
+        self, mock_plugin_context, mock_progress, tmp_path
+    ):
+        phase = ReportPhase(
+            plugin_context=mock_plugin_context,
+            plugins=[
+                _make_reporter_class("First", "csv", "1", delay=0.3),
+                _make_reporter_class("Second", "md", "2", delay=0.1),
+                _make_reporter_class("Third", "yaml", "3"),
+            ],
+            progress_display=mock_progress,
+        )
+        with patch.object(phase, "notify_event") as mock_notify:
+            _run(phase, tmp_path, parallel=True)
+
+        completed = [
+            c.kwargs["reporter"]
+            for c in mock_notify.call_args_list
+            if c.args and c.args[0] == AshEventType.REPORT_COMPLETE
+        ]
+        assert completed == ["first", "second", "third"]
+
+    def test_reporters_run_concurrently(
+        self, mock_plugin_context, mock_progress, tmp_path
+    ):
+        barrier = threading.Barrier(3, timeout=5)
+        plugins = []
+        for name, ext in (("A", "csv"), ("B", "md"), ("C", "yaml")):
+            cls = _make_reporter_class(name, ext)
+            # Each reporter waits for the others, which can only succeed
+            # if all three are running at the same time.
+            cls.return_value.report.side_effect = lambda model: str(barrier.wait())
+            plugins.append(cls)
+
+        phase = ReportPhase(
+            plugin_context=mock_plugin_context,
+            plugins=plugins,
+            progress_display=mock_progress,
+        )
+        _run(phase, tmp_path, parallel=True, max_workers=3)
+
+        assert len(list((tmp_path / "reports").iterdir())) == 3
+
+    def test_reporters_not_thread_safe_run_on_calling_thread(
+        self, mock_plugin_context, mock_progress, tmp_path
+    ):
+        threads = {}
+        plugins = []
+        for name, ext, thread_safe in (
+            ("Safe", "csv", True),
+            ("UnsafeA", "md", False),
+            ("UnsafeB", "yaml", False),
+        ):
+            cls = _make_reporter_class(name, ext, thread_safe=thread_safe)
+
+            def _report(model, name=name):
+                threads[name] = threading.current_thread()
+                return name
+
+            cls.return_value.report.side_effect = _report
+            plugins.append(cls)
+
+        phase = ReportPhase(
+            plugin_context=mock_plugin_context,
+            plugins=plugins,
+            progress_display=mock_progress,
+        )
+        _run(phase, tmp_path, parallel=True, max_workers=3)
+
+        assert threads["UnsafeA"] is threading.current_thread()
+        assert threads["UnsafeB"] is threading.current_thread()
+        assert threads["Safe"] is not threading.current_thread()
+        assert (tmp_path / "reports" / "ash.yaml").read_text() == "UnsafeB"
+
+    def test_failing_reporter_is_isolated(
+        self, mock_plugin_context, mock_progress, tmp_path
+    ):
+        phase = ReportPhase(
+            plugin_context=mock_plugin_context,
+            plugins=[
+                _make_reporter_class("Broken", "csv", RuntimeError("boom")),
+                _make_reporter_class("Healthy", "md", "ok"),
+            ],
+            progress_display=mock_progress,
+        )
+        _run(phase, tmp_path, parallel=True)
+
+        assert (tmp_path / "reports" / "ash.md").read_text() == "ok"
+        assert not (tmp_path / "reports" / "ash.csv").exists()
+        descriptions = [
+            c.kwargs.get("description", "")
+            for c in mock_progress.update_task.call_args_list
+        ]
+        assert any("(broken) Failed: boom" in d for d in descriptions)
+
+    def test_flat_vulnerabilities_materialized_before_fan_out(
+        self, mock_plugin_context, mock_progress, tmp_path
+    ):
+        model = AshAggregatedResults.from_json(
+            {
+                "sarif": {
+                    "version": "2.1.0",
+                    "runs": [
+                        {
+                            "tool": {"driver": {"name": "bandit"}},
+                            "results": [
+                                {"ruleId": "B101", "message": {"text": "assert"}}
+                            ],
+                        }
+                    ],
+                }
+            }
+        )
+        phase = ReportPhase(
+            plugin_context=mock_plugin_context,
+            plugins=[
+                _make_reporter_class("A", "csv", "a"),
+                _make_reporter_class("B", "md", "b"),
+            ],
+            progress_display=mock_progress,
+        )
+        phase._execute_phase(
+            report_dir=tmp_path / "reports",
+            aggregated_results=model,
+            parallel=True,
+        )
+        assert model._flat_cache is not None
+        # Lazy fields are serialized before reporters share the findings.
+        assert all("raw_data" in v.__dict__ for v in model._flat_cache)
+
+
+class TestReportPhaseSequential:
+    def test_sequential_is_default(self, mock_plugin_context, mock_progress, tmp_path):
+        phase = ReportPhase(
+            plugin_context=mock_plugin_context,
+            plugins=[
+                _make_reporter_class("A", "csv", "a"),
+                _make_reporter_class("B", "md", RuntimeError("boom")),
+            ],
+            progress_display=mock_progress,
+        )
+        with patch.object(phase, "_run_reporters_parallel") as mock_parallel:
+            _run(phase, tmp_path)
+
+        mock_parallel.assert_not_called()
+        assert (tmp_path / "reports" / "ash.csv").read_text() == "a"
+        assert not (tmp_path / "reports" / "ash.md").exists()
+
+
+class TestReportPhaseStreaming:
+    def test_streaming_reporter_writes_through_file_handle(
+        self, mock_plugin_context, mock_progress, tmp_path
+    ):
+        cls = _make_reporter_class("Streamer", "csv")
+        instance = cls.return_value
+        instance.supports_streaming = True
+
+        def _stream(model, fh):
+            fh.write("a,b\n")
+            fh.write("1,2\n")
+            return True
+
+        instance.report_stream.side_effect = _stream
+        phase = ReportPhase(
+            plugin_context=mock_plugin_context,
+            plugins=[cls],
+            progress_display=mock_progress,
+        )
+        _run(phase, tmp_path)
+
+        instance.report.assert_not_called()
+        assert (tmp_path / "reports" / "ash.csv").read_text() == "a,b\n1,2\n"
+
+    def test_failed_stream_leaves_no_partial_report(
+        self, mock_plugin_context, mock_progress, tmp_path
+    ):
+        cls = _make_reporter_class("Streamer", "csv")
+        instance = cls.return_value
+        instance.supports_streaming = True
+
+        def _stream(model, fh):
+            fh.write("partial")
+            raise RuntimeError("boom")
+
+        instance.report_stream.side_effect = _stream
+        phase = ReportPhase(
+            plugin_context=mock_plugin_context,
+            plugins=[cls],
+            progress_display=mock_progress,
+        )
+        _run(phase, tmp_path)
+
+        assert list((tmp_path / "reports").iterdir()) == []
+
+    def test_stream_without_output_writes_nothing(
+        self, mock_plugin_context, mock_progress, tmp_path
+    ):
+        cls = _make_reporter_class("Streamer", "csv")
+        instance = cls.return_value
+        instance.supports_streaming = True
+        instance.report_stream.return_value = False
+        phase = ReportPhase(
+            plugin_context=mock_plugin_context,
+            plugins=[cls],
+            progress_display=mock_progress,
+        )
+        _run(phase, tmp_path)
+
+        assert list((tmp_path / "reports").iterdir()) == []
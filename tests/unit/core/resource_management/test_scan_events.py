@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Unit tests for the scan event stream module.
+
+Covers writing events, incremental tailing (including partial lines and
+restarts), folding events into progress, and the file-based tracking
+functions preferring the event stream over the scanners directory.
+"""
+
+import json
+from unittest.mock import MagicMock, patch
+
+from automated_security_helper.core.resource_management import scan_events
+from automated_security_helper.core.resource_management.scan_events import (
+    SCAN_EVENTS_FILENAME,
+    ScanEventProgress,
+    ScanEventTailer,
+    build_scan_event,
+    read_scan_event_progress,
+    write_scan_event,
+)
+from automated_security_helper.core.resource_management.scan_tracking import (
+    create_scan_progress_from_files,
+    get_scanner_progress,
+)
+from automated_security_helper.plugin_modules.ash_builtin.event_handlers.scan_event_stream import (
+    SCAN_EVENT_STREAM_HANDLERS,
+)
+from automated_security_helper.plugins.events import AshEventType
+
+
+class TestBuildScanEvent:
+    """Tests for build_scan_event."""
+
+    def test_keeps_only_streamed_fields(self):
+        event = build_scan_event(
+            AshEventType.SCAN_COMPLETE,
+            scanner="bandit",
+            total_count=3,
+            plugin_context=MagicMock(),
+            results=object(),
+        )
+        assert event["event"] == "SCAN_COMPLETE"
+        assert event["scanner"] == "bandit"
+        assert event["total_count"] == 3
+        assert "plugin_context" not in event
+        assert "results" not in event
+        assert "timestamp" in event
+
+    def test_exception_is_stringified(self):
+        event = build_scan_event(AshEventType.ERROR, exception=ValueError("boom"))
+        assert event["error"] == "boom"
+
+
+class TestWriteAndTail:
+    """Tests for write_scan_event and ScanEventTailer."""
+
+    def test_tailer_returns_only_new_events(self, tmp_path):
+        tailer = ScanEventTailer(tmp_path)
+        assert tailer.read_new_events() == []
+
+        write_scan_event(tmp_path, AshEventType.EXECUTION_START, truncate=True)
+        write_scan_event(tmp_path, AshEventType.SCAN_START, scanner="bandit")
+        assert [e["event"] for e in tailer.read_new_events()] == [
+            "EXECUTION_START",
+            "SCAN_START",
+        ]
+        assert tailer.read_new_events() == []
+
+        write_scan_event(tmp_path, AshEventType.SCAN_COMPLETE, scanner="bandit")
+        events = tailer.read_new_events()
+        assert len(events) == 1
+        assert events[0]["scanner"] == "bandit"
+
+    def test_partial_line_is_held_back(self, tmp_path):
+        events_path = tmp_path / SCAN_EVENTS_FILENAME
+        events_path.write_text(json.dumps({"event": "SCAN_START"}) + '\n{"event": ')
+        tailer = ScanEventTailer(tmp_path)
+
+        assert [e["event"] for e in tailer.read_new_events()] == ["SCAN_START"]
+
+        with open(events_path, "a") as f:
+            f.write('"SCAN_COMPLETE"}\n')
+        assert [e["event"] for e in tailer.read_new_events()] == ["SCAN_COMPLETE"]
+
+    def test_truncated_stream_rewinds(self, tmp_path):
+        tailer = ScanEventTailer(tmp_path)
+        for _ in range(5):
+            write_scan_event(tmp_path, AshEventType.SCAN_START, scanner="bandit")
+        assert len(tailer.read_new_events()) == 5
+
+        write_scan_event(tmp_path, AshEventType.EXECUTION_START, truncate=True)
+        assert [e["event"] for e in tailer.read_new_events()] == ["EXECUTION_START"]
+
+    def test_malformed_lines_are_skipped(self, tmp_path):
+        (tmp_path / SCAN_EVENTS_FILENAME).write_text(
+            "not json\n" + json.dumps({"event": "SCAN_START"}) + "\n"
+        )
+        assert [e["event"] for e in ScanEventTailer(tmp_path).read_new_events()] == [
+            "SCAN_START"
+        ]
+
+
+class TestScanEventProgress:
+    """Tests for folding events into ScanEventProgress."""
+
+    def test_tracks_scanner_lifecycle(self):
+        progress = ScanEventProgress()
+        progress.apply({"event": "EXECUTION_START"})
+        progress.apply({"event": "SCAN_PHASE_START"})
+        progress.apply({"event": "SCAN_START", "scanner": "bandit"})
+        progress.apply({"event": "SCAN_START", "scanner": "checkov"})
+        progress.apply(
+            {
+                "event": "SCAN_COMPLETE",
+                "scanner": "bandit",
+                "total_count": 2,
+                "finding_count": 3,
+                "severity_counts": {"high": 3},
+                "target_types": ["source"],
+            }
+        )
+
+        assert progress.started
+        assert progress.current_phase == "scan"
+        assert progress.running_scanners == {"checkov"}
+        assert progress.completed_scanners["bandit"]["finding_count"] == 3
+        assert progress.progress == 0.5
+        assert not progress.finished
+
+        progress.apply({"event": "EXECUTION_COMPLETE"})
+        assert progress.finished
+        assert progress.progress == 1.0
+
+    def test_execution_error_marks_failed(self):
+        progress = ScanEventProgress()
+        progress.apply({"event": "ERROR", "phase": "scan", "error": "scanner broke"})
+        assert not progress.failed
+        progress.apply(
+            {"event": "ERROR", "phase": "execution", "error": "engine broke"}
+        )
+        assert progress.failed
+        assert progress.errors == ["scanner broke", "engine broke"]
+
+    def test_execution_start_resets_state(self):
+        progress = ScanEventProgress()
+        progress.apply(
+            {"event": "SCAN_COMPLETE", "scanner": "bandit", "total_count": 1}
+        )
+        progress.apply({"event": "EXECUTION_START"})
+        assert progress.completed_scanners == {}
+        assert progress.total_scanners == 0
+
+
+class TestStreamSubscribers:
+    """Tests for the built-in event stream subscribers."""
+
+    def test_subscriber_writes_to_context_output_dir(self, tmp_path):
+        context = MagicMock()
+        context.output_dir = tmp_path
+
+        SCAN_EVENT_STREAM_HANDLERS[AshEventType.EXECUTION_START](plugin_context=context)
+        SCAN_EVENT_STREAM_HANDLERS[AshEventType.SCAN_COMPLETE](
+            plugin_context=context, scanner="bandit", total_count=1
+        )
+
+        events = ScanEventTailer(tmp_path).read_new_events()
+        assert [e["event"] for e in events] == ["EXECUTION_START", "SCAN_COMPLETE"]
+
+    def test_subscriber_accepts_explicit_output_dir(self, tmp_path):
+        context = MagicMock()
+        context.output_dir = tmp_path / "unused"
+
+        SCAN_EVENT_STREAM_HANDLERS[AshEventType.EXECUTION_START](
+            plugin_context=context, output_dir=tmp_path
+        )
+
+        events = ScanEventTailer(tmp_path).read_new_events()
+        assert [e["event"] for e in events] == ["EXECUTION_START"]
+
+    def test_subscriber_without_output_dir_is_noop(self):
+        with patch(
+            "automated_security_helper.plugin_modules.ash_builtin.event_handlers.scan_event_stream.write_scan_event"
+        ) as mock_write:
+            assert SCAN_EVENT_STREAM_HANDLERS[AshEventType.SCAN_START](scanner="bandit")
+        mock_write.assert_not_called()
+
+
+class TestTrackingUsesEventStream:
+    """Tests for scan tracking reading the event stream."""
+
+    def test_returns_none_without_stream(self, tmp_path):
+        assert read_scan_event_progress(tmp_path) is None
+
+    def test_get_scanner_progress_from_events(self, tmp_path):
+        write_scan_event(tmp_path, AshEventType.EXECUTION_START, truncate=True)
+        write_scan_event(
+            tmp_path,
+            AshEventType.SCAN_COMPLETE,
+            scanner="bandit",
+            total_count=2,
+            finding_count=1,
+            severity_counts={"high": 1},
+            target_types=["source", "converted"],
+        )
+
+        with patch(
+            "automated_security_helper.core.resource_management.scan_tracking.find_scanner_result_files"
+        ) as mock_find:
+            progress = get_scanner_progress(tmp_path)
+            scan_progress = create_scan_progress_from_files("scan-1", tmp_path)
+        mock_find.assert_not_called()
+
+        assert progress["bandit"]["targets_completed"] == ["source", "converted"]
+        assert progress["bandit"]["finding_count"] == 1
+        assert set(scan_progress.scanners["bandit"].keys()) == {"source", "converted"}
+
+    def test_progress_is_read_incrementally(self, tmp_path):
+        write_scan_event(tmp_path, AshEventType.EXECUTION_START, truncate=True)
+        first = read_scan_event_progress(tmp_path)
+        assert first.completed_scanners == {}
+
+        write_scan_event(tmp_path, AshEventType.SCAN_COMPLETE, scanner="bandit")
+        second = read_scan_event_progress(tmp_path)
+        assert second is first
+        assert "bandit" in second.completed_scanners
+
+    def test_removed_stream_drops_finished_progress(self, tmp_path):
+        write_scan_event(tmp_path, AshEventType.EXECUTION_START, truncate=True)
+        write_scan_event(tmp_path, AshEventType.EXECUTION_COMPLETE)
+        assert read_scan_event_progress(tmp_path).finished
+
+        # A new run removes the previous stream before it starts writing.
+        (tmp_path / SCAN_EVENTS_FILENAME).unlink()
+        assert read_scan_event_progress(tmp_path) is None
+        write_scan_event(tmp_path, AshEventType.EXECUTION_START, truncate=True)
+        assert not read_scan_event_progress(tmp_path).finished
+
+    def test_progress_cache_is_bounded(self, tmp_path):
+        for index in range(scan_events.PROGRESS_CACHE_SIZE + 5):
+            output_dir = tmp_path / str(index)
+            write_scan_event(output_dir, AshEventType.EXECUTION_START, truncate=True)
+            read_scan_event_progress(output_dir)
+
+        assert len(scan_events._progress_cache) == scan_events.PROGRESS_CACHE_SIZE
+        assert str(tmp_path / "0") not in scan_events._progress_cache
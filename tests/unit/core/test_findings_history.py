@@ -0,0 +1,204 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for the persistent findings history."""
+
+import hashlib
+import json
+from unittest.mock import patch
+
+from automated_security_helper.base.plugin_context import PluginContext
+from automated_security_helper.config.ash_config import AshConfig
+from automated_security_helper.core.findings_history import (
+    FindingsHistory,
+    history_path,
+    iter_scan_findings,
+    keep_new_findings,
+    record_findings_history,
+)
+from automated_security_helper.models.asharp_model import AshAggregatedResults
+
+
+def _result(rule_id, line=3, snippet=None, suppressed=False):
+    region = {"startLine": line}
+    if snippet is not None:
+        region["snippet"] = {"text": snippet}
+    result = {
+        "ruleId": rule_id,
+        "level": "error",
+        "message": {"text": f"{rule_id} found"},
+        "locations": [
+            {
+                "physicalLocation": {
+                    "artifactLocation": {"uri": "src/app.py"},
+                    "region": region,
+                }
+            }
+        ],
+    }
+    if suppressed:
+        result["suppressions"] = [{"kind": "external", "justification": "ok"}]
+    return result
+
+
+def _results(generated_at, *results):
+    return AshAggregatedResults.from_json(
+        {
+            "metadata": {"report_id": "ASH-20260101", "generated_at": generated_at},
+            "sarif": {
+                "version": "2.1.0",
+                "runs": [
+                    {"tool": {"driver": {"name": "bandit"}}, "results": list(results)}
+                ],
+            },
+        }
+    )
+
+
+def _rules(findings):
+    return sorted(f["rule_id"] for f in findings)
+
+
+def test_new_and_resolved_findings_between_scans(tmp_path):
+    with FindingsHistory(tmp_path / "history.sqlite3") as history:
+        first = history.ingest(
+            _results("2026-01-01T00:00:00", _result("B101"), _result("B102"))
+        )
+        second = history.ingest(
+            _results("2026-01-02T00:00:00", _result("B101"), _result("B103", 9))
+        )
+
+        assert _rules(history.new_findings()) == ["B103"]
+        assert _rules(history.resolved_findings()) == ["B102"]
+        assert _rules(history.new_findings(scan=first)) == ["B101", "B102"]
+        assert _rules(history.new_findings(scan=first, baseline=second)) == ["B102"]
+        assert history.resolve_scan(-1) == first
+        assert history.resolve_scan("ASH-20260101") == second
+
+        [b101] = history.findings(rule_id="B101")
+        assert b101["first_seen_seq"] == first
+        assert b101["first_seen_at"].startswith("2026-01-01")
+        assert [s["severity_counts"] for s in history.trend()] == [
+            {"HIGH": 2},
+            {"HIGH": 2},
+        ]
+
+
+def test_ingest_is_idempotent_per_scan(tmp_path):
+    results = _results("2026-01-01T00:00:00", _result("B101"))
+    with FindingsHistory(tmp_path / "history.sqlite3") as history:
+        seq = history.ingest(results)
+        assert history.ingest(results) == seq
+        assert len(history.scans()) == 1
+
+
+def test_snippet_keeps_fingerprint_when_lines_move(tmp_path):
+    with FindingsHistory(tmp_path / "history.sqlite3") as history:
+        history.ingest(_results("2026-01-01T00:00:00", _result("B101", 3, "assert  x")))
+        history.ingest(_results("2026-01-02T00:00:00", _result("B101", 30, "assert x")))
+
+        assert history.new_findings() == []
+        assert history.findings()[0]["line_start"] == 30
+
+
+def test_old_scans_are_pruned(tmp_path):
+    with FindingsHistory(tmp_path / "history.sqlite3", max_scans=2) as history:
+        history.ingest(_results("2026-01-01T00:00:00", _result("B102")))
+        history.ingest(_results("2026-01-02T00:00:00", _result("B101")))
+        history.ingest(_results("2026-01-03T00:00:00", _result("B101")))
+
+        assert [s["generated_at"][:10] for s in history.scans()] == [
+            "2026-01-03",
+            "2026-01-02",
+        ]
+        assert history.findings(rule_id="B102", scan=-1) == []
+
+
+def test_keep_new_findings_filters_results(tmp_path):
+    with FindingsHistory(tmp_path / "history.sqlite3") as history:
+        history.ingest(_results("2026-01-01T00:00:00", _result("B101")))
+        latest = _results("2026-01-02T00:00:00", _result("B101"), _result("B103", 9))
+
+        assert not keep_new_findings(latest, history)
+        history.ingest(latest)
+        assert keep_new_findings(latest, history)
+
+    assert [r.ruleId for r in latest.sarif.runs[0].results] == ["B103"]
+
+
+def test_record_findings_history_follows_config(tmp_path):
+    results = _results("2026-01-01T00:00:00", _result("B101"))
+    enabled = PluginContext(
+        source_dir=tmp_path, output_dir=tmp_path / "out", config=AshConfig()
+    )
+    disabled = PluginContext(
+        source_dir=tmp_path,
+        output_dir=tmp_path / "off",
+        config=AshConfig(findings_history={"enabled": False}),
+    )
+
+    assert record_findings_history(enabled, results) == 1
+    assert history_path(tmp_path / "out").exists()
+    assert record_findings_history(disabled, results) is None
+    assert not history_path(tmp_path / "off").exists()
+
+
+def test_record_findings_history_never_fails_the_scan(tmp_path):
+    context = PluginContext(
+        source_dir=tmp_path, output_dir=tmp_path / "out", config=AshConfig()
+    )
+    results = _results("2026-01-01T00:00:00", _result("B101"))
+
+    with patch.object(FindingsHistory, "ingest", side_effect=ValueError("bad")):
+        assert record_findings_history(context, results) is None
+
+
+def test_history_is_recorded_after_the_final_suppression_pass(tmp_path):
+    from automated_security_helper.core.execution_engine import ScanExecutionEngine
+
+    context = PluginContext(
+        source_dir=tmp_path, output_dir=tmp_path / "out", config=AshConfig()
+    )
+    engine = ScanExecutionEngine(context=context, show_progress=False)
+    engine._initialized = True
+    engine._results = _results("2026-01-01T00:00:00", _result("B101"))
+    calls = []
+
+    def _suppress(sarif_report, **kwargs):
+        calls.append("suppress")
+        return sarif_report
+
+    def _record(plugin_context, results):
+        calls.append("history")
+
+    with (
+        patch(
+            "automated_security_helper.utils.sarif_utils.apply_suppressions_to_sarif",
+            side_effect=_suppress,
+        ),
+        patch(
+            "automated_security_helper.core.findings_history.record_findings_history",
+            side_effect=_record,
+        ),
+        patch(
+            "automated_security_helper.core.execution_engine.ReportPhase"
+        ) as report_phase,
+    ):
+        report_phase.return_value.execute.side_effect = (
+            lambda **kwargs: calls.append("report") or kwargs["aggregated_results"]
+        )
+        engine.execute_phases(phases=["report"])
+
+    assert calls == ["suppress", "history", "report"]
+
+
+def test_additional_findings_without_id_get_a_stable_id():
+    entry = {"title": "outdated dependency", "file_path": "package.json"}
+    results = AshAggregatedResults.from_json(
+        {"metadata": {}, "additional_reports": {"npm-audit": [entry]}}
+    )
+    digest = hashlib.sha256(json.dumps(entry, sort_keys=True).encode()).hexdigest()
+
+    [finding] = iter_scan_findings(results)
+
+    assert finding.id == f"npm-audit-{digest[:8]}"
@@ -0,0 +1,138 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for the performance profile recorder."""
+
+import contextvars
+import json
+import threading
+
+import pytest
+
+from automated_security_helper.core import perf_profile
+from automated_security_helper.core.perf_profile import (
+    PERF_PROFILE_FILENAME,
+    PERF_TRACE_FILENAME,
+    PerfRecorder,
+    get_active_recorder,
+    perf_span,
+    start_recording,
+    stop_recording,
+    write_active_profile,
+)
+
+
+@pytest.fixture
+def recorder():
+    recorder, started = start_recording()
+    assert started
+    yield recorder
+    stop_recording(recorder)
+
+
+def test_perf_span_is_noop_without_recorder(tmp_path):
+    assert get_active_recorder() is None
+    with perf_span("scan", "scanner", plugin="bandit"):
+        pass
+    assert write_active_profile(tmp_path) is None
+    assert not (tmp_path / PERF_PROFILE_FILENAME).exists()
+
+
+def test_nested_start_recording_reuses_active_recorder(recorder):
+    nested, started = start_recording()
+    assert nested is recorder
+    assert not started
+    stop_recording(PerfRecorder())
+    assert get_active_recorder() is recorder
+
+
+def test_concurrent_runs_record_separately(recorder):
+    recorded = {}
+
+    def run(name):
+        own, started = start_recording()
+        with perf_span("scan", "phase", plugin=name):
+            pass
+        stop_recording(own)
+        recorded[name] = (started, [s.args["plugin"] for s in own.spans])
+
+    workers = [threading.Thread(target=run, args=(n,)) for n in ("one", "two")]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    assert recorded == {"one": (True, ["one"]), "two": (True, ["two"])}
+    assert recorder.spans == []
+    assert get_active_recorder() is recorder
+
+
+def _scan_in_thread(plugin):
+    with perf_span("scan", "scanner", plugin=plugin):
+        pass
+
+
+def test_profile_summarizes_phases_and_plugins(recorder):
+    with perf_span("scan", "phase"):
+        with perf_span("scan", "scanner", plugin="bandit"):
+            with perf_span("subprocess", "plugin", plugin="bandit", command="bandit"):
+                pass
+        worker = threading.Thread(
+            target=contextvars.copy_context().run,
+            args=(_scan_in_thread, "semgrep"),
+            name="worker",
+        )
+        worker.start()
+        worker.join()
+    with perf_span("report", "reporter", plugin="sarif", unused=None):
+        pass
+
+    profile = recorder.to_profile()
+    assert profile["schema_version"] == perf_profile.PERF_PROFILE_SCHEMA_VERSION
+    assert set(profile["phases"]) == {"scan"}
+    assert set(profile["plugins"]["bandit"]) == {"scan", "subprocess", "in_process"}
+    assert profile["plugins"]["bandit"]["in_process"] >= 0
+    assert profile["operations"]["scanner.scan"]["count"] == 2
+    assert {s["thread"] for s in profile["spans"]} == {
+        threading.current_thread().name,
+        "worker",
+    }
+    assert [s["name"] for s in profile["spans"]] == [
+        "scan",
+        "scan",
+        "subprocess",
+        "scan",
+        "report",
+    ]
+    assert profile["spans"][-1]["args"] == {"plugin": "sarif"}
+
+
+def test_span_records_failures(recorder):
+    with pytest.raises(RuntimeError):
+        with perf_span("convert", "converter", plugin="archive"):
+            raise RuntimeError("boom")
+    assert [s.name for s in recorder.spans] == ["convert"]
+
+
+def test_chrome_trace_uses_complete_events(recorder):
+    with perf_span("report", "reporter", plugin="sarif"):
+        pass
+    trace = recorder.to_chrome_trace()
+    complete = [e for e in trace["traceEvents"] if e["ph"] == "X"]
+    assert complete[0]["name"] == "report"
+    assert complete[0]["cat"] == "reporter"
+    assert complete[0]["dur"] >= 0
+    assert any(e["ph"] == "M" for e in trace["traceEvents"])
+
+
+@pytest.mark.parametrize("env_value, expect_trace", [("1", True), ("", False)])
+def test_write_active_profile(recorder, tmp_path, monkeypatch, env_value, expect_trace):
+    monkeypatch.setenv(perf_profile.ENV_PERF_TRACE, env_value)
+    with perf_span("report", "phase"):
+        pass
+
+    profile_path = write_active_profile(tmp_path / "reports")
+
+    assert profile_path == tmp_path / "reports" / PERF_PROFILE_FILENAME
+    assert json.loads(profile_path.read_text())["phases"].keys() == {"report"}
+    assert (tmp_path / "reports" / PERF_TRACE_FILENAME).exists() is expect_trace
@@ -0,0 +1,234 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for the cross-run scanner result cache."""
+
+import os
+import shutil
+import subprocess
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from automated_security_helper.base.plugin_context import PluginContext
+from automated_security_helper.base.scanner_plugin import ScannerPluginConfigBase
+from automated_security_helper.config.ash_config import AshConfig
+from automated_security_helper.core.phases.scanner_executor import ScannerExecutor
+from automated_security_helper.core.scanner_result_cache import (
+    ScannerResultCache,
+    compute_tree_fingerprint,
+)
+from automated_security_helper.schemas.sarif_schema_model import SarifReport
+
+
+def _sarif(rule_ids=("R1",)) -> SarifReport:
+    return SarifReport.model_validate(
+        {
+            "version": "2.1.0",
+            "runs": [
+                {
+                    "tool": {"driver": {"name": "fake"}},
+                    "results": [
+                        {
+                            "ruleId": rule_id,
+                            "level": "error",
+                            "message": {"text": "finding"},
+                            "locations": [
+                                {
+                                    "physicalLocation": {
+                                        "artifactLocation": {"uri": "src/app.py"},
+                                        "region": {"startLine": 1},
+                                    }
+                                }
+                            ],
+                        }
+                        for rule_id in rule_ids
+                    ],
+                }
+            ],
+        }
+    )
+
+
+@pytest.fixture
+def source_dir(tmp_path):
+    source = tmp_path / "repo"
+    source.joinpath("src").mkdir(parents=True)
+    source.joinpath("src", "app.py").write_text("print('hi')\n")
+    return source
+
+
+def test_manifest_fingerprint_tracks_contents_and_skips_excluded(source_dir):
+    output_dir = source_dir / ".ash" / "ash_output"
+    output_dir.mkdir(parents=True)
+    before = compute_tree_fingerprint(source_dir, [output_dir])
+    assert before.startswith("manifest:")
+
+    output_dir.joinpath("report.json").write_text("{}")
+    assert compute_tree_fingerprint(source_dir, [output_dir]) == before
+
+    source_dir.joinpath("src", "app.py").write_text("print('bye')\n")
+    assert compute_tree_fingerprint(source_dir, [output_dir]) != before
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git is not installed")
+def test_git_fingerprint_includes_uncommitted_files(source_dir):
+    def git(*args):
+        subprocess.run(
+            ["git", "-c", "user.name=t", "-c", "user.email=t@t", *args],
+            cwd=source_dir,
+            check=True,
+            capture_output=True,
+        )
+
+    source_dir.joinpath(".gitignore").write_text(".ash/\n*.log\n")
+    git("init", "-q")
+    git("add", ".")
+    git("commit", "-qm", "init")
+    output_dir = source_dir / ".ash" / "ash_output"
+    output_dir.mkdir(parents=True)
+
+    committed = compute_tree_fingerprint(source_dir, [output_dir])
+    assert committed.startswith("git:")
+
+    output_dir.joinpath("report.json").write_text("{}")
+    assert compute_tree_fingerprint(source_dir, [output_dir]) == committed
+
+    source_dir.joinpath("debug.log").write_text("ignored but still scanned")
+    with_ignored = compute_tree_fingerprint(source_dir, [output_dir])
+    assert with_ignored != committed
+
+    source_dir.joinpath("debug.log").write_text("changed")
+    assert compute_tree_fingerprint(source_dir, [output_dir]) != with_ignored
+
+
+def test_store_and_load_round_trip(tmp_path):
+    cache = ScannerResultCache(tmp_path / "cache", max_size_bytes=1024 * 1024)
+    assert cache.load("ab" * 32) is None
+
+    cache.store("ab" * 32, _sarif(["R1", "R2"]), exit_code=1)
+    cached = cache.load("ab" * 32)
+
+    assert cached.exit_code == 1
+    assert [r.ruleId for r in cached.report.runs[0].results] == ["R1", "R2"]
+
+
+def test_scanner_outputs_are_restored(tmp_path):
+    outputs = tmp_path / "scanners" / "fake" / "source"
+    outputs.joinpath("nested").mkdir(parents=True)
+    outputs.joinpath("results.sarif").write_text("{}")
+    outputs.joinpath("nested", "raw.bin").write_bytes(b"\x00\xff")
+    cache = ScannerResultCache(tmp_path / "cache", max_size_bytes=1024 * 1024)
+    cache.store("ab" * 32, _sarif(), outputs_dir=outputs)
+    cached = cache.load("ab" * 32)
+    cached.outputs["../escape.txt"] = "eA=="
+
+    restored = tmp_path / "restored"
+    assert cached.restore_outputs(restored) == 2
+    assert restored.joinpath("results.sarif").read_text() == "{}"
+    assert restored.joinpath("nested", "raw.bin").read_bytes() == b"\x00\xff"
+    assert not tmp_path.joinpath("escape.txt").exists()
+
+
+def test_expired_entries_are_misses(tmp_path):
+    cache = ScannerResultCache(
+        tmp_path / "cache", max_size_bytes=1024 * 1024, max_age_seconds=60
+    )
+    cache.store("cd" * 32, _sarif())
+    entry = next((tmp_path / "cache").glob("*/*.gz"))
+    old = time.time() - 120
+    os.utime(entry, (old, old))
+
+    assert cache.load("cd" * 32) is None
+    assert not entry.exists()
+
+
+def test_eviction_removes_least_recently_used_entries(tmp_path):
+    cache = ScannerResultCache(tmp_path / "cache", max_size_bytes=1024 * 1024)
+    keys = [f"{i:02d}" * 32 for i in range(3)]
+    for age, key in zip((300, 200, 100), keys):
+        cache.store(key, _sarif())
+        entry = cache._entry_path(key)
+        stamp = time.time() - age
+        os.utime(entry, (stamp, stamp))
+    # Reading the oldest entry makes it the most recently used.
+    assert cache.load(keys[0]) is not None
+
+    cache.max_size_bytes = cache._entry_path(keys[0]).stat().st_size * 2
+    assert cache.evict() == 1
+    assert cache._entry_path(keys[0]).exists()
+    assert not cache._entry_path(keys[1]).exists()
+    assert cache._entry_path(keys[2]).exists()
+
+
+def test_key_ignores_severity_threshold_but_not_tool_version(source_dir, tmp_path):
+    cache = ScannerResultCache(tmp_path / "cache", max_size_bytes=1024)
+    plugin = MagicMock(tool_version="1.0")
+    config = ScannerPluginConfigBase(name="fake")
+
+    key = cache.key_for(plugin, config, source_dir, "source")
+    config.options.severity_threshold = "CRITICAL"
+    assert cache.key_for(plugin, config, source_dir, "source") == key
+    assert cache.key_for(plugin, config, source_dir, "converted") != key
+
+    plugin.tool_version = "1.1"
+    assert cache.key_for(plugin, config, source_dir, "source") != key
+
+
+def _run_scanner(source_dir, output_dir, suppressions=()):
+    config = AshConfig(
+        scanner_result_cache={"enabled": True},
+        global_settings={
+            "suppressions": [
+                {"rule_id": rule_id, "path": "src/*", "reason": "test"}
+                for rule_id in suppressions
+            ]
+        },
+    )
+    context = PluginContext(source_dir=source_dir, output_dir=output_dir, config=config)
+    plugin = MagicMock(
+        config=ScannerPluginConfigBase(name="fake"),
+        tool_version="1.0",
+        errors=[],
+        output=[],
+        exit_code=1,
+    )
+
+    def scan(**kwargs):
+        outputs = output_dir / "scanners" / "fake" / kwargs["target_type"]
+        outputs.mkdir(parents=True, exist_ok=True)
+        outputs.joinpath("results.json").write_text('{"raw": true}')
+        return _sarif(["R1", "R2"])
+
+    plugin.scan.side_effect = scan
+    executor = ScannerExecutor(
+        plugin_context=context, progress_display=None, scanner_tasks=[]
+    )
+    [container] = executor._execute_scanner(
+        "fake", plugin, [{"path": source_dir, "type": "source"}]
+    )
+    return plugin, container
+
+
+def test_executor_reuses_cached_results_and_reapplies_suppressions(source_dir):
+    output_dir = source_dir / ".ash" / "ash_output"
+
+    first_plugin, first = _run_scanner(source_dir, output_dir)
+    assert first_plugin.scan.call_count == 1
+    assert first.finding_count == 2
+    assert "cache_hit" not in first.metadata
+
+    shutil.rmtree(output_dir / "scanners")
+    second_plugin, second = _run_scanner(source_dir, output_dir, suppressions=["R1"])
+    second_plugin.scan.assert_not_called()
+    assert (
+        output_dir / "scanners" / "fake" / "source" / "results.json"
+    ).read_text() == '{"raw": true}'
+    assert second.metadata["cache_hit"] is True
+    assert second.exit_code == 1
+    assert second.severity_counts.suppressed == 1
+
+    source_dir.joinpath("src", "app.py").write_text("print('changed')\n")
+    third_plugin, _ = _run_scanner(source_dir, output_dir)
+    assert third_plugin.scan.call_count == 1
@@ -0,0 +1,138 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for fingerprint-based image reuse in run_ash_container._build_image."""
+
+import json
+import sys
+import textwrap
+
+import pytest
+
+from automated_security_helper.interactions.run_ash_container import (
+    ASH_BUILD_FINGERPRINT_LABEL,
+    _build_image,
+    _hash_build_context,
+)
+
+_FAKE_RUNNER = """\
+#!{python}
+import json, pathlib, sys
+
+state = pathlib.Path(__file__).with_suffix(".state")
+with open(pathlib.Path(__file__).with_suffix(".log"), "a") as log:
+    log.write(json.dumps(sys.argv[1:]) + "\\n")
+
+args = sys.argv[1:]
+if args[:2] == ["image", "inspect"]:
+    if not state.exists():
+        sys.exit(1)
+    print(state.read_text())
+elif args[:1] == ["build"]:
+    label = args[args.index("--label") + 1].split("=", 1)[1]
+    state.write_text(label)
+"""
+
+
+@pytest.fixture
+def fake_runner(tmp_path):
+    runner = tmp_path / "fake-oci"
+    runner.write_text(textwrap.dedent(_FAKE_RUNNER).format(python=sys.executable))
+    runner.chmod(0o755)
+    return runner
+
+
+@pytest.fixture
+def build_context(tmp_path):
+    context = tmp_path / "context"
+    context.mkdir()
+    (context / "Dockerfile").write_text("FROM scratch\n")
+    (context / "app.py").write_text("print('hello')\n")
+    (context / ".dockerignore").write_text("ash_output\n*.pyc\n")
+    return context
+
+
+def _calls(runner):
+    log = runner.with_suffix(".log")
+    if not log.exists():
+        return []
+    return [json.loads(line) for line in log.read_text().splitlines()]
+
+
+def _build(runner, context, **overrides):
+    kwargs = dict(
+        oci_command_prefix=[],
+        resolved_oci_runner=str(runner),
+        dockerfile_path=context / "Dockerfile",
+        image_name="ash:test",
+        build_target="non-root",
+        container_uid="1000",
+        container_gid="1000",
+        resolved_revision=None,
+        offline=False,
+        offline_semgrep_rulesets="p/ci",
+        force=False,
+        quiet=True,
+        custom_build_arg=[],
+        debug=False,
+    )
+    kwargs.update(overrides)
+    _build_image(**kwargs)
+    return [call[0] for call in _calls(runner)]
+
+
+def test_second_build_reuses_image(fake_runner, build_context):
+    assert _build(fake_runner, build_context) == ["image", "build"]
+    assert _build(fake_runner, build_context) == ["image", "build", "image"]
+
+
+def test_force_always_builds(fake_runner, build_context):
+    _build(fake_runner, build_context)
+    assert _build(fake_runner, build_context, force=True)[-1] == "build"
+
+
+@pytest.mark.parametrize(
+    "change",
+    [
+        lambda ctx: (ctx / "app.py").write_text("print('changed')\n"),
+        lambda ctx: (ctx / "Dockerfile").write_text("FROM busybox\n"),
+    ],
+)
+def test_changed_context_rebuilds(fake_runner, build_context, change):
+    _build(fake_runner, build_context)
+    change(build_context)
+    assert _build(fake_runner, build_context)[-1] == "build"
+
+
+def test_changed_build_args_rebuild(fake_runner, build_context):
+    _build(fake_runner, build_context)
+    assert _build(fake_runner, build_context, offline=True)[-1] == "build"
+    assert (
+        _build(fake_runner, build_context, custom_build_arg=["FOO=bar"])[-1] == "build"
+    )
+    build_call = _calls(fake_runner)[-1]
+    assert build_call[build_call.index("FOO=bar") - 1] == "--build-arg"
+    assert any(arg.startswith(ASH_BUILD_FINGERPRINT_LABEL) for arg in build_call)
+
+
+def test_context_hash_skips_dockerignored_paths(build_context):
+    before = _hash_build_context(build_context)
+    (build_context / "ash_output").mkdir()
+    (build_context / "ash_output" / "report.txt").write_text("results\n")
+    (build_context / "module.pyc").write_bytes(b"\x00")
+    assert _hash_build_context(build_context) == before
+
+
+@pytest.mark.parametrize("revision", ["v3.0.0", "v3.0.0-beta", "3.1.2", "a" * 40])
+def test_pinned_revision_reuses_image(fake_runner, build_context, revision):
+    _build(fake_runner, build_context, resolved_revision=revision)
+    assert _build(fake_runner, build_context, resolved_revision=revision)[-1] == "image"
+
+
+@pytest.mark.parametrize("revision", ["main", "feature/lazy-plugins", "abc123"])
+def test_branch_revision_always_builds(fake_runner, build_context, revision):
+    _build(fake_runner, build_context, resolved_revision=revision)
+    assert _build(fake_runner, build_context, resolved_revision=revision) == [
+        "build",
+        "build",
+    ]
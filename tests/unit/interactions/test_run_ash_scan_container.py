@@ -168,8 +168,10 @@ def test_run_ash_container_build_only(
         build_cmd = mock_run_cmd_direct.call_args[0][0]
         assert "build" in build_cmd
 
-        # Verify subprocess_utils.run_command was not called (no run phase)
-        mock_run_command.assert_not_called()
+        # Verify subprocess_utils.run_command was only used to inspect the
+        # existing image (no run phase)
+        for call in mock_run_command.call_args_list:
+            assert call.kwargs["args"][1:3] == ["image", "inspect"]
 
 
 @pytest.mark.skipif(
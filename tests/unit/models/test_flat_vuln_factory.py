@@ -10,6 +10,7 @@ AshAggregatedResults.to_flat_vulnerabilities().
 """
 
 import json
+from concurrent.futures import ThreadPoolExecutor
 
 from automated_security_helper.models.flat_vulnerability import (
     FlatVulnerability,
@@ -254,6 +255,78 @@ class TestFromSarifResultScannerType:
         assert vuln.scanner_type == "SCA"
 
 
+class TestFromSarifResultLazyFields:
+    """properties, references and raw_data are serialized on first read."""
+
+    def test_lazy_fields_are_not_serialized_until_read(self):
+        result = _make_result(tags=["security"])
+        vuln = FlatVulnerability.from_sarif_result(result, "bandit", "SAST")
+        assert "raw_data" not in vuln.__dict__
+        assert json.loads(vuln.raw_data)["ruleId"] == "RULE001"
+        assert json.loads(vuln.properties) == {"tags": ["security"]}
+        assert vuln.references is None
+
+    def test_lazy_and_eager_dumps_match(self):
+        result = _make_result(tags=["security"], issue_severity="HIGH")
+        lazy = FlatVulnerability.from_sarif_result(
+            result, "bandit", "SAST", detected_at="2025-01-01T00:00:00+00:00"
+        )
+        eager = FlatVulnerability.from_sarif_result(
+            result,
+            "bandit",
+            "SAST",
+            detected_at="2025-01-01T00:00:00+00:00",
+            eager=True,
+        )
+        assert "raw_data" in eager.__dict__
+        assert lazy.model_dump(exclude_unset=True) == eager.model_dump(
+            exclude_unset=True
+        )
+        assert lazy == eager
+
+    def test_dict_and_repr_include_lazy_fields(self):
+        result = _make_result(tags=["security"])
+        eager = FlatVulnerability.from_sarif_result(
+            result, "bandit", "SAST", eager=True
+        )
+
+        lazy = FlatVulnerability.from_sarif_result(result, "bandit", "SAST")
+        as_dict = dict(lazy)
+        assert json.loads(as_dict["raw_data"])["ruleId"] == "RULE001"
+        assert as_dict["properties"] == eager.properties
+        assert "references" in as_dict
+
+        lazy = FlatVulnerability.from_sarif_result(result, "bandit", "SAST")
+        assert [name for name, _ in lazy] == [name for name, _ in eager]
+
+        lazy = FlatVulnerability.from_sarif_result(result, "bandit", "SAST")
+        assert "raw_data=" in repr(lazy)
+
+    def test_lazy_read_after_concurrent_materialize(self):
+        # A thread whose attribute lookup missed before another thread
+        # materialized the finding still gets the field.
+        vuln = FlatVulnerability.from_sarif_result(_make_result(), "bandit", "SAST")
+        vuln.materialize()
+        assert json.loads(vuln.__getattr__("raw_data"))["ruleId"] == "RULE001"
+
+    def test_concurrent_reads_see_materialized_fields(self):
+        vulns = [
+            FlatVulnerability.from_sarif_result(_make_result(), "bandit", "SAST")
+            for _ in range(50)
+        ]
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            raw = list(
+                executor.map(lambda v: v.raw_data, [v for v in vulns for _ in range(4)])
+            )
+        assert all(json.loads(r)["ruleId"] == "RULE001" for r in raw)
+
+    def test_raw_data_dict_does_not_round_trip_json(self):
+        result = _make_result()
+        vuln = FlatVulnerability.from_sarif_result(result, "bandit", "SAST")
+        assert vuln.raw_data_dict()["ruleId"] == "RULE001"
+        assert "raw_data" not in vuln.__dict__
+
+
 class TestFromAdditionalReport:
     """FlatVulnerability.from_additional_report()."""
 
@@ -91,12 +91,12 @@ class TestOcsfSuppressedStatusId:
             OcsfReporter,
         )
 
-        src = inspect.getsource(OcsfReporter.report)
+        src = inspect.getsource(OcsfReporter._iter_serialized_findings)
         assert "StatusId.integer_4" not in src, (
-            "ocsf_reporter.report still checks StatusId.integer_4 "
+            "ocsf_reporter._iter_serialized_findings still checks StatusId.integer_4 "
             "instead of StatusId.integer_3 for suppressed findings"
         )
         assert "StatusId.integer_3" in src, (
-            "ocsf_reporter.report does not check StatusId.integer_3 "
+            "ocsf_reporter._iter_serialized_findings does not check StatusId.integer_3 "
             "for suppressed findings"
         )
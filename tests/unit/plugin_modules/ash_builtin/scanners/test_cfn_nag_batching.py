@@ -0,0 +1,144 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for batched cfn-nag execution.
+
+A fake ``cfn_nag_scan`` stands in for the Ruby tool. Like cfn-nag, it scans
+every template under ``--input-path`` and reports locations relative to its
+working directory, so the tests exercise staging and de-multiplexing.
+"""
+
+import json
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+
+from automated_security_helper.plugin_modules.ash_builtin.scanners.cfn_nag_scanner import (
+    CfnNagScanner,
+    CfnNagScannerConfig,
+    CfnNagScannerConfigOptions,
+)
+
+TEMPLATE = """\
+Resources:
+  Bucket:
+    Type: AWS::S3::Bucket
+{extra}
+"""
+
+FAKE_CFN_NAG = textwrap.dedent(
+    """\
+    #!{python}
+    import json, os, sys
+    from pathlib import Path
+
+    args = sys.argv[1:]
+    target = Path(args[args.index("--input-path") + 1])
+    files = sorted(p for p in target.rglob("*") if p.suffix in (".yaml", ".json"))
+    with open({log!r}, "a") as log:
+        log.write(json.dumps([p.name for p in files]) + "\\n")
+    if any("CRASH" in p.read_text() for p in files):
+        sys.exit(2)
+    results = [
+        {{
+            "ruleId": "W51",
+            "level": "warning",
+            "message": {{"text": "S3 bucket should likely have a bucket policy"}},
+            "locations": [{{"physicalLocation": {{
+                "artifactLocation": {{
+                    "uri": os.path.relpath(p, os.getcwd()),
+                    "uriBaseId": "%SRCROOT%",
+                }},
+                "region": {{"startLine": 3}},
+            }}}}],
+        }}
+        for p in files
+    ]
+    print(json.dumps({{
+        "version": "2.1.0",
+        "runs": [{{"tool": {{"driver": {{"name": "cfn_nag"}}}}, "results": results}}],
+    }}))
+    sys.exit(2 if results else 0)
+    """
+)
+
+
+@pytest.fixture
+def cfn_scanner(test_plugin_context, tmp_path, monkeypatch):
+    fake = tmp_path / "bin" / "cfn_nag_scan"
+    fake.parent.mkdir()
+    invocations = tmp_path / "invocations.log"
+    fake.write_text(FAKE_CFN_NAG.format(python=sys.executable, log=str(invocations)))
+    fake.chmod(0o755)
+
+    def make(batch_size: int, max_workers: int = 2) -> CfnNagScanner:
+        scanner = CfnNagScanner(
+            context=test_plugin_context,
+            config=CfnNagScannerConfig(
+                options=CfnNagScannerConfigOptions(
+                    batch_size=batch_size, max_workers=max_workers
+                )
+            ),
+        )
+        scanner.command = fake.as_posix()
+        scanner.results_dir = test_plugin_context.output_dir / "scanners" / "cfn-nag"
+        monkeypatch.setattr(scanner, "validate_plugin_dependencies", lambda: True)
+        return scanner
+
+    make.invocations = invocations
+    return make
+
+
+def _write_templates(source_dir: Path, names, crash=()):
+    for name in names:
+        path = source_dir / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(TEMPLATE.format(extra="# CRASH" if name in crash else ""))
+
+
+def _batches(log: Path):
+    return [json.loads(line) for line in log.read_text().splitlines()]
+
+
+def test_templates_are_scanned_in_batches(cfn_scanner, test_plugin_context):
+    source_dir = test_plugin_context.source_dir
+    names = [f"stacks/stack{i}.yaml" for i in range(5)]
+    _write_templates(source_dir, names)
+    (source_dir / "config.yaml").write_text("name: not-a-template\n")
+
+    scanner = cfn_scanner(batch_size=2)
+    report = scanner.scan(target=source_dir, target_type="source")
+
+    assert sorted(len(b) for b in _batches(cfn_scanner.invocations)) == [1, 2, 2]
+    uris = [
+        r.locations[0].physicalLocation.root.artifactLocation.uri
+        for r in report.runs[0].results
+    ]
+    assert uris == names
+    results_dir = scanner.results_dir / "source"
+    assert not list(results_dir.glob("cfn-nag-staging-*"))
+    assert len(list(results_dir.glob("*/cfn_nag.sarif"))) == len(names)
+
+
+def test_failed_batch_is_rescanned_per_template(cfn_scanner, test_plugin_context):
+    source_dir = test_plugin_context.source_dir
+    names = ["a.yaml", "b.yaml", "c.yaml"]
+    _write_templates(source_dir, names, crash={"b.yaml"})
+
+    report = cfn_scanner(batch_size=3, max_workers=1).scan(
+        target=source_dir, target_type="source"
+    )
+
+    assert _batches(cfn_scanner.invocations) == [
+        names,
+        ["a.yaml"],
+        ["b.yaml"],
+        ["c.yaml"],
+    ]
+    uris = [
+        r.locations[0].physicalLocation.root.artifactLocation.uri
+        for r in report.runs[0].results
+    ]
+    assert uris == ["a.yaml", "c.yaml"]
@@ -0,0 +1,220 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for deduplicated, concurrent package manager audits.
+
+A fake ``npm`` on PATH records the directory it ran in and reports one
+vulnerable package, so the tests can count audits and check where each
+finding is reported.
+"""
+
+import json
+import sys
+import textwrap
+import threading
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from automated_security_helper.base.plugin_base import PluginBase
+from automated_security_helper.plugin_modules.ash_builtin.scanners.npm_audit_scanner import (
+    NpmAuditScanner,
+    NpmAuditScannerConfig,
+)
+from automated_security_helper.utils.subprocess_utils import (
+    clear_find_executable_cache,
+)
+
+FAKE_NPM = textwrap.dedent(
+    """\
+    #!{python}
+    import json, os, sys
+
+    with open({log!r}, "a") as log:
+        log.write(os.getcwd() + "\\n")
+    print(json.dumps({{
+        "vulnerabilities": {{
+            "lodash": {{
+                "severity": "high",
+                "range": "<4.17.21",
+                "nodes": ["node_modules/lodash"],
+                "via": [{{"title": "Prototype pollution", "url": "https://github.com/advisories/GHSA-1"}}],
+            }}
+        }},
+        "metadata": {{"vulnerabilities": {{"high": 1}}}},
+    }}))
+    sys.exit(1)
+    """
+)
+
+
+@pytest.fixture
+def fake_npm(tmp_path, monkeypatch):
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    log = tmp_path / "npm.log"
+    npm = bin_dir / "npm"
+    npm.write_text(FAKE_NPM.format(python=sys.executable, log=str(log)))
+    npm.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{bin_dir}:{Path(sys.executable).parent}")
+    clear_find_executable_cache()
+    yield log
+    clear_find_executable_cache()
+
+
+def _package(root: Path, name: str, lock: str) -> Path:
+    package_dir = root / name
+    package_dir.mkdir(parents=True)
+    (package_dir / "package.json").write_text('{"name":"app"}')
+    (package_dir / "package-lock.json").write_text(lock)
+    return package_dir / "package.json"
+
+
+def _scan(context, root: Path, package_files):
+    scanner = NpmAuditScanner(context=context, config=NpmAuditScannerConfig())
+    scanner.dependencies_satisfied = True
+    scanner.tool_version = "10.0.0"
+    with (
+        patch(
+            "automated_security_helper.plugin_modules.ash_builtin.scanners.npm_audit_scanner.scan_set",
+            return_value=[str(p) for p in package_files],
+        ),
+        patch.object(scanner, "_pre_scan", return_value=True),
+        patch.object(scanner, "_post_scan"),
+    ):
+        report = scanner.scan(target=root, target_type="source")
+    return scanner, report
+
+
+def test_identical_lockfiles_are_audited_once(test_plugin_context, fake_npm):
+    root = test_plugin_context.source_dir
+    package_files = [
+        _package(root, "apps/a", '{"lockfileVersion":3}'),
+        _package(root, "apps/b", '{"lockfileVersion":3}'),
+        _package(root, "libs/c", '{"lockfileVersion":3,"name":"c"}'),
+    ]
+
+    scanner, report = _scan(test_plugin_context, root, package_files)
+
+    audited = sorted(Path(line).name for line in fake_npm.read_text().splitlines())
+    assert audited == ["a", "c"]
+    uris = sorted(
+        r.locations[0].physicalLocation.root.artifactLocation.uri
+        for r in report.runs[0].results
+    )
+    assert uris == [
+        "apps/a/node_modules/lodash/package.json",
+        "apps/b/node_modules/lodash/package.json",
+        "libs/c/node_modules/lodash/package.json",
+    ]
+    assert [rule.id for rule in report.runs[0].tool.driver.rules] == ["GHSA-1"]
+    assert scanner.exit_code == 1
+
+
+def test_parallel_audits_apply_responses_on_scanning_thread(
+    test_plugin_context, fake_npm
+):
+    root = test_plugin_context.source_dir
+    package_files = [
+        _package(root, "a", '{"lockfileVersion":3}'),
+        _package(root, "b", '{"lockfileVersion":3,"name":"b"}'),
+    ]
+    applied_on = []
+    process_command_response = PluginBase._process_command_response
+
+    def _record(self, response):
+        applied_on.append(threading.current_thread())
+        process_command_response(self, response)
+
+    with patch.object(PluginBase, "_process_command_response", _record):
+        scanner, _ = _scan(test_plugin_context, root, package_files)
+
+    assert applied_on == [threading.current_thread()] * 2
+    assert scanner.exit_code == 1
+
+
+def test_audit_output_is_cached_across_runs(test_plugin_context, fake_npm):
+    root = test_plugin_context.source_dir
+    package_files = [_package(root, "app", '{"lockfileVersion":3}')]
+
+    _scan(test_plugin_context, root, package_files)
+    scanner, report = _scan(test_plugin_context, root, package_files)
+
+    assert len(fake_npm.read_text().splitlines()) == 1
+    assert len(report.runs[0].results) == 1
+    assert scanner.exit_code == 1
+    cache_dir = test_plugin_context.output_dir / "cache" / "npm_audit"
+    [day] = cache_dir.iterdir()
+    assert json.loads(next(day.iterdir()).read_text())["returncode"] == 1
+
+
+def test_lockfile_engine_runs_without_package_managers(
+    test_plugin_context, tmp_path, monkeypatch
+):
+    monkeypatch.setenv("PATH", str(tmp_path / "empty"))
+    clear_find_executable_cache()
+    root = test_plugin_context.source_dir
+    root.mkdir(parents=True, exist_ok=True)
+    advisories = root / "advisories.json"
+    advisories.write_text(
+        json.dumps(
+            {
+                "lodash": [
+                    {
+                        "id": 1,
+                        "title": "Prototype pollution",
+                        "url": "https://github.com/advisories/GHSA-1",
+                        "severity": "high",
+                        "vulnerable_versions": "<4.17.21",
+                    }
+                ]
+            }
+        )
+    )
+    lock = json.dumps(
+        {
+            "lockfileVersion": 3,
+            "packages": {"node_modules/lodash": {"version": "4.17.20"}},
+        }
+    )
+    package_files = [_package(root, "app", lock)]
+    (root / "web").mkdir()
+    (root / "web" / "package.json").write_text('{"name":"web"}')
+    (root / "web" / "yarn.lock").write_text('lodash@^4.0.0:\n  version "4.17.21"\n')
+    package_files.append(root / "web" / "package.json")
+
+    scanner = NpmAuditScanner(
+        context=test_plugin_context,
+        config=NpmAuditScannerConfig(
+            options={"engine": "lockfile", "advisory_database": "advisories.json"}
+        ),
+    )
+    assert scanner.validate_plugin_dependencies() is True
+    assert scanner.tool_version.startswith("lockfile+")
+    scanner.dependencies_satisfied = True
+    with (
+        patch(
+            "automated_security_helper.plugin_modules.ash_builtin.scanners.npm_audit_scanner.scan_set",
+            return_value=[str(p) for p in package_files],
+        ),
+        patch.object(scanner, "_pre_scan", return_value=True),
+        patch.object(scanner, "_post_scan"),
+    ):
+        report = scanner.scan(target=root, target_type="source")
+    clear_find_executable_cache()
+
+    [result] = report.runs[0].results
+    assert (
+        result.locations[0].physicalLocation.root.artifactLocation.uri
+        == "app/node_modules/lodash/package.json"
+    )
+    assert scanner.exit_code == 1
+
+
+def test_lockfile_engine_requires_advisory_database(test_plugin_context):
+    scanner = NpmAuditScanner(
+        context=test_plugin_context,
+        config=NpmAuditScannerConfig(options={"engine": "lockfile"}),
+    )
+    assert scanner.validate_plugin_dependencies() is False
@@ -56,16 +56,21 @@ def test_semgrep_offline_empty_cache_raises_actionable_error(test_plugin_context
 
 
 def test_semgrep_offline_with_cache_does_not_raise(test_plugin_context, monkeypatch, tmp_path):
-    """SEMGREP_RULES_CACHE_DIR set with a .yaml file → no error, --config appended."""
+    """SEMGREP_RULES_CACHE_DIR set with a .yaml file → no error, cached rules used."""
     rule_file = tmp_path / "rules.yaml"
-    rule_file.write_text("rules: []")
+    rule_file.write_text(
+        "rules:\n  - id: cached-offline-rule\n    pattern: eval(...)\n"
+        "    message: m\n    languages: [python]\n    severity: ERROR\n"
+    )
     monkeypatch.setenv("SEMGREP_RULES_CACHE_DIR", str(tmp_path))
 
     scanner = _make_scanner(test_plugin_context)
 
-    config_args = [a for a in scanner.args.extra_args if a.key == "--config"]
-    cache_configs = [a for a in config_args if str(tmp_path) in a.value]
-    assert cache_configs, "Expected --config pointing to cache dir"
+    # Cached rules are merged with the bundled ASH rules into a single file.
+    config_args = [a.value for a in scanner.args.extra_args if a.key == "--config"]
+    assert len(config_args) == 1
+    assert "cached-offline-rule" in open(config_args[0]).read()
+    assert "--no-rewrite-rule-ids" in [a.key for a in scanner.args.extra_args]
 
 
 def test_semgrep_offline_no_subprocess_on_failure(test_plugin_context, monkeypatch):
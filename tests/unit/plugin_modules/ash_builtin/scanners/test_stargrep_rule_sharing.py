@@ -0,0 +1,142 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for Semgrep and Opengrep sharing one run over the union of their rules."""
+
+import json
+from unittest.mock import patch
+
+from automated_security_helper.base.plugin_context import PluginContext
+from automated_security_helper.config.ash_config import AshConfig
+from automated_security_helper.plugin_modules.ash_builtin.scanners.opengrep_scanner import (
+    OpengrepScanner,
+    OpengrepScannerConfig,
+    OpengrepScannerConfigOptions,
+)
+from automated_security_helper.plugin_modules.ash_builtin.scanners.semgrep_scanner import (
+    SemgrepScanner,
+    SemgrepScannerConfig,
+    SemgrepScannerConfigOptions,
+)
+
+
+def _rules_file(path, rule_id):
+    path.write_text(
+        f"rules:\n  - id: {rule_id}\n    pattern: eval(...)\n    message: m\n"
+        "    languages: [python]\n    severity: ERROR\n"
+    )
+    return path
+
+
+def _context(tmp_path, rule_sharing):
+    source_dir = tmp_path / "source"
+    source_dir.mkdir()
+    (source_dir / "app.py").write_text("eval(input())\n")
+    options = {
+        "semgrep": {
+            "rule_sharing": rule_sharing,
+            "merge_local_rules": True,
+            "offline": False,
+            "config": str(_rules_file(tmp_path / "semgrep.yaml", "semgrep-rule")),
+        },
+        "opengrep": {
+            "rule_sharing": rule_sharing,
+            "merge_local_rules": True,
+            "offline": False,
+            "config": str(_rules_file(tmp_path / "opengrep.yaml", "opengrep-rule")),
+        },
+    }
+    config = AshConfig(
+        scanners={
+            name: {"enabled": True, "options": opts} for name, opts in options.items()
+        }
+    )
+    context = PluginContext(
+        source_dir=source_dir, output_dir=tmp_path / "output", config=config
+    )
+    return context, options
+
+
+def _scan(scanner, context, engine_runs):
+    def fake_run_subprocess(command, results_dir, env=None):
+        engine_runs.append(scanner.config.name)
+        sarif_file = command[command.index("--sarif-output") + 1]
+        with open(sarif_file, "w") as f:
+            json.dump(
+                {
+                    "version": "2.1.0",
+                    "runs": [
+                        {
+                            "tool": {"driver": {"name": scanner.config.name}},
+                            "results": [
+                                {"ruleId": rule_id, "message": {"text": "m"}}
+                                for rule_id in ("semgrep-rule", "opengrep-rule")
+                            ],
+                        }
+                    ],
+                },
+                f,
+            )
+        return {"returncode": 1}
+
+    scanner.dependencies_satisfied = True
+    with (
+        patch.object(scanner, "_pre_scan", return_value=True),
+        patch.object(scanner, "_post_scan"),
+        patch.object(scanner, "_run_subprocess", side_effect=fake_run_subprocess),
+    ):
+        report = scanner.scan(target=context.source_dir, target_type="source")
+    return [result.ruleId for result in report.runs[0].results]
+
+
+def _scanners(context, options):
+    semgrep = SemgrepScanner(
+        context=context,
+        config=SemgrepScannerConfig(
+            options=SemgrepScannerConfigOptions(**options["semgrep"])
+        ),
+    )
+    with patch.object(OpengrepScanner, "_should_use_metrics_flag", return_value=False):
+        opengrep = OpengrepScanner(
+            context=context,
+            config=OpengrepScannerConfig(
+                options=OpengrepScannerConfigOptions(**options["opengrep"])
+            ),
+        )
+    return semgrep, opengrep
+
+
+def test_union_runs_engine_once_and_keeps_own_results(tmp_path):
+    context, options = _context(tmp_path, "union")
+    semgrep, opengrep = _scanners(context, options)
+    engine_runs = []
+
+    assert _scan(semgrep, context, engine_runs) == ["semgrep-rule"]
+    assert _scan(opengrep, context, engine_runs) == ["opengrep-rule"]
+    assert engine_runs == ["semgrep"]
+
+
+def test_separate_runs_use_own_merged_rules(tmp_path):
+    context, options = _context(tmp_path, "separate")
+    semgrep, opengrep = _scanners(context, options)
+
+    [semgrep_rules] = [a.value for a in semgrep.args.extra_args if a.key == "--config"]
+    [opengrep_rules] = [
+        a.value for a in opengrep.args.extra_args if a.key == "--config"
+    ]
+    assert "opengrep-rule" not in open(semgrep_rules).read()
+    assert "semgrep-rule" not in open(opengrep_rules).read()
+    assert "hardcoded-sqlplus-credentials" in open(semgrep_rules).read()
+
+
+def test_online_runs_do_not_merge_or_rewrite_rule_ids_by_default(tmp_path):
+    context, options = _context(tmp_path, "separate")
+    for scanner_options in options.values():
+        del scanner_options["merge_local_rules"]
+    semgrep, opengrep = _scanners(context, options)
+
+    for scanner in (semgrep, opengrep):
+        keys = [a.key for a in scanner.args.extra_args]
+        configs = [a.value for a in scanner.args.extra_args if a.key == "--config"]
+        assert "--no-rewrite-rule-ids" not in keys
+        assert options[scanner.config.name]["config"] in configs
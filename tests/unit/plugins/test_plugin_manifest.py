@@ -0,0 +1,169 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for the built-in plugin manifest and lazy plugin registration."""
+
+import json
+import subprocess
+import sys
+import textwrap
+
+from automated_security_helper.plugins.manifest import (
+    PLUGIN_MANIFEST_PATH,
+    generate_plugin_manifest,
+)
+from automated_security_helper.plugins.plugin_manager import AshPluginManager
+
+_PLUGIN_PREFIX = "automated_security_helper.plugin_modules.ash_builtin."
+
+
+def _run_isolated(code: str) -> dict:
+    """Run code in a fresh interpreter and return the JSON it prints."""
+    completed = subprocess.run(
+        [sys.executable, "-c", textwrap.dedent(code)],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def test_manifest_is_up_to_date():
+    """Regenerate with `python -m automated_security_helper.plugins.manifest`."""
+    on_disk = json.loads(PLUGIN_MANIFEST_PATH.read_text(encoding="utf-8"))
+    assert on_disk == generate_plugin_manifest()
+
+
+def test_manifest_records_config_schema():
+    manifest = generate_plugin_manifest()
+    sarif = next(e for e in manifest["reporters"] if e["name"] == "SarifReporter")
+    assert sarif["config_name"] == "sarif"
+    assert sarif["extension"] == "sarif"
+    assert sarif["config_class"].endswith("sarif_reporter:SARIFReporterConfig")
+
+
+def test_load_internal_plugins_imports_no_plugin_modules():
+    result = _run_isolated(
+        f"""
+        import json, sys
+        from automated_security_helper.plugins import ash_plugin_manager
+        from automated_security_helper.plugins.loader import load_internal_plugins
+
+        loaded = load_internal_plugins()
+        print(json.dumps({{
+            "scanners": len(ash_plugin_manager.plugin_library.scanners),
+            "loaded": len(loaded["scanners"]),
+            "imported": [
+                m for m in sys.modules
+                if m.startswith("{_PLUGIN_PREFIX}")
+                and m.count(".") > 3
+                and ".event_handlers" not in m
+            ],
+        }}))
+        """
+    )
+    assert result["scanners"] == result["loaded"] == 10
+    assert result["imported"] == []
+
+
+def test_cli_import_loads_no_plugin_modules():
+    result = _run_isolated(
+        f"""
+        import json, sys
+        import automated_security_helper.cli
+        import automated_security_helper.cli.main
+
+        print(json.dumps({{
+            "imported": [
+                m for m in sys.modules
+                if m.startswith("{_PLUGIN_PREFIX}") and m.count(".") > 3
+            ],
+            "detect_secrets": "detect_secrets" in sys.modules,
+        }}))
+        """
+    )
+    assert result["imported"] == []
+    assert result["detect_secrets"] is False
+
+
+def test_ash_config_imports_builtin_configs_on_first_use():
+    result = _run_isolated(
+        f"""
+        import json, sys
+        from automated_security_helper.config.ash_config import AshConfig
+
+        before = [m for m in sys.modules if m.startswith("{_PLUGIN_PREFIX}scanners.")]
+        config = AshConfig.model_validate({{"scanners": {{"bandit": {{"enabled": False}}}}}})
+        print(json.dumps({{
+            "before": before,
+            "bandit": type(config.scanners.bandit).__name__,
+            "enabled": config.scanners.bandit.enabled,
+        }}))
+        """
+    )
+    assert result["before"] == []
+    assert result["bandit"] == "BanditScannerConfig"
+    assert result["enabled"] is False
+
+
+def test_get_plugin_module_imports_only_that_plugin():
+    result = _run_isolated(
+        f"""
+        import json, sys
+        from automated_security_helper.plugins import ash_plugin_manager
+        from automated_security_helper.plugins.loader import load_internal_plugins
+
+        load_internal_plugins()
+        plugin = ash_plugin_manager.get_plugin_module("reporter", "sarif")
+        print(json.dumps({{
+            "plugin": plugin.__name__,
+            "reporters": sorted(
+                m for m in sys.modules if m.startswith("{_PLUGIN_PREFIX}reporters.")
+            ),
+        }}))
+        """
+    )
+    assert result["plugin"] == "SarifReporter"
+    assert result["reporters"] == [f"{_PLUGIN_PREFIX}reporters.sarif_reporter"]
+
+
+def test_decorator_registration_after_manifest_is_silent(caplog):
+    manager = AshPluginManager()
+    manager.register_plugin_manifest(
+        {
+            "scanners": [
+                {
+                    "name": "DemoScanner",
+                    "plugin_module_path": "demo.scanner",
+                    "config_name": "demo",
+                }
+            ]
+        }
+    )
+    manager.register_plugin_module(
+        plugin_type="scanner",
+        plugin_module_class="DemoScanner",
+        plugin_module_path="demo.scanner",
+    )
+    registration = manager.plugin_library.scanners["DemoScanner"]
+    assert registration.config_name == "demo"
+    assert "already registered" not in caplog.text
+
+
+def test_new_registration_invalidates_resolved_plugins():
+    manager = AshPluginManager()
+    assert manager.plugin_modules("converter") == []
+
+    manager.register_plugin_manifest(
+        {
+            "converters": [
+                {
+                    "name": "ArchiveConverter",
+                    "plugin_module_path": f"{_PLUGIN_PREFIX}converters.archive_converter",
+                }
+            ]
+        }
+    )
+    assert [c.__name__ for c in manager.plugin_modules("converter")] == [
+        "ArchiveConverter"
+    ]
@@ -1732,18 +1732,14 @@ class TestOcsfReporterSeverityMapping:
         self, reporter, sample_ash_model, monkeypatch
     ):
         """Test error handling when JSON serialization fails."""
-        # Mock json.dumps to raise an exception only for the main findings array
+        # Findings are serialized one at a time, so fail every finding while
+        # letting the error response itself serialize.
         import json
 
         original_dumps = json.dumps
 
-        call_count = 0
-
         def mock_dumps(*args, **kwargs):
-            nonlocal call_count
-            call_count += 1
-            # Fail on first call (main findings array), succeed on second call (error response)
-            if call_count == 1 and isinstance(args[0], list) and len(args[0]) > 0:
+            if isinstance(args[0], dict) and "finding_info" in args[0]:
                 raise Exception("JSON serialization error")
             return original_dumps(*args, **kwargs)
 
@@ -1751,14 +1747,12 @@ class TestOcsfReporterSeverityMapping:
 
         result_json = reporter.report(sample_ash_model)
 
-        import json
-
         findings = json.loads(result_json)
 
         # Should return error response array
         assert isinstance(findings, list)
         assert len(findings) == 1
-        assert "error" in findings[0]
+        assert findings[0]["error"] == "All findings failed to serialize"
         assert "processing_statistics" in findings[0]
         assert findings[0]["processing_statistics"]["processed_results_count"] == 2
-        assert findings[0]["processing_statistics"]["failed_results_count"] == 0
+        assert findings[0]["processing_statistics"]["failed_results_count"] == 2
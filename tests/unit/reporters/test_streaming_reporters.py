@@ -0,0 +1,131 @@
+"""Tests for the streaming reporter interface."""
+
+from datetime import datetime, timezone
+from io import StringIO
+from unittest.mock import patch
+
+import pytest
+
+from automated_security_helper.base.reporter_plugin import ReporterPluginBase
+from automated_security_helper.plugin_modules.ash_builtin.reporters.csv_reporter import (
+    CsvReporter,
+)
+from automated_security_helper.plugin_modules.ash_builtin.reporters.flatjson_reporter import (
+    FlatJSONReporter,
+)
+from automated_security_helper.plugin_modules.ash_builtin.reporters.html_reporter import (
+    HtmlReporter,
+)
+from automated_security_helper.plugin_modules.ash_builtin.reporters.ocsf_reporter import (
+    OcsfReporter,
+)
+from automated_security_helper.plugin_modules.ash_builtin.reporters.yaml_reporter import (
+    YamlReporter,
+)
+from automated_security_helper.schemas.sarif_schema_model import SarifReport
+
+STREAMING_REPORTERS = [
+    CsvReporter,
+    HtmlReporter,
+    OcsfReporter,
+]
+
+
+@pytest.fixture
+def model_with_findings(sample_ash_model):
+    results = []
+    for i in range(5):
+        result = {
+            "ruleId": f"RULE{i}",
+            "level": "error" if i % 2 else "warning",
+            "message": {"text": f"Finding {i}"},
+            "locations": [
+                {
+                    "physicalLocation": {
+                        "artifactLocation": {"uri": f"src/file{i}.py"},
+                        "region": {"startLine": i + 1},
+                    }
+                }
+            ],
+        }
+        if i == 0:
+            result["suppressions"] = [
+                {"kind": "external", "justification": "Accepted risk"}
+            ]
+        results.append(result)
+    sample_ash_model.sarif = SarifReport.model_validate(
+        {
+            "version": "2.1.0",
+            "runs": [{"tool": {"driver": {"name": "bandit"}}, "results": results}],
+        }
+    )
+    return sample_ash_model
+
+
+@pytest.mark.parametrize("reporter_class", STREAMING_REPORTERS)
+def test_builtin_reporter_streams(
+    reporter_class, test_plugin_context, model_with_findings
+):
+    reporter = reporter_class(context=test_plugin_context)
+    assert reporter.supports_streaming is True
+
+    fh = StringIO()
+    assert reporter.report_stream(model_with_findings, fh) is True
+    assert fh.getvalue()
+    assert "RULE3" in fh.getvalue()
+
+
+@pytest.mark.parametrize("reporter_class", [CsvReporter, HtmlReporter])
+def test_stream_matches_report(
+    reporter_class, test_plugin_context, model_with_findings
+):
+    reporter = reporter_class(context=test_plugin_context)
+    fh = StringIO()
+    # Pin the "report generated" timestamp so both renders are comparable.
+    frozen = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    with patch(
+        "automated_security_helper.plugin_modules.ash_builtin.reporters.report_content_emitter.datetime"
+    ) as mock_datetime:
+        mock_datetime.now.return_value = frozen
+        reporter.report_stream(model_with_findings, fh)
+        assert fh.getvalue() == reporter.report(model_with_findings)
+
+
+@pytest.mark.parametrize("reporter_class", [FlatJSONReporter, YamlReporter])
+def test_whole_document_reporters_write_report(
+    reporter_class, test_plugin_context, model_with_findings
+):
+    # These reporters build the whole document anyway, so they use the
+    # default report_stream(), which writes the result of report().
+    reporter = reporter_class(context=test_plugin_context)
+    assert reporter.supports_streaming is False
+
+    fh = StringIO()
+    assert reporter.report_stream(model_with_findings, fh) is True
+    assert "RULE3" in fh.getvalue()
+
+
+def test_default_report_stream_writes_report(test_plugin_context, sample_ash_model):
+    class StringReporter(ReporterPluginBase):
+        def report(self, model):
+            return "whole report"
+
+    reporter = StringReporter(context=test_plugin_context)
+    assert reporter.supports_streaming is False
+
+    fh = StringIO()
+    assert reporter.report_stream(sample_ash_model, fh) is True
+    assert fh.getvalue() == "whole report"
+
+
+def test_default_report_stream_without_report(test_plugin_context, sample_ash_model):
+    class EmptyReporter(ReporterPluginBase):
+        def report(self, model):
+            return None
+
+    fh = StringIO()
+    assert (
+        EmptyReporter(context=test_plugin_context).report_stream(sample_ash_model, fh)
+        is False
+    )
+    assert fh.getvalue() == ""
@@ -0,0 +1,60 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Smoke test for scripts/benchmark_post_scan.py at a tiny scale."""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+SCRIPT = REPO_ROOT / "scripts" / "benchmark_post_scan.py"
+TINY = [
+    "--files",
+    "40",
+    "--depth",
+    "3",
+    "--results",
+    "30",
+    "--scanners",
+    "3",
+    "--suppressions",
+    "6",
+    "--runs",
+    "1",
+]
+
+
+def _run(*args: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, str(SCRIPT), *TINY, *args],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+    )
+
+
+def test_benchmark_runs_and_compares_against_baseline(tmp_path):
+    output = tmp_path / "baseline.json"
+    first = _run("--output", str(output))
+    assert first.returncode == 0, first.stderr
+
+    results = json.loads(output.read_text())["results"]
+    for name in (
+        "scan_set",
+        "merge_sarif_report",
+        "apply_suppressions_to_sarif",
+        "to_flat_vulnerabilities",
+        "get_unified_scanner_metrics",
+        "reporter:sarif",
+    ):
+        assert name in results
+
+    # Shrink the baseline so the comparison has to report a regression.
+    baseline = json.loads(output.read_text())
+    baseline["results"] = {"scan_set": {"median_seconds": 0.0, "min_seconds": 0.0}}
+    output.write_text(json.dumps(baseline))
+    second = _run("--benchmark", "scan_set", "--baseline", str(output))
+    assert second.returncode == 1
+    assert "scan_set:" in second.stdout
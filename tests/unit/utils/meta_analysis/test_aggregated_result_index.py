@@ -0,0 +1,83 @@
+import random
+
+from automated_security_helper.utils.meta_analysis import sarif_analysis
+from automated_security_helper.utils.meta_analysis.sarif_analysis import (
+    AggregatedResultIndex,
+    find_matching_result,
+    validate_sarif_aggregation,
+)
+
+
+def _result(rule_id, uri=None, start=None, end=None, target=None, message="m"):
+    result = {"ruleId": rule_id, "message": {"text": message}}
+    if uri is not None or start is not None:
+        physical = {}
+        if uri is not None:
+            physical["artifactLocation"] = {"uri": uri}
+        if start is not None or end is not None:
+            physical["region"] = {
+                k: v
+                for k, v in (("startLine", start), ("endLine", end))
+                if v is not None
+            }
+        result["locations"] = [{"physicalLocation": physical}]
+    if target is not None:
+        result["analysisTarget"] = {"uri": target}
+    return result
+
+
+def _random_result(rng):
+    start = rng.choice([None, *range(1, 30)])
+    end = rng.choice([None, start, (start or 1) + rng.randint(0, 8)])
+    return _result(
+        rng.choice(["R1", "R2", "R3", None]),
+        uri=rng.choice([None, "", "a.py", "b.py", "c/d.py"]),
+        start=start,
+        end=end,
+        target=rng.choice([None, None, "a.py", "b.py"]),
+    )
+
+
+def test_index_matches_linear_search():
+    """The index returns exactly what find_matching_result returns."""
+    rng = random.Random(1234)  # nosec B311 — deterministic test data
+    aggregated = [_random_result(rng) for _ in range(400)]
+    index = AggregatedResultIndex(aggregated)
+    for _ in range(2000):
+        original = _random_result(rng)
+        assert index.find(original) is find_matching_result(original, aggregated)
+
+
+def test_index_fuzzy_start_line_window():
+    aggregated = [
+        _result("R1", "a.py", 20, 30),
+        _result("R1", "a.py", 12, 18),
+    ]
+    index = AggregatedResultIndex(aggregated)
+    assert index.find(_result("R1", "a.py", 10, 15)) is aggregated[1]
+    assert index.find(_result("R1", "a.py", 2, 25)) is None
+    assert index.find(_result("R1", "b.py", 12, 18)) is None
+
+
+def test_validate_sarif_aggregation_parallel_matches_serial(monkeypatch):
+    monkeypatch.setattr(sarif_analysis, "PARALLEL_COMPARE_MIN_PAIRS", 2)
+    rng = random.Random(99)  # nosec B311 — deterministic test data
+    aggregated = {"runs": [{"results": [_random_result(rng) for _ in range(60)]}]}
+    originals = {
+        "Bandit": {"runs": [{"results": [_random_result(rng) for _ in range(60)]}]}
+    }
+    serial = validate_sarif_aggregation(originals, aggregated)
+    parallel = validate_sarif_aggregation(originals, aggregated, workers=2)
+    assert parallel == serial
+    assert serial["summary"]["matched_findings"] > 0
+
+
+def test_validate_sarif_aggregation_small_runs_stay_serial(monkeypatch):
+    def _no_pool(*args, **kwargs):
+        raise AssertionError("process pool started for a small run")
+
+    monkeypatch.setattr(sarif_analysis, "ProcessPoolExecutor", _no_pool)
+    aggregated = {"runs": [{"results": [_result("R1", "a.py", 1, 2)]}]}
+    originals = {"Bandit": {"runs": [{"results": [_result("R1", "a.py", 1, 2)]}]}}
+    report = validate_sarif_aggregation(originals, aggregated, workers=4)
+    assert report["summary"]["matched_findings"] == 1
@@ -0,0 +1,89 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for the per-run inline suppression index."""
+
+import os
+from unittest.mock import patch
+
+from automated_security_helper.base.plugin_context import PluginContext
+from automated_security_helper.config.ash_config import AshConfig
+from automated_security_helper.utils import inline_suppression_index
+from automated_security_helper.utils.inline_suppression_index import (
+    InlineSuppressionIndex,
+    get_inline_suppression_index,
+)
+
+
+def _write(path, text):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+    return path
+
+
+def test_lookup_matches_same_and_next_line_directives(tmp_path):
+    src = _write(
+        tmp_path / "app.py",
+        "x = 1  # ash-ignore: B101 fine here\n"
+        "// ASH-IGNORE-NEXT-LINE: js/xss sanitized\n"
+        "render(x)\n",
+    )
+    index = InlineSuppressionIndex()
+    index.build([src])
+
+    assert index.lookup(src, 1, "b101").reason == "fine here"
+    assert index.lookup(src, 3, "JS/XSS").reason == "sanitized"
+    assert index.lookup(src, 2, "js/xss") is None
+    assert index.lookup(tmp_path / "missing.py", 1, "B101") is None
+
+
+def test_files_without_marker_are_not_parsed(tmp_path):
+    files = [_write(tmp_path / f"f{i}.py", "print('hi')\n") for i in range(5)]
+    files.append(_write(tmp_path / "g.py", "x = 1  # ash-ignore: B101\n"))
+
+    with patch.object(
+        inline_suppression_index,
+        "parse_inline_suppressions",
+        wraps=inline_suppression_index.parse_inline_suppressions,
+    ) as parse:
+        InlineSuppressionIndex().build(files)
+
+    assert parse.call_count == 1
+
+
+def test_cache_skips_unchanged_files_across_runs(tmp_path):
+    cache_file = tmp_path / "cache" / "index.json"
+    src = _write(tmp_path / "src" / "app.py", "x = 1  # ash-ignore: B101 ok\n")
+    first = InlineSuppressionIndex(cache_file=cache_file)
+    first.build([src])
+    first.save()
+
+    with patch.object(inline_suppression_index.mmap, "mmap") as mapped:
+        second = InlineSuppressionIndex(cache_file=cache_file)
+        second.build([src])
+        mapped.assert_not_called()
+    assert second.lookup(src, 1, "B101").reason == "ok"
+
+    src.write_text("x = 1\ny = 2  # ash-ignore: B102 moved\n")
+    stat = src.stat()
+    os.utime(src, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    third = InlineSuppressionIndex(cache_file=cache_file)
+    third.build([src])
+    assert third.lookup(src, 1, "B101") is None
+    assert third.lookup(src, 2, "B102").reason == "moved"
+
+
+def test_index_is_built_once_per_context(tmp_path):
+    source_dir = tmp_path / "source"
+    _write(source_dir / "app.py", "x = 1  # ash-ignore: B101 ok\n")
+    context = PluginContext(
+        source_dir=source_dir, output_dir=tmp_path / "output", config=AshConfig()
+    )
+
+    index = get_inline_suppression_index(context)
+
+    assert get_inline_suppression_index(context) is index
+    assert index.lookup(source_dir / "app.py", 1, "B101") is not None
+    assert (
+        tmp_path / "output" / "cache" / "inline_suppressions" / "index.json"
+    ).exists()
@@ -0,0 +1,56 @@
+"""Tests for the incremental JSON writing helpers."""
+
+import json
+
+import pytest
+
+from automated_security_helper.utils.json_stream import dumps_nested, iter_json_array
+
+
+@pytest.mark.parametrize(
+    "items",
+    [
+        [],
+        [1],
+        [{"a": [1, 2, {"b": "line\nbreak"}], "c": {}}, [], "x"],
+        [{"nested": {"deep": [{"deeper": None}]}}] * 3,
+    ],
+)
+def test_iter_json_array_matches_json_dumps(items):
+    streamed = "".join(iter_json_array(iter(items), indent=2))
+    assert streamed == json.dumps(items, indent=2)
+
+
+def test_nested_array_matches_json_dumps():
+    findings = [{"id": i, "tags": ["a", "b"]} for i in range(3)]
+    document = {"metadata": {"project": "p"}, "findings": findings}
+
+    streamed = (
+        '{\n  "metadata": '
+        + dumps_nested(document["metadata"], indent=2, level=1)
+        + ',\n  "findings": '
+        + "".join(iter_json_array(findings, indent=2, level=1))
+        + "\n}"
+    )
+    assert streamed == json.dumps(document, indent=2)
+
+
+def test_default_serializer_is_used():
+    class Custom:
+        def __str__(self):
+            return "custom"
+
+    assert "".join(iter_json_array([Custom()], default=str)) == '[\n  "custom"\n]'
+
+
+def test_items_are_consumed_lazily():
+    consumed = []
+
+    def items():
+        for i in range(3):
+            consumed.append(i)
+            yield i
+
+    chunks = iter_json_array(items())
+    next(chunks)
+    assert consumed == [0]
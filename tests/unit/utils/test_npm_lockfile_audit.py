@@ -0,0 +1,216 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for offline lock file auditing."""
+
+import json
+import textwrap
+
+import pytest
+
+from automated_security_helper.utils.npm_lockfile_audit import (
+    AdvisoryIndex,
+    ResolvedPackage,
+    audit_lock_file,
+    audit_packages,
+    parse_package_lock,
+    parse_pnpm_lock,
+    parse_range,
+    parse_version,
+    parse_yarn_lock,
+)
+
+
+def _matches(range_text: str, version: str) -> bool:
+    key = parse_version(version)
+    return any(interval.contains(key) for interval in parse_range(range_text))
+
+
+@pytest.mark.parametrize(
+    "range_text, version, expected",
+    [
+        ("<4.17.21", "4.17.20", True),
+        ("<4.17.21", "4.17.21", False),
+        (">=1.0.0 <1.2.3", "1.2.2", True),
+        (">= 1.0.0 < 1.2.3", "1.2.3", False),
+        ("^1.2.3", "1.9.0", True),
+        ("^1.2.3", "2.0.0", False),
+        ("^0.2.3", "0.3.0", False),
+        ("~1.2.3", "1.2.9", True),
+        ("~1.2.3", "1.3.0", False),
+        ("1.x", "1.99.0", True),
+        ("1.2 - 2.3", "2.3.9", True),
+        ("1.2 - 2.3", "2.4.0", False),
+        ("<1.0.0 || >=2.0.0 <2.1.0", "2.0.5", True),
+        ("<1.0.0 || >=2.0.0 <2.1.0", "1.5.0", False),
+        ("*", "3.0.0", True),
+        ("<2.0.0", "2.0.0-beta.1", True),
+        ("not a range", "1.0.0", False),
+    ],
+)
+def test_semver_ranges(range_text, version, expected):
+    assert _matches(range_text, version) is expected
+
+
+def test_advisory_index_matches_overlapping_intervals():
+    index = AdvisoryIndex(
+        {
+            "lodash": [
+                {"id": 1, "vulnerable_versions": "<4.17.12", "severity": "high"},
+                {
+                    "id": 2,
+                    "vulnerable_versions": ">=3.0.0 <4.17.21",
+                    "severity": "moderate",
+                },
+                {"id": 3, "vulnerable_versions": ">=5.0.0", "severity": "low"},
+                {"id": 4, "vulnerable_versions": "", "severity": "low"},
+            ]
+        }
+    )
+
+    assert sorted(a["id"] for a in index.match("lodash", "4.17.11")) == [1, 2]
+    assert [a["id"] for a in index.match("lodash", "4.17.15")] == [2]
+    assert index.match("lodash", "4.17.21") == []
+    assert [a["id"] for a in index.match("lodash", "5.1.0")] == [3]
+    assert index.match("minimist", "0.0.1") == []
+
+
+def test_package_lock_v3_and_v1():
+    v3 = json.dumps(
+        {
+            "lockfileVersion": 3,
+            "packages": {
+                "": {"name": "app"},
+                "node_modules/lodash": {"version": "4.17.20"},
+                "node_modules/a/node_modules/@scope/b": {"version": "1.0.0"},
+                "node_modules/linked": {"link": True, "resolved": "../linked"},
+                "packages/local": {"version": "0.0.1"},
+            },
+        }
+    )
+    assert {(p.name, p.version, p.path) for p in parse_package_lock(v3)} == {
+        ("lodash", "4.17.20", "node_modules/lodash"),
+        ("@scope/b", "1.0.0", "node_modules/a/node_modules/@scope/b"),
+    }
+
+    v1 = json.dumps(
+        {
+            "lockfileVersion": 1,
+            "dependencies": {
+                "a": {
+                    "version": "1.0.0",
+                    "dependencies": {"b": {"version": "2.0.0"}},
+                },
+                "alias": {"version": "npm:real@3.0.0"},
+            },
+        }
+    )
+    assert {(p.name, p.version, p.path) for p in parse_package_lock(v1)} == {
+        ("a", "1.0.0", "node_modules/a"),
+        ("b", "2.0.0", "node_modules/a/node_modules/b"),
+        ("real", "3.0.0", "node_modules/alias"),
+    }
+
+
+def test_yarn_classic_and_berry():
+    classic = textwrap.dedent(
+        """\
+        # yarn lockfile v1
+
+        "@scope/pkg@^1.0.0", "@scope/pkg@^1.1.0":
+          version "1.2.0"
+          dependencies:
+            version "^2.0.0"
+
+        lodash@^4.17.0:
+          version "4.17.20"
+        """
+    )
+    assert {(p.name, p.version) for p in parse_yarn_lock(classic)} == {
+        ("@scope/pkg", "1.2.0"),
+        ("lodash", "4.17.20"),
+    }
+
+    berry = textwrap.dedent(
+        """\
+        __metadata:
+          version: 6
+
+        "app@workspace:.":
+          version: 0.0.0-use.local
+
+        "lodash@npm:^4.17.0":
+          version: 4.17.20
+        """
+    )
+    assert [(p.name, p.version) for p in parse_yarn_lock(berry)] == [
+        ("lodash", "4.17.20")
+    ]
+
+
+@pytest.mark.parametrize(
+    "lock",
+    [
+        # v5: /name/version_peer
+        "lockfileVersion: 5.4\npackages:\n  /lodash/4.17.20:\n    dev: false\n"
+        "  /@scope/b/1.0.0_react@18.0.0:\n    dev: false\n",
+        # v6: /name@version(peer)
+        "lockfileVersion: '6.0'\npackages:\n  /lodash@4.17.20:\n    dev: false\n"
+        "  /@scope/b@1.0.0(react@18.0.0):\n    dev: false\n",
+        # v9: name@version in packages and snapshots
+        "lockfileVersion: '9.0'\npackages:\n  lodash@4.17.20:\n    resolution: {}\n"
+        "  '@scope/b@1.0.0':\n    resolution: {}\n"
+        "snapshots:\n  '@scope/b@1.0.0(react@18.0.0)': {}\n",
+    ],
+)
+def test_pnpm_lock_versions(lock):
+    assert {(p.name, p.version) for p in parse_pnpm_lock(lock)} == {
+        ("lodash", "4.17.20"),
+        ("@scope/b", "1.0.0"),
+    }
+
+
+def test_audit_output_has_npm_audit_shape(tmp_path):
+    index = AdvisoryIndex(
+        {
+            "lodash": [
+                {
+                    "id": 1523,
+                    "title": "Prototype Pollution",
+                    "url": "https://github.com/advisories/GHSA-p6mc-m468-83gw",
+                    "severity": "high",
+                    "vulnerable_versions": "<4.17.19",
+                    "cwe": ["CWE-1321"],
+                }
+            ]
+        }
+    )
+    packages = [
+        ResolvedPackage("lodash", "4.17.15", "node_modules/lodash"),
+        ResolvedPackage("lodash", "4.17.15", "node_modules/a/node_modules/lodash"),
+        ResolvedPackage("lodash", "4.17.21", "node_modules/b/node_modules/lodash"),
+    ]
+
+    results = audit_packages(packages, index)
+
+    vulnerability = results["vulnerabilities"]["lodash"]
+    assert vulnerability["severity"] == "high"
+    assert vulnerability["range"] == "<4.17.19"
+    assert vulnerability["nodes"] == [
+        "node_modules/a/node_modules/lodash",
+        "node_modules/lodash",
+    ]
+    assert vulnerability["via"][0]["url"].endswith("GHSA-p6mc-m468-83gw")
+    assert results["metadata"]["vulnerabilities"]["high"] == 1
+    assert results["metadata"]["dependencies"]["total"] == 3
+
+    lock_file = tmp_path / "package-lock.json"
+    lock_file.write_text(
+        json.dumps(
+            {
+                "lockfileVersion": 2,
+                "packages": {"node_modules/lodash": {"version": "4.17.21"}},
+            }
+        )
+    )
+    assert audit_lock_file(lock_file, index)["vulnerabilities"] == {}
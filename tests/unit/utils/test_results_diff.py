@@ -0,0 +1,208 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for the aggregated results diff engine and the `inspect diff` gate."""
+
+import json
+from unittest.mock import patch
+
+from typer.testing import CliRunner
+
+from automated_security_helper.cli.inspect import inspect_app
+from automated_security_helper.core.findings_history import finding_fingerprint
+from automated_security_helper.models.asharp_model import AshAggregatedResults
+from automated_security_helper.utils.results_diff import (
+    ResultsIndex,
+    diff_results_files,
+)
+
+
+def _result(rule_id, text, uri="file:///src/app.py", **extra):
+    result = {
+        "ruleId": rule_id,
+        "message": {"text": text},
+        "locations": [
+            {
+                "physicalLocation": {
+                    "artifactLocation": {"uri": uri},
+                    "region": {"startLine": 3},
+                }
+            }
+        ],
+    }
+    result.update(extra)
+    return result
+
+
+def _document(*results, additional=None):
+    return {
+        "metadata": {
+            "scan_id": "test-scan",
+            "scan_timestamp": "2026-01-01T00:00:00+00:00",
+            "summary_stats": {},
+        },
+        "sarif": {
+            "version": "2.1.0",
+            "runs": [
+                {
+                    "tool": {
+                        "driver": {"name": "bandit", "properties": {"tags": ["SAST"]}}
+                    },
+                    "results": list(results),
+                }
+            ],
+        },
+        "additional_reports": additional or {},
+        "scanner_results": {},
+    }
+
+
+def _write(path, document):
+    path.write_text(json.dumps(document))
+    return path
+
+
+def test_summaries_match_flat_vulnerabilities():
+    document = _document(
+        _result("B101", "assert used"),
+        _result("B105", "Possible hardcoded password: 'hunter2'", level="warning"),
+        _result(
+            "secret",
+            "token",
+            level="note",
+            properties={"issue_severity": "critical", "scanner_name": "detect-secrets"},
+        ),
+        _result(
+            "B102",
+            "exec used",
+            level=None,
+            suppressions=[{"kind": "external", "justification": "ok"}],
+        ),
+        additional={"npm-audit": [{"id": "GHSA-1", "severity": "high"}]},
+    )
+
+    index = ResultsIndex(json.loads(json.dumps(document)))
+    flat = AshAggregatedResults.from_json(document).to_flat_vulnerabilities()
+
+    assert {
+        finding_fingerprint(f): (f.id, f.severity, f.rule_id, f.is_suppressed)
+        for f in flat
+    } == {
+        key: (s.id, s.severity, s.rule_id, s.is_suppressed)
+        for key, s in index.findings.items()
+    }
+    assert index.findings[finding_fingerprint(flat[0])].location == "/src/app.py:3"
+
+
+def test_same_rule_in_other_files_is_new(tmp_path):
+    before = _write(
+        tmp_path / "before.json",
+        _document(_result("B101", "assert used", uri="a.py")),
+    )
+    after = _write(
+        tmp_path / "after.json",
+        _document(
+            _result("B101", "assert used", uri="a.py"),
+            _result("B101", "assert used", uri="new_module.py"),
+            _result("B101", "assert used", uri="other.py"),
+        ),
+    )
+
+    diff = diff_results_files(before, after)
+
+    assert sorted(s.location for s in diff.new()) == ["new_module.py:3", "other.py:3"]
+    assert len({s.id for s in diff.new()}) == 1
+    assert diff.resolved() == []
+    assert sorted(f.file_path for f in diff.new_findings()) == [
+        "new_module.py",
+        "other.py",
+    ]
+
+
+def test_only_changed_findings_are_materialized(tmp_path):
+    before = _write(
+        tmp_path / "before.json",
+        _document(_result("B101", "assert used"), _result("B102", "exec used")),
+    )
+    after = _write(
+        tmp_path / "after.json",
+        _document(
+            _result("B101", "assert used", level="note"),
+            _result("B103", "bad permissions"),
+        ),
+    )
+
+    diff = diff_results_files(before, after)
+
+    assert [s.rule_id for s in diff.new()] == ["B103"]
+    assert [s.rule_id for s in diff.resolved()] == ["B102"]
+    assert diff.severity_changed == [
+        {
+            "id": diff.severity_changed[0]["id"],
+            "before_severity": "MEDIUM",
+            "after_severity": "LOW",
+        }
+    ]
+    materialize = ResultsIndex.materialize
+    with patch.object(
+        ResultsIndex, "materialize", autospec=True, side_effect=materialize
+    ) as spy:
+        new_findings = diff.new_findings()
+    assert spy.call_count == 1
+    assert new_findings[0].rule_id == "B103"
+    assert new_findings[0].scanner_type == "SAST"
+
+
+def test_inspect_diff_gates_on_new_findings(tmp_path):
+    before = _write(tmp_path / "before.json", _document(_result("B101", "assert used")))
+    after = _write(
+        tmp_path / "after.json",
+        _document(
+            _result("B101", "assert used"),
+            _result("B104", "binds to all interfaces", level="note"),
+        ),
+    )
+    runner = CliRunner()
+
+    failed = runner.invoke(
+        inspect_app, ["diff", "--baseline", str(before), "--current", str(after)]
+    )
+    below_threshold = runner.invoke(
+        inspect_app,
+        [
+            "diff",
+            "--baseline",
+            str(before),
+            "--current",
+            str(after),
+            "--severity-threshold",
+            "medium",
+            "--json",
+        ],
+    )
+    unchanged = runner.invoke(
+        inspect_app, ["diff", "--baseline", str(before), "--current", str(before)]
+    )
+
+    assert failed.exit_code == 2
+    assert "B104" in failed.output
+    assert below_threshold.exit_code == 0
+    payload = json.loads(below_threshold.output)
+    assert [f["rule_id"] for f in payload["new"]] == ["B104"]
+    assert payload["gated"] == []
+    assert unchanged.exit_code == 0
+
+
+def test_inspect_diff_missing_baseline(tmp_path):
+    result = CliRunner().invoke(
+        inspect_app,
+        [
+            "diff",
+            "--baseline",
+            str(tmp_path / "missing.json"),
+            "--output-dir",
+            str(tmp_path),
+        ],
+    )
+
+    assert result.exit_code == 1
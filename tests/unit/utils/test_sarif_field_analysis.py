@@ -96,3 +96,57 @@ class TestAnalyzeSarifFieldsLogic:
         data = _json.loads(fields_json.read_text())
         assert isinstance(data, dict)
         assert any("ruleId" in key for key in data)
+
+
+class TestValidateAggregationCommand:
+    @staticmethod
+    def _write_sarif(path, results):
+        import json
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps({"version": "2.1.0", "runs": [{"results": results}]}))
+
+    @staticmethod
+    def _finding(rule_id, line):
+        return {
+            "ruleId": rule_id,
+            "level": "error",
+            "message": {"text": rule_id},
+            "locations": [
+                {
+                    "physicalLocation": {
+                        "artifactLocation": {"uri": "app.py"},
+                        "region": {"startLine": line, "endLine": line},
+                    }
+                }
+            ],
+        }
+
+    def _invoke(self, tmp_path):
+        from typer.testing import CliRunner
+
+        from automated_security_helper.cli.inspect import inspect_app
+
+        return CliRunner().invoke(
+            inspect_app, ["aggregation", "--output-dir", str(tmp_path)]
+        )
+
+    def test_passes_when_all_findings_are_aggregated(self, tmp_path):
+        findings = [self._finding("B101", 3), self._finding("B105", 9)]
+        self._write_sarif(tmp_path / "scanners" / "bandit" / "source" / "bandit.sarif", findings)
+        self._write_sarif(tmp_path / "reports" / "ash.sarif", findings)
+
+        result = self._invoke(tmp_path)
+        assert result.exit_code == 0, result.output
+        assert "2 of 2 findings preserved" in result.output
+
+    def test_fails_when_a_finding_is_missing(self, tmp_path):
+        self._write_sarif(
+            tmp_path / "scanners" / "bandit" / "source" / "bandit.sarif",
+            [self._finding("B101", 3), self._finding("B105", 9)],
+        )
+        self._write_sarif(tmp_path / "reports" / "ash.sarif", [self._finding("B101", 3)])
+
+        result = self._invoke(tmp_path)
+        assert result.exit_code == 1
+        assert "1 findings missing" in result.output
@@ -2,7 +2,13 @@ from pathlib import Path
 import sys
 from unittest.mock import patch
 
+import random
+import uuid
+
+import pytest
+
 from automated_security_helper.utils.sarif_utils import (
+    _cached_finding_id,
     get_finding_id,
     _sanitize_uri,
 )
@@ -27,6 +33,37 @@ def test_get_finding_id():
     assert id4 != id1  # Should be different from the full parameter version
 
 
+def test_get_finding_id_compat_engine_preserves_legacy_ids(monkeypatch):
+    """The default compat engine reproduces the IDs of earlier releases."""
+    rd = random.Random()  # nosec B311 — reproduces the legacy finding ID
+    rd.seed("RULE001::file.py::10::20")
+    legacy = str(uuid.UUID(int=rd.getrandbits(128), version=4))
+
+    monkeypatch.delenv("ASH_FINDING_ID_ENGINE", raising=False)
+    assert get_finding_id("RULE001", "file.py", 10, 20, engine="compat") == legacy
+    assert get_finding_id("RULE001", "file.py", 10, 20) == legacy
+    monkeypatch.setenv("ASH_FINDING_ID_ENGINE", "blake2")
+    assert get_finding_id("RULE001", "file.py", 10, 20) != legacy
+
+
+def test_get_finding_id_blake2_engine_is_uuid4_shaped():
+    finding_id = get_finding_id("RULE001", "file.py", 10, 20, engine="blake2")
+    assert uuid.UUID(finding_id).version == 4
+    assert finding_id == "8d946e9d-bc36-454a-892a-e5064e1de71f"
+
+
+def test_get_finding_id_is_memoized():
+    _cached_finding_id.cache_clear()
+    get_finding_id("RULE001", "file.py", 10, 20, engine="blake2")
+    get_finding_id("RULE001", "file.py", 10, 20, engine="blake2")
+    assert _cached_finding_id.cache_info().hits == 1
+
+
+def test_get_finding_id_rejects_unknown_engine():
+    with pytest.raises(ValueError, match="Unknown finding ID engine"):
+        get_finding_id("RULE001", engine="md5")
+
+
 def test_sanitize_uri(test_source_dir):
     """Test the _sanitize_uri function."""
     source_dir_path = test_source_dir
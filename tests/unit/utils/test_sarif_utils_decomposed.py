@@ -33,6 +33,9 @@ from automated_security_helper.schemas.sarif_schema_model import (
     Tool,
     ToolComponent,
 )
+from automated_security_helper.utils.inline_suppression_index import (
+    InlineSuppressionIndex,
+)
 from automated_security_helper.utils.sarif_utils import (
     _apply_config_suppression,
     _apply_inline_suppression,
@@ -284,7 +287,7 @@ class TestApplyInlineSuppression:
         src = tmp_path / "foo.py"
         src.write_text("x = 1  # ash-ignore: B108 deliberate\n")
         result = self._bare_result("B108")
-        cache: dict = {}
+        cache = InlineSuppressionIndex()
         applied = _apply_inline_suppression(result, "foo.py", tmp_path, 1, cache)
         assert applied is True
         assert result.suppressions is not None and len(result.suppressions) >= 1
@@ -293,7 +296,7 @@ class TestApplyInlineSuppression:
         tmp_path / "bar.py"
         (tmp_path / "bar.py").write_text("x = 1\n")
         result = self._bare_result("B108")
-        cache: dict = {}
+        cache = InlineSuppressionIndex()
         applied = _apply_inline_suppression(result, "bar.py", tmp_path, 1, cache)
         assert applied is False
         assert not result.suppressions
@@ -301,7 +304,7 @@ class TestApplyInlineSuppression:
     def test_wrong_rule_id_returns_false(self, tmp_path: Path):
         (tmp_path / "baz.py").write_text("x = 1  # ash-ignore: B999 other\n")
         result = self._bare_result("B108")
-        cache: dict = {}
+        cache = InlineSuppressionIndex()
         applied = _apply_inline_suppression(result, "baz.py", tmp_path, 1, cache)
         assert applied is False
 
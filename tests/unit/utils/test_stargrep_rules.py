@@ -0,0 +1,184 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for the shared Semgrep/Opengrep rule cache."""
+
+import json
+import threading
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from automated_security_helper.utils import stargrep_rules
+from automated_security_helper.utils.stargrep_rules import (
+    StargrepRuleConfig,
+    build_merged_rules,
+    claim_shared_run,
+    filter_sarif_to_rules,
+    run_with_shared_rules,
+    split_rule_sources,
+)
+
+
+def _rule(rule_id, pattern="eval(...)"):
+    return (
+        f"  - id: {rule_id}\n    pattern: {pattern}\n    message: m\n"
+        "    languages: [python]\n    severity: ERROR\n"
+    )
+
+
+def _write_rules(path, *rules):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("rules:\n" + "".join(rules))
+    return path
+
+
+def test_split_rule_sources_expands_directories(tmp_path):
+    a = _write_rules(tmp_path / "pack" / "a.yaml", _rule("a"))
+    b = _write_rules(tmp_path / "pack" / "nested" / "b.yml", _rule("b"))
+    (tmp_path / "pack" / "README.md").write_text("not rules")
+
+    local, remote = split_rule_sources(
+        [str(tmp_path / "pack"), str(a), "p/ci", "https://example.com/rules.yaml"]
+    )
+
+    assert local == [a.resolve(), b.resolve()]
+    assert remote == ["p/ci", "https://example.com/rules.yaml"]
+
+
+def test_merged_rules_are_deduplicated_and_cached(tmp_path):
+    first = _write_rules(tmp_path / "one.yaml", _rule("shared"), _rule("only-one"))
+    second = _write_rules(
+        tmp_path / "two.yaml", _rule("shared"), _rule("only-two", "exec(...)")
+    )
+    cache_dir = tmp_path / "cache"
+
+    merged = build_merged_rules([first, second], cache_dir)
+
+    rules = json.loads(merged.path.read_text())["rules"]
+    assert [rule["id"] for rule in rules] == ["shared", "only-one", "only-two"]
+    assert merged.rule_ids([second]) == {"shared", "only-two"}
+
+    with patch.object(stargrep_rules.yaml, "safe_load") as safe_load:
+        again = build_merged_rules([first, second], cache_dir)
+        safe_load.assert_not_called()
+    assert again.path == merged.path
+    assert again.rule_ids() == {"shared", "only-one", "only-two"}
+
+    _write_rules(second, _rule("changed"))
+    changed = build_merged_rules([first, second], cache_dir)
+    assert changed.path != merged.path
+    assert changed.rule_ids([second]) == {"changed"}
+
+
+def test_conflicting_rule_ids_are_reported(tmp_path):
+    first = _write_rules(tmp_path / "one.yaml", _rule("shared"))
+    second = _write_rules(tmp_path / "two.yaml", _rule("shared", "exec(...)"))
+
+    with patch.object(stargrep_rules.ASH_LOGGER, "warning") as warning:
+        merged = build_merged_rules([first, second], tmp_path / "cache")
+
+    rules = json.loads(merged.path.read_text())["rules"]
+    assert [rule["pattern"] for rule in rules] == ["eval(...)"]
+    warning.assert_called_once()
+    message = warning.call_args.args[0]
+    assert "shared" in message and str(first) in message and str(second) in message
+
+
+def test_files_without_rules_produce_no_merged_file(tmp_path):
+    empty = tmp_path / "empty.yaml"
+    empty.write_text("rules: []")
+
+    assert build_merged_rules([empty], tmp_path / "cache") is None
+
+
+def _sarif(*rule_ids):
+    return {
+        "runs": [
+            {
+                "tool": {"driver": {"rules": [{"id": r} for r in rule_ids]}},
+                "results": [{"ruleId": r} for r in rule_ids],
+            }
+        ]
+    }
+
+
+def test_filter_sarif_to_rules():
+    filtered = filter_sarif_to_rules(_sarif("a", "b", "c"), frozenset({"a", "c"}))
+
+    assert [r["ruleId"] for r in filtered["runs"][0]["results"]] == ["a", "c"]
+    assert [r["id"] for r in filtered["runs"][0]["tool"]["driver"]["rules"]] == [
+        "a",
+        "c",
+    ]
+
+
+def test_union_run_is_shared_and_filtered_per_scanner(tmp_path):
+    context = SimpleNamespace()
+    calls = []
+    started = threading.Event()
+
+    def make_run(results_file):
+        def run():
+            calls.append(results_file)
+            started.set()
+            results_file.parent.mkdir(parents=True, exist_ok=True)
+            results_file.write_text(json.dumps(_sarif("semgrep-rule", "opengrep-rule")))
+            return 1
+
+        return run
+
+    results = {}
+
+    def scan(name, own_rule):
+        results_file = tmp_path / name / "results_sarif.sarif"
+        if name == "opengrep":
+            started.wait(5)
+        exit_code = run_with_shared_rules(
+            context,
+            StargrepRuleConfig(
+                config_args=[], own_rule_ids=frozenset({own_rule}), shared_key="digest"
+            ),
+            ("target", "source"),
+            results_file,
+            make_run(results_file),
+        )
+        results[name] = (exit_code, json.loads(results_file.read_text()))
+
+    threads = [
+        threading.Thread(target=scan, args=("semgrep", "semgrep-rule")),
+        threading.Thread(target=scan, args=("opengrep", "opengrep-rule")),
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(10)
+
+    assert len(calls) == 1
+    assert results["semgrep"][0] is None
+    assert results["opengrep"][0] == 1
+    for name in ("semgrep", "opengrep"):
+        assert [r["ruleId"] for r in results[name][1]["runs"][0]["results"]] == [
+            f"{name}-rule"
+        ]
+
+
+def test_waiting_for_a_stalled_union_run_times_out(tmp_path):
+    context = SimpleNamespace()
+    rule_config = StargrepRuleConfig(
+        config_args=[], own_rule_ids=frozenset({"semgrep-rule"}), shared_key="digest"
+    )
+    # Another scanner claimed the run but never publishes it.
+    claim_shared_run(context, ("digest", "target", "source"))
+    results_file = tmp_path / "results_sarif.sarif"
+
+    def run():
+        results_file.write_text(json.dumps(_sarif("semgrep-rule", "opengrep-rule")))
+        return 0
+
+    exit_code = run_with_shared_rules(
+        context, rule_config, ("target", "source"), results_file, run, timeout=0.01
+    )
+
+    assert exit_code is None
+    results = json.loads(results_file.read_text())["runs"][0]["results"]
+    assert [r["ruleId"] for r in results] == ["semgrep-rule"]
@@ -0,0 +1,80 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for the run-scoped URI normalizer."""
+
+from pathlib import Path
+from unittest.mock import patch
+
+from automated_security_helper.base.plugin_context import PluginContext
+from automated_security_helper.config.ash_config import AshConfig
+from automated_security_helper.core.constants import ASH_WORK_DIR_NAME
+from automated_security_helper.utils.uri_normalizer import (
+    UriNormalizer,
+    get_uri_normalizer,
+)
+
+
+def test_normalize_strips_source_prefix_and_interns(tmp_path):
+    normalizer = UriNormalizer(tmp_path)
+    uri = f"{tmp_path.resolve()}/src/app.py"
+
+    first = normalizer.normalize(uri)
+    second = normalizer.normalize("".join([str(tmp_path.resolve()), "/src/app.py"]))
+
+    assert first == "src/app.py"
+    assert first is second
+
+
+def test_sanitize_handles_file_uris(tmp_path):
+    normalizer = UriNormalizer(tmp_path)
+
+    assert normalizer.sanitize(f"file://{tmp_path.resolve()}/a/b.py") == "a/b.py"
+    assert normalizer.sanitize("relative\\path.py") == "relative/path.py"
+    assert normalizer.sanitize("") == ""
+
+
+def test_lookups_touch_the_filesystem_once_per_uri(tmp_path):
+    normalizer = UriNormalizer(tmp_path, tmp_path / "output")
+
+    with patch.object(
+        Path, "resolve", autospec=True, side_effect=lambda p: p
+    ) as resolve:
+        for _ in range(5):
+            normalizer.in_output_dir("src/app.py")
+            normalizer.resolve_in_source("src/app.py")
+
+    assert resolve.call_count == 2
+
+
+def test_in_output_dir_excludes_work_dir(tmp_path):
+    output_dir = tmp_path / "output"
+    normalizer = UriNormalizer(tmp_path, output_dir)
+
+    assert normalizer.in_output_dir(str(output_dir / "reports" / "ash.sarif"))
+    assert not normalizer.in_output_dir(
+        str(output_dir / ASH_WORK_DIR_NAME / "notebook.py")
+    )
+    assert not normalizer.in_output_dir(str(tmp_path / "src" / "app.py"))
+    assert not UriNormalizer(tmp_path).in_output_dir(str(output_dir / "x"))
+
+
+def test_resolve_in_source_strips_file_scheme(tmp_path):
+    normalizer = UriNormalizer(tmp_path)
+    expected = (tmp_path / "src" / "app.py").resolve()
+
+    assert normalizer.resolve_in_source("src/app.py") == expected
+    assert normalizer.resolve_in_source("file://src/app.py") == expected
+    assert normalizer.resolve_in_source(f"file://{expected}") == expected
+
+
+def test_get_uri_normalizer_is_shared_per_context(tmp_path):
+    context = PluginContext(
+        source_dir=tmp_path, output_dir=tmp_path / "output", config=AshConfig()
+    )
+
+    normalizer = get_uri_normalizer(context)
+
+    assert get_uri_normalizer(context) is normalizer
+    context.source_dir = tmp_path / "other"
+    assert get_uri_normalizer(context) is not normalizer